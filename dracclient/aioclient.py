@@ -0,0 +1,1365 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+asyncio counterpart of the client module.
+"""
+
+import asyncio
+import logging
+
+from dracclient import aiowsman
+from dracclient import client
+from dracclient import constants
+from dracclient import exceptions
+from dracclient import probe
+from dracclient.resources import bios
+from dracclient.resources import idrac_card
+from dracclient.resources import inventory
+from dracclient.resources import job
+from dracclient.resources import lifecycle_controller
+from dracclient.resources import nic
+from dracclient.resources import raid
+from dracclient.resources import system
+from dracclient.resources import uris
+from dracclient import utils
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncDRACClient(object):
+    """asyncio client for managing DRAC nodes
+
+       Mirrors DRACClient: every method is a coroutine taking the same
+       parameters, returning the same objects and raising the same
+       exceptions as its DRACClient counterpart.
+    """
+
+    BIOS_DEVICE_FQDD = client.DRACClient.BIOS_DEVICE_FQDD
+    IDRAC_FQDD = client.DRACClient.IDRAC_FQDD
+
+    def __init__(
+            self, host, username, password, port=443, path='/wsman',
+            protocol='https',
+            ssl_retries=constants.DEFAULT_WSMAN_SSL_ERROR_RETRIES,
+            ssl_retry_delay=constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC,
+            ready_retries=constants.DEFAULT_IDRAC_IS_READY_RETRIES,
+            ready_retry_delay=(
+                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC),
+            pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+            idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+            transport=None, liveness_probe=None,
+            connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+            read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC):
+        """Creates client object
+
+        :param host: hostname or IP of the DRAC interface
+        :param username: username for accessing the DRAC interface
+        :param password: password for accessing the DRAC interface
+        :param port: port for accessing the DRAC interface
+        :param path: path for accessing the DRAC interface
+        :param protocol: protocol for accessing the DRAC interface
+        :param ssl_retries: number of resends to attempt on SSL failures
+        :param ssl_retry_delay: number of seconds to wait between
+                                retries on SSL failures
+        :param ready_retries: number of times to check if the iDRAC is
+                              ready
+        :param ready_retry_delay: number of seconds to wait between
+                                  checks if the iDRAC is ready
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded
+        :param transport: an aiowsman.Transport compatible object used to
+                          send the requests
+        :param liveness_probe: a probe.LivenessProbe checking if the DRAC
+                               interface is up while it is reset
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for each read of the
+                             response of the DRAC interface. If None, waits
+                             forever.
+        """
+        self.client = AsyncWSManClient(host, username, password, port, path,
+                                       protocol, ssl_retries, ssl_retry_delay,
+                                       ready_retries, ready_retry_delay,
+                                       pool_size, idle_timeout, transport,
+                                       connect_timeout, read_timeout)
+        self._liveness_probe = (liveness_probe or
+                                probe.LivenessProbe(port=port))
+        # The resource managers are only used for building the requests and
+        # parsing the responses, their blocking methods are never called.
+        self._job_mgmt = job.JobManagement(self.client)
+        self._power_mgmt = bios.PowerManagement(self.client)
+        self._boot_mgmt = bios.BootManagement(self.client)
+        self._bios_cfg = bios.BIOSConfiguration(self.client)
+        self._lifecycle_mgmt = (
+            lifecycle_controller.LifecycleControllerManagement(self.client))
+        self._lifecycle_cfg = lifecycle_controller.LCConfiguration(self.client)
+        self._idrac_cfg = idrac_card.iDRACCardConfiguration(self.client)
+        self._raid_mgmt = raid.RAIDManagement(self.client)
+        self._system_cfg = system.SystemConfiguration(self.client)
+        self._inventory_mgmt = inventory.InventoryManagement(self.client)
+        self._nic_cfg = nic.NICConfiguration(self.client)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the connections kept open to the DRAC interface"""
+        await self.client.close()
+
+    async def get_power_state(self):
+        """Returns the current power state of the node
+
+        :returns: power state of the node, one of 'POWER_ON', 'POWER_OFF' or
+                  'REBOOT'
+        """
+        doc = await self.client.enumerate(
+            uris.DCIM_ComputerSystem,
+            filter_query=bios.POWER_STATE_FILTER_QUERY)
+
+        return self._power_mgmt._parse_get_power_state(doc)
+
+    async def set_power_state(self, target_state):
+        """Turns the server power on/off or do a reboot
+
+        :param target_state: target power state. Valid options are: 'POWER_ON',
+                             'POWER_OFF' and 'REBOOT'.
+        """
+        properties = {
+            'RequestedState': self._power_mgmt._get_drac_power_state(
+                target_state)}
+
+        await self.client.invoke(uris.DCIM_ComputerSystem,
+                                 'RequestStateChange',
+                                 bios.COMPUTER_SYSTEM_SELECTORS, properties)
+
+    async def list_boot_modes(self):
+        """Returns the list of boot modes
+
+        :returns: list of BootMode objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_BootConfigSetting)
+
+        return self._boot_mgmt._parse_list_boot_modes(doc)
+
+    async def list_boot_devices(self):
+        """Returns the list of boot devices
+
+        :returns: a dictionary with the boot modes and the list of associated
+                  BootDevice objects, ordered by the pending_assigned_sequence
+                  property
+        """
+        doc = await self.client.enumerate(uris.DCIM_BootSourceSetting)
+
+        try:
+            return self._boot_mgmt._parse_list_boot_devices(doc)
+        except AttributeError:
+            # DRAC 11g doesn't have the BootSourceType attribute on the
+            # DCIM_BootSourceSetting resource
+            controller_version = await self.get_lifecycle_controller_version()
+
+            if controller_version < bios.LC_CONTROLLER_VERSION_12G:
+                return self._boot_mgmt._parse_list_boot_devices(doc,
+                                                                is_11g=True)
+            else:
+                raise
+
+    async def change_boot_device_order(self, boot_mode, boot_device_list):
+        """Changes the boot device sequence for a boot mode
+
+        :param boot_mode: boot mode for which the boot device list is to be
+                          changed
+        :param boot_device_list: a list of boot device ids in an order
+                                 representing the desired boot sequence
+        """
+        selectors = {'InstanceID': boot_mode}
+        properties = {'source': boot_device_list}
+
+        await self.client.invoke(uris.DCIM_BootConfigSetting,
+                                 'ChangeBootOrderByInstanceID', selectors,
+                                 properties,
+                                 expected_return_value=utils.RET_SUCCESS)
+
+    async def list_bios_settings(self, by_name=True, lazy=False):
+        """List the BIOS configuration settings
+
+        :param by_name: Controls whether returned dictionary uses BIOS
+                        attribute name or instance_id as key.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
+        :returns: a dictionary with the BIOS settings using its name as the
+                  key. The attributes are either BIOSEnumerableAttribute,
+                  BIOSStringAttribute or BIOSIntegerAttribute objects.
+        """
+        return await _list_settings(self.client, self._bios_cfg.NAMESPACES,
+                                    by_name, lazy=lazy)
+
+    async def set_bios_settings(self, settings):
+        """Sets the BIOS configuration
+
+        :param settings: a dictionary containing the proposed values, with
+                         each key being the name of attribute and the value
+                         being the proposed value.
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        return await _set_settings('BIOS',
+                                   self.client,
+                                   self._bios_cfg.NAMESPACES,
+                                   settings,
+                                   uris.DCIM_BIOSService,
+                                   "DCIM_BIOSService",
+                                   "DCIM:BIOSService",
+                                   self.BIOS_DEVICE_FQDD)
+
+    async def list_idrac_settings(self, by_name=False,
+                                  fqdd_filter=IDRAC_FQDD, lazy=False):
+        """List the iDRAC configuration settings
+
+        :param by_name: Controls whether returned dictionary uses iDRAC card
+                        attribute name as key. If set to False, instance_id
+                        will be used.  If set to True the keys will be of the
+                        form "group_id#name".
+        :param fqdd_filter: An FQDD used to filter the instances.  Note that
+                            this is only used when by_name is True.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
+        :returns: a dictionary with the iDRAC settings
+        """
+        return await _list_settings(self.client,
+                                    self._idrac_cfg.NAMESPACES,
+                                    by_name=by_name,
+                                    fqdd_filter=fqdd_filter,
+                                    name_formatter=idrac_card._name_formatter,
+                                    lazy=lazy)
+
+    async def set_idrac_settings(self, settings, idrac_fqdd=IDRAC_FQDD):
+        """Sets the iDRAC configuration settings
+
+        :param settings: a dictionary containing the proposed values, with
+                         each key being the name of attribute qualified
+                         with the group ID in the form "group_id#name" and
+                         the value being the proposed value.
+        :param idrac_fqdd: the FQDD of the iDRAC.
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        return await _set_settings('iDRAC Card',
+                                   self.client,
+                                   self._idrac_cfg.NAMESPACES,
+                                   settings,
+                                   uris.DCIM_iDRACCardService,
+                                   "DCIM_iDRACCardService",
+                                   "DCIM:iDRACCardService",
+                                   idrac_fqdd,
+                                   name_formatter=idrac_card._name_formatter)
+
+    async def reset_idrac(
+            self, force=False, wait=False, ready_wait_time=30,
+            state_timeout=constants.DEFAULT_IDRAC_RESET_STATE_TIMEOUT_SEC):
+        """Resets the iDRAC and optionally waits until reset is complete.
+
+        :param force: does a force reset when True and a graceful reset when
+               False
+        :param wait: returns immediately after reset if False, or waits
+                for the iDRAC to return to operational state if True
+        :param ready_wait_time: the amount of time in seconds to wait after
+                the reset before starting to check on the iDRAC's status
+        :param state_timeout: the amount of time in seconds to wait for the
+                iDRAC to go down and then to come back up
+        :returns: True on success, raises exception on failure
+        :raises: DRACOperationFailed on failure to reset iDRAC
+        """
+        properties = {'Force': "1" if force else "0"}
+
+        doc = await self.client.invoke(uris.DCIM_iDRACCardService,
+                                       'iDRACReset',
+                                       idrac_card.IDRAC_CARD_SERVICE_SELECTORS,
+                                       properties,
+                                       check_return_value=False)
+        return_value = self._idrac_cfg._parse_reset_idrac(doc)
+        if not wait and return_value:
+            return return_value
+
+        if not return_value:
+            raise exceptions.DRACOperationFailed(
+                drac_messages="Failed to reset iDRAC")
+
+        LOG.debug("iDRAC was reset, waiting for return to operational state")
+
+        state_reached = await self._wait_for_host_state(
+            self.client.host,
+            alive=False,
+            timeout=state_timeout)
+
+        if not state_reached:
+            raise exceptions.DRACOperationFailed(
+                drac_messages="Timed out waiting for the %s iDRAC to become "
+                "not pingable" % self.client.host)
+
+        LOG.info("The iDRAC has become not pingable")
+
+        state_reached = await self._wait_for_host_state(
+            self.client.host,
+            alive=True,
+            timeout=state_timeout)
+
+        if not state_reached:
+            raise exceptions.DRACOperationFailed(
+                drac_messages="Timed out waiting for the %s iDRAC to become "
+                "pingable" % self.client.host)
+
+        LOG.info("The iDRAC has become pingable")
+        LOG.info("Waiting for the iDRAC to become ready")
+        await asyncio.sleep(ready_wait_time)
+
+        await self.client.wait_until_idrac_is_ready()
+
+    async def _wait_for_host_state(self, host, alive, timeout):
+        if alive:
+            ping_type = "pingable"
+
+        else:
+            ping_type = "not pingable"
+
+        LOG.info("Waiting for the iDRAC to become %s", ping_type)
+
+        state_reached = await self._liveness_probe.wait_for_state_async(
+            [host], alive, timeout)
+        return state_reached[host]
+
+    async def commit_pending_idrac_changes(
+            self,
+            idrac_fqdd=IDRAC_FQDD,
+            reboot=False,
+            start_time='TIME_NOW'):
+        """Create a config job for applying all pending iDRAC changes.
+
+        :param idrac_fqdd: the FQDD of the iDRAC.
+        :param reboot: indication of whether to also create a reboot job
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss, the string 'TIME_NOW' which
+                           means execute immediately or None which means
+                           the job will not execute until
+                           schedule_job_execution is called
+        :returns: id of the created configuration job
+        """
+        return await self.create_config_job(
+            resource_uri=uris.DCIM_iDRACCardService,
+            cim_creation_class_name='DCIM_iDRACCardService',
+            cim_name='DCIM:iDRACCardService',
+            target=idrac_fqdd,
+            reboot=reboot,
+            start_time=start_time)
+
+    async def abandon_pending_idrac_changes(self, idrac_fqdd=IDRAC_FQDD):
+        """Abandon all pending changes to an iDRAC
+
+        :param idrac_fqdd: the FQDD of the iDRAC.
+        """
+        await self.delete_pending_config(
+            resource_uri=uris.DCIM_iDRACCardService,
+            cim_creation_class_name='DCIM_iDRACCardService',
+            cim_name='DCIM:iDRACCardService',
+            target=idrac_fqdd)
+
+    async def list_lifecycle_settings(self, by_name=False, lazy=False):
+        """List the Lifecycle Controller configuration settings
+
+        :param by_name: Controls whether returned dictionary uses Lifecycle
+                        attribute name or instance_id as key.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
+        :returns: a dictionary with the Lifecycle Controller settings
+        """
+        return await _list_settings(self.client,
+                                    self._lifecycle_cfg.NAMESPACES, by_name,
+                                    lazy=lazy)
+
+    async def is_lifecycle_in_recovery(self):
+        """Checks if Lifecycle Controller in recovery mode or not
+
+        :returns: a boolean indicating if lifecycle controller is in recovery
+        """
+        doc = await self.client.invoke(
+            uris.DCIM_LCService,
+            'GetRemoteServicesAPIStatus',
+            lifecycle_controller.LC_SERVICE_SELECTORS,
+            {},
+            expected_return_value=utils.RET_SUCCESS,
+            wait_for_idrac=False)
+
+        return self._lifecycle_cfg._parse_is_lifecycle_in_recovery(doc)
+
+    async def set_lifecycle_settings(self, settings):
+        """Sets the Lifecycle Controller configuration
+
+        :param settings: a dictionary containing the proposed values, with
+                         each key being the name of attribute and the value
+                         being the proposed value.
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        return await _set_settings('Lifecycle',
+                                   self.client,
+                                   self._lifecycle_cfg.NAMESPACES,
+                                   settings,
+                                   uris.DCIM_LCService,
+                                   "DCIM_LCService",
+                                   "DCIM:LCService",
+                                   '',
+                                   wait_for_idrac=False)
+
+    async def list_system_settings(self):
+        """List the System configuration settings
+
+        :returns: a dictionary with the System settings using its name as the
+                  key. The attributes are either SystemEnumerableAttribute,
+                  SystemStringAttribute or SystemIntegerAttribute objects.
+        """
+        result = {}
+        for (namespace, attr_cls) in self._system_cfg.NAMESPACES:
+            doc = await self.client.enumerate(namespace)
+            result.update(self._system_cfg._parse_config(doc, attr_cls))
+        return result
+
+    async def list_jobs(self, only_unfinished=False):
+        """Returns a list of jobs from the job queue
+
+        :param only_unfinished: indicates whether only unfinished jobs should
+                                be returned
+        :returns: a list of Job objects
+        """
+        filter_query = None
+        if only_unfinished:
+            filter_query = job.UNFINISHED_JOBS_FILTER_QUERY
+
+        doc = await self.client.enumerate(uris.DCIM_LifecycleJob,
+                                          filter_query=filter_query)
+
+        return self._job_mgmt._parse_list_jobs(doc)
+
+    async def get_job(self, job_id):
+        """Returns a job from the job queue
+
+        :param job_id: id of the job
+        :returns: a Job object on successful query, None otherwise
+        """
+        doc = await self.client.enumerate(
+            uris.DCIM_LifecycleJob, filter_query=job.JOB_FILTER_QUERY % job_id)
+
+        return self._job_mgmt._parse_get_job(doc)
+
+    async def delete_jobs(self, job_ids=['JID_CLEARALL']):
+        """Deletes the given jobs, or all jobs if none specified
+
+        :param job_ids: a list of job ids to delete. Clearing all the jobs may
+                        be accomplished using the keyword JID_CLEARALL in the
+                        job_ids list, or by not passing a job_ids argument.
+        """
+        if job_ids is None:
+            return
+
+        messages = []
+
+        for job_id in job_ids:
+            properties = {'JobID': job_id}
+
+            try:
+                await self.client.invoke(
+                    uris.DCIM_JobService,
+                    'DeleteJobQueue',
+                    job.JOB_SERVICE_SELECTORS,
+                    properties,
+                    expected_return_value=utils.RET_SUCCESS)
+            except exceptions.DRACOperationFailed as dof:
+                for message in dof.args:
+                    messages.append(message + " " + job_id)
+
+        if len(messages):
+            raise exceptions.DRACOperationFailed(drac_messages=messages)
+
+    async def create_config_job(self,
+                                resource_uri,
+                                cim_creation_class_name,
+                                cim_name,
+                                target,
+                                cim_system_creation_class_name=(
+                                    'DCIM_ComputerSystem'),
+                                cim_system_name='DCIM:ComputerSystem',
+                                reboot=False,
+                                start_time='TIME_NOW',
+                                realtime=False,
+                                wait_for_idrac=True,
+                                method_name='CreateTargetedConfigJob'):
+        """Creates a configuration job
+
+        :param resource_uri: URI of resource to invoke
+        :param cim_creation_class_name: creation class name of the CIM object
+        :param cim_name: name of the CIM object
+        :param target: target device
+        :param cim_system_creation_class_name: creation class name of the
+                                               scoping system
+        :param cim_system_name: name of the scoping system
+        :param reboot: indicates whether a RebootJob should also be
+                       created or not
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss, the string 'TIME_NOW' which
+                           means execute immediately or None which means
+                           the job will not execute until
+                           schedule_job_execution is called
+        :param realtime: Indicates if reatime mode should be used.
+               Valid values are True and False.
+        :param wait_for_idrac: indicates whether or not to wait for the
+                               iDRAC to be ready to accept commands before
+                               issuing the command.
+        :param method_name: method of CIM object to invoke
+        :returns: id of the created job
+        """
+        selectors = {'SystemCreationClassName': cim_system_creation_class_name,
+                     'SystemName': cim_system_name,
+                     'CreationClassName': cim_creation_class_name,
+                     'Name': cim_name}
+
+        properties = self._job_mgmt._build_config_job_properties(
+            target, reboot, start_time, realtime)
+
+        doc = await self.client.invoke(resource_uri, method_name,
+                                       selectors, properties,
+                                       expected_return_value=utils.RET_CREATED,
+                                       wait_for_idrac=wait_for_idrac)
+
+        return self._job_mgmt._get_job_id(doc)
+
+    async def create_nic_config_job(
+            self,
+            nic_id,
+            reboot=False,
+            start_time='TIME_NOW'):
+        """Creates config job for applying pending changes to a NIC.
+
+        :param nic_id: id of the network interface controller (NIC)
+        :param reboot: indication of whether to also create a reboot job
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss; the string 'TIME_NOW' means
+                           immediately and None means unspecified
+        :returns: id of the created configuration job
+        """
+        return await self.create_config_job(
+            resource_uri=uris.DCIM_NICService,
+            cim_creation_class_name='DCIM_NICService',
+            cim_name='DCIM:NICService',
+            target=nic_id,
+            reboot=reboot,
+            start_time=start_time)
+
+    async def create_reboot_job(
+            self,
+            reboot_type=constants.RebootJobType.reboot_forced_shutdown):
+        """Creates a reboot job.
+
+        :param reboot_type: type of reboot
+        :returns: id of the created job
+        """
+        properties = {
+            'RebootJobType': self._job_mgmt._get_drac_reboot_type(
+                reboot_type)}
+
+        doc = await self.client.invoke(uris.DCIM_JobService,
+                                       'CreateRebootJob',
+                                       job.JOB_SERVICE_SELECTORS,
+                                       properties,
+                                       expected_return_value=utils.RET_CREATED)
+
+        return self._job_mgmt._get_job_id(doc)
+
+    async def schedule_job_execution(self, job_ids, start_time='TIME_NOW'):
+        """Schedules jobs for execution in a specified order.
+
+        :param job_ids: list of job identifiers
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss; the string 'TIME_NOW' means
+                           immediately
+        """
+        # If the list of job identifiers is empty, there is nothing to do.
+        if not job_ids:
+            return
+
+        properties = {'JobArray': job_ids,
+                      'StartTimeInterval': start_time}
+
+        await self.client.invoke(uris.DCIM_JobService,
+                                 'SetupJobQueue',
+                                 job.JOB_SERVICE_SELECTORS,
+                                 properties,
+                                 expected_return_value=utils.RET_SUCCESS)
+
+    async def delete_pending_config(
+            self, resource_uri, cim_creation_class_name, cim_name, target,
+            cim_system_creation_class_name='DCIM_ComputerSystem',
+            cim_system_name='DCIM:ComputerSystem'):
+        """Cancels pending configuration
+
+        :param resource_uri: URI of resource to invoke
+        :param cim_creation_class_name: creation class name of the CIM object
+        :param cim_name: name of the CIM object
+        :param target: target device
+        :param cim_system_creation_class_name: creation class name of the
+                                               scoping system
+        :param cim_system_name: name of the scoping system
+        """
+        selectors = {'SystemCreationClassName': cim_system_creation_class_name,
+                     'SystemName': cim_system_name,
+                     'CreationClassName': cim_creation_class_name,
+                     'Name': cim_name}
+
+        properties = {'Target': target}
+
+        await self.client.invoke(resource_uri, 'DeletePendingConfiguration',
+                                 selectors, properties,
+                                 expected_return_value=utils.RET_SUCCESS)
+
+    async def commit_pending_bios_changes(
+            self,
+            reboot=False,
+            start_time='TIME_NOW'):
+        """Applies all pending changes on the BIOS by creating a config job
+
+        :param reboot: indicates whether a RebootJob should also be
+                       created or not
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss, the string 'TIME_NOW' which
+                           means execute immediately or None which means
+                           the job will not execute until
+                           schedule_job_execution is called
+        :returns: id of the created job
+        """
+        return await self.create_config_job(
+            resource_uri=uris.DCIM_BIOSService,
+            cim_creation_class_name='DCIM_BIOSService',
+            cim_name='DCIM:BIOSService',
+            target=self.BIOS_DEVICE_FQDD,
+            reboot=reboot,
+            start_time=start_time)
+
+    async def abandon_pending_bios_changes(self):
+        """Deletes all pending changes on the BIOS"""
+        await self.delete_pending_config(
+            resource_uri=uris.DCIM_BIOSService,
+            cim_creation_class_name='DCIM_BIOSService',
+            cim_name='DCIM:BIOSService', target=self.BIOS_DEVICE_FQDD)
+
+    async def commit_pending_lifecycle_changes(
+            self,
+            reboot=False,
+            start_time='TIME_NOW'):
+        """Applies all pending changes on Lifecycle by creating a config job
+
+        :param reboot: indicates whether a RebootJob should also be
+                       created or not
+        :param start_time: start time for job execution in format
+                           yyyymmddhhmmss, the string 'TIME_NOW' which
+                           means execute immediately or None which means
+                           the job will not execute until
+                           schedule_job_execution is called
+        :returns: id of the created job
+        """
+        return await self.create_config_job(
+            resource_uri=uris.DCIM_LCService,
+            cim_creation_class_name='DCIM_LCService',
+            cim_name='DCIM:LCService',
+            target='',
+            reboot=reboot,
+            start_time=start_time,
+            wait_for_idrac=False,
+            method_name='CreateConfigJob')
+
+    async def get_lifecycle_controller_version(self):
+        """Returns the Lifecycle controller version
+
+        :returns: Lifecycle controller version as a tuple of integers
+        """
+        doc = await self.client.enumerate(uris.DCIM_SystemView,
+                                          wait_for_idrac=False)
+
+        return self._lifecycle_mgmt._parse_get_version(doc)
+
+    async def list_raid_controllers(self):
+        """Returns the list of RAID controllers
+
+        :returns: a list of RAIDController objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_ControllerView)
+
+        return self._raid_mgmt._parse_list_raid_controllers(doc)
+
+    async def list_raid_settings(self):
+        """List the RAID configuration settings
+
+        :returns: a dictionary with the RAID settings using InstanceID as the
+                  key. The attributes are either RAIDEnumerableAttribute,
+                  RAIDStringAttribute objects.
+        """
+        return await _list_settings(self.client, self._raid_mgmt.NAMESPACES,
+                                    by_name=False)
+
+    async def set_raid_settings(self, raid_fqdd, settings):
+        """Sets the RAID configuration
+
+        :param raid_fqdd: the FQDD of the RAID setting.
+        :param settings: a dictionary containing the proposed values, with
+                         each key being the name of attribute and the value
+                         being the proposed value.
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        return await _set_settings('RAID',
+                                   self.client,
+                                   self._raid_mgmt.NAMESPACES,
+                                   settings,
+                                   uris.DCIM_RAIDService,
+                                   "DCIM_RAIDService",
+                                   "DCIM:RAIDService",
+                                   raid_fqdd,
+                                   by_name=False)
+
+    async def list_virtual_disks(self):
+        """Returns the list of virtual disks
+
+        :returns: a list of VirtualDisk objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_VirtualDiskView)
+
+        return self._raid_mgmt._parse_list_virtual_disks(doc)
+
+    async def list_physical_disks(self):
+        """Returns the list of physical disks
+
+        :returns: a list of PhysicalDisk objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_PhysicalDiskView)
+
+        return self._raid_mgmt._parse_list_physical_disks(doc)
+
+    async def convert_physical_disks(self, raid_controller, physical_disks,
+                                     raid_enable=True):
+        """Changes the operational mode of physical disks.
+
+        :param raid_controller: the FQDD ID of the RAID controller
+        :param physical_disks: list of FQDD ID strings of the physical disks
+               to update
+        :param raid_enable: boolean flag, set to True if the disk is to
+               become part of the RAID.  The same flag is applied to all
+               listed disks
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        invocation = 'ConvertToRAID' if raid_enable else 'ConvertToNonRAID'
+
+        properties = {'PDArray': physical_disks}
+
+        doc = await self.client.invoke(uris.DCIM_RAIDService, invocation,
+                                       raid.RAID_SERVICE_SELECTORS,
+                                       properties,
+                                       expected_return_value=utils.RET_SUCCESS)
+
+        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
+                                       is_commit_required_value=True)
+
+    async def create_virtual_disk(self, raid_controller, physical_disks,
+                                  raid_level, size_mb, disk_name=None,
+                                  span_length=None, span_depth=None):
+        """Creates a virtual disk
+
+        :param raid_controller: id of the RAID controller
+        :param physical_disks: ids of the physical disks
+        :param raid_level: RAID level of the virtual disk
+        :param size_mb: size of the virtual disk in megabytes
+        :param disk_name: name of the virtual disk (optional)
+        :param span_length: number of disks per span (optional)
+        :param span_depth: number of spans in virtual disk (optional)
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        properties = self._raid_mgmt._build_virtual_disk_properties(
+            raid_controller, physical_disks, raid_level, size_mb, disk_name,
+            span_length, span_depth)
+
+        doc = await self.client.invoke(uris.DCIM_RAIDService,
+                                       'CreateVirtualDisk',
+                                       raid.RAID_SERVICE_SELECTORS,
+                                       properties,
+                                       expected_return_value=utils.RET_SUCCESS)
+
+        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
+                                       is_commit_required_value=True)
+
+    async def delete_virtual_disk(self, virtual_disk):
+        """Deletes a virtual disk
+
+        :param virtual_disk: id of the virtual disk
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        properties = {'Target': virtual_disk}
+
+        doc = await self.client.invoke(uris.DCIM_RAIDService,
+                                       'DeleteVirtualDisk',
+                                       raid.RAID_SERVICE_SELECTORS,
+                                       properties,
+                                       expected_return_value=utils.RET_SUCCESS)
+
+        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
+                                       is_commit_required_value=True)
+
+    async def reset_raid_config(self, raid_controller):
+        """Deletes all virtual disk and unassign all hotspares
+
+        :param raid_controller: id of the RAID controller
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        properties = {'Target': raid_controller}
+
+        doc = await self.client.invoke(uris.DCIM_RAIDService, 'ResetConfig',
+                                       raid.RAID_SERVICE_SELECTORS,
+                                       properties,
+                                       expected_return_value=utils.RET_SUCCESS)
+
+        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
+                                       is_commit_required_value=True)
+
+    async def clear_foreign_config(self, raid_controller):
+        """Frees up foreign drives
+
+        :param raid_controller: id of the RAID controller
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        properties = {'Target': raid_controller}
+
+        doc = await self.client.invoke(uris.DCIM_RAIDService,
+                                       'ClearForeignConfig',
+                                       raid.RAID_SERVICE_SELECTORS,
+                                       properties,
+                                       check_return_value=False)
+
+        return self._raid_mgmt._parse_clear_foreign_config(doc)
+
+    async def commit_pending_raid_changes(self, raid_controller, reboot=False,
+                                          start_time='TIME_NOW',
+                                          realtime=False):
+        """Applies all pending changes on a RAID controller
+
+        :param raid_controller: id of the RAID controller
+        :param reboot: indicates whether a RebootJob should also be
+                       created or not
+        :param start_time: start time for job execution in format
+               yyyymmddhhmmss, the string 'TIME_NOW' which
+               means execute immediately or None which means
+               the job will not execute until
+               schedule_job_execution is called
+        :param realtime: Indicates if reatime mode should be used.
+               Valid values are True and False.
+        :returns: id of the created job
+        """
+        return await self.create_config_job(
+            resource_uri=uris.DCIM_RAIDService,
+            cim_creation_class_name='DCIM_RAIDService',
+            cim_name='DCIM:RAIDService',
+            target=raid_controller,
+            reboot=reboot,
+            start_time=start_time,
+            realtime=realtime)
+
+    async def abandon_pending_raid_changes(self, raid_controller):
+        """Deletes all pending changes on a RAID controller
+
+        :param raid_controller: id of the RAID controller
+        """
+        await self.delete_pending_config(
+            resource_uri=uris.DCIM_RAIDService,
+            cim_creation_class_name='DCIM_RAIDService',
+            cim_name='DCIM:RAIDService', target=raid_controller)
+
+    async def is_realtime_supported(self, raid_controller):
+        """Find if controller supports realtime or not
+
+        :param raid_controller: ID of RAID controller
+        :returns: True or False
+        """
+        drac_raid_controllers = await self.list_raid_controllers()
+        realtime_controller = [cnt.id for cnt in drac_raid_controllers
+                               if cnt.supports_realtime]
+
+        return raid_controller in realtime_controller
+
+    async def is_jbod_capable(self, raid_controller_fqdd):
+        """Find out if raid controller supports jbod
+
+        :param raid_controller_fqdd: The raid controller's fqdd
+                                     being checked to see if it is jbod
+                                     capable.
+        :returns: a boolean
+        :raises: DRACRequestFailed if unable to find any disks in the Ready
+                 or non-RAID states
+        """
+        all_physical_disks = await self.list_physical_disks()
+        ready_disk = self._raid_mgmt._get_jbod_check_disk(raid_controller_fqdd,
+                                                          all_physical_disks)
+        is_jbod_capable = ready_disk is None
+
+        if not is_jbod_capable:
+            # Try moving a disk in the Ready state to JBOD mode and back, see
+            # RAIDManagement.is_jbod_capable
+            try:
+                await self.convert_physical_disks(raid_controller_fqdd,
+                                                  [ready_disk.id], False)
+                is_jbod_capable = True
+
+                await self.convert_physical_disks(raid_controller_fqdd,
+                                                  [ready_disk.id], True)
+            except exceptions.DRACOperationFailed as ex:
+                if constants.NOT_SUPPORTED_MSG not in str(ex):
+                    raise
+
+        return is_jbod_capable
+
+    async def is_raid_controller(self, raid_controller_fqdd,
+                                 raid_controllers=None):
+        """Find out if object's fqdd is for a raid controller or not
+
+        :param raid_controller_fqdd: The object's fqdd we are testing to see
+                                     if it is a raid controller or not.
+        :param raid_controllers: A list of RAIDControllers used to check for
+                                 the presence of BOSS cards.  If None, the
+                                 iDRAC will be queried for the list of
+                                 controllers.
+        :returns: boolean, True if the device is a RAID controller,
+                  False if not.
+        """
+        return raid_controller_fqdd.startswith('RAID.') or \
+            await self.is_boss_controller(raid_controller_fqdd,
+                                          raid_controllers)
+
+    async def is_boss_controller(self, raid_controller_fqdd,
+                                 raid_controllers=None):
+        """Find out if a RAID controller a BOSS card or not
+
+        :param raid_controller_fqdd: The object's fqdd we are testing to see
+                                     if it is a BOSS card or not.
+        :param raid_controllers: A list of RAIDController to scan for presence
+                                 of BOSS card, if None the drac will be queried
+                                 for the list of controllers which will then be
+                                 scanned.
+        :returns: boolean, True if the device is a BOSS card, False if not.
+        """
+        if raid_controllers is None:
+            raid_controllers = await self.list_raid_controllers()
+
+        return self._raid_mgmt.is_boss_controller(raid_controller_fqdd,
+                                                  raid_controllers)
+
+    async def change_physical_disk_state(
+            self, mode, controllers_to_physical_disk_ids=None):
+        """Convert disks RAID status
+
+        :param mode: constants.RaidStatus enumeration that indicates the mode
+                     to change the disks to.
+        :param controllers_to_physical_disk_ids: Dictionary of controllers and
+               corresponding disk ids to convert to the requested mode.
+        :returns: a dictionary containing conversion_results, a dictionary
+                  that maps controller ids to the conversion results for that
+                  controller.
+        """
+        physical_disks = await self.list_physical_disks()
+
+        if not controllers_to_physical_disk_ids:
+            all_controllers = await self.list_raid_controllers()
+            controllers_to_physical_disk_ids = (
+                self._raid_mgmt._get_controllers_to_physical_disk_ids(
+                    physical_disks, all_controllers))
+
+        final_ctls_to_phys_disk_ids = self._raid_mgmt._check_disks_status(
+            mode, physical_disks, controllers_to_physical_disk_ids)
+
+        controllers_to_results = {}
+        for controller, physical_disk_ids \
+                in final_ctls_to_phys_disk_ids.items():
+            if not physical_disk_ids:
+                controllers_to_results[controller] = \
+                    self._raid_mgmt._build_unconverted_return_dict()
+                continue
+
+            LOG.debug("Converting the following disks to %s on RAID "
+                      "controller %s: %s", mode, controller,
+                      physical_disk_ids)
+            try:
+                controllers_to_results[controller] = \
+                    await self.convert_physical_disks(
+                        controller, physical_disk_ids,
+                        mode == constants.RaidStatus.raid)
+            except exceptions.DRACOperationFailed as ex:
+                if constants.NOT_SUPPORTED_MSG not in str(ex):
+                    raise
+
+                LOG.debug("Controller %s does not support JBOD mode",
+                          controller)
+                controllers_to_results[controller] = \
+                    self._raid_mgmt._build_unconverted_return_dict()
+
+        return {'conversion_results': controllers_to_results}
+
+    async def list_cpus(self):
+        """Returns the list of CPUs
+
+        :returns: a list of CPU objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_CPUView)
+
+        return self._inventory_mgmt._parse_list_cpus(doc)
+
+    async def list_memory(self):
+        """Returns a list of memory modules
+
+        :returns: a list of Memory objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_MemoryView)
+
+        return self._inventory_mgmt._parse_list_memory(doc)
+
+    async def list_nics(self, sort=False):
+        """Returns the list of NICs
+
+        :param sort: indicates whether the NICs should be sorted by id
+        :returns: a list of NIC objects
+        """
+        doc = await self.client.enumerate(uris.DCIM_NICView)
+
+        return self._inventory_mgmt._parse_list_nics(doc, sort)
+
+    async def list_nic_settings(self, nic_id, lazy=False):
+        """Return the list of attribute settings of a NIC.
+
+        :param nic_id: id of the network interface controller (NIC)
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
+        :returns: dictionary containing the NIC settings. The keys are
+                  attribute names. Each value is a
+                  NICEnumerationAttribute, NICIntegerAttribute, or
+                  NICStringAttribute object.
+        """
+        return await _list_settings(self.client, self._nic_cfg.NAMESPACES,
+                                    fqdd_filter=nic_id, lazy=lazy)
+
+    async def set_nic_settings(self, nic_id, settings):
+        """Modify one or more settings of a NIC.
+
+        :param nic_id: id of the network interface controller (NIC)
+        :param settings: dictionary containing the proposed values, with
+                         each key being the name of an attribute and the
+                         value being the proposed value
+        :returns: a dictionary containing the is_commit_required and
+                  is_reboot_required keys
+        """
+        return await _set_settings('iDRAC Card',
+                                   self.client,
+                                   self._nic_cfg.NAMESPACES,
+                                   settings,
+                                   uris.DCIM_NICService,
+                                   "DCIM_NICService",
+                                   "DCIM:NICService",
+                                   nic_id)
+
+    async def get_system(self):
+        """Returns a System object
+
+        :returns: a System object
+        """
+        doc = await self.client.enumerate(uris.DCIM_SystemView)
+
+        return self._inventory_mgmt._parse_get_system(doc)
+
+    async def is_idrac_ready(self):
+        """Indicates if the iDRAC is ready to accept commands
+
+        :returns: Boolean indicating iDRAC readiness
+        """
+        return await self.client.is_idrac_ready()
+
+    async def wait_until_idrac_is_ready(self, retries=None, retry_delay=None):
+        """Waits until the iDRAC is in a ready state
+
+        :param retries: The number of times to check if the iDRAC is
+                        ready. If None, the value of ready_retries that
+                        was provided when the object was created is
+                        used.
+        :param retry_delay: The number of seconds to wait between
+                            retries. If None, the value of
+                            ready_retry_delay that was provided when the
+                            object was created is used.
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface or timeout
+        """
+        await self.client.wait_until_idrac_is_ready(retries, retry_delay)
+
+
+class AsyncWSManClient(aiowsman.Client):
+    """Wrapper for aiowsman.Client that can wait until iDRAC is ready
+
+       Additionally, the Invoke operation offers return value checking.
+    """
+
+    def __init__(
+            self, host, username, password, port=443, path='/wsman',
+            protocol='https',
+            ssl_retries=constants.DEFAULT_WSMAN_SSL_ERROR_RETRIES,
+            ssl_retry_delay=constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC,
+            ready_retries=constants.DEFAULT_IDRAC_IS_READY_RETRIES,
+            ready_retry_delay=(
+                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC),
+            pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+            idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+            transport=None,
+            connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+            read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC):
+        """Creates client object
+
+        :param host: hostname or IP of the DRAC interface
+        :param username: username for accessing the DRAC interface
+        :param password: password for accessing the DRAC interface
+        :param port: port for accessing the DRAC interface
+        :param path: path for accessing the DRAC interface
+        :param protocol: protocol for accessing the DRAC interface
+        :param ssl_retries: number of resends to attempt on SSL failures
+        :param ssl_retry_delay: number of seconds to wait between
+                                retries on SSL failures
+        :param ready_retries: number of times to check if the iDRAC is
+                              ready
+        :param ready_retry_delay: number of seconds to wait between
+                                  checks if the iDRAC is ready
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded
+        :param transport: an aiowsman.Transport compatible object used to
+                          send the requests
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for each read of the
+                             response of the DRAC interface. If None, waits
+                             forever.
+        """
+        super(AsyncWSManClient, self).__init__(host, username, password,
+                                               port, path, protocol,
+                                               ssl_retries, ssl_retry_delay,
+                                               pool_size, idle_timeout,
+                                               transport, connect_timeout,
+                                               read_timeout)
+
+        self._ready_retries = ready_retries
+        self._ready_retry_delay = ready_retry_delay
+
+    async def enumerate(self, resource_uri, optimization=True, max_elems=100,
+                        auto_pull=True, filter_query=None,
+                        filter_dialect='cql', wait_for_idrac=True):
+        """Executes enumerate operation over WS-Man
+
+        :param resource_uri: URI of resource to enumerate
+        :param optimization: flag to enable enumeration optimization. If
+                             disabled, the enumeration returns only an
+                             enumeration context.
+        :param max_elems: maximum number of elements returned by the operation
+        :param auto_pull: flag to enable automatic pull on the enumeration
+                          context, merging the items returned
+        :param filter_query: filter query string
+        :param filter_dialect: filter dialect. Valid options are: 'cql' and
+                               'wql'.
+        :param wait_for_idrac: indicates whether or not to wait for the
+            iDRAC to be ready to accept commands before issuing the
+            command
+        :returns: an lxml.etree.Element object of the response received
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+        if wait_for_idrac:
+            await self.wait_until_idrac_is_ready()
+
+        return await super(AsyncWSManClient, self).enumerate(
+            resource_uri, optimization, max_elems, auto_pull, filter_query,
+            filter_dialect)
+
+    async def invoke(self,
+                     resource_uri,
+                     method,
+                     selectors=None,
+                     properties=None,
+                     expected_return_value=None,
+                     wait_for_idrac=True,
+                     check_return_value=True):
+        """Invokes a remote WS-Man method
+
+        :param resource_uri: URI of the resource
+        :param method: name of the method to invoke
+        :param selectors: dictionary of selectors
+        :param properties: dictionary of properties
+        :param expected_return_value: expected return value reported back by
+            the DRAC card. For return value codes check the profile
+            documentation of the resource used in the method call. If not set,
+            return value checking is skipped.
+        :param wait_for_idrac: indicates whether or not to wait for the
+            iDRAC to be ready to accept commands before issuing the
+            command
+        :param check_return_value: indicates if the ReturnValue should be
+            checked and an exception thrown on an unexpected value
+        :returns: an lxml.etree.Element object of the response received
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        :raises: DRACUnexpectedReturnValue on return value mismatch
+        """
+        if wait_for_idrac:
+            await self.wait_until_idrac_is_ready()
+
+        if selectors is None:
+            selectors = {}
+
+        if properties is None:
+            properties = {}
+
+        resp = await super(AsyncWSManClient, self).invoke(
+            resource_uri, method, selectors, properties)
+
+        if check_return_value:
+            client._check_return_value(resp, resource_uri,
+                                       expected_return_value)
+
+        return resp
+
+    async def is_idrac_ready(self):
+        """Indicates if the iDRAC is ready to accept commands
+
+           Returns a boolean indicating if the iDRAC is ready to accept
+           commands.
+
+        :returns: Boolean indicating iDRAC readiness
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        :raises: DRACUnexpectedReturnValue on return value mismatch
+        """
+
+        result = await self.invoke(uris.DCIM_LCService,
+                                   'GetRemoteServicesAPIStatus',
+                                   client.LC_SERVICE_SELECTORS,
+                                   {},
+                                   expected_return_value=utils.RET_SUCCESS,
+                                   wait_for_idrac=False)
+
+        return client._is_idrac_ready(result)
+
+    async def wait_until_idrac_is_ready(self, retries=None, retry_delay=None):
+        """Waits until the iDRAC is in a ready state
+
+        :param retries: The number of times to check if the iDRAC is
+                        ready. If None, the value of ready_retries that
+                        was provided when the object was created is
+                        used.
+        :param retry_delay: The number of seconds to wait between
+                            retries. If None, the value of
+                            ready_retry_delay that was provided when the
+                            object was created is used.
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface or timeout
+        :raises: DRACUnexpectedReturnValue on return value mismatch
+        """
+
+        if retries is None:
+            retries = self._ready_retries
+
+        if retry_delay is None:
+            retry_delay = self._ready_retry_delay
+
+        while retries > 0:
+            LOG.debug("Checking to see if the iDRAC is ready")
+
+            if await self.is_idrac_ready():
+                LOG.debug("The iDRAC is ready")
+                return
+
+            LOG.debug("The iDRAC is not ready")
+            retries -= 1
+            if retries > 0:
+                await asyncio.sleep(retry_delay)
+
+        err_msg = "Timed out waiting for the iDRAC to become ready"
+        LOG.error(err_msg)
+        raise exceptions.DRACOperationFailed(drac_messages=err_msg)
+
+
+async def _list_settings(client, namespaces, by_name=True, fqdd_filter=None,
+                         name_formatter=None, wait_for_idrac=True,
+                         lazy=False):
+    """Awaitable counterpart of utils.list_settings"""
+    result = utils.LazySettings() if lazy else {}
+    for (namespace, attr_cls) in namespaces:
+        doc = await client.enumerate(namespace,
+                                     wait_for_idrac=wait_for_idrac)
+        attribs = utils._parse_config(doc, attr_cls, by_name, fqdd_filter,
+                                      name_formatter, lazy)
+        utils._merge_settings(result, attribs)
+    return result
+
+
+async def _set_settings(settings_type, client, namespaces, new_settings,
+                        resource_uri, cim_creation_class_name, cim_name,
+                        target, name_formatter=None, wait_for_idrac=True,
+                        by_name=True):
+    """Awaitable counterpart of utils.set_settings"""
+    current_settings = await _list_settings(client, namespaces,
+                                            by_name=by_name,
+                                            name_formatter=name_formatter,
+                                            wait_for_idrac=wait_for_idrac,
+                                            lazy=True)
+
+    properties = utils._build_set_attributes_properties(
+        settings_type, current_settings, new_settings, target)
+    if properties is None:
+        return utils.build_return_dict(
+            None,
+            resource_uri,
+            is_commit_required_value=False,
+            is_reboot_required_value=constants.RebootRequired.false)
+
+    selectors = utils._build_set_attributes_selectors(cim_creation_class_name,
+                                                      cim_name)
+    doc = await client.invoke(resource_uri, 'SetAttributes',
+                              selectors, properties,
+                              wait_for_idrac=wait_for_idrac)
+
+    return utils.build_return_dict(doc, resource_uri)
@@ -0,0 +1,538 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+asyncio counterpart of the wsman module.
+
+The requests are sent over a small keep-alive HTTP/1.1 transport built on
+asyncio streams, so a single event loop can talk to many DRAC interfaces at
+once without a thread per request. The transport only speaks the subset of
+HTTP/1.1 the DRAC interfaces answer POST requests with, and rejects the
+responses it cannot parse or whose headers or body exceed its limits.
+"""
+
+import asyncio
+import base64
+import collections
+import logging
+import ssl
+import time
+
+from lxml import etree as ElementTree
+
+from dracclient import constants
+from dracclient import exceptions
+from dracclient import wsman
+
+LOG = logging.getLogger(__name__)
+
+_Connection = collections.namedtuple('_Connection',
+                                     ['reader', 'writer', 'last_used'])
+
+
+class HTTPResponseError(OSError):
+    """Malformed or oversized HTTP response received by Transport"""
+
+
+class Response(object):
+    """HTTP response received by Transport"""
+
+    def __init__(self, status_code, reason, headers, content):
+        """Creates Response object
+
+        :param status_code: HTTP status code
+        :param reason: HTTP reason phrase
+        :param headers: dictionary of headers with lowercase names
+        :param content: body of the response as bytes
+        """
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+
+class Transport(object):
+    """Keep-alive HTTP/1.1 transport over asyncio streams"""
+
+    def __init__(self, host, port, protocol='https',
+                 pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+                 idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+                 connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+                 read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC,
+                 max_header_size=constants.DEFAULT_WSMAN_MAX_HEADER_SIZE,
+                 max_response_size=constants.DEFAULT_WSMAN_MAX_RESPONSE_SIZE):
+        """Creates Transport object
+
+        :param host: hostname or IP of the DRAC interface
+        :param port: port for accessing the DRAC interface
+        :param protocol: protocol for accessing the DRAC interface
+        :param pool_size: maximum number of connections opened to the DRAC
+                          interface at once
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded. If None, idle
+                             connections are never discarded.
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for each read of the
+                             response of the DRAC interface. If None, waits
+                             forever.
+        :param max_header_size: maximum number of bytes of the status line
+                                and headers of a response
+        :param max_response_size: maximum number of bytes of the body of a
+                                  response
+        """
+        self.host = host
+        self.port = int(port)
+        self.protocol = protocol
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_header_size = max_header_size
+        self.max_response_size = max_response_size
+
+        self._ssl_context = None
+        if protocol == 'https':
+            # TODO(ifarkas): enable cert verification
+            self._ssl_context = ssl.create_default_context()
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        self._idle = collections.deque()
+        # created on first use so that it is bound to the running loop
+        self._slots = None
+
+    async def post(self, path, body, headers):
+        """Sends a POST request
+
+        A connection that was closed by the DRAC interface while sitting in
+        the pool is replaced by a new one transparently.
+
+        :param path: path of the request
+        :param body: body of the request as bytes
+        :param headers: dictionary of headers
+        :returns: a Response object
+        :raises: OSError, ssl.SSLError or asyncio.IncompleteReadError on
+                 transport failures, TimeoutError when the DRAC interface
+                 does not accept the connection or answer in time,
+                 HTTPResponseError when the response is malformed or
+                 exceeds the size limits
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+
+        request = self._build_request(path, body, headers)
+
+        async with self._slots:
+            conn = self._get_idle_connection()
+            if conn is not None:
+                try:
+                    return await self._send(conn, request)
+                except TimeoutError:
+                    # the DRAC interface is slow, not the connection stale
+                    raise
+                except (OSError, asyncio.IncompleteReadError):
+                    LOG.debug('Pooled connection to %s was closed, '
+                              'reconnecting', self.host)
+
+            conn = await self._connect()
+            return await self._send(conn, request)
+
+    async def close(self):
+        """Closes the idle connections of the pool"""
+        while self._idle:
+            self._close_connection(self._idle.pop())
+
+    def _get_idle_connection(self):
+        now = time.monotonic()
+        while self._idle:
+            conn = self._idle.pop()
+            if (self.idle_timeout is not None
+                    and now - conn.last_used > self.idle_timeout):
+                self._close_connection(conn)
+                continue
+
+            if conn.reader.at_eof():
+                self._close_connection(conn)
+                continue
+
+            return conn
+
+    async def _connect(self):
+        reader, writer = await self._wait_for(
+            asyncio.open_connection(self.host, self.port,
+                                    ssl=self._ssl_context),
+            self.connect_timeout, 'connecting to')
+
+        return _Connection(reader, writer, None)
+
+    async def _read(self, awaitable):
+        return await self._wait_for(awaitable, self.read_timeout,
+                                    'reading from')
+
+    async def _wait_for(self, awaitable, timeout, action):
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            # a subclass of OSError, like the other transport failures
+            raise TimeoutError('Timed out %(action)s %(host)s after '
+                               '%(timeout)s seconds' %
+                               {'action': action, 'host': self.host,
+                                'timeout': timeout})
+
+    def _close_connection(self, conn):
+        conn.writer.close()
+
+    def _build_request(self, path, body, headers):
+        lines = ['POST %s HTTP/1.1' % path,
+                 'Host: %s:%s' % (self.host, self.port),
+                 'Content-Length: %d' % len(body),
+                 'Connection: keep-alive']
+        lines.extend('%s: %s' % (name, value)
+                     for (name, value) in headers.items())
+
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    async def _send(self, conn, request):
+        try:
+            conn.writer.write(request)
+            await conn.writer.drain()
+            resp, keep_alive = await self._read_response(conn.reader)
+        except BaseException:
+            self._close_connection(conn)
+            raise
+
+        if keep_alive:
+            self._idle.append(conn._replace(last_used=time.monotonic()))
+        else:
+            self._close_connection(conn)
+
+        return resp
+
+    async def _read_response(self, reader):
+        while True:
+            version, status_code, reason = await self._read_status(reader)
+            headers = await self._read_headers(reader)
+            # interim responses, such as 100 Continue, precede the final one
+            if not 100 <= status_code < 200:
+                break
+
+        keep_alive = (version == 'HTTP/1.1'
+                      and headers.get('connection', '').lower() != 'close')
+
+        if status_code in (204, 304):
+            content = b''
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            content = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            length = headers['content-length']
+            if not length.isdigit():
+                raise self._invalid('invalid Content-Length %r' % length)
+            self._check_size(int(length))
+            content = await self._read(reader.readexactly(int(length)))
+        else:
+            # the body ends when the DRAC interface closes the connection
+            content = await self._read_until_eof(reader)
+            keep_alive = False
+
+        return (Response(status_code, reason, headers, content),
+                keep_alive)
+
+    async def _read_status(self, reader):
+        status_line = await self._read_line(reader)
+        parts = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        if (len(parts) < 2 or not parts[0].startswith('HTTP/')
+                or len(parts[1]) != 3 or not parts[1].isdigit()):
+            raise self._invalid('malformed status line %r' % status_line)
+
+        version, status_code, reason = (parts + [''])[:3]
+        return version, int(status_code), reason
+
+    async def _read_headers(self, reader):
+        headers = {}
+        size = 0
+        while True:
+            line = await self._read_line(reader)
+            size += len(line)
+            if size > self.max_header_size:
+                raise self._invalid('headers exceed %d bytes' %
+                                    self.max_header_size)
+            if line in (b'\r\n', b'\n'):
+                return headers
+
+            name, sep, value = line.decode('latin-1').partition(':')
+            if not sep or not name.strip() or name[0] in ' \t':
+                raise self._invalid('malformed header line %r' % line)
+
+            headers[name.strip().lower()] = value.strip()
+
+    async def _read_line(self, reader):
+        try:
+            line = await self._read(reader.readline())
+        except ValueError:
+            # the line does not fit in the buffer of the stream
+            raise self._invalid('line exceeds %d bytes' %
+                                self.max_header_size)
+
+        if not line.endswith(b'\n'):
+            raise asyncio.IncompleteReadError(line, None)
+
+        return line
+
+    async def _read_chunked(self, reader):
+        chunks = []
+        size = 0
+        while True:
+            size_line = await self._read_line(reader)
+            try:
+                chunk_size = int(size_line.split(b';', 1)[0].strip(), 16)
+            except ValueError:
+                chunk_size = -1
+            if chunk_size < 0:
+                raise self._invalid('malformed chunk size %r' % size_line)
+
+            if chunk_size == 0:
+                # skip trailers
+                await self._read_headers(reader)
+                break
+
+            size += chunk_size
+            self._check_size(size)
+            chunks.append(await self._read(reader.readexactly(chunk_size)))
+            if await self._read(reader.readexactly(2)) != b'\r\n':
+                raise self._invalid('chunk not terminated by CRLF')
+
+        return b''.join(chunks)
+
+    async def _read_until_eof(self, reader):
+        chunks = []
+        size = 0
+        while True:
+            data = await self._read(reader.read(64 * 1024))
+            if not data:
+                return b''.join(chunks)
+
+            size += len(data)
+            self._check_size(size)
+            chunks.append(data)
+
+    def _check_size(self, size):
+        if size > self.max_response_size:
+            raise self._invalid('body exceeds %d bytes' %
+                                self.max_response_size)
+
+    def _invalid(self, reason):
+        return HTTPResponseError('Invalid response from %(host)s: %(reason)s'
+                                 % {'host': self.host, 'reason': reason})
+
+
+class Client(object):
+    """Simple asyncio client for talking over WSMan protocol."""
+
+    def __init__(self, host, username, password, port=443, path='/wsman',
+                 protocol='https',
+                 ssl_retries=constants.DEFAULT_WSMAN_SSL_ERROR_RETRIES,
+                 ssl_retry_delay=(
+                     constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC),
+                 pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+                 idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+                 transport=None,
+                 connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+                 read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC):
+        """Creates client object
+
+        :param host: hostname or IP of the DRAC interface
+        :param username: username for accessing the DRAC interface
+        :param password: password for accessing the DRAC interface
+        :param port: port for accessing the DRAC interface
+        :param path: path for accessing the DRAC interface
+        :param protocol: protocol for accessing the DRAC interface
+        :param ssl_retries: number of resends to attempt on SSL failures
+        :param ssl_retry_delay: number of seconds to wait between
+                                retries on SSL failures
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded
+        :param transport: a Transport compatible object used to send the
+                          requests. If None, one is created for the client.
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever. Ignored if transport is given.
+        :param read_timeout: number of seconds to wait for each read of the
+                             response of the DRAC interface. If None, waits
+                             forever. Ignored if transport is given.
+        """
+
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.path = path
+        self.protocol = protocol
+        self.ssl_retries = ssl_retries
+        self.ssl_retry_delay = ssl_retry_delay
+        self.endpoint = ('%(protocol)s://%(host)s:%(port)s%(path)s' % {
+            'protocol': self.protocol,
+            'host': self.host,
+            'port': self.port,
+            'path': self.path})
+
+        if transport is None:
+            transport = Transport(host, port, protocol, pool_size,
+                                  idle_timeout, connect_timeout,
+                                  read_timeout)
+        self.transport = transport
+
+        credentials = ('%s:%s' % (username, password)).encode('utf-8')
+        self._headers = {
+            'Authorization': 'Basic %s' % (
+                base64.b64encode(credentials).decode('ascii')),
+            'Content-Type': 'application/soap+xml;charset=UTF-8'}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the connections kept open to the DRAC interface"""
+        await self.transport.close()
+
+    async def _do_request(self, payload):
+        payload = payload.build()
+        LOG.debug('Sending request to %(endpoint)s: %(payload)s',
+                  {'endpoint': self.endpoint, 'payload': payload})
+
+        num_tries = 1
+        while num_tries <= self.ssl_retries:
+            try:
+                resp = await self.transport.post(self.path, payload,
+                                                 self._headers)
+                break
+            except (OSError, asyncio.IncompleteReadError) as ex:
+
+                error_msg = "A {error_type} error occurred while " \
+                    " communicating with {host}, attempt {num_tries} of " \
+                    "{retries}".format(
+                        error_type=type(ex).__name__,
+                        host=self.host,
+                        num_tries=num_tries,
+                        retries=self.ssl_retries)
+
+                if num_tries == self.ssl_retries:
+                    LOG.error(error_msg)
+                    raise exceptions.WSManRequestFailure(
+                        "A {error_type} error occurred while communicating "
+                        "with {host}: {error}".format(
+                            error_type=type(ex).__name__,
+                            host=self.host,
+                            error=ex))
+                else:
+                    LOG.warning(error_msg)
+
+                num_tries += 1
+                if self.ssl_retry_delay > 0 and num_tries <= self.ssl_retries:
+                    await asyncio.sleep(self.ssl_retry_delay)
+
+        LOG.debug('Received response from %(endpoint)s: %(payload)s',
+                  {'endpoint': self.endpoint, 'payload': resp.content})
+        if not resp.ok:
+            raise exceptions.WSManInvalidResponse(
+                status_code=resp.status_code,
+                reason=resp.reason)
+        else:
+            return resp
+
+    async def enumerate(self, resource_uri, optimization=True, max_elems=100,
+                        auto_pull=True, filter_query=None,
+                        filter_dialect='cql'):
+        """Executes enumerate operation over WSMan.
+
+        :param resource_uri: URI of resource to enumerate.
+        :param optimization: flag to enable enumeration optimization. If
+                             disabled, the enumeration returns only an
+                             enumeration context.
+        :param max_elems: maximum number of elements returned by the operation.
+        :param auto_pull: flag to enable automatic pull on the enumeration
+                          context, merging the items returned.
+        :param filter_query: filter query string.
+        :param filter_dialect: filter dialect. Valid options are: 'cql' and
+                               'wql'.
+        :returns: an lxml.etree.Element object of the response received.
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+
+        payload = wsman._EnumeratePayload(self.endpoint, resource_uri,
+                                          optimization, max_elems,
+                                          filter_query, filter_dialect)
+
+        resp = await self._do_request(payload)
+        resp_xml = wsman._parse_enumerate_response(resp.content)
+
+        if auto_pull:
+            items_xml = wsman._find_enumerate_items(resp_xml)
+
+            context = wsman._enum_context(resp_xml)
+            while context is not None:
+                pull_resp_xml = await self.pull(resource_uri, context,
+                                                max_elems)
+                context = wsman._enum_context(pull_resp_xml)
+
+                wsman._merge_pulled_items(items_xml, pull_resp_xml)
+
+            wsman._remove_enum_context(resp_xml)
+
+        return resp_xml
+
+    async def pull(self, resource_uri, context, max_elems=100):
+        """Executes pull operation over WSMan.
+
+        :param resource_uri: URI of resource to pull
+        :param context: enumeration context
+        :param max_elems: maximum number of elements returned by the operation
+        :returns: an lxml.etree.Element object of the response received
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+
+        payload = wsman._PullPayload(self.endpoint, resource_uri, context,
+                                     max_elems)
+        resp = await self._do_request(payload)
+
+        return ElementTree.fromstring(resp.content)
+
+    async def invoke(self, resource_uri, method, selectors, properties):
+        """Executes invoke operation over WSMan.
+
+        :param resource_uri: URI of resource to invoke
+        :param method: name of the method to invoke
+        :param selector: dict of selectors
+        :param properties: dict of properties
+        :returns: an lxml.etree.Element object of the response received.
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+
+        payload = wsman._InvokePayload(self.endpoint, resource_uri, method,
+                                       selectors, properties)
+        resp = await self._do_request(payload)
+
+        return ElementTree.fromstring(resp.content)
@@ -0,0 +1,224 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Per-host circuit breakers failing requests fast to unreachable DRAC cards.
+"""
+
+import logging
+import threading
+import time
+
+from dracclient import constants
+
+LOG = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_shared_registry = None
+_shared_registry_lock = threading.Lock()
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of a single DRAC interface
+
+    The circuit opens after failure_threshold consecutive failed requests.
+    While it is open, requests are rejected without being sent. Once
+    reset_timeout seconds have passed, it becomes half-open and lets a
+    single trial request through: the circuit closes if it succeeds and
+    opens again if it fails.
+    """
+
+    def __init__(
+            self,
+            failure_threshold=(
+                constants.DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD),
+            reset_timeout=constants.DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT_SEC):
+        """Creates CircuitBreaker object
+
+        :param failure_threshold: number of consecutive failed requests
+                                  opening the circuit
+        :param reset_timeout: number of seconds the circuit stays open before
+                              a trial request is let through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self):
+        """State of the circuit: CLOSED, OPEN or HALF_OPEN"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if (self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout):
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+
+        return self._state
+
+    def retry_after(self):
+        """Returns the number of seconds until a trial request is allowed"""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0
+
+            return max(self._opened_at + self.reset_timeout - time.monotonic(),
+                       0)
+
+    def allow_request(self):
+        """Indicates if a request may be sent
+
+        In the half-open state, only the first caller is allowed until the
+        outcome of its request is recorded.
+
+        :returns: a boolean
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            return False
+
+    def record_success(self):
+        """Records a request answered by the DRAC interface"""
+        with self._lock:
+            if self._state != CLOSED:
+                LOG.info('Circuit breaker closed after a successful request')
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release(self):
+        """Records a request abandoned without an outcome for the DRAC
+
+        Neither a success nor a failure is recorded, a trial request of the
+        half-open state is given back to the next caller.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Records a request the DRAC interface did not answer"""
+        with self._lock:
+            self._failures += 1
+            if (self._state == HALF_OPEN
+                    or self._failures >= self.failure_threshold):
+                if self._state != OPEN:
+                    LOG.warning('Circuit breaker opened after %d consecutive '
+                                'failed requests', self._failures)
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class CircuitBreakerRegistry(object):
+    """Circuit breakers of many DRAC interfaces, keyed by host"""
+
+    def __init__(
+            self,
+            failure_threshold=(
+                constants.DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD),
+            reset_timeout=constants.DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT_SEC):
+        """Creates CircuitBreakerRegistry object
+
+        :param failure_threshold: number of consecutive failed requests
+                                  opening the circuit of a host
+        :param reset_timeout: number of seconds the circuit of a host stays
+                              open before a trial request is let through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def get(self, host):
+        """Returns the circuit breaker of a DRAC interface
+
+        :param host: hostname or IP of the DRAC interface
+        :returns: a CircuitBreaker object
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold,
+                                         self.reset_timeout)
+                self._breakers[host] = breaker
+
+            return breaker
+
+    def state(self, host):
+        """Returns the state of the circuit of a DRAC interface
+
+        :param host: hostname or IP of the DRAC interface
+        :returns: CLOSED, OPEN or HALF_OPEN. Hosts never contacted are
+                  CLOSED.
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+
+        if breaker is None:
+            return CLOSED
+
+        return breaker.state
+
+    def states(self):
+        """Returns the state of the circuit of every known DRAC interface
+
+        :returns: a dictionary with the state of each host, keyed by host
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+
+        return {host: breaker.state for host, breaker in breakers.items()}
+
+    def reset(self, host=None):
+        """Forgets the failures of a DRAC interface, closing its circuit
+
+        :param host: hostname or IP of the DRAC interface. If None, the
+                     circuits of all hosts are reset.
+        """
+        with self._lock:
+            if host is None:
+                self._breakers.clear()
+            else:
+                self._breakers.pop(host, None)
+
+
+def get_shared_registry():
+    """Returns the CircuitBreakerRegistry shared by the whole process
+
+    :returns: a CircuitBreakerRegistry object
+    """
+    global _shared_registry
+
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = CircuitBreakerRegistry()
+
+        return _shared_registry
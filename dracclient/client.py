@@ -16,7 +16,7 @@ Wrapper for pywsman.Client
 """
 
 import logging
-import subprocess
+import threading
 import time
 
 from dracclient import constants
@@ -30,11 +30,18 @@ from dracclient.resources import nic
 from dracclient.resources import raid
 from dracclient.resources import system
 from dracclient.resources import uris
+from dracclient import probe
+from dracclient import reset
+from dracclient import retry
+from dracclient import scheduler
+from dracclient import singleflight
 from dracclient import utils
 from dracclient import wsman
 
 IDRAC_IS_READY = "0"
 
+LC_SERVICE_SELECTORS = lifecycle_controller.LC_SERVICE_SELECTORS
+
 LOG = logging.getLogger(__name__)
 
 
@@ -51,7 +58,17 @@ class DRACClient(object):
             ssl_retry_delay=constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC,
             ready_retries=constants.DEFAULT_IDRAC_IS_READY_RETRIES,
             ready_retry_delay=(
-                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC)):
+                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC),
+            pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+            idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+            session_pool=None,
+            ready_ttl=constants.DEFAULT_IDRAC_IS_READY_TTL_SEC,
+            retry_policy=None, ready_retry_policy=None,
+            circuit_breakers=None,
+            connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+            read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC,
+            liveness_probe=None, poll_scheduler=None,
+            job_retention_policy=None):
         """Creates client object
 
         :param host: hostname or IP of the DRAC interface
@@ -67,11 +84,57 @@ class DRACClient(object):
                               ready
         :param ready_retry_delay: number of seconds to wait between
                                   checks if the iDRAC is ready
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded
+        :param session_pool: a pool.SessionPool shared with other clients to
+                             borrow connections from, such as
+                             pool.get_shared_pool()
+        :param ready_ttl: number of seconds a ready answer of the iDRAC is
+                          trusted before it is checked again. If 0, the
+                          iDRAC is checked before every command.
+        :param retry_policy: a retry.RetryPolicy deciding how failed requests
+                             are retried. Takes precedence over ssl_retries
+                             and ssl_retry_delay.
+        :param ready_retry_policy: a retry.RetryPolicy deciding how often
+                                   the iDRAC is checked while waiting for it
+                                   to become ready. Takes precedence over
+                                   ready_retries and ready_retry_delay.
+        :param circuit_breakers: a breaker.CircuitBreakerRegistry shared with
+                                 other clients, such as
+                                 breaker.get_shared_registry(). Requests
+                                 fail fast with WSManCircuitOpen while the
+                                 circuit of the DRAC interface is open.
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for the DRAC interface
+                             to send a response. If None, waits forever.
+        :param liveness_probe: a probe.LivenessProbe checking if the DRAC
+                               interface is up while it is reset
+        :param poll_scheduler: a scheduler.PollScheduler running the checks
+                               made while waiting for the DRAC interface.
+                               Defaults to
+                               scheduler.get_shared_scheduler().
+        :param job_retention_policy: a job.JobRetentionPolicy applied to the
+                                     job queue after each config job is
+                                     created. If None, the job queue is only
+                                     pruned by calling prune_jobs.
         """
         self.client = WSManClient(host, username, password, port, path,
                                   protocol, ssl_retries, ssl_retry_delay,
-                                  ready_retries, ready_retry_delay)
-        self._job_mgmt = job.JobManagement(self.client)
+                                  ready_retries, ready_retry_delay,
+                                  pool_size, idle_timeout, session_pool,
+                                  ready_ttl, retry_policy, ready_retry_policy,
+                                  circuit_breakers, connect_timeout,
+                                  read_timeout, poll_scheduler)
+        if liveness_probe is None:
+            liveness_probe = probe.LivenessProbe(
+                port=port, poll_scheduler=self.client.poll_scheduler)
+        self._liveness_probe = liveness_probe
+        self._job_mgmt = job.JobManagement(self.client,
+                                           job_retention_policy)
         self._power_mgmt = bios.PowerManagement(self.client)
         self._boot_mgmt = bios.BootManagement(self.client)
         self._bios_cfg = bios.BIOSConfiguration(self.client)
@@ -82,6 +145,33 @@ class DRACClient(object):
         self._inventory_mgmt = inventory.InventoryManagement(self.client)
         self._nic_cfg = nic.NICConfiguration(self.client)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the connections kept open to the DRAC interface"""
+        self.client.close()
+
+    def deadline(self, timeout):
+        """Bounds the time spent by the calls of the current thread
+
+        Used as a context manager, every request, retry, Pull and readiness
+        wait of the calls made within the context counts against the same
+        budget::
+
+            with client.deadline(60):
+                client.list_jobs()
+
+        :param timeout: number of seconds the calls may take
+        :returns: a context manager
+        :raises: DRACDeadlineExceeded from the calls made within the context
+                 once the budget is spent
+        """
+        return self.client.deadline(timeout)
+
     def get_power_state(self):
         """Returns the current power state of the node
 
@@ -148,12 +238,15 @@ class DRACClient(object):
         return self._boot_mgmt.change_boot_device_order(boot_mode,
                                                         boot_device_list)
 
-    def list_bios_settings(self, by_name=True):
+    def list_bios_settings(self, by_name=True, lazy=False):
         """List the BIOS configuration settings
 
         :param by_name: Controls whether returned dictionary uses BIOS
                         attribute name as key. If set to False, instance_id
                         will be used.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the BIOS settings using its name as the
                   key. The attributes are either BIOSEnumerableAttribute,
                   BIOSStringAttribute or BIOSIntegerAttribute objects.
@@ -162,7 +255,7 @@ class DRACClient(object):
         :raises: DRACOperationFailed on error reported back by the DRAC
                  interface
         """
-        return self._bios_cfg.list_bios_settings(by_name)
+        return self._bios_cfg.list_bios_settings(by_name, lazy=lazy)
 
     def set_bios_settings(self, settings):
         """Sets the BIOS configuration
@@ -190,7 +283,8 @@ class DRACClient(object):
         """
         return self._bios_cfg.set_bios_settings(settings)
 
-    def list_idrac_settings(self, by_name=False, fqdd_filter=IDRAC_FQDD):
+    def list_idrac_settings(self, by_name=False, fqdd_filter=IDRAC_FQDD,
+                            lazy=False):
         """List the iDRAC configuration settings
 
         :param by_name: Controls whether returned dictionary uses iDRAC card
@@ -199,6 +293,9 @@ class DRACClient(object):
                         form "group_id#name".
         :param fqdd_filter: An FQDD used to filter the instances.  Note that
                             this is only used when by_name is True.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the iDRAC settings using instance_id as the
                   key except when by_name is True. The attributes are either
                   iDRACCardEnumerableAttribute, iDRACCardStringAttribute or
@@ -209,7 +306,8 @@ class DRACClient(object):
                  interface
         """
         return self._idrac_cfg.list_idrac_settings(by_name=by_name,
-                                                   fqdd_filter=fqdd_filter)
+                                                   fqdd_filter=fqdd_filter,
+                                                   lazy=lazy)
 
     def set_idrac_settings(self, settings, idrac_fqdd=IDRAC_FQDD):
         """Sets the iDRAC configuration settings
@@ -240,7 +338,9 @@ class DRACClient(object):
         return self._idrac_cfg.set_idrac_settings(settings, idrac_fqdd)
 
     def reset_idrac(self, force=False, wait=False,
-                    ready_wait_time=30):
+                    ready_wait_time=30,
+                    state_timeout=(
+                        constants.DEFAULT_IDRAC_RESET_STATE_TIMEOUT_SEC)):
         """Resets the iDRAC and optionally block until reset is complete.
 
         :param force: does a force reset when True and a graceful reset when
@@ -249,6 +349,8 @@ class DRACClient(object):
                 for the iDRAC to return to operational state if True
         :param ready_wait_time: the amount of time in seconds to wait after
                 the reset before starting to check on the iDRAC's status
+        :param state_timeout: the amount of time in seconds to wait for the
+                iDRAC to go down and then to come back up
         :returns: True on success, raises exception on failure
         :raises: WSManRequestFailure on request failures
         :raises: WSManInvalidResponse when receiving invalid response
@@ -267,8 +369,7 @@ class DRACClient(object):
         state_reached = self._wait_for_host_state(
             self.client.host,
             alive=False,
-            ping_count=2,
-            retries=24)
+            timeout=state_timeout)
 
         if not state_reached:
             raise exceptions.DRACOperationFailed(
@@ -280,8 +381,7 @@ class DRACClient(object):
         state_reached = self._wait_for_host_state(
             self.client.host,
             alive=True,
-            ping_count=3,
-            retries=24)
+            timeout=state_timeout)
 
         if not state_reached:
             raise exceptions.DRACOperationFailed(
@@ -290,20 +390,34 @@ class DRACClient(object):
 
         LOG.info("The iDRAC has become pingable")
         LOG.info("Waiting for the iDRAC to become ready")
-        time.sleep(ready_wait_time)
+        time.sleep(self.client.cap_to_deadline(ready_wait_time))
 
         self.client.wait_until_idrac_is_ready()
 
-    def _ping_host(self, host):
-        response = subprocess.call(
-            "ping -c 1 {} 2>&1 1>/dev/null".format(host), shell=True)
-        return (response == 0)
+    def start_reset_idrac(
+            self, force=False, ready_wait_time=30,
+            state_timeout=constants.DEFAULT_IDRAC_RESET_STATE_TIMEOUT_SEC):
+        """Resets the iDRAC without waiting for the reset to complete
+
+        :param force: does a force reset when True and a graceful reset when
+               False
+        :param ready_wait_time: the amount of time in seconds to wait after
+                the iDRAC comes back up before checking if it is ready
+        :param state_timeout: the amount of time in seconds to wait for the
+                iDRAC to go down and then to come back up
+        :returns: a reset.ResetHandle tracking the reset
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on failure to reset iDRAC
+        """
+        if not self._idrac_cfg.reset_idrac(force):
+            raise exceptions.DRACOperationFailed(
+                drac_messages="Failed to reset iDRAC")
+
+        return reset.ResetHandle(self.client, self._liveness_probe,
+                                 ready_wait_time, state_timeout)
 
-    def _wait_for_host_state(self,
-                             host,
-                             alive=True,
-                             ping_count=3,
-                             retries=24):
+    def _wait_for_host_state(self, host, alive, timeout):
         if alive:
             ping_type = "pingable"
 
@@ -312,27 +426,10 @@ class DRACClient(object):
 
         LOG.info("Waiting for the iDRAC to become %s", ping_type)
 
-        response_count = 0
-        state_reached = False
-
-        while retries > 0 and not state_reached:
-            response = self._ping_host(host)
-            retries -= 1
-            if response == alive:
-                response_count += 1
-                LOG.debug("The iDRAC is %s, count=%s",
-                          ping_type,
-                          response_count)
-                if response_count == ping_count:
-                    LOG.debug("Reached specified ping count")
-                    state_reached = True
-            else:
-                response_count = 0
-                if alive:
-                    LOG.debug("The iDRAC is still not pingable")
-                else:
-                    LOG.debug("The iDRAC is still pingable")
-            time.sleep(10)
+        state_reached = self._liveness_probe.wait_for_state(
+            [host], alive, self.client.cap_to_deadline(timeout))[host]
+        if not state_reached:
+            self.client.check_deadline()
 
         return state_reached
 
@@ -383,12 +480,15 @@ class DRACClient(object):
             cim_name='DCIM:iDRACCardService',
             target=idrac_fqdd)
 
-    def list_lifecycle_settings(self, by_name=False):
+    def list_lifecycle_settings(self, by_name=False, lazy=False):
         """List the Lifecycle Controller configuration settings
 
         :param by_name: Controls whether returned dictionary uses Lifecycle
                         attribute name as key. If set to False, instance_id
                         will be used.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the Lifecycle Controller settings using its
                   InstanceID as the key. The attributes are either
                   LCEnumerableAttribute or LCStringAttribute objects.
@@ -397,7 +497,8 @@ class DRACClient(object):
         :raises: DRACOperationFailed on error reported back by the DRAC
                  interface
         """
-        return self._lifecycle_cfg.list_lifecycle_settings(by_name)
+        return self._lifecycle_cfg.list_lifecycle_settings(by_name,
+                                                           lazy=lazy)
 
     def is_lifecycle_in_recovery(self):
         """Checks if Lifecycle Controller in recovery mode or not
@@ -467,6 +568,37 @@ class DRACClient(object):
         """
         return self._job_mgmt.list_jobs(only_unfinished)
 
+    def iter_jobs(self, only_unfinished=False):
+        """Yields the jobs from the job queue as they are received
+
+        :param only_unfinished: indicates whether only unfinished jobs should
+                                be returned
+        :returns: a generator of Job objects
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        return self._job_mgmt.iter_jobs(only_unfinished)
+
+    def job_view(
+            self, full_refresh_interval=(
+                constants.DEFAULT_JOB_VIEW_FULL_REFRESH_INTERVAL_SEC)):
+        """Returns an incrementally refreshed table of the job queue
+
+        The first refresh of the table lists the whole job queue, the
+        following ones fetch the unfinished jobs, except every
+        full_refresh_interval seconds when the whole job queue is listed
+        again.
+
+        :param full_refresh_interval: number of seconds after which a
+                                      refresh lists the whole job queue
+                                      again. If None, only the first
+                                      refresh does.
+        :returns: a job.JobView object, empty until it is refreshed
+        """
+        return self._job_mgmt.job_view(full_refresh_interval)
+
     def get_job(self, job_id):
         """Returns a job from the job queue
 
@@ -479,6 +611,65 @@ class DRACClient(object):
         """
         return self._job_mgmt.get_job(job_id)
 
+    def get_jobs(self, job_ids):
+        """Returns many jobs from the job queue
+
+        :param job_ids: ids of the jobs
+        :returns: a dictionary of Job objects keyed by job id, in the order
+                  of job_ids, with None for the jobs which are not in the
+                  job queue
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        return self._job_mgmt.get_jobs(job_ids)
+
+    def wait_for_jobs(
+            self, job_ids, timeout=None,
+            interval=constants.DEFAULT_JOB_WAIT_INTERVAL_SEC,
+            max_interval=constants.DEFAULT_JOB_WAIT_MAX_INTERVAL_SEC):
+        """Waits until jobs are finished
+
+        :param job_ids: ids of the jobs
+        :param timeout: number of seconds to wait. If None, waits until all
+                        the jobs are finished.
+        :param interval: minimum number of seconds between two polls
+        :param max_interval: maximum number of seconds between two polls
+        :returns: a dictionary with the final Job objects keyed by job id,
+                  None for the jobs missing from the job queue
+        :raises: DRACWaitTimeout if the jobs are not finished after timeout
+                 seconds
+        :raises: DRACDeadlineExceeded when the deadline of the calling thread
+                 passes first
+        :raises: DRACWaitCancelled if the poll scheduler stops waiting, such
+                 as when it is shut down
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        return self._job_mgmt.wait_for_jobs(job_ids, timeout, interval,
+                                            max_interval)
+
+    def watch_jobs(self, job_ids=None,
+                   interval=constants.DEFAULT_JOB_WAIT_INTERVAL_SEC):
+        """Yields the changes of the jobs in the job queue
+
+        :param job_ids: ids of the jobs to watch. If None, all the jobs are
+                        watched until the caller stops iterating.
+        :param interval: number of seconds between two listings
+        :returns: a generator of JobEvent objects. previous is None for a
+                  job seen for the first time and current is None for a job
+                  which left the job queue.
+        :raises: DRACDeadlineExceeded when the deadline of the calling thread
+                 passes
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        return self._job_mgmt.watch(job_ids, interval)
+
     def delete_jobs(self, job_ids=['JID_CLEARALL']):
         """Deletes the given jobs, or all jobs if none specified
 
@@ -500,6 +691,50 @@ class DRACClient(object):
 
         return self._job_mgmt.delete_jobs(job_ids)
 
+    def bulk_delete_jobs(
+            self, job_ids,
+            max_workers=constants.DEFAULT_JOB_DELETE_MAX_WORKERS):
+        """Deletes many jobs, reporting the outcome of each one
+
+        :param job_ids: ids of the jobs to delete
+        :param max_workers: maximum number of deletion requests in flight
+        :returns: a dictionary keyed by job id with None for the deleted
+                  jobs and the exception raised for the others. Jobs
+                  missing from the job queue are reported with a
+                  DRACOperationFailed exception.
+        :raises: WSManRequestFailure on request failures while checking the
+                 job queue
+        :raises: WSManInvalidResponse when receiving invalid response while
+                 checking the job queue
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface while checking the job queue
+        """
+        return self._job_mgmt.bulk_delete_jobs(job_ids, max_workers)
+
+    def prune_jobs(self, retention_policy=None,
+                   max_workers=constants.DEFAULT_JOB_DELETE_MAX_WORKERS):
+        """Deletes the finished jobs the retention policy does not keep
+
+        Scheduled and running jobs are never deleted.
+
+        :param retention_policy: a job.JobRetentionPolicy. If None, the
+                                 job_retention_policy given when the client
+                                 was created is used.
+        :param max_workers: maximum number of deletion requests in flight
+        :returns: a job.PruneResult object with the size of the job queue
+                  before and after pruning, the ids of the deleted jobs and
+                  the exceptions raised for the jobs which could not be
+                  deleted
+        :raises: InvalidParameterValue if no retention policy is available
+        :raises: WSManRequestFailure on request failures while listing the
+                 job queue
+        :raises: WSManInvalidResponse when receiving invalid response while
+                 listing the job queue
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface while listing the job queue
+        """
+        return self._job_mgmt.prune_jobs(retention_policy, max_workers)
+
     def create_config_job(self,
                           resource_uri,
                           cim_creation_class_name,
@@ -812,6 +1047,20 @@ class DRACClient(object):
         """
         return self._raid_mgmt.list_physical_disks()
 
+    def iter_physical_disks(self):
+        """Yields the physical disks as they are received
+
+        Unlike list_physical_disks, the disks are returned in the order the
+        DRAC card reports them, so PCIe SSDs may come before other disks.
+
+        :returns: a generator of PhysicalDisk objects
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        return self._raid_mgmt.iter_physical_disks()
+
     def convert_physical_disks(self, raid_controller, physical_disks,
                                raid_enable=True):
         """Changes the operational mode of a physical disk.
@@ -1026,10 +1275,13 @@ class DRACClient(object):
 
         return self._inventory_mgmt.list_nics(sort=sort)
 
-    def list_nic_settings(self, nic_id):
+    def list_nic_settings(self, nic_id, lazy=False):
         """Return the list of attribute settings of a NIC.
 
         :param nic_id: id of the network interface controller (NIC)
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: dictionary containing the NIC settings. The keys are
                   attribute names. Each value is a
                   NICEnumerationAttribute, NICIntegerAttribute, or
@@ -1039,7 +1291,7 @@ class DRACClient(object):
         :raises: DRACOperationFailed on error reported back by the iDRAC
                  interface
         """
-        return self._nic_cfg.list_nic_settings(nic_id)
+        return self._nic_cfg.list_nic_settings(nic_id, lazy=lazy)
 
     def set_nic_settings(self, nic_id, settings):
         """Modify one or more settings of a NIC.
@@ -1206,7 +1458,16 @@ class WSManClient(wsman.Client):
             ssl_retry_delay=constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC,
             ready_retries=constants.DEFAULT_IDRAC_IS_READY_RETRIES,
             ready_retry_delay=(
-                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC)):
+                constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC),
+            pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+            idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+            session_pool=None,
+            ready_ttl=constants.DEFAULT_IDRAC_IS_READY_TTL_SEC,
+            retry_policy=None, ready_retry_policy=None,
+            circuit_breakers=None,
+            connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+            read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC,
+            poll_scheduler=None):
         """Creates client object
 
         :param host: hostname or IP of the DRAC interface
@@ -1222,13 +1483,114 @@ class WSManClient(wsman.Client):
                               ready
         :param ready_retry_delay: number of seconds to wait between
                                   checks if the iDRAC is ready
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded
+        :param session_pool: a pool.SessionPool shared with other clients to
+                             borrow connections from, such as
+                             pool.get_shared_pool()
+        :param ready_ttl: number of seconds a ready answer of the iDRAC is
+                          trusted before it is checked again. If 0, the
+                          iDRAC is checked before every command.
+        :param retry_policy: a retry.RetryPolicy deciding how failed requests
+                             are retried. Takes precedence over ssl_retries
+                             and ssl_retry_delay.
+        :param ready_retry_policy: a retry.RetryPolicy deciding how often
+                                   the iDRAC is checked while waiting for it
+                                   to become ready. Takes precedence over
+                                   ready_retries and ready_retry_delay.
+        :param circuit_breakers: a breaker.CircuitBreakerRegistry shared with
+                                 other clients, such as
+                                 breaker.get_shared_registry(). Requests
+                                 fail fast with WSManCircuitOpen while the
+                                 circuit of the DRAC interface is open.
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for the DRAC interface
+                             to send a response. If None, waits forever.
+        :param poll_scheduler: a scheduler.PollScheduler running the checks
+                               made while waiting for the iDRAC to become
+                               ready. Defaults to
+                               scheduler.get_shared_scheduler().
         """
         super(WSManClient, self).__init__(host, username, password,
                                           port, path, protocol, ssl_retries,
-                                          ssl_retry_delay)
+                                          ssl_retry_delay, pool_size,
+                                          idle_timeout,
+                                          session_pool=session_pool,
+                                          retry_policy=retry_policy,
+                                          circuit_breakers=circuit_breakers,
+                                          connect_timeout=connect_timeout,
+                                          read_timeout=read_timeout)
 
         self._ready_retries = ready_retries
         self._ready_retry_delay = ready_retry_delay
+        if ready_retry_policy is None:
+            ready_retry_policy = retry.RetryPolicy.fixed(ready_retries,
+                                                         ready_retry_delay)
+        self.ready_retry_policy = ready_retry_policy
+        self._ready_ttl = ready_ttl
+        self._ready_until = None
+        self._ready_lock = threading.Lock()
+        self.ready_probes_skipped = 0
+        self._single_flight = singleflight.SingleFlight(
+            remaining_time=self.remaining_time,
+            check_deadline=self.check_deadline,
+            retried_errors=[exceptions.DRACDeadlineExceeded])
+        self.poll_scheduler = (poll_scheduler or
+                               scheduler.get_shared_scheduler())
+
+    @property
+    def requests_coalesced(self):
+        """Number of read requests served by an identical one in flight"""
+        return self._single_flight.coalesced
+
+    def _do_request(self, payload):
+        try:
+            return super(WSManClient, self)._do_request(payload)
+        except exceptions.WSManRequestFailure:
+            self.invalidate_ready_cache()
+            raise
+
+    def invalidate_ready_cache(self):
+        """Forgets the last ready answer of the iDRAC
+
+        The next command checks again if the iDRAC is ready. Called on
+        connection errors and after operations that can keep the Lifecycle
+        Controller busy, such as resetting the iDRAC or creating a job.
+        """
+        with self._ready_lock:
+            self._ready_until = None
+
+    def is_ready_cached(self):
+        """Indicates if the iDRAC was recently found ready
+
+        A true answer skips a readiness check, counted by
+        ready_probes_skipped.
+
+        :returns: True if the last ready answer of the iDRAC is less than
+                  ready_ttl seconds old
+        """
+        with self._ready_lock:
+            if (self._ready_until is not None
+                    and time.monotonic() < self._ready_until):
+                self.ready_probes_skipped += 1
+                return True
+
+            return False
+
+    def cache_ready(self):
+        """Records that the iDRAC was found ready
+
+        Called by the callers checking the readiness of the iDRAC on their
+        own, such as a reset.ResetHandle, so the following commands skip
+        the check. Does nothing if the ready cache is disabled.
+        """
+        if self._ready_ttl:
+            with self._ready_lock:
+                self._ready_until = time.monotonic() + self._ready_ttl
 
     def enumerate(self, resource_uri, optimization=True, max_elems=100,
                   auto_pull=True, filter_query=None, filter_dialect='cql',
@@ -1255,9 +1617,46 @@ class WSManClient(wsman.Client):
         if wait_for_idrac:
             self.wait_until_idrac_is_ready()
 
-        return super(WSManClient, self).enumerate(resource_uri, optimization,
-                                                  max_elems, auto_pull,
-                                                  filter_query, filter_dialect)
+        if not auto_pull:
+            # the enumeration context of the response may only be pulled
+            # once, it cannot be shared by several callers
+            return super(WSManClient, self).enumerate(
+                resource_uri, optimization, max_elems, auto_pull,
+                filter_query, filter_dialect)
+
+        key = ('enumerate', resource_uri, filter_query, filter_dialect,
+               optimization, max_elems)
+        return self._single_flight.do(
+            key, super(WSManClient, self).enumerate, resource_uri,
+            optimization, max_elems, auto_pull, filter_query, filter_dialect)
+
+    def iter_enumerate(self, resource_uri, optimization=True, max_elems=100,
+                       filter_query=None, filter_dialect='cql',
+                       wait_for_idrac=True):
+        """Executes enumerate operation over WS-Man, yielding the items
+
+        :param resource_uri: URI of resource to enumerate
+        :param optimization: flag to enable enumeration optimization. If
+                             disabled, the items are only returned by the
+                             pull operations.
+        :param max_elems: maximum number of elements returned by each
+                          operation
+        :param filter_query: filter query string
+        :param filter_dialect: filter dialect. Valid options are: 'cql' and
+                               'wql'.
+        :param wait_for_idrac: indicates whether or not to wait for the
+            iDRAC to be ready to accept commands before issuing the
+            command
+        :returns: a generator of lxml.etree.Element objects, one per item
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+        if wait_for_idrac:
+            self.wait_until_idrac_is_ready()
+
+        return super(WSManClient, self).iter_enumerate(
+            resource_uri, optimization, max_elems, filter_query,
+            filter_dialect)
 
     def invoke(self,
                resource_uri,
@@ -1302,20 +1701,7 @@ class WSManClient(wsman.Client):
                                                properties)
 
         if check_return_value:
-            return_value = utils.find_xml(resp, 'ReturnValue',
-                                          resource_uri).text
-            if return_value == utils.RET_ERROR:
-                message_elems = utils.find_xml(resp, 'Message',
-                                               resource_uri, True)
-                messages = [message_elem.text for message_elem in
-                            message_elems]
-                raise exceptions.DRACOperationFailed(drac_messages=messages)
-
-            if (expected_return_value is not None
-                    and return_value != expected_return_value):
-                raise exceptions.DRACUnexpectedReturnValue(
-                    expected_return_value=expected_return_value,
-                    actual_return_value=return_value)
+            _check_return_value(resp, resource_uri, expected_return_value)
 
         return resp
 
@@ -1333,23 +1719,14 @@ class WSManClient(wsman.Client):
         :raises: DRACUnexpectedReturnValue on return value mismatch
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'CreationClassName': 'DCIM_LCService',
-                     'Name': 'DCIM:LCService'}
+        key = ('invoke', uris.DCIM_LCService, 'GetRemoteServicesAPIStatus',
+               tuple(sorted(LC_SERVICE_SELECTORS.items())))
+        result = self._single_flight.do(
+            key, self.invoke, uris.DCIM_LCService,
+            'GetRemoteServicesAPIStatus', LC_SERVICE_SELECTORS, {},
+            expected_return_value=utils.RET_SUCCESS, wait_for_idrac=False)
 
-        result = self.invoke(uris.DCIM_LCService,
-                             'GetRemoteServicesAPIStatus',
-                             selectors,
-                             {},
-                             expected_return_value=utils.RET_SUCCESS,
-                             wait_for_idrac=False)
-
-        lc_status = utils.find_xml(result,
-                                   'LCStatus',
-                                   uris.DCIM_LCService).text
-
-        return lc_status == IDRAC_IS_READY
+        return _is_idrac_ready(result)
 
     def wait_until_idrac_is_ready(self, retries=None, retry_delay=None):
         """Waits until the iDRAC is in a ready state
@@ -1367,28 +1744,74 @@ class WSManClient(wsman.Client):
         :raises: DRACOperationFailed on error reported back by the DRAC
                  interface or timeout
         :raises: DRACUnexpectedReturnValue on return value mismatch
+        :raises: DRACDeadlineExceeded when the deadline of the calling thread
+                 passes first
+        :raises: DRACWaitCancelled if the poll scheduler stops waiting, such
+                 as when it is shut down
         """
 
-        if retries is None:
-            retries = self._ready_retries
+        if self.is_ready_cached():
+            LOG.debug("The iDRAC was ready less than %s seconds ago",
+                      self._ready_ttl)
+            return
 
-        if retry_delay is None:
-            retry_delay = self._ready_retry_delay
+        policy = self.ready_retry_policy
+        if retries is not None or retry_delay is not None:
+            if retries is None:
+                retries = self._ready_retries
 
-        # Try every 10 seconds over 4 minutes for the iDRAC to become ready
-        while retries > 0:
-            LOG.debug("Checking to see if the iDRAC is ready")
+            if retry_delay is None:
+                retry_delay = self._ready_retry_delay
 
+            policy = retry.RetryPolicy.fixed(retries, retry_delay)
+
+        # By default, try every 10 seconds over 16 minutes for the iDRAC to
+        # become ready
+        num_tries = 0
+
+        def check():
+            nonlocal num_tries
+
+            num_tries += 1
+            LOG.debug("Checking to see if the iDRAC is ready")
             if self.is_idrac_ready():
                 LOG.debug("The iDRAC is ready")
-                return
+                self.cache_ready()
+                return True
 
             LOG.debug("The iDRAC is not ready")
-            retries -= 1
-            if retries > 0:
-                time.sleep(retry_delay)
-
-        if retries == 0:
-            err_msg = "Timed out waiting for the iDRAC to become ready"
-            LOG.error(err_msg)
-            raise exceptions.DRACOperationFailed(drac_messages=err_msg)
+            if (num_tries >= policy.max_attempts
+                    or not policy.acquire_retry(self.host)):
+                err_msg = "Timed out waiting for the iDRAC to become ready"
+                LOG.error(err_msg)
+                raise exceptions.DRACOperationFailed(drac_messages=err_msg)
+
+            return False
+
+        timeout = self.remaining_time()
+        if (not self.poll_scheduler.wait(self.bind_deadline(check),
+                                         policy.delay, timeout=timeout,
+                                         key=self.host)
+                and timeout is not None):
+            # the wait only expires with the deadline of the calling thread
+            raise exceptions.DRACDeadlineExceeded(host=self.host)
+
+
+def _check_return_value(resp, resource_uri, expected_return_value):
+    return_value = utils.find_xml(resp, 'ReturnValue', resource_uri).text
+    if return_value == utils.RET_ERROR:
+        message_elems = utils.find_xml(resp, 'Message', resource_uri, True)
+        messages = [message_elem.text for message_elem in message_elems]
+        raise exceptions.DRACOperationFailed(drac_messages=messages)
+
+    if (expected_return_value is not None
+            and return_value != expected_return_value):
+        raise exceptions.DRACUnexpectedReturnValue(
+            expected_return_value=expected_return_value,
+            actual_return_value=return_value)
+
+
+def _is_idrac_ready(resp):
+    lc_status = utils.find_xml(resp, 'LCStatus', uris.DCIM_LCService).text
+
+    return lc_status == IDRAC_IS_READY
@@ -14,12 +14,70 @@
 # iDRAC is ready retry constants
 DEFAULT_IDRAC_IS_READY_RETRIES = 96
 DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC = 10
+DEFAULT_IDRAC_IS_READY_TTL_SEC = 0
+
+# iDRAC liveness probe constants
+DEFAULT_LIVENESS_PROBE_TIMEOUT_SEC = 0.5
+DEFAULT_LIVENESS_PROBE_INTERVAL_SEC = 0.5
+DEFAULT_LIVENESS_PROBE_UP_CONFIRMATIONS = 3
+DEFAULT_LIVENESS_PROBE_DOWN_CONFIRMATIONS = 2
+DEFAULT_IDRAC_RESET_STATE_TIMEOUT_SEC = 240
 
 # Web Services Management (WS-Management and WS-Man) SSL retry on error
 # behavior constants
 DEFAULT_WSMAN_SSL_ERROR_RETRIES = 3
 DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC = 0
 
+# Web Services Management (WS-Management and WS-Man) transport timeout
+# constants
+DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC = 10
+DEFAULT_WSMAN_READ_TIMEOUT_SEC = 300
+
+# Web Services Management (WS-Management and WS-Man) asyncio transport
+# response size limit constants
+DEFAULT_WSMAN_MAX_HEADER_SIZE = 64 * 1024
+DEFAULT_WSMAN_MAX_RESPONSE_SIZE = 64 * 1024 * 1024
+
+# Retry policy constants
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY_SEC = 1
+DEFAULT_RETRY_MAX_DELAY_SEC = 60
+DEFAULT_RETRY_HTTP_STATUSES = (502, 503, 504)
+DEFAULT_RETRY_HOST_BUDGET_PERIOD_SEC = 60
+
+# Per-host circuit breaker constants
+DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT_SEC = 60
+
+# Web Services Management (WS-Management and WS-Man) connection reuse
+# constants
+DEFAULT_WSMAN_POOL_SIZE = 2
+DEFAULT_WSMAN_IDLE_TIMEOUT_SEC = 30
+
+# Process wide WS-Man session pool constants
+DEFAULT_SESSION_POOL_MAX_HOSTS = 256
+DEFAULT_SESSION_POOL_MAX_CONNECTIONS = 512
+
+# Fleet operation concurrency constants
+DEFAULT_FLEET_MAX_WORKERS = 16
+DEFAULT_FLEET_MAX_PER_HOST = 1
+
+# Job wait constants
+DEFAULT_JOB_WAIT_INTERVAL_SEC = 10
+DEFAULT_JOB_WAIT_MAX_INTERVAL_SEC = 60
+
+# Job view constants
+DEFAULT_JOB_VIEW_FULL_REFRESH_INTERVAL_SEC = 300
+
+# Job deletion constants
+DEFAULT_JOB_DELETE_MAX_WORKERS = 4
+
+# Poll scheduler constants
+DEFAULT_POLL_SCHEDULER_TICK_SEC = 0.05
+DEFAULT_POLL_SCHEDULER_WHEEL_SIZE = 512
+DEFAULT_POLL_SCHEDULER_MAX_WORKERS = 16
+DEFAULT_POLL_SCHEDULER_MAX_WORKERS_PER_KEY = 2
+
 NOT_SUPPORTED_MSG = " operation is not supported on th"
 
 # power states
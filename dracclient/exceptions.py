@@ -35,6 +35,23 @@ class DRACUnexpectedReturnValue(DRACRequestFailed):
                '%(expected_return_value)s')
 
 
+class DRACDeadlineExceeded(BaseClientException):
+    msg_fmt = ('Deadline exceeded while communicating with %(host)s')
+
+
+class DRACResetInProgress(BaseClientException):
+    msg_fmt = ('Reset of the %(host)s iDRAC is still in the %(phase)s phase '
+               'after %(timeout)s seconds')
+
+
+class DRACWaitTimeout(BaseClientException):
+    msg_fmt = ('Wait did not complete within %(timeout)s seconds')
+
+
+class DRACWaitCancelled(BaseClientException):
+    msg_fmt = ('Wait was cancelled before completing')
+
+
 class DRACEmptyResponseField(BaseClientException):
     msg_fmt = ("Attribute '%(attr)s' is not nullable, but no value received")
 
@@ -43,6 +60,11 @@ class DRACMissingResponseField(BaseClientException, AttributeError):
     msg_fmt = ("Attribute '%(attr)s' is missing from the response")
 
 
+class FleetOperationTimeout(BaseClientException):
+    msg_fmt = ('Operation on %(host)s did not finish within %(timeout)s '
+               'seconds')
+
+
 class InvalidParameterValue(BaseClientException):
     msg_fmt = '%(reason)s'
 
@@ -51,6 +73,11 @@ class WSManRequestFailure(BaseClientException):
     msg_fmt = ('WSMan request failed')
 
 
+class WSManCircuitOpen(WSManRequestFailure):
+    msg_fmt = ('Requests to %(host)s are failing fast, its circuit breaker '
+               'is %(state)s')
+
+
 class WSManInvalidResponse(BaseClientException):
     msg_fmt = ('Invalid response received. Status code: "%(status_code)s", '
                'reason: "%(reason)s"')
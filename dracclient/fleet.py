@@ -0,0 +1,220 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Runs DRACClient operations across many DRAC interfaces concurrently.
+"""
+
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+from dracclient import client
+from dracclient import constants
+from dracclient import exceptions
+
+LOG = logging.getLogger(__name__)
+
+FleetResult = collections.namedtuple(
+    'FleetResult', ['host', 'node', 'result', 'error', 'duration'])
+
+
+class FleetExecutor(object):
+    """Runs a DRACClient operation on many nodes with bounded concurrency
+
+    The operations of all the runs of an executor share its worker threads,
+    so at most max_workers operations are in flight at any time and at most
+    max_per_host of them talk to the same DRAC interface. Nodes are only
+    handed to the workers when a slot is free, so a large fleet does not
+    pile up in a queue.
+    """
+
+    def __init__(self, max_workers=constants.DEFAULT_FLEET_MAX_WORKERS,
+                 max_per_host=constants.DEFAULT_FLEET_MAX_PER_HOST,
+                 session_pool=None):
+        """Creates FleetExecutor object
+
+        :param max_workers: maximum number of operations running at once
+        :param max_per_host: maximum number of operations running at once
+                             against a single DRAC interface
+        :param session_pool: a pool.SessionPool the clients borrow their
+                             connections from, such as
+                             pool.get_shared_pool(). If None, every client
+                             opens its own connections.
+        """
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.session_pool = session_pool
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._slots_freed = threading.Condition()
+        self._in_flight = 0
+        self._in_flight_per_host = collections.Counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads
+
+        :param wait: indicates whether to wait for the running operations
+                     to finish
+        """
+        self._executor.shutdown(wait)
+
+    def run(self, nodes, operation, *args, run_timeout=None, **kwargs):
+        """Runs an operation on every node
+
+        Results are yielded as soon as the operation finishes on a node, so
+        the fast nodes do not wait for the slowest one. Exceptions raised by
+        the operation are reported in the error field of the result instead
+        of being raised.
+
+        :param nodes: a list of dictionaries with the DRACClient arguments of
+                      each node, at least host, username and password
+        :param operation: name of the DRACClient method to call, or a
+                          callable taking the DRACClient as first argument
+        :param args: positional arguments of the operation
+        :param run_timeout: number of seconds after which the nodes still
+                            waiting for a result are reported with a
+                            FleetOperationTimeout error. If None, waits for
+                            every node.
+        :param kwargs: keyword arguments of the operation
+        :returns: a generator of FleetResult objects, in completion order
+        """
+        deadline = None
+        if run_timeout is not None:
+            deadline = time.monotonic() + run_timeout
+
+        pending = collections.deque(nodes)
+        futures = {}
+        try:
+            while pending or futures:
+                if not self._submit(pending, futures, operation, args, kwargs,
+                                    deadline):
+                    break
+
+                remaining = None
+                if deadline is not None:
+                    remaining = max(deadline - time.monotonic(), 0)
+
+                done, _ = concurrent.futures.wait(
+                    futures, timeout=remaining,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                if not done:
+                    break
+
+                for future in done:
+                    del futures[future]
+                    yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+        for node in list(futures.values()) + list(pending):
+            error = exceptions.FleetOperationTimeout(host=node['host'],
+                                                     timeout=run_timeout)
+            yield FleetResult(node['host'], node, None, error, run_timeout)
+
+    def run_all(self, nodes, operation, *args, run_timeout=None, **kwargs):
+        """Runs an operation on every node and waits for all the results
+
+        :param nodes: a list of dictionaries with the DRACClient arguments of
+                      each node, at least host, username and password
+        :param operation: name of the DRACClient method to call, or a
+                          callable taking the DRACClient as first argument
+        :param args: positional arguments of the operation
+        :param run_timeout: number of seconds after which the nodes still
+                            waiting for a result are reported with a
+                            FleetOperationTimeout error, see run
+        :param kwargs: keyword arguments of the operation
+        :returns: a dictionary with the FleetResult of each node, keyed by
+                  host
+        """
+        return {result.host: result
+                for result in self.run(nodes, operation, *args,
+                                       run_timeout=run_timeout, **kwargs)}
+
+    def _submit(self, pending, futures, operation, args, kwargs, deadline):
+        """Hands the pending nodes to the workers while slots are free
+
+        Blocks until at least one operation of the run is in flight.
+
+        :returns: False if the deadline passed while waiting for a slot
+        """
+        with self._slots_freed:
+            while True:
+                blocked = collections.deque()
+                while pending and self._in_flight < self.max_workers:
+                    node = pending.popleft()
+                    host = node['host']
+                    if self._in_flight_per_host[host] >= self.max_per_host:
+                        blocked.append(node)
+                        continue
+
+                    self._in_flight += 1
+                    self._in_flight_per_host[host] += 1
+                    future = self._executor.submit(self._run_on_node, node,
+                                                   operation, args, kwargs)
+                    futures[future] = node
+                pending.extendleft(reversed(blocked))
+
+                if futures or not pending:
+                    return True
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+
+                self._slots_freed.wait(remaining)
+
+    def _release(self, host):
+        with self._slots_freed:
+            self._in_flight -= 1
+            self._in_flight_per_host[host] -= 1
+            if not self._in_flight_per_host[host]:
+                del self._in_flight_per_host[host]
+            self._slots_freed.notify_all()
+
+    def _create_client(self, node):
+        client_args = dict(node)
+        client_args.setdefault('session_pool', self.session_pool)
+
+        return client.DRACClient(**client_args)
+
+    def _run_on_node(self, node, operation, args, kwargs):
+        host = node['host']
+        start = time.monotonic()
+        try:
+            with self._create_client(node) as drac_client:
+                if callable(operation):
+                    result = operation(drac_client, *args, **kwargs)
+                else:
+                    result = getattr(drac_client, operation)(*args, **kwargs)
+        except Exception as ex:
+            LOG.warning('Operation %(operation)s failed on %(host)s: '
+                        '%(error)s', {'operation': operation, 'host': host,
+                                      'error': ex})
+            return FleetResult(host, node, None, ex,
+                               time.monotonic() - start)
+        finally:
+            self._release(host)
+
+        return FleetResult(host, node, result, None, time.monotonic() - start)
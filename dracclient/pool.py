@@ -0,0 +1,222 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Process wide pool of keep-alive WS-Man sessions shared between clients.
+"""
+
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+import requests
+import requests.adapters
+
+from dracclient import constants
+
+LOG = logging.getLogger(__name__)
+
+PoolStats = collections.namedtuple(
+    'PoolStats',
+    ['hits', 'misses', 'evictions', 'hosts', 'connections_in_use'])
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+class _PoolEntry(object):
+
+    def __init__(self, session):
+        self.session = session
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class SessionPool(object):
+    """Registry of keep-alive sessions keyed by DRAC endpoint and credentials
+
+    Clients borrow the session of their endpoint for the duration of a
+    request, so warm connections survive across client objects talking to the
+    same DRAC interface.
+    """
+
+    def __init__(
+            self,
+            max_hosts=constants.DEFAULT_SESSION_POOL_MAX_HOSTS,
+            max_connections=constants.DEFAULT_SESSION_POOL_MAX_CONNECTIONS,
+            max_connections_per_host=constants.DEFAULT_WSMAN_POOL_SIZE,
+            idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC):
+        """Creates SessionPool object
+
+        :param max_hosts: maximum number of DRAC interfaces to keep sessions
+                          for. Least recently used idle sessions are evicted
+                          above this limit.
+        :param max_connections: maximum number of requests in flight through
+                                the pool at any time. If None, the number is
+                                not limited.
+        :param max_connections_per_host: maximum number of connections opened
+                                         to a single DRAC interface. Requests
+                                         above this limit wait for a
+                                         connection to be released.
+        :param idle_timeout: number of seconds a session may stay unused
+                             before it is evicted. If None, sessions are only
+                             evicted to honour max_hosts.
+        """
+        self.max_hosts = max_hosts
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._connections = None
+        if max_connections is not None:
+            self._connections = threading.BoundedSemaphore(max_connections)
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @contextlib.contextmanager
+    def session(self, key):
+        """Borrows the session for a DRAC interface
+
+        :param key: hashable identifying the DRAC interface and the
+                    credentials used, such as (host, port, username, password)
+        :returns: a context manager yielding a requests.Session
+        """
+        if self._connections is not None:
+            self._connections.acquire()
+
+        try:
+            entry = self._checkout(key)
+            try:
+                yield entry.session
+            finally:
+                self._checkin(key, entry)
+        finally:
+            if self._connections is not None:
+                self._connections.release()
+
+    def stats(self):
+        """Returns the usage statistics of the pool
+
+        :returns: a PoolStats object
+        """
+        with self._lock:
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                hosts=len(self._entries),
+                connections_in_use=sum(entry.in_use
+                                       for entry in self._entries.values()))
+
+    def clear(self):
+        """Closes every idle session of the pool"""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if not entry.in_use:
+                    self._evict(key)
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_connections_per_host,
+            pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def _checkout(self, key):
+        with self._lock:
+            self._evict_idle()
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                entry = _PoolEntry(self._create_session())
+                entry.in_use += 1
+                self._entries[key] = entry
+                self._evict_lru()
+            else:
+                self._hits += 1
+                entry.in_use += 1
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def _checkin(self, key, entry):
+        with self._lock:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            # keeps the idle entries ordered by last_used
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+
+    def _evict(self, key):
+        entry = self._entries.pop(key)
+        entry.session.close()
+        self._evictions += 1
+
+    def _evict_idle(self):
+        if self.idle_timeout is None:
+            return
+
+        # the idle entries are ordered by last_used, the scan stops at the
+        # first one which has not expired
+        now = time.monotonic()
+        expired = []
+        for key, entry in self._entries.items():
+            if entry.in_use:
+                continue
+
+            if now - entry.last_used <= self.idle_timeout:
+                break
+
+            expired.append(key)
+
+        for key in expired:
+            LOG.debug('Evicting session idle for more than %s seconds',
+                      self.idle_timeout)
+            self._evict(key)
+
+    def _evict_lru(self):
+        # entries are kept in least recently used first order, from their
+        # last checkout or checkin
+        for key, entry in list(self._entries.items()):
+            if len(self._entries) <= self.max_hosts:
+                break
+
+            if not entry.in_use:
+                LOG.debug('Evicting least recently used session, pool is '
+                          'limited to %s hosts', self.max_hosts)
+                self._evict(key)
+
+
+def get_shared_pool():
+    """Returns the SessionPool shared by the whole process
+
+    :returns: a SessionPool object
+    """
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SessionPool()
+
+        return _shared_pool
@@ -0,0 +1,228 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+In-process liveness probing of DRAC interfaces over TCP.
+"""
+
+import asyncio
+import errno
+import logging
+import selectors
+import socket
+import time
+
+from dracclient import constants
+from dracclient import scheduler
+
+LOG = logging.getLogger(__name__)
+
+# a refused connection still means the network stack of the host answered
+_ALIVE_ERRORS = (0, errno.ECONNREFUSED)
+_IN_PROGRESS_ERRORS = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN)
+
+
+class LivenessProbe(object):
+    """Checks if DRAC interfaces answer on their WS-Man port
+
+    A host is alive when a TCP connection to the port is accepted or actively
+    refused, the same way it would answer a ping. All the hosts of a probe
+    are connected to at once from the calling thread, without spawning any
+    process.
+    """
+
+    def __init__(self, port=443,
+                 timeout=constants.DEFAULT_LIVENESS_PROBE_TIMEOUT_SEC,
+                 interval=constants.DEFAULT_LIVENESS_PROBE_INTERVAL_SEC,
+                 up_confirmations=(
+                     constants.DEFAULT_LIVENESS_PROBE_UP_CONFIRMATIONS),
+                 down_confirmations=(
+                     constants.DEFAULT_LIVENESS_PROBE_DOWN_CONFIRMATIONS),
+                 poll_scheduler=None):
+        """Creates LivenessProbe object
+
+        :param port: TCP port to connect to
+        :param timeout: number of seconds to wait for a host to answer
+        :param interval: number of seconds between the probes of a host while
+                         waiting for it to change state
+        :param up_confirmations: number of consecutive successful probes
+                                 confirming a host is alive
+        :param down_confirmations: number of consecutive failed probes
+                                   confirming a host is down
+        :param poll_scheduler: a scheduler.PollScheduler running the probes
+                               made while waiting for hosts to change state.
+                               Defaults to
+                               scheduler.get_shared_scheduler().
+        """
+        self.port = port
+        self.timeout = timeout
+        self.interval = interval
+        self.up_confirmations = up_confirmations
+        self.down_confirmations = down_confirmations
+        self.poll_scheduler = (poll_scheduler or
+                               scheduler.get_shared_scheduler())
+
+    def probe(self, hosts):
+        """Probes hosts once
+
+        :param hosts: hostnames or IPs of the DRAC interfaces
+        :returns: a dictionary with a boolean indicating if each host is
+                  alive, keyed by host
+        """
+        results = {}
+        selector = selectors.DefaultSelector()
+        try:
+            for host in set(hosts):
+                sock = self._connect(host)
+                if isinstance(sock, bool):
+                    results[host] = sock
+                else:
+                    selector.register(sock, selectors.EVENT_WRITE, host)
+
+            deadline = time.monotonic() + self.timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                for key, events in selector.select(remaining):
+                    err = key.fileobj.getsockopt(socket.SOL_SOCKET,
+                                                 socket.SO_ERROR)
+                    results[key.data] = err in _ALIVE_ERRORS
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+
+            for key in list(selector.get_map().values()):
+                results[key.data] = False
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+        finally:
+            selector.close()
+
+        return results
+
+    def _connect(self, host):
+        try:
+            family, socktype, proto, _, sockaddr = socket.getaddrinfo(
+                host, self.port, type=socket.SOCK_STREAM)[0]
+            sock = socket.socket(family, socktype, proto)
+        except OSError as ex:
+            LOG.debug('Unable to probe %(host)s: %(error)s',
+                      {'host': host, 'error': ex})
+            return False
+
+        sock.setblocking(False)
+        err = sock.connect_ex(sockaddr)
+        if err in _IN_PROGRESS_ERRORS:
+            return sock
+
+        sock.close()
+        return err in _ALIVE_ERRORS
+
+    async def probe_async(self, hosts):
+        """Probes hosts once from the running event loop
+
+        :param hosts: hostnames or IPs of the DRAC interfaces
+        :returns: a dictionary with a boolean indicating if each host is
+                  alive, keyed by host
+        """
+        hosts = list(set(hosts))
+        results = await asyncio.gather(*[self._probe_host_async(host)
+                                         for host in hosts])
+
+        return dict(zip(hosts, results))
+
+    async def _probe_host_async(self, host):
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, self.port), self.timeout)
+        except ConnectionRefusedError:
+            return True
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        writer.close()
+        return True
+
+    def wait_for_state(self, hosts, alive, timeout):
+        """Waits until hosts are confirmed alive or down
+
+        :param hosts: hostnames or IPs of the DRAC interfaces
+        :param alive: the state to wait for, True for alive and False for
+                      down
+        :param timeout: number of seconds to wait
+        :returns: a dictionary with a boolean indicating if each host reached
+                  the state, keyed by host
+        :raises: DRACWaitCancelled if the poll scheduler stops waiting, such
+                 as when it is shut down
+        """
+        tracker = _StateTracker(hosts, alive, self._confirmations(alive))
+
+        def check():
+            tracker.update(self.probe(set(tracker.pending)))
+            return not tracker.pending
+
+        self.poll_scheduler.wait(check, self.interval, timeout)
+        return tracker.reached()
+
+    async def wait_for_state_async(self, hosts, alive, timeout):
+        """Waits until hosts are confirmed alive or down
+
+        :param hosts: hostnames or IPs of the DRAC interfaces
+        :param alive: the state to wait for, True for alive and False for
+                      down
+        :param timeout: number of seconds to wait
+        :returns: a dictionary with a boolean indicating if each host reached
+                  the state, keyed by host
+        """
+        tracker = _StateTracker(hosts, alive, self._confirmations(alive))
+        deadline = time.monotonic() + timeout
+        while True:
+            started = time.monotonic()
+            tracker.update(await self.probe_async(set(tracker.pending)))
+            if not tracker.pending or started + self.interval >= deadline:
+                return tracker.reached()
+
+            await asyncio.sleep(
+                max(started + self.interval - time.monotonic(), 0))
+
+    def _confirmations(self, alive):
+        if alive:
+            return self.up_confirmations
+
+        return self.down_confirmations
+
+
+class _StateTracker(object):
+
+    def __init__(self, hosts, alive, confirmations):
+        self.hosts = list(hosts)
+        self.alive = alive
+        self.confirmations = confirmations
+        self.pending = set(self.hosts)
+        self._counts = dict.fromkeys(self.hosts, 0)
+
+    def update(self, results):
+        for host, is_alive in results.items():
+            if is_alive == self.alive:
+                self._counts[host] += 1
+                if self._counts[host] >= self.confirmations:
+                    LOG.debug('%(host)s is %(state)s',
+                              {'host': host,
+                               'state': 'alive' if self.alive else 'down'})
+                    self.pending.discard(host)
+            else:
+                self._counts[host] = 0
+
+    def reached(self):
+        return {host: host not in self.pending for host in self.hosts}
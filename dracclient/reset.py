@@ -0,0 +1,281 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Non-blocking tracking of iDRAC resets.
+"""
+
+import logging
+import time
+
+from dracclient import exceptions
+
+LOG = logging.getLogger(__name__)
+
+# iDRAC reset phases
+RESET_ISSUED = 'reset_issued'
+UNREACHABLE = 'unreachable'
+REACHABLE = 'reachable'
+READY = 'ready'
+
+
+class ResetHandle(object):
+    """Tracks an iDRAC reset through its phases
+
+    The reset moves from RESET_ISSUED to UNREACHABLE once the iDRAC is
+    confirmed down, to REACHABLE once it is confirmed up again and to READY
+    once the Lifecycle Controller accepts commands. Nothing happens in the
+    background: each call to poll() advances the reset by at most one probe
+    or readiness check, so a single thread can drive many resets.
+    """
+
+    def __init__(self, client, liveness_probe, ready_wait_time,
+                 state_timeout):
+        """Creates ResetHandle object
+
+        :param client: an instance of WSManClient of the reset iDRAC
+        :param liveness_probe: a probe.LivenessProbe checking if the iDRAC is
+                               up
+        :param ready_wait_time: the amount of time in seconds to wait after
+                the iDRAC comes back up before checking if it is ready
+        :param state_timeout: the amount of time in seconds to wait for the
+                iDRAC to go down and then to come back up
+        """
+        self.client = client
+        self.host = client.host
+        self.liveness_probe = liveness_probe
+        self.ready_wait_time = ready_wait_time
+        self.state_timeout = state_timeout
+        self.phase = None
+        self.timestamps = {}
+        self.error = None
+        self._confirmations = 0
+        self._ready_checks = 0
+        self._next_poll = 0
+        self._enter(RESET_ISSUED, state_timeout)
+
+    def _enter(self, phase, timeout=None):
+        now = time.monotonic()
+        LOG.debug('The reset of the %(host)s iDRAC reached the %(phase)s '
+                  'phase', {'host': self.host, 'phase': phase})
+        self.phase = phase
+        self.timestamps[phase] = time.time()
+        self._confirmations = 0
+        self._phase_deadline = None if timeout is None else now + timeout
+
+    def _fail(self, message):
+        LOG.error(message)
+        self.error = exceptions.DRACOperationFailed(drac_messages=message)
+
+    def done(self):
+        """Indicates if the reset is over
+
+        :returns: True if the iDRAC is ready or the reset failed
+        """
+        return self.phase == READY or self.error is not None
+
+    def needs_probe(self):
+        """Indicates if the next step of the reset is a liveness probe
+
+        :returns: True if the reset waits for the iDRAC to go down or come
+                  back up and a probe is due
+        """
+        return (not self.done()
+                and self.phase in (RESET_ISSUED, UNREACHABLE)
+                and time.monotonic() >= self._next_poll)
+
+    def needs_ready_check(self):
+        """Indicates if the next step of the reset is a readiness check
+
+        :returns: True if the reset waits for the iDRAC to become ready and
+                  a check is due
+        """
+        return (not self.done()
+                and self.phase == REACHABLE
+                and time.monotonic() >= self._next_poll)
+
+    def poll(self, alive=None):
+        """Advances the reset by at most one step
+
+        :param alive: the result of a liveness probe of the iDRAC made by the
+                      caller, such as poll_all(). If None, the iDRAC is
+                      probed when needed.
+        :returns: True if the reset is over
+        """
+        if self.done():
+            return True
+
+        now = time.monotonic()
+        if now < self._next_poll:
+            return False
+
+        if self.phase in (RESET_ISSUED, UNREACHABLE):
+            if alive is None:
+                alive = self.liveness_probe.probe([self.host])[self.host]
+
+            self._poll_state(alive, now)
+        else:
+            self._poll_ready()
+
+        return self.done()
+
+    def _poll_state(self, alive, now):
+        waiting_for_alive = self.phase == UNREACHABLE
+        if waiting_for_alive:
+            confirmations = self.liveness_probe.up_confirmations
+        else:
+            confirmations = self.liveness_probe.down_confirmations
+
+        if alive == waiting_for_alive:
+            self._confirmations += 1
+        else:
+            self._confirmations = 0
+
+        if self._confirmations >= confirmations:
+            if waiting_for_alive:
+                self._enter(REACHABLE)
+                self._next_poll = time.monotonic() + self.ready_wait_time
+            else:
+                self._enter(UNREACHABLE, self.state_timeout)
+                self._next_poll = now + self.liveness_probe.interval
+            return
+
+        if now + self.liveness_probe.interval >= self._phase_deadline:
+            self._fail("Timed out waiting for the %s iDRAC to become %s" %
+                       (self.host,
+                        'pingable' if waiting_for_alive else 'not pingable'))
+            return
+
+        self._next_poll = now + self.liveness_probe.interval
+
+    def _poll_ready(self):
+        self._ready_checks += 1
+        try:
+            ready = self.client.is_idrac_ready()
+        except exceptions.WSManRequestFailure as ex:
+            LOG.debug('Unable to check if the %(host)s iDRAC is ready: '
+                      '%(error)s', {'host': self.host, 'error': ex})
+            ready = False
+        except exceptions.BaseClientException as ex:
+            self.error = ex
+            return
+
+        if ready:
+            self.client.cache_ready()
+            self._enter(READY)
+            return
+
+        policy = self.client.ready_retry_policy
+        if (self._ready_checks >= policy.max_attempts
+                or not policy.acquire_retry(self.host)):
+            self._fail("Timed out waiting for the %s iDRAC to become ready" %
+                       self.host)
+            return
+
+        self._next_poll = time.monotonic() + policy.delay(self._ready_checks)
+
+    def result(self, timeout=None):
+        """Waits for the reset to be over
+
+        :param timeout: the number of seconds to wait. If None, waits until
+                        the reset is over.
+        :returns: True once the iDRAC is ready
+        :raises: DRACResetInProgress if the reset is not over after timeout
+                 seconds
+        :raises: DRACOperationFailed on failure to reset iDRAC
+        """
+        wait_all([self], timeout)
+        if self.error is not None:
+            raise self.error
+
+        return True
+
+    def wait_time(self):
+        """Returns the number of seconds until the next step of the reset
+
+        :returns: the number of seconds, 0 if the next step is due
+        """
+        return max(self._next_poll - time.monotonic(), 0)
+
+
+def poll_all(handles):
+    """Advances many resets by at most one step each
+
+    The iDRACs waiting for a liveness probe are probed at once. The
+    readiness checks of the iDRACs which came back up are made at the same
+    time by the poll schedulers of their clients.
+
+    :param handles: ResetHandle objects
+    :returns: the list of the handles of the resets which are over
+    """
+    handles = list(handles)
+    probed = [handle for handle in handles if handle.needs_probe()]
+    results = {}
+    for liveness_probe in set(handle.liveness_probe for handle in probed):
+        results.update(liveness_probe.probe(
+            [handle.host for handle in probed
+             if handle.liveness_probe is liveness_probe]))
+
+    checked = [handle for handle in handles if handle.needs_ready_check()]
+    waits = [handle.client.poll_scheduler.schedule(
+        handle.client.bind_deadline(_single_check(handle.poll)), 0,
+        key=handle.host) for handle in checked]
+    for wait in waits:
+        wait.result()
+
+    for handle in handles:
+        if handle not in checked:
+            handle.poll(results.get(handle.host))
+
+    return [handle for handle in handles if handle.done()]
+
+
+def _single_check(poll):
+    # a check ending its wait after a single call
+    def check():
+        poll()
+        return True
+
+    return check
+
+
+def wait_all(handles, timeout=None):
+    """Waits for many resets to be over from the calling thread
+
+    :param handles: ResetHandle objects
+    :param timeout: the number of seconds to wait. If None, waits until all
+                    the resets are over.
+    :returns: the list of the handles
+    :raises: DRACResetInProgress if a reset is not over after timeout
+             seconds
+    """
+    handles = list(handles)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = handles
+    while True:
+        poll_all(pending)
+        pending = [handle for handle in pending if not handle.done()]
+        if not pending:
+            return handles
+
+        delay = min(handle.wait_time() for handle in pending)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise exceptions.DRACResetInProgress(
+                    host=pending[0].host, phase=pending[0].phase,
+                    timeout=timeout)
+
+            delay = min(delay, remaining)
+
+        time.sleep(delay)
@@ -31,6 +31,11 @@ POWER_STATES = {
 
 REVERSE_POWER_STATES = dict((v, k) for (k, v) in POWER_STATES.items())
 
+POWER_STATE_FILTER_QUERY = 'select EnabledState from DCIM_ComputerSystem'
+
+COMPUTER_SYSTEM_SELECTORS = {'CreationClassName': 'DCIM_ComputerSystem',
+                             'Name': 'srv:system'}
+
 BOOT_MODE_IS_CURRENT = {
     '1': True,
     '2': False
@@ -52,6 +57,36 @@ BootDevice = collections.namedtuple(
     ['id',  'boot_mode', 'current_assigned_sequence',
      'pending_assigned_sequence', 'bios_boot_string'])
 
+BOOT_MODE_PARSER = utils.ViewParser(
+    BootMode, uris.DCIM_BootConfigSetting, {
+        'id': utils.ViewField('InstanceID'),
+        'name': utils.ViewField('ElementName'),
+        'is_current': utils.ViewField('IsCurrent',
+                                      lookup=BOOT_MODE_IS_CURRENT),
+        'is_next': utils.ViewField('IsNext', lookup=BOOT_MODE_IS_NEXT),
+    })
+
+_BOOT_DEVICE_FIELDS = {
+    'id': utils.ViewField('InstanceID'),
+    'boot_mode': utils.ViewField('BootSourceType'),
+    'current_assigned_sequence': utils.ViewField('CurrentAssignedSequence',
+                                                 converter=int),
+    'pending_assigned_sequence': utils.ViewField('PendingAssignedSequence',
+                                                 converter=int),
+    'bios_boot_string': utils.ViewField('BIOSBootString'),
+}
+
+BOOT_DEVICE_PARSER = utils.ViewParser(
+    BootDevice, uris.DCIM_BootSourceSetting, _BOOT_DEVICE_FIELDS)
+
+# DRAC 11g doesn't have the BootSourceType attribute, the boot mode is the
+# prefix of the InstanceID
+BOOT_DEVICE_PARSER_11G = utils.ViewParser(
+    BootDevice, uris.DCIM_BootSourceSetting, dict(
+        _BOOT_DEVICE_FIELDS,
+        boot_mode=utils.ComputedField(
+            lambda values: values['id'].split(':')[0])))
+
 
 class PowerManagement(object):
 
@@ -73,13 +108,10 @@ class PowerManagement(object):
                  interface
         """
 
-        filter_query = ('select EnabledState from DCIM_ComputerSystem')
         doc = self.client.enumerate(uris.DCIM_ComputerSystem,
-                                    filter_query=filter_query)
-        enabled_state = utils.find_xml(doc, 'EnabledState',
-                                       uris.DCIM_ComputerSystem)
+                                    filter_query=POWER_STATE_FILTER_QUERY)
 
-        return POWER_STATES[enabled_state.text]
+        return self._parse_get_power_state(doc)
 
     def set_power_state(self, target_state):
         """Turns the server power on/off or do a reboot
@@ -94,8 +126,21 @@ class PowerManagement(object):
         :raises: InvalidParameterValue on invalid target power state
         """
 
+        properties = {
+            'RequestedState': self._get_drac_power_state(target_state)}
+
+        self.client.invoke(uris.DCIM_ComputerSystem, 'RequestStateChange',
+                           COMPUTER_SYSTEM_SELECTORS, properties)
+
+    def _parse_get_power_state(self, doc):
+        enabled_state = utils.find_xml(doc, 'EnabledState',
+                                       uris.DCIM_ComputerSystem)
+
+        return POWER_STATES[enabled_state.text]
+
+    def _get_drac_power_state(self, target_state):
         try:
-            drac_requested_state = REVERSE_POWER_STATES[target_state]
+            return REVERSE_POWER_STATES[target_state]
         except KeyError:
             msg = ("'%(target_state)s' is not supported. "
                    "Supported power states: %(supported_power_states)r") % {
@@ -103,13 +148,6 @@ class PowerManagement(object):
                        'supported_power_states': list(REVERSE_POWER_STATES)}
             raise exceptions.InvalidParameterValue(reason=msg)
 
-        selectors = {'CreationClassName': 'DCIM_ComputerSystem',
-                     'Name': 'srv:system'}
-        properties = {'RequestedState': drac_requested_state}
-
-        self.client.invoke(uris.DCIM_ComputerSystem, 'RequestStateChange',
-                           selectors, properties)
-
 
 class BootManagement(object):
 
@@ -132,6 +170,9 @@ class BootManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_BootConfigSetting)
 
+        return self._parse_list_boot_modes(doc)
+
+    def _parse_list_boot_modes(self, doc):
         drac_boot_modes = utils.find_xml(doc, 'DCIM_BootConfigSetting',
                                          uris.DCIM_BootConfigSetting,
                                          find_all=True)
@@ -153,12 +194,8 @@ class BootManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_BootSourceSetting)
 
-        drac_boot_devices = utils.find_xml(doc, 'DCIM_BootSourceSetting',
-                                           uris.DCIM_BootSourceSetting,
-                                           find_all=True)
         try:
-            boot_devices = [self._parse_drac_boot_device(drac_boot_device)
-                            for drac_boot_device in drac_boot_devices]
+            return self._parse_list_boot_devices(doc)
         except AttributeError:
             # DRAC 11g doesn't have the BootSourceType attribute on the
             # DCIM_BootSourceSetting resource
@@ -167,12 +204,22 @@ class BootManagement(object):
                     self.client).get_version())
 
             if controller_version < LC_CONTROLLER_VERSION_12G:
-                boot_devices = [
-                    self._parse_drac_boot_device_11g(drac_boot_device)
-                    for drac_boot_device in drac_boot_devices]
+                return self._parse_list_boot_devices(doc, is_11g=True)
             else:
                 raise
 
+    def _parse_list_boot_devices(self, doc, is_11g=False):
+        drac_boot_devices = utils.find_xml(doc, 'DCIM_BootSourceSetting',
+                                           uris.DCIM_BootSourceSetting,
+                                           find_all=True)
+        if is_11g:
+            parse_drac_boot_device = self._parse_drac_boot_device_11g
+        else:
+            parse_drac_boot_device = self._parse_drac_boot_device
+
+        boot_devices = [parse_drac_boot_device(drac_boot_device)
+                        for drac_boot_device in drac_boot_devices]
+
         # group devices by boot mode
         boot_devices_per_mode = {device.boot_mode: []
                                  for device in boot_devices}
@@ -208,57 +255,21 @@ class BootManagement(object):
                            properties, expected_return_value=utils.RET_SUCCESS)
 
     def _parse_drac_boot_mode(self, drac_boot_mode):
-        return BootMode(
-            id=self._get_boot_mode_attr(drac_boot_mode, 'InstanceID'),
-            name=self._get_boot_mode_attr(drac_boot_mode, 'ElementName'),
-            is_current=BOOT_MODE_IS_CURRENT[self._get_boot_mode_attr(
-                drac_boot_mode, 'IsCurrent')],
-            is_next=BOOT_MODE_IS_NEXT[self._get_boot_mode_attr(
-                drac_boot_mode, 'IsNext')])
-
-    def _get_boot_mode_attr(self, drac_boot_mode, attr_name):
-        return utils.get_wsman_resource_attr(drac_boot_mode,
-                                             uris.DCIM_BootConfigSetting,
-                                             attr_name)
-
-    def _parse_drac_boot_device_common(self, drac_boot_device, instance_id,
-                                       boot_mode):
-        return BootDevice(
-            id=instance_id,
-            boot_mode=boot_mode,
-            current_assigned_sequence=int(self._get_boot_device_attr(
-                drac_boot_device, 'CurrentAssignedSequence')),
-            pending_assigned_sequence=int(self._get_boot_device_attr(
-                drac_boot_device, 'PendingAssignedSequence')),
-            bios_boot_string=self._get_boot_device_attr(drac_boot_device,
-                                                        'BIOSBootString'))
+        return BOOT_MODE_PARSER.parse(drac_boot_mode)
 
     def _parse_drac_boot_device(self, drac_boot_device):
-        instance_id = self._get_boot_device_attr(drac_boot_device,
-                                                 'InstanceID')
-        boot_mode = self._get_boot_device_attr(drac_boot_device,
-                                               'BootSourceType')
-
-        return self._parse_drac_boot_device_common(drac_boot_device,
-                                                   instance_id, boot_mode)
+        return BOOT_DEVICE_PARSER.parse(drac_boot_device)
 
     def _parse_drac_boot_device_11g(self, drac_boot_device):
-        instance_id = self._get_boot_device_attr(drac_boot_device,
-                                                 'InstanceID')
-        boot_mode = instance_id.split(':')[0]
-
-        return self._parse_drac_boot_device_common(drac_boot_device,
-                                                   instance_id, boot_mode)
-
-    def _get_boot_device_attr(self, drac_boot_device, attr_name):
-        return utils.get_wsman_resource_attr(drac_boot_device,
-                                             uris.DCIM_BootSourceSetting,
-                                             attr_name)
+        return BOOT_DEVICE_PARSER_11G.parse(drac_boot_device)
 
 
 class BIOSAttribute(object):
     """Generic BIOS attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only):
         """Creates BIOSAttribute object
@@ -277,7 +288,7 @@ class BIOSAttribute(object):
         self.read_only = read_only
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -286,16 +297,12 @@ class BIOSAttribute(object):
     def parse(cls, namespace, bios_attr_xml):
         """Parses XML and creates BIOSAttribute object"""
 
-        name = utils.get_wsman_resource_attr(
-            bios_attr_xml, namespace, 'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(
-            bios_attr_xml, namespace, 'InstanceID')
-        current_value = utils.get_wsman_resource_attr(
-            bios_attr_xml, namespace, 'CurrentValue', nullable=True)
-        pending_value = utils.get_wsman_resource_attr(
-            bios_attr_xml, namespace, 'PendingValue', nullable=True)
-        read_only = utils.get_wsman_resource_attr(
-            bios_attr_xml, namespace, 'IsReadOnly')
+        bios_attr_xml = utils.ItemView.of(bios_attr_xml, namespace)
+        name = bios_attr_xml.get_attr('AttributeName')
+        instance_id = bios_attr_xml.get_attr('InstanceID')
+        current_value = bios_attr_xml.get_attr('CurrentValue', nullable=True)
+        pending_value = bios_attr_xml.get_attr('PendingValue', nullable=True)
+        read_only = bios_attr_xml.get_attr('IsReadOnly')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'))
@@ -304,6 +311,8 @@ class BIOSAttribute(object):
 class BIOSEnumerableAttribute(BIOSAttribute):
     """Enumerable BIOS attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_BIOSEnumeration
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -327,10 +336,10 @@ class BIOSEnumerableAttribute(BIOSAttribute):
     def parse(cls, bios_attr_xml):
         """Parses XML and creates BIOSEnumerableAttribute object"""
 
+        bios_attr_xml = utils.ItemView.of(bios_attr_xml, cls.namespace)
         bios_attr = BIOSAttribute.parse(cls.namespace, bios_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(bios_attr_xml, 'PossibleValues',
-                                             cls.namespace, find_all=True)]
+                           in bios_attr_xml.find_all('PossibleValues')]
 
         return cls(bios_attr.name, bios_attr.instance_id,
                    bios_attr.current_value, bios_attr.pending_value,
@@ -351,6 +360,8 @@ class BIOSEnumerableAttribute(BIOSAttribute):
 class BIOSStringAttribute(BIOSAttribute):
     """String BIOS attribute class"""
 
+    __slots__ = ('min_length', 'max_length', 'pcre_regex')
+
     namespace = uris.DCIM_BIOSString
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -378,13 +389,11 @@ class BIOSStringAttribute(BIOSAttribute):
     def parse(cls, bios_attr_xml):
         """Parses XML and creates BIOSStringAttribute object"""
 
+        bios_attr_xml = utils.ItemView.of(bios_attr_xml, cls.namespace)
         bios_attr = BIOSAttribute.parse(cls.namespace, bios_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(
-            bios_attr_xml, cls.namespace, 'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(
-            bios_attr_xml, cls.namespace, 'MaxLength'))
-        pcre_regex = utils.get_wsman_resource_attr(
-            bios_attr_xml, cls.namespace, 'ValueExpression', nullable=True)
+        min_length = int(bios_attr_xml.get_attr('MinLength'))
+        max_length = int(bios_attr_xml.get_attr('MaxLength'))
+        pcre_regex = bios_attr_xml.get_attr('ValueExpression', nullable=True)
 
         return cls(bios_attr.name, bios_attr.instance_id,
                    bios_attr.current_value, bios_attr.pending_value,
@@ -407,6 +416,8 @@ class BIOSStringAttribute(BIOSAttribute):
 class BIOSIntegerAttribute(BIOSAttribute):
     """Integer BIOS attribute class"""
 
+    __slots__ = ('lower_bound', 'upper_bound')
+
     namespace = uris.DCIM_BIOSInteger
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -431,11 +442,10 @@ class BIOSIntegerAttribute(BIOSAttribute):
     def parse(cls, bios_attr_xml):
         """Parses XML and creates BIOSIntegerAttribute object"""
 
+        bios_attr_xml = utils.ItemView.of(bios_attr_xml, cls.namespace)
         bios_attr = BIOSAttribute.parse(cls.namespace, bios_attr_xml)
-        lower_bound = utils.get_wsman_resource_attr(
-            bios_attr_xml, cls.namespace, 'LowerBound')
-        upper_bound = utils.get_wsman_resource_attr(
-            bios_attr_xml, cls.namespace, 'UpperBound')
+        lower_bound = bios_attr_xml.get_attr('LowerBound')
+        upper_bound = bios_attr_xml.get_attr('UpperBound')
 
         if bios_attr.current_value:
             bios_attr.current_value = int(bios_attr.current_value)
@@ -473,11 +483,14 @@ class BIOSConfiguration(object):
         """
         self.client = client
 
-    def list_bios_settings(self, by_name=True):
+    def list_bios_settings(self, by_name=True, lazy=False):
         """List the BIOS configuration settings
 
         :param by_name: Controls whether returned dictionary uses BIOS
                         attribute name or instance_id as key.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the BIOS settings using its name as the
                   key. The attributes are either BIOSEnumerableAttribute,
                   BIOSStringAttribute or BIOSIntegerAttribute objects.
@@ -487,7 +500,8 @@ class BIOSConfiguration(object):
                  interface
         """
 
-        return utils.list_settings(self.client, self.NAMESPACES, by_name)
+        return utils.list_settings(self.client, self.NAMESPACES, by_name,
+                                   lazy=lazy)
 
     def set_bios_settings(self, new_settings):
         """Sets the BIOS configuration
@@ -14,10 +14,19 @@
 from dracclient.resources import uris
 from dracclient import utils
 
+IDRAC_CARD_SERVICE_SELECTORS = {
+    'CreationClassName': "DCIM_iDRACCardService",
+    'Name': "DCIM:iDRACCardService",
+    'SystemCreationClassName': 'DCIM_ComputerSystem',
+    'SystemName': 'DCIM:ComputerSystem'}
+
 
 class iDRACCardAttribute(object):
     """Generic iDRACCard attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only', 'fqdd', 'group_id')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only, fqdd, group_id):
         """Creates iDRACCardAttribute object
@@ -42,26 +51,20 @@ class iDRACCardAttribute(object):
         self.group_id = group_id
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     @classmethod
     def parse(cls, namespace, idrac_attr_xml):
         """Parses XML and creates iDRACCardAttribute object"""
 
-        name = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'InstanceID')
-        current_value = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'CurrentValue', nullable=True)
-        pending_value = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'PendingValue', nullable=True)
-        read_only = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'IsReadOnly').lower()
-        fqdd = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'FQDD')
-        group_id = utils.get_wsman_resource_attr(
-            idrac_attr_xml, namespace, 'GroupID')
+        idrac_attr_xml = utils.ItemView.of(idrac_attr_xml, namespace)
+        name = idrac_attr_xml.get_attr('AttributeName')
+        instance_id = idrac_attr_xml.get_attr('InstanceID')
+        current_value = idrac_attr_xml.get_attr('CurrentValue', nullable=True)
+        pending_value = idrac_attr_xml.get_attr('PendingValue', nullable=True)
+        read_only = idrac_attr_xml.get_attr('IsReadOnly').lower()
+        fqdd = idrac_attr_xml.get_attr('FQDD')
+        group_id = idrac_attr_xml.get_attr('GroupID')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'), fqdd, group_id)
@@ -70,6 +73,8 @@ class iDRACCardAttribute(object):
 class iDRACCardEnumerableAttribute(iDRACCardAttribute):
     """Enumerable iDRACCard attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_iDRACCardEnumeration
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -100,10 +105,10 @@ class iDRACCardEnumerableAttribute(iDRACCardAttribute):
     def parse(cls, idrac_attr_xml):
         """Parses XML and creates iDRACCardEnumerableAttribute object"""
 
+        idrac_attr_xml = utils.ItemView.of(idrac_attr_xml, cls.namespace)
         idrac_attr = iDRACCardAttribute.parse(cls.namespace, idrac_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(idrac_attr_xml, 'PossibleValues',
-                                             cls.namespace, find_all=True)]
+                           in idrac_attr_xml.find_all('PossibleValues')]
 
         return cls(idrac_attr.name, idrac_attr.instance_id,
                    idrac_attr.current_value, idrac_attr.pending_value,
@@ -125,6 +130,8 @@ class iDRACCardEnumerableAttribute(iDRACCardAttribute):
 class iDRACCardStringAttribute(iDRACCardAttribute):
     """String iDRACCard attribute class"""
 
+    __slots__ = ('min_length', 'max_length')
+
     namespace = uris.DCIM_iDRACCardString
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -156,11 +163,10 @@ class iDRACCardStringAttribute(iDRACCardAttribute):
     def parse(cls, idrac_attr_xml):
         """Parses XML and creates iDRACCardStringAttribute object"""
 
+        idrac_attr_xml = utils.ItemView.of(idrac_attr_xml, cls.namespace)
         idrac_attr = iDRACCardAttribute.parse(cls.namespace, idrac_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(
-            idrac_attr_xml, cls.namespace, 'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(
-            idrac_attr_xml, cls.namespace, 'MaxLength'))
+        min_length = int(idrac_attr_xml.get_attr('MinLength'))
+        max_length = int(idrac_attr_xml.get_attr('MaxLength'))
 
         return cls(idrac_attr.name, idrac_attr.instance_id,
                    idrac_attr.current_value, idrac_attr.pending_value,
@@ -185,6 +191,8 @@ class iDRACCardStringAttribute(iDRACCardAttribute):
 class iDRACCardIntegerAttribute(iDRACCardAttribute):
     """Integer iDRACCard attribute class"""
 
+    __slots__ = ('lower_bound', 'upper_bound')
+
     namespace = uris.DCIM_iDRACCardInteger
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -216,11 +224,10 @@ class iDRACCardIntegerAttribute(iDRACCardAttribute):
     def parse(cls, idrac_attr_xml):
         """Parses XML and creates iDRACCardIntegerAttribute object"""
 
+        idrac_attr_xml = utils.ItemView.of(idrac_attr_xml, cls.namespace)
         idrac_attr = iDRACCardAttribute.parse(cls.namespace, idrac_attr_xml)
-        lower_bound = utils.get_wsman_resource_attr(
-            idrac_attr_xml, cls.namespace, 'LowerBound')
-        upper_bound = utils.get_wsman_resource_attr(
-            idrac_attr_xml, cls.namespace, 'UpperBound')
+        lower_bound = idrac_attr_xml.get_attr('LowerBound')
+        upper_bound = idrac_attr_xml.get_attr('UpperBound')
 
         if idrac_attr.current_value:
             idrac_attr.current_value = int(idrac_attr.current_value)
@@ -260,7 +267,8 @@ class iDRACCardConfiguration(object):
         """
         self.client = client
 
-    def list_idrac_settings(self, by_name=False, fqdd_filter=None):
+    def list_idrac_settings(self, by_name=False, fqdd_filter=None,
+                            lazy=False):
         """List the iDRACCard configuration settings
 
         :param by_name: Controls whether returned dictionary uses iDRAC card
@@ -269,6 +277,9 @@ class iDRACCardConfiguration(object):
                         form "group_id#name".
         :param fqdd_filter: An FQDD used to filter the instances.  Note that
                             this is only used when by_name is True.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the iDRAC settings using instance_id as the
                   key except when by_name is True. The attributes are either
                   iDRACCArdEnumerableAttribute, iDRACCardStringAttribute or
@@ -283,7 +294,8 @@ class iDRACCardConfiguration(object):
                                    self.NAMESPACES,
                                    by_name=by_name,
                                    fqdd_filter=fqdd_filter,
-                                   name_formatter=_name_formatter)
+                                   name_formatter=_name_formatter,
+                                   lazy=lazy)
 
     def set_idrac_settings(self, new_settings, idrac_fqdd):
         """Set the iDRACCard configuration settings
@@ -330,19 +342,18 @@ class iDRACCardConfiguration(object):
         :raises: WSManRequestFailure on request failures
         :raises: WSManInvalidResponse when receiving invalid response
         """
-        selectors = {'CreationClassName': "DCIM_iDRACCardService",
-                     'Name': "DCIM:iDRACCardService",
-                     'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'DCIM:ComputerSystem'}
-
         properties = {'Force': "1" if force else "0"}
 
         doc = self.client.invoke(uris.DCIM_iDRACCardService,
                                  'iDRACReset',
-                                 selectors,
+                                 IDRAC_CARD_SERVICE_SELECTORS,
                                  properties,
                                  check_return_value=False)
+        self.client.invalidate_ready_cache()
+
+        return self._parse_reset_idrac(doc)
 
+    def _parse_reset_idrac(self, doc):
         message_id = utils.find_xml(doc,
                                     'MessageID',
                                     uris.DCIM_iDRACCardService).text
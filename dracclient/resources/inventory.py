@@ -62,6 +62,61 @@ System = collections.namedtuple(
     ['id', 'lcc_version', 'model', 'service_tag', 'uuid'])
 
 
+def _cpu_count(values):
+    if values['ht_enabled']:
+        return values['cores'] * 2
+    else:
+        return values['cores']
+
+
+CPU_PARSER = utils.ViewParser(CPU, uris.DCIM_CPUView, {
+    'id': utils.ViewField('FQDD'),
+    'cores': utils.ViewField('NumberOfProcessorCores', converter=int),
+    'speed_mhz': utils.ViewField('CurrentClockSpeed', converter=int),
+    'model': utils.ViewField('Model'),
+    'status': utils.ViewField('PrimaryStatus',
+                              lookup=constants.PRIMARY_STATUS),
+    'ht_enabled': utils.ViewField('HyperThreadingEnabled', allow_missing=True,
+                                  converter=bool, default=False),
+    'cpu_count': utils.ComputedField(_cpu_count),
+    'turbo_enabled': utils.ViewField('TurboModeEnabled', allow_missing=True,
+                                     converter=bool, default=False),
+    'vt_enabled': utils.ViewField('VirtualizationTechnologyEnabled',
+                                  allow_missing=True, converter=bool,
+                                  default=False),
+    'arch64': utils.ViewField(
+        'Characteristics',
+        converter=lambda value: value == CPU_CHARACTERISTICS_64BIT),
+})
+
+MEMORY_PARSER = utils.ViewParser(Memory, uris.DCIM_MemoryView, {
+    'id': utils.ViewField('FQDD'),
+    'size_mb': utils.ViewField('Size', converter=int),
+    'speed_mhz': utils.ViewField('Speed', converter=int),
+    'manufacturer': utils.ViewField('Manufacturer'),
+    'model': utils.ViewField('Model'),
+    'status': utils.ViewField('PrimaryStatus',
+                              lookup=constants.PRIMARY_STATUS),
+})
+
+NIC_PARSER = utils.ViewParser(NIC, uris.DCIM_NICView, {
+    'id': utils.ViewField('FQDD'),
+    'mac': utils.ViewField('CurrentMACAddress'),
+    'model': utils.ViewField('ProductName'),
+    'speed_mbps': utils.ViewField('LinkSpeed', lookup=NIC_LINK_SPEED_MBPS),
+    'duplex': utils.ViewField('LinkDuplex', lookup=NIC_LINK_DUPLEX),
+    'media_type': utils.ViewField('MediaType'),
+})
+
+SYSTEM_PARSER = utils.ViewParser(System, uris.DCIM_SystemView, {
+    'id': utils.ViewField('InstanceID'),
+    'lcc_version': utils.ViewField('LifecycleControllerVersion'),
+    'model': utils.ViewField('Model'),
+    'service_tag': utils.ViewField('ServiceTag'),
+    'uuid': utils.ViewField('UUID'),
+})
+
+
 class InventoryManagement(object):
 
     def __init__(self, client):
@@ -82,6 +137,9 @@ class InventoryManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_CPUView)
 
+        return self._parse_list_cpus(doc)
+
+    def _parse_list_cpus(self, doc):
         cpus = utils.find_xml(doc, 'DCIM_CPUView',
                               uris.DCIM_CPUView,
                               find_all=True)
@@ -89,37 +147,7 @@ class InventoryManagement(object):
         return [self._parse_cpus(cpu) for cpu in cpus]
 
     def _parse_cpus(self, cpu):
-        drac_characteristics = self._get_cpu_attr(cpu, 'Characteristics')
-        arch64 = (CPU_CHARACTERISTICS_64BIT == drac_characteristics)
-
-        return CPU(
-            id=self._get_cpu_attr(cpu, 'FQDD'),
-            cores=int(self._get_cpu_attr(cpu, 'NumberOfProcessorCores')),
-            speed_mhz=int(self._get_cpu_attr(cpu, 'CurrentClockSpeed')),
-            model=self._get_cpu_attr(cpu, 'Model'),
-            status=constants.PRIMARY_STATUS[
-                self._get_cpu_attr(cpu, 'PrimaryStatus')],
-            ht_enabled=bool(self._get_cpu_attr(cpu, 'HyperThreadingEnabled',
-                                               allow_missing=True)),
-            turbo_enabled=bool(self._get_cpu_attr(cpu, 'TurboModeEnabled',
-                                                  allow_missing=True)),
-            cpu_count=self._get_cpu_count(
-                int(self._get_cpu_attr(cpu, 'NumberOfProcessorCores')),
-                bool(self._get_cpu_attr(cpu, 'HyperThreadingEnabled',
-                                        allow_missing=True))),
-            vt_enabled=bool(self._get_cpu_attr(
-                cpu, 'VirtualizationTechnologyEnabled', allow_missing=True)),
-            arch64=arch64)
-
-    def _get_cpu_count(self, cores, ht_enabled):
-        if ht_enabled:
-            return int(cores * 2)
-        else:
-            return int(cores)
-
-    def _get_cpu_attr(self, cpu, attr_name, allow_missing=False):
-        return utils.get_wsman_resource_attr(
-            cpu, uris.DCIM_CPUView, attr_name, allow_missing=allow_missing)
+        return CPU_PARSER.parse(cpu)
 
     def list_memory(self):
         """Returns the list of installed memory
@@ -132,6 +160,9 @@ class InventoryManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_MemoryView)
 
+        return self._parse_list_memory(doc)
+
+    def _parse_list_memory(self, doc):
         installed_memory = utils.find_xml(doc, 'DCIM_MemoryView',
                                           uris.DCIM_MemoryView,
                                           find_all=True)
@@ -139,18 +170,7 @@ class InventoryManagement(object):
         return [self._parse_memory(memory) for memory in installed_memory]
 
     def _parse_memory(self, memory):
-        return Memory(
-            id=self._get_memory_attr(memory, 'FQDD'),
-            size_mb=int(self._get_memory_attr(memory, 'Size')),
-            speed_mhz=int(self._get_memory_attr(memory, 'Speed')),
-            manufacturer=self._get_memory_attr(memory, 'Manufacturer'),
-            model=self._get_memory_attr(memory, 'Model'),
-            status=constants.PRIMARY_STATUS[
-                self._get_memory_attr(memory, 'PrimaryStatus')])
-
-    def _get_memory_attr(self, memory, attr_name):
-        return utils.get_wsman_resource_attr(memory, uris.DCIM_MemoryView,
-                                             attr_name)
+        return MEMORY_PARSER.parse(memory)
 
     def list_nics(self, sort=False):
         """Returns the list of NICs
@@ -163,6 +183,10 @@ class InventoryManagement(object):
         """
 
         doc = self.client.enumerate(uris.DCIM_NICView)
+
+        return self._parse_list_nics(doc, sort)
+
+    def _parse_list_nics(self, doc, sort=False):
         drac_nics = utils.find_xml(doc, 'DCIM_NICView', uris.DCIM_NICView,
                                    find_all=True)
         nics = [self._parse_drac_nic(nic) for nic in drac_nics]
@@ -172,21 +196,7 @@ class InventoryManagement(object):
         return nics
 
     def _parse_drac_nic(self, drac_nic):
-        fqdd = self._get_nic_attr(drac_nic, 'FQDD')
-        drac_speed = self._get_nic_attr(drac_nic, 'LinkSpeed')
-        drac_duplex = self._get_nic_attr(drac_nic, 'LinkDuplex')
-
-        return NIC(
-            id=fqdd,
-            mac=self._get_nic_attr(drac_nic, 'CurrentMACAddress'),
-            model=self._get_nic_attr(drac_nic, 'ProductName'),
-            speed_mbps=NIC_LINK_SPEED_MBPS[drac_speed],
-            duplex=NIC_LINK_DUPLEX[drac_duplex],
-            media_type=self._get_nic_attr(drac_nic, 'MediaType'))
-
-    def _get_nic_attr(self, drac_nic, attr_name):
-        return utils.get_wsman_resource_attr(drac_nic, uris.DCIM_NICView,
-                                             attr_name)
+        return NIC_PARSER.parse(drac_nic)
 
     def get_system(self):
         """Returns a System object
@@ -196,6 +206,10 @@ class InventoryManagement(object):
             :raises: WSManInvalidRespons when receiving invalid response
         """
         doc = self.client.enumerate(uris.DCIM_SystemView)
+
+        return self._parse_get_system(doc)
+
+    def _parse_get_system(self, doc):
         drac_system = utils.find_xml(doc,
                                      'DCIM_SystemView',
                                      uris.DCIM_SystemView,
@@ -204,15 +218,4 @@ class InventoryManagement(object):
         return self._parse_drac_system(drac_system)
 
     def _parse_drac_system(self, drac_system):
-        return System(
-            id=self._get_system_attr(drac_system, 'InstanceID'),
-            uuid=self._get_system_attr(drac_system, 'UUID'),
-            service_tag=self._get_system_attr(drac_system, 'ServiceTag'),
-            model=self._get_system_attr(drac_system, 'Model'),
-            lcc_version=self._get_system_attr(drac_system,
-                                              'LifecycleControllerVersion'))
-
-    def _get_system_attr(self, drac_system, attr_name):
-        return utils.get_wsman_resource_attr(drac_system,
-                                             uris.DCIM_SystemView,
-                                             attr_name)
+        return SYSTEM_PARSER.parse(drac_system)
@@ -12,7 +12,10 @@
 #    under the License.
 
 import collections
+import concurrent.futures
 import logging
+import re
+import time
 
 from dracclient import constants
 import dracclient.exceptions as exceptions
@@ -27,21 +30,167 @@ Job = collections.namedtuple(
     ['id', 'name', 'start_time', 'until_time', 'message', 'status',
      'percent_complete'])
 
+JobEvent = collections.namedtuple(
+    'JobEvent',
+    ['job_id', 'previous', 'current'])
+
+JOB_PARSER = utils.ViewParser(Job, uris.DCIM_LifecycleJob, {
+    'id': utils.ViewField('InstanceID'),
+    'name': utils.ViewField('Name'),
+    'start_time': utils.ViewField('JobStartTime'),
+    'until_time': utils.ViewField('JobUntilTime'),
+    'message': utils.ViewField('Message'),
+    'status': utils.ViewField('JobStatus'),
+    'percent_complete': utils.ViewField('PercentComplete'),
+})
+
 REBOOT_TYPES = {
     constants.RebootJobType.power_cycle: '1',
     constants.RebootJobType.graceful_reboot: '2',
     constants.RebootJobType.reboot_forced_shutdown: '3',
 }
 
+JOB_SERVICE_SELECTORS = {'SystemCreationClassName': 'DCIM_ComputerSystem',
+                         'SystemName': 'idrac',
+                         'CreationClassName': 'DCIM_JobService',
+                         'Name': 'JobService'}
+
+UNFINISHED_JOBS_FILTER_QUERY = ('select * from DCIM_LifecycleJob '
+                                'where Name != "CLEARALL" and '
+                                'JobStatus != "Reboot Completed" and '
+                                'JobStatus != "Reboot Failed" and '
+                                'JobStatus != "Completed" and '
+                                'JobStatus != "Completed with Errors" and '
+                                'JobStatus != "Failed"')
+
+CLEAR_ALL_JOB_IDS = ('JID_CLEARALL', 'JID_CLEARALL_FORCE')
+
+JOB_FILTER_QUERY = 'select * from DCIM_LifecycleJob where InstanceID="%s"'
+
+JOBS_FILTER_QUERY = 'select * from DCIM_LifecycleJob where %s'
+
+JOB_ID_FILTER = 'InstanceID="%s"'
+
+# longest filter query sent when looking up many jobs at once
+JOBS_FILTER_QUERY_MAX_LENGTH = 1024
+
+FINISHED_JOB_STATUSES = frozenset(['Reboot Completed', 'Reboot Failed',
+                                   'Completed', 'Completed with Errors',
+                                   'Failed'])
+
+JOB_ID_SELECTOR_QUERY = ('.//{%s}Selector[@Name="InstanceID"]'
+                         % wsman.NS_WSMAN)
+
+# the ids of the jobs end with the number of seconds since the epoch at which
+# they were created, such as JID_001436912645
+JOB_ID_EPOCH_RE = re.compile(r'^[A-Z]+_0*(\d+)$')
+
+PruneResult = collections.namedtuple(
+    'PruneResult',
+    ['size_before', 'size_after', 'deleted', 'errors'])
+
+
+class JobRetentionPolicy(object):
+    """Decides which finished jobs are pruned from the job queue
+
+    A finished job is kept if it is one of the keep_last most recent
+    finished jobs or if it is younger than max_age seconds. Jobs which are
+    not finished, such as scheduled or running ones, are always kept.
+
+    The iDRAC reports no usable start time for most jobs, so the age and the
+    order of the jobs come from their creation time, encoded in their ids.
+    Jobs whose id does not encode it are taken as the most recent ones.
+    """
+
+    def __init__(self, keep_last=None, max_age=None):
+        """Creates JobRetentionPolicy object
+
+        :param keep_last: number of most recent finished jobs to keep. If
+                          None, jobs are only kept by age.
+        :param max_age: number of seconds after its creation during which a
+                        finished job is kept. If None, jobs are only kept by
+                        count.
+        :raises: InvalidParameterValue if neither keep_last nor max_age is
+                 given
+        """
+        if keep_last is None and max_age is None:
+            raise exceptions.InvalidParameterValue(
+                reason='keep_last or max_age must be given')
+
+        self.keep_last = keep_last
+        self.max_age = max_age
+
+    def select(self, jobs, now=None):
+        """Returns the jobs to prune
+
+        :param jobs: a list of Job objects, in any order
+        :param now: number of seconds since the epoch to compute the age of
+                    the jobs from. If None, the current time is used.
+        :returns: a list of the ids of the jobs to prune, from the oldest to
+                  the most recent
+        """
+        if now is None:
+            now = time.time()
+
+        finished = [job for job in jobs
+                    if job.status in FINISHED_JOB_STATUSES
+                    and job.id != 'JID_CLEARALL']
+        # the sort is stable, jobs created the same second keep their order
+        finished.sort(key=_job_creation_sort_key)
+        if self.keep_last is not None:
+            kept = len(finished) - self.keep_last
+            candidates = finished[:max(kept, 0)]
+        else:
+            candidates = finished
+
+        return [job.id for job in candidates if not self._is_young(job, now)]
+
+    def _is_young(self, job, now):
+        if self.max_age is None:
+            return False
+
+        created = job_creation_time(job.id)
+        if created is None:
+            return True
+
+        return now - created < self.max_age
+
+
+def job_creation_time(job_id):
+    """Returns the creation time encoded in the id of a job
+
+    :param job_id: id of the job, such as JID_001436912645
+    :returns: the number of seconds since the epoch at which the job was
+              created, or None if the id does not encode it
+    """
+    match = JOB_ID_EPOCH_RE.match(job_id or '')
+    if match is None:
+        return None
+
+    return int(match.group(1))
+
+
+def _job_creation_sort_key(job):
+    created = job_creation_time(job.id)
+    if created is None:
+        return (1, 0)
+
+    return (0, created)
+
 
 class JobManagement(object):
 
-    def __init__(self, client):
+    def __init__(self, client, retention_policy=None):
         """Creates JobManagement object
 
         :param client: an instance of WSManClient
+        :param retention_policy: a JobRetentionPolicy applied to the job
+                                 queue after each config job is created. If
+                                 None, the job queue is only pruned by
+                                 calling prune_jobs.
         """
         self.client = client
+        self.retention_policy = retention_policy
 
     def list_jobs(self, only_unfinished=False):
         """Returns a list of jobs from the job queue
@@ -57,22 +206,56 @@ class JobManagement(object):
 
         filter_query = None
         if only_unfinished:
-            filter_query = ('select * from DCIM_LifecycleJob '
-                            'where Name != "CLEARALL" and '
-                            'JobStatus != "Reboot Completed" and '
-                            'JobStatus != "Reboot Failed" and '
-                            'JobStatus != "Completed" and '
-                            'JobStatus != "Completed with Errors" and '
-                            'JobStatus != "Failed"')
+            filter_query = UNFINISHED_JOBS_FILTER_QUERY
 
         doc = self.client.enumerate(uris.DCIM_LifecycleJob,
                                     filter_query=filter_query)
 
+        return self._parse_list_jobs(doc)
+
+    def _parse_list_jobs(self, doc):
         drac_jobs = utils.find_xml(doc, 'DCIM_LifecycleJob',
                                    uris.DCIM_LifecycleJob, find_all=True)
 
         return [self._parse_drac_job(drac_job) for drac_job in drac_jobs]
 
+    def iter_jobs(self, only_unfinished=False, wait_for_idrac=True):
+        """Yields the jobs from the job queue as they are received
+
+        :param only_unfinished: indicates whether only unfinished jobs should
+                                be returned
+        :param wait_for_idrac: indicates whether or not to wait for the
+                               iDRAC to be ready to accept commands first
+        :returns: a generator of Job objects
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+
+        filter_query = None
+        if only_unfinished:
+            filter_query = UNFINISHED_JOBS_FILTER_QUERY
+
+        for item in self.client.iter_enumerate(uris.DCIM_LifecycleJob,
+                                               filter_query=filter_query,
+                                               wait_for_idrac=wait_for_idrac):
+            if item.tag == '{%s}DCIM_LifecycleJob' % uris.DCIM_LifecycleJob:
+                yield self._parse_drac_job(item)
+
+    def job_view(
+            self, full_refresh_interval=(
+                constants.DEFAULT_JOB_VIEW_FULL_REFRESH_INTERVAL_SEC)):
+        """Returns an incrementally refreshed table of the job queue
+
+        :param full_refresh_interval: number of seconds after which a
+                                      refresh lists the whole job queue
+                                      again. If None, only the first
+                                      refresh does.
+        :returns: a JobView object, empty until it is refreshed
+        """
+        return JobView(self, full_refresh_interval)
+
     def get_job(self, job_id):
         """Returns a job from the job queue
 
@@ -84,18 +267,148 @@ class JobManagement(object):
                  interface
         """
 
-        filter_query = ('select * from DCIM_LifecycleJob where InstanceID="%s"'
-                        % job_id)
-
         doc = self.client.enumerate(uris.DCIM_LifecycleJob,
-                                    filter_query=filter_query)
+                                    filter_query=JOB_FILTER_QUERY % job_id)
+
+        return self._parse_get_job(doc)
 
+    def _parse_get_job(self, doc):
         drac_job = utils.find_xml(doc, 'DCIM_LifecycleJob',
                                   uris.DCIM_LifecycleJob)
 
         if drac_job is not None:
             return self._parse_drac_job(drac_job)
 
+    def wait_for_jobs(
+            self, job_ids, timeout=None,
+            interval=constants.DEFAULT_JOB_WAIT_INTERVAL_SEC,
+            max_interval=constants.DEFAULT_JOB_WAIT_MAX_INTERVAL_SEC):
+        """Waits until jobs are finished
+
+        All the jobs still running are fetched with a single enumeration on
+        every poll. The polls are spaced according to the progress reported
+        by the jobs, from interval up to max_interval seconds apart.
+
+        :param job_ids: ids of the jobs
+        :param timeout: number of seconds to wait. If None, waits until all
+                        the jobs are finished.
+        :param interval: minimum number of seconds between two polls
+        :param max_interval: maximum number of seconds between two polls
+        :returns: a dictionary with the final Job objects keyed by job id,
+                  None for the jobs missing from the job queue
+        :raises: DRACWaitTimeout if the jobs are not finished after timeout
+                 seconds
+        :raises: DRACDeadlineExceeded when the deadline of the calling thread
+                 passes first
+        :raises: DRACWaitCancelled if the poll scheduler stops waiting, such
+                 as when it is shut down
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        jobs_wait = _JobsWait(self, job_ids, interval, max_interval)
+        if not jobs_wait.pending:
+            return jobs_wait.jobs
+
+        capped_timeout = self.client.cap_to_deadline(timeout)
+        if not self.client.poll_scheduler.wait(
+                self.client.bind_deadline(jobs_wait.check),
+                jobs_wait.next_interval, capped_timeout,
+                key=self.client.host):
+            # cancelled waits raise DRACWaitCancelled, so the wait expired
+            # and had a timeout or a deadline
+            if capped_timeout != timeout:
+                raise exceptions.DRACDeadlineExceeded(host=self.client.host)
+
+            raise exceptions.DRACWaitTimeout(timeout=timeout)
+
+        return jobs_wait.jobs
+
+    def watch(self, job_ids=None,
+              interval=constants.DEFAULT_JOB_WAIT_INTERVAL_SEC):
+        """Yields the changes of the jobs in the job queue
+
+        The unfinished jobs are listed every interval seconds and compared
+        with the previous listing. An event is only yielded for the jobs
+        which appeared, finished or whose status, message or progress
+        changed.
+
+        The listings are polled by the poll scheduler of the client, the
+        calling thread only waits for the next events. The first listing
+        is made from the calling thread, the next ones are only scheduled
+        once the caller asks for more events.
+
+        :param job_ids: ids of the jobs to watch. If None, all the jobs are
+                        watched until the caller stops iterating.
+        :param interval: number of seconds between two listings
+        :returns: a generator of JobEvent objects. previous is None for a
+                  job seen for the first time and current is None for a job
+                  which left the job queue.
+        :raises: DRACDeadlineExceeded when the deadline of the calling thread
+                 passes
+        :raises: DRACWaitCancelled if the poll scheduler stops waiting, such
+                 as when it is shut down
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        jobs_watch = _JobsWatch(self, job_ids)
+        check = self.client.bind_deadline(jobs_watch.check)
+        delay = 0
+        while not jobs_watch.over:
+            timeout = self.client.remaining_time()
+            if (not self.client.poll_scheduler.wait(check, interval, timeout,
+                                                    delay,
+                                                    key=self.client.host)
+                    and timeout is not None):
+                # the wait only expires with the deadline of the caller
+                raise exceptions.DRACDeadlineExceeded(host=self.client.host)
+
+            delay = self.client.cap_to_deadline(interval)
+            events, jobs_watch.events = jobs_watch.events, []
+            for event in events:
+                yield event
+
+            events, jobs_watch.events = jobs_watch.events, []
+            for event in events:
+                yield event
+
+    def get_jobs(self, job_ids):
+        """Returns many jobs from the job queue
+
+        The jobs are looked up with as few enumerations as the length of the
+        filter query allows, checking once if the iDRAC is ready.
+
+        :param job_ids: ids of the jobs
+        :returns: a dictionary of Job objects keyed by job id, in the order
+                  of job_ids, with None for the jobs which are not in the
+                  job queue
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        job_ids = list(collections.OrderedDict.fromkeys(job_ids))
+        if not job_ids:
+            return collections.OrderedDict()
+
+        jobs = self._fetch_jobs(job_ids)
+        return collections.OrderedDict(
+            (job_id, jobs.get(job_id)) for job_id in job_ids)
+
+    def _fetch_jobs(self, job_ids, wait_for_idrac=True):
+        jobs = {}
+        for filter_query in _build_jobs_filter_queries(job_ids):
+            doc = self.client.enumerate(uris.DCIM_LifecycleJob,
+                                        filter_query=filter_query,
+                                        wait_for_idrac=wait_for_idrac)
+            jobs.update((job.id, job) for job in self._parse_list_jobs(doc))
+            # the iDRAC was found ready for the first query
+            wait_for_idrac = False
+
+        return jobs
+
     def create_config_job(self, resource_uri, cim_creation_class_name,
                           cim_name, target,
                           cim_system_creation_class_name='DCIM_ComputerSystem',
@@ -148,6 +461,26 @@ class JobManagement(object):
                      'CreationClassName': cim_creation_class_name,
                      'Name': cim_name}
 
+        properties = self._build_config_job_properties(target, reboot,
+                                                       start_time, realtime)
+
+        doc = self.client.invoke(resource_uri, method_name,
+                                 selectors, properties,
+                                 expected_return_value=utils.RET_CREATED,
+                                 wait_for_idrac=wait_for_idrac)
+        self.client.invalidate_ready_cache()
+        job_id = self._get_job_id(doc)
+
+        if self.retention_policy is not None:
+            try:
+                self.prune_jobs()
+            except exceptions.BaseClientException as ex:
+                LOG.warning('Unable to prune the job queue: %s', ex)
+
+        return job_id
+
+    def _build_config_job_properties(self, target, reboot, start_time,
+                                     realtime):
         properties = {'Target': target}
 
         if realtime:
@@ -159,11 +492,7 @@ class JobManagement(object):
         if start_time is not None:
             properties['ScheduledStartTime'] = start_time
 
-        doc = self.client.invoke(resource_uri, method_name,
-                                 selectors, properties,
-                                 expected_return_value=utils.RET_CREATED,
-                                 wait_for_idrac=wait_for_idrac)
-        return self._get_job_id(doc)
+        return properties
 
     def create_reboot_job(
             self,
@@ -180,30 +509,28 @@ class JobManagement(object):
         :raises: DRACUnexpectedReturnValue on return value mismatch
         """
 
-        try:
-            drac_reboot_type = REBOOT_TYPES[reboot_type]
-        except KeyError:
-            msg = ("'%(reboot_type)s' is not supported. "
-                   "Supported reboot types: %(supported_reboot_types)r") % {
-                       'reboot_type': reboot_type,
-                       'supported_reboot_types': list(REBOOT_TYPES)}
-            raise exceptions.InvalidParameterValue(reason=msg)
-
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'idrac',
-                     'CreationClassName': 'DCIM_JobService',
-                     'Name': 'JobService'}
-
-        properties = {'RebootJobType': drac_reboot_type}
+        properties = {
+            'RebootJobType': self._get_drac_reboot_type(reboot_type)}
 
         doc = self.client.invoke(uris.DCIM_JobService,
                                  'CreateRebootJob',
-                                 selectors,
+                                 JOB_SERVICE_SELECTORS,
                                  properties,
                                  expected_return_value=utils.RET_CREATED)
+        self.client.invalidate_ready_cache()
 
         return self._get_job_id(doc)
 
+    def _get_drac_reboot_type(self, reboot_type):
+        try:
+            return REBOOT_TYPES[reboot_type]
+        except KeyError:
+            msg = ("'%(reboot_type)s' is not supported. "
+                   "Supported reboot types: %(supported_reboot_types)r") % {
+                       'reboot_type': reboot_type,
+                       'supported_reboot_types': list(REBOOT_TYPES)}
+            raise exceptions.InvalidParameterValue(reason=msg)
+
     def schedule_job_execution(self, job_ids, start_time='TIME_NOW'):
         """Schedules jobs for execution in a specified order.
 
@@ -222,29 +549,18 @@ class JobManagement(object):
         if not job_ids:
             return
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'idrac',
-                     'CreationClassName': 'DCIM_JobService',
-                     'Name': 'JobService'}
-
         properties = {'JobArray': job_ids,
                       'StartTimeInterval': start_time}
 
         self.client.invoke(uris.DCIM_JobService,
                            'SetupJobQueue',
-                           selectors,
+                           JOB_SERVICE_SELECTORS,
                            properties,
                            expected_return_value=utils.RET_SUCCESS)
+        self.client.invalidate_ready_cache()
 
     def _get_job_id(self, doc):
-        query = (
-            './/{%(namespace)s}%(item)s[@%(attribute_name)s='
-            '"%(attribute_value)s"]' % {
-                'namespace': wsman.NS_WSMAN,
-                'item': 'Selector',
-                'attribute_name': 'Name',
-                'attribute_value': 'InstanceID'})
-        job_id = doc.find(query).text
+        job_id = doc.find(JOB_ID_SELECTOR_QUERY).text
         return job_id
 
     def delete_jobs(self, job_ids=['JID_CLEARALL']):
@@ -257,11 +573,6 @@ class JobManagement(object):
         :raises: DRACUnexpectedReturnValue on non-success
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'idrac',
-                     'CreationClassName': 'DCIM_JobService',
-                     'Name': 'JobService'}
-
         if job_ids is None:
             return
 
@@ -274,7 +585,7 @@ class JobManagement(object):
                 self.client.invoke(
                     uris.DCIM_JobService,
                     'DeleteJobQueue',
-                    selectors,
+                    JOB_SERVICE_SELECTORS,
                     properties,
                     expected_return_value=utils.RET_SUCCESS)
             except exceptions.DRACOperationFailed as dof:
@@ -284,6 +595,137 @@ class JobManagement(object):
         if len(messages):
             raise exceptions.DRACOperationFailed(drac_messages=messages)
 
+    def bulk_delete_jobs(
+            self, job_ids,
+            max_workers=constants.DEFAULT_JOB_DELETE_MAX_WORKERS):
+        """Deletes many jobs, reporting the outcome of each one
+
+        The iDRAC is checked for readiness once, when listing the job queue,
+        then the jobs are deleted by up to max_workers concurrent requests.
+        When the jobs are exactly the ones of the job queue, a single
+        JID_CLEARALL request deletes them. Since it deletes whatever is in
+        the job queue, the job queue is listed again right before, and the
+        jobs are deleted one by one if it changed. A job created between
+        that listing and the JID_CLEARALL request is still deleted with the
+        others.
+
+        :param job_ids: ids of the jobs to delete
+        :param max_workers: maximum number of deletion requests in flight
+        :returns: a dictionary keyed by job id with None for the deleted
+                  jobs and the exception raised for the others. Jobs
+                  missing from the job queue are reported with a
+                  DRACOperationFailed exception, without any request.
+        :raises: WSManRequestFailure on request failures while checking the
+                 job queue
+        :raises: WSManInvalidResponse when receiving invalid response while
+                 checking the job queue
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface while checking the job queue
+        """
+        job_ids = list(collections.OrderedDict.fromkeys(job_ids))
+        if not job_ids:
+            return {}
+
+        # listing the job queue is the only request waiting for the iDRAC
+        return self._bulk_delete_jobs(job_ids, self.list_jobs(), max_workers)
+
+    def _bulk_delete_jobs(self, job_ids, queued_jobs, max_workers):
+        queued_job_ids = set(job.id for job in queued_jobs
+                             if job.id != 'JID_CLEARALL')
+        if queued_job_ids and queued_job_ids == set(job_ids):
+            # the job queue may have changed since it was listed, and
+            # JID_CLEARALL would delete the jobs created since then as well
+            queued_job_ids = self._list_queued_job_ids()
+            if queued_job_ids == set(job_ids):
+                LOG.debug('Deleting the whole job queue with JID_CLEARALL')
+                error = self._delete_job('JID_CLEARALL')
+                return collections.OrderedDict(
+                    (job_id, error) for job_id in job_ids)
+
+            LOG.debug('The job queue changed, deleting the jobs one by one')
+
+        results = collections.OrderedDict(
+            (job_id, None) for job_id in job_ids)
+        deleted_job_ids = []
+        for job_id in job_ids:
+            if job_id in queued_job_ids or job_id in CLEAR_ALL_JOB_IDS:
+                deleted_job_ids.append(job_id)
+            else:
+                LOG.debug('Job %s is not in the job queue', job_id)
+                results[job_id] = exceptions.DRACOperationFailed(
+                    drac_messages='Job %s is not in the job queue' % job_id)
+
+        if deleted_job_ids:
+            with concurrent.futures.ThreadPoolExecutor(
+                    min(max_workers, len(deleted_job_ids))) as executor:
+                results.update(zip(deleted_job_ids, executor.map(
+                    self.client.bind_deadline(self._delete_job),
+                    deleted_job_ids)))
+
+        return results
+
+    def prune_jobs(self, retention_policy=None,
+                   max_workers=constants.DEFAULT_JOB_DELETE_MAX_WORKERS):
+        """Deletes the finished jobs the retention policy does not keep
+
+        :param retention_policy: a JobRetentionPolicy. If None, the policy
+                                 given when the object was created is used.
+        :param max_workers: maximum number of deletion requests in flight
+        :returns: a PruneResult object with the size of the job queue before
+                  and after pruning, the ids of the deleted jobs and the
+                  exceptions raised for the jobs which could not be deleted
+        :raises: InvalidParameterValue if no retention policy is available
+        :raises: WSManRequestFailure on request failures while listing the
+                 job queue
+        :raises: WSManInvalidResponse when receiving invalid response while
+                 listing the job queue
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface while listing the job queue
+        """
+        if retention_policy is None:
+            retention_policy = self.retention_policy
+        if retention_policy is None:
+            raise exceptions.InvalidParameterValue(
+                reason='No job retention policy given')
+
+        jobs = self.list_jobs()
+        job_ids = retention_policy.select(jobs)
+        results = {}
+        if job_ids:
+            results = self._bulk_delete_jobs(job_ids, jobs, max_workers)
+
+        deleted = [job_id for job_id, error in results.items()
+                   if error is None]
+        errors = dict((job_id, error) for job_id, error in results.items()
+                      if error is not None)
+        size_before = len([job for job in jobs if job.id != 'JID_CLEARALL'])
+        LOG.info('Pruned %(deleted)d of %(size)d jobs from the job queue',
+                 {'deleted': len(deleted), 'size': size_before})
+
+        return PruneResult(size_before=size_before,
+                           size_after=size_before - len(deleted),
+                           deleted=deleted, errors=errors)
+
+    def _list_queued_job_ids(self):
+        doc = self.client.enumerate(uris.DCIM_LifecycleJob,
+                                    wait_for_idrac=False)
+
+        return set(job.id for job in self._parse_list_jobs(doc)
+                   if job.id != 'JID_CLEARALL')
+
+    def _delete_job(self, job_id):
+        try:
+            self.client.invoke(uris.DCIM_JobService,
+                               'DeleteJobQueue',
+                               JOB_SERVICE_SELECTORS,
+                               {'JobID': job_id},
+                               expected_return_value=utils.RET_SUCCESS,
+                               wait_for_idrac=False)
+        except exceptions.BaseClientException as ex:
+            LOG.debug('Unable to delete job %(job_id)s: %(error)s',
+                      {'job_id': job_id, 'error': ex})
+            return ex
+
     def delete_pending_config(
             self, resource_uri, cim_creation_class_name, cim_name, target,
             cim_system_creation_class_name='DCIM_ComputerSystem',
@@ -325,15 +767,273 @@ class JobManagement(object):
                            expected_return_value=utils.RET_SUCCESS)
 
     def _parse_drac_job(self, drac_job):
-        return Job(id=self._get_job_attr(drac_job, 'InstanceID'),
-                   name=self._get_job_attr(drac_job, 'Name'),
-                   start_time=self._get_job_attr(drac_job, 'JobStartTime'),
-                   until_time=self._get_job_attr(drac_job, 'JobUntilTime'),
-                   message=self._get_job_attr(drac_job, 'Message'),
-                   status=self._get_job_attr(drac_job, 'JobStatus'),
-                   percent_complete=self._get_job_attr(drac_job,
-                                                       'PercentComplete'))
-
-    def _get_job_attr(self, drac_job, attr_name):
-        return utils.get_wsman_resource_attr(drac_job, uris.DCIM_LifecycleJob,
-                                             attr_name)
+        return JOB_PARSER.parse(drac_job)
+
+
+class JobView(object):
+    """Incrementally refreshed table of the job queue
+
+    The first refresh lists the whole job queue. Finished jobs never change,
+    so later refreshes only enumerate the unfinished jobs and look up the
+    ones which left that listing by id, keeping the finished jobs from the
+    previous refreshes.
+
+    A job created and finished between two such refreshes is in neither
+    listing, and neither are the changes made to the finished jobs, such as
+    their deletion. The whole job queue is therefore listed again once
+    full_refresh_interval seconds passed since it last was.
+    """
+
+    def __init__(
+            self, job_mgmt, full_refresh_interval=(
+                constants.DEFAULT_JOB_VIEW_FULL_REFRESH_INTERVAL_SEC)):
+        """Creates JobView object
+
+        :param job_mgmt: a JobManagement object
+        :param full_refresh_interval: number of seconds after which a
+                                      refresh lists the whole job queue
+                                      again. If None, only the first
+                                      refresh does.
+        """
+        self.job_mgmt = job_mgmt
+        self.full_refresh_interval = full_refresh_interval
+        self._jobs = collections.OrderedDict()
+        self._loaded = False
+        self._last_full_refresh = None
+
+    @property
+    def jobs(self):
+        """The jobs of the last refresh, in job queue order"""
+        return list(self._jobs.values())
+
+    def get(self, job_id):
+        """Returns a job of the last refresh
+
+        :param job_id: id of the job
+        :returns: a Job object or None if the job was not in the job queue
+        """
+        return self._jobs.get(job_id)
+
+    def refresh(self, full=False):
+        """Updates the table from the job queue
+
+        :param full: indicates whether the whole job queue should be listed
+                     again, such as to drop finished jobs deleted since the
+                     last refresh. The whole job queue is listed anyway on
+                     the first refresh and once full_refresh_interval
+                     seconds passed since it last was.
+        :returns: a list of Job objects, in job queue order
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        now = time.monotonic()
+        if (full or not self._loaded
+                or (self.full_refresh_interval is not None
+                    and now - self._last_full_refresh
+                    >= self.full_refresh_interval)):
+            self._jobs = collections.OrderedDict(
+                (job.id, job) for job in self.job_mgmt.iter_jobs())
+            self._loaded = True
+            self._last_full_refresh = now
+            return self.jobs
+
+        unfinished = collections.OrderedDict(
+            (job.id, job)
+            for job in self.job_mgmt.iter_jobs(only_unfinished=True))
+
+        left = [job.id for job in self._jobs.values()
+                if _is_tracked(job) and job.id not in unfinished]
+        final_jobs = {}
+        if left:
+            final_jobs = self.job_mgmt._fetch_jobs(left,
+                                                   wait_for_idrac=False)
+
+        for job_id in left:
+            if job_id in final_jobs:
+                self._jobs[job_id] = final_jobs[job_id]
+            else:
+                del self._jobs[job_id]
+
+        # jobs keep their place in the table, new ones are added at the end
+        self._jobs.update(unfinished)
+        return self.jobs
+
+
+def _is_tracked(job):
+    # the jobs the unfinished jobs filter query returns
+    return (job.status not in FINISHED_JOB_STATUSES
+            and job.name != 'CLEARALL')
+
+
+def _build_jobs_filter_queries(job_ids):
+    # splits the lookup so that no filter query is longer than the maximum
+    filters = []
+    length = len(JOBS_FILTER_QUERY % '')
+    for job_id in job_ids:
+        job_filter = JOB_ID_FILTER % job_id
+        if (filters and length + len(' or ') + len(job_filter)
+                > JOBS_FILTER_QUERY_MAX_LENGTH):
+            yield JOBS_FILTER_QUERY % ' or '.join(filters)
+            filters = []
+            length = len(JOBS_FILTER_QUERY % '')
+
+        if filters:
+            length += len(' or ')
+        filters.append(job_filter)
+        length += len(job_filter)
+
+    if filters:
+        yield JOBS_FILTER_QUERY % ' or '.join(filters)
+
+
+def _job_state(job):
+    return job.status, job.message, job.percent_complete
+
+
+class _JobsWatch(object):
+    """Lists the unfinished jobs on every poll of JobManagement.watch"""
+
+    def __init__(self, job_mgmt, job_ids):
+        self.job_mgmt = job_mgmt
+        self.watched = None if job_ids is None else set(job_ids)
+        self.previous = collections.OrderedDict()
+        self.events = []
+        # only the first check, made from the calling thread, waits for the
+        # iDRAC to be ready
+        self._wait_for_idrac = True
+
+    @property
+    def over(self):
+        return self.watched is not None and not self.watched
+
+    def check(self):
+        client = self.job_mgmt.client
+        wait_for_idrac = self._wait_for_idrac
+        self._wait_for_idrac = False
+        if not wait_for_idrac and not client.is_ready_cached():
+            # the next checks run on the workers of the poll scheduler, which
+            # must not block waiting for the iDRAC
+            if not client.is_idrac_ready():
+                LOG.debug('The iDRAC is not ready, the jobs are listed on '
+                          'the next poll')
+                return False
+
+            client.cache_ready()
+
+        watched = self.watched
+        previous = self.previous
+        current = collections.OrderedDict(
+            (job.id, job)
+            for job in self.job_mgmt.iter_jobs(only_unfinished=True,
+                                               wait_for_idrac=wait_for_idrac)
+            if watched is None or job.id in watched)
+
+        finished = [job_id for job_id in previous if job_id not in current]
+        if watched is not None:
+            finished.extend(job_id for job_id in sorted(watched)
+                            if job_id not in current
+                            and job_id not in previous)
+
+        final_jobs = {}
+        if finished:
+            final_jobs = self.job_mgmt._fetch_jobs(finished,
+                                                   wait_for_idrac=False)
+
+        for job_id in finished:
+            self.events.append(JobEvent(job_id, previous.get(job_id),
+                                        final_jobs.get(job_id)))
+
+        for job_id, job in current.items():
+            previous_job = previous.get(job_id)
+            if (previous_job is None
+                    or _job_state(previous_job) != _job_state(job)):
+                self.events.append(JobEvent(job_id, previous_job, job))
+
+        self.previous = current
+        if watched is not None:
+            watched.difference_update(finished)
+
+        return bool(self.events) or self.over
+
+
+class _JobsWait(object):
+
+    def __init__(self, job_mgmt, job_ids, interval, max_interval):
+        self.job_mgmt = job_mgmt
+        self.interval = interval
+        self.max_interval = max_interval
+        self.jobs = collections.OrderedDict(
+            (job_id, None) for job_id in job_ids)
+        self.pending = set(self.jobs)
+        # only the first check, made from the calling thread, waits for the
+        # iDRAC to be ready
+        self._wait_for_idrac = True
+        self._check_ready = False
+        self._first_seen = {}
+        self._remaining = {}
+
+    def check(self):
+        wait_for_idrac = self._wait_for_idrac
+        self._wait_for_idrac = False
+        try:
+            if (self._check_ready
+                    and not self.job_mgmt.client.is_idrac_ready()):
+                LOG.debug('The iDRAC is not ready, the jobs are fetched on '
+                          'the next poll')
+                return False
+
+            if self._check_ready:
+                self.job_mgmt.client.cache_ready()
+                self._check_ready = False
+
+            jobs = self.job_mgmt._fetch_jobs(
+                sorted(self.pending), wait_for_idrac=wait_for_idrac)
+        except exceptions.WSManRequestFailure as ex:
+            # the iDRAC may be restarting while running the jobs. The next
+            # checks run on the workers of the poll scheduler, which must not
+            # block waiting for the iDRAC: its readiness is checked once per
+            # poll instead.
+            LOG.debug('Unable to fetch the jobs: %s', ex)
+            self._check_ready = True
+            return False
+
+        now = time.monotonic()
+        for job_id in list(self.pending):
+            job = jobs.get(job_id)
+            self.jobs[job_id] = job
+            if job is None or job.status in FINISHED_JOB_STATUSES:
+                self.pending.discard(job_id)
+                self._first_seen.pop(job_id, None)
+                self._remaining.pop(job_id, None)
+            else:
+                self._record_progress(job, now)
+
+        return not self.pending
+
+    def _record_progress(self, job, now):
+        try:
+            percent = float(job.percent_complete)
+        except (TypeError, ValueError):
+            return
+
+        first_seen = self._first_seen.get(job.id)
+        if first_seen is None or percent < first_seen[1]:
+            first_seen = self._first_seen[job.id] = (now, percent)
+
+        elapsed = now - first_seen[0]
+        progress = percent - first_seen[1]
+        if elapsed > 0 and progress > 0:
+            self._remaining[job.id] = (100 - percent) * elapsed / progress
+        else:
+            self._remaining.pop(job.id, None)
+
+    def next_interval(self, attempts):
+        if not self._remaining:
+            return self.interval
+
+        # poll when the job closest to the end is estimated to be halfway
+        # to finishing
+        return min(max(min(self._remaining.values()) / 2, self.interval),
+                   self.max_interval)
@@ -15,6 +15,11 @@ from dracclient import constants
 from dracclient.resources import uris
 from dracclient import utils
 
+LC_SERVICE_SELECTORS = {'SystemCreationClassName': 'DCIM_ComputerSystem',
+                        'SystemName': 'DCIM:ComputerSystem',
+                        'CreationClassName': 'DCIM_LCService',
+                        'Name': 'DCIM:LCService'}
+
 
 class LifecycleControllerManagement(object):
 
@@ -36,6 +41,10 @@ class LifecycleControllerManagement(object):
         """
 
         doc = self.client.enumerate(uris.DCIM_SystemView, wait_for_idrac=False)
+
+        return self._parse_get_version(doc)
+
+    def _parse_get_version(self, doc):
         lc_version_str = utils.find_xml(doc, 'LifecycleControllerVersion',
                                         uris.DCIM_SystemView).text
 
@@ -45,6 +54,9 @@ class LifecycleControllerManagement(object):
 class LCAttribute(object):
     """Generic LC attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only):
         """Creates LCAttribute object
@@ -63,22 +75,20 @@ class LCAttribute(object):
         self.read_only = read_only
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     @classmethod
     def parse(cls, namespace, lifecycle_attr_xml):
         """Parses XML and creates LCAttribute object"""
 
-        name = utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, namespace, 'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, namespace, 'InstanceID')
-        current_value = utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, namespace, 'CurrentValue', nullable=True)
-        pending_value = utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, namespace, 'PendingValue', nullable=True)
-        read_only = utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, namespace, 'IsReadOnly')
+        lifecycle_attr_xml = utils.ItemView.of(lifecycle_attr_xml, namespace)
+        name = lifecycle_attr_xml.get_attr('AttributeName')
+        instance_id = lifecycle_attr_xml.get_attr('InstanceID')
+        current_value = lifecycle_attr_xml.get_attr('CurrentValue',
+                                                    nullable=True)
+        pending_value = lifecycle_attr_xml.get_attr('PendingValue',
+                                                    nullable=True)
+        read_only = lifecycle_attr_xml.get_attr('IsReadOnly')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'))
@@ -87,6 +97,8 @@ class LCAttribute(object):
 class LCEnumerableAttribute(LCAttribute):
     """Enumerable LC attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_LCEnumeration
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -110,11 +122,11 @@ class LCEnumerableAttribute(LCAttribute):
     def parse(cls, lifecycle_attr_xml):
         """Parses XML and creates LCEnumerableAttribute object"""
 
+        lifecycle_attr_xml = utils.ItemView.of(lifecycle_attr_xml,
+                                               cls.namespace)
         lifecycle_attr = LCAttribute.parse(cls.namespace, lifecycle_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(lifecycle_attr_xml,
-                                             'PossibleValues',
-                                             cls.namespace, find_all=True)]
+                           in lifecycle_attr_xml.find_all('PossibleValues')]
 
         return cls(lifecycle_attr.name, lifecycle_attr.instance_id,
                    lifecycle_attr.current_value, lifecycle_attr.pending_value,
@@ -135,6 +147,8 @@ class LCEnumerableAttribute(LCAttribute):
 class LCStringAttribute(LCAttribute):
     """String LC attribute class"""
 
+    __slots__ = ('min_length', 'max_length')
+
     namespace = uris.DCIM_LCString
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -160,11 +174,11 @@ class LCStringAttribute(LCAttribute):
     def parse(cls, lifecycle_attr_xml):
         """Parses XML and creates LCStringAttribute object"""
 
+        lifecycle_attr_xml = utils.ItemView.of(lifecycle_attr_xml,
+                                               cls.namespace)
         lifecycle_attr = LCAttribute.parse(cls.namespace, lifecycle_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, cls.namespace, 'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(
-            lifecycle_attr_xml, cls.namespace, 'MaxLength'))
+        min_length = int(lifecycle_attr_xml.get_attr('MinLength'))
+        max_length = int(lifecycle_attr_xml.get_attr('MaxLength'))
 
         return cls(lifecycle_attr.name, lifecycle_attr.instance_id,
                    lifecycle_attr.current_value, lifecycle_attr.pending_value,
@@ -183,11 +197,14 @@ class LCConfiguration(object):
         """
         self.client = client
 
-    def list_lifecycle_settings(self, by_name=False):
+    def list_lifecycle_settings(self, by_name=False, lazy=False):
         """List the LC configuration settings
 
         :param by_name: Controls whether returned dictionary uses Lifecycle
                         attribute name or instance_id as key.
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: a dictionary with the LC settings using InstanceID as the
                   key. The attributes are either LCEnumerableAttribute,
                   LCStringAttribute or LCIntegerAttribute objects.
@@ -196,7 +213,8 @@ class LCConfiguration(object):
         :raises: DRACOperationFailed on error reported back by the DRAC
                  interface
         """
-        return utils.list_settings(self.client, self.NAMESPACES, by_name)
+        return utils.list_settings(self.client, self.NAMESPACES, by_name,
+                                   lazy=lazy)
 
     def is_lifecycle_in_recovery(self):
         """Check if Lifecycle Controller in recovery mode or not
@@ -212,18 +230,16 @@ class LCConfiguration(object):
                  interface
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'CreationClassName': 'DCIM_LCService',
-                     'Name': 'DCIM:LCService'}
-
         doc = self.client.invoke(uris.DCIM_LCService,
                                  'GetRemoteServicesAPIStatus',
-                                 selectors,
+                                 LC_SERVICE_SELECTORS,
                                  {},
                                  expected_return_value=utils.RET_SUCCESS,
                                  wait_for_idrac=False)
 
+        return self._parse_is_lifecycle_in_recovery(doc)
+
+    def _parse_is_lifecycle_in_recovery(self, doc):
         lc_status = utils.find_xml(doc,
                                    'LCStatus',
                                    uris.DCIM_LCService).text
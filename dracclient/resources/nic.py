@@ -25,6 +25,9 @@ LOG = logging.getLogger(__name__)
 class NICAttribute(object):
     """Generic NIC attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only', 'fqdd')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only, fqdd):
         """Construct a NICAttribute object.
@@ -46,33 +49,20 @@ class NICAttribute(object):
         self.fqdd = fqdd
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     @classmethod
     def parse(cls, namespace, nic_attr_xml):
         """Parses XML and creates a NICAttribute object."""
 
-        name = utils.get_wsman_resource_attr(nic_attr_xml,
-                                             namespace,
-                                             'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                    namespace,
-                                                    'InstanceID')
-        current_value = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                      namespace,
-                                                      'CurrentValue',
-                                                      nullable=True)
-        pending_value = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                      namespace,
-                                                      'PendingValue',
-                                                      nullable=True)
-        read_only = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                  namespace,
-                                                  'IsReadOnly')
-
-        fqdd = utils.get_wsman_resource_attr(nic_attr_xml,
-                                             namespace,
-                                             'FQDD')
+        nic_attr_xml = utils.ItemView.of(nic_attr_xml, namespace)
+        name = nic_attr_xml.get_attr('AttributeName')
+        instance_id = nic_attr_xml.get_attr('InstanceID')
+        current_value = nic_attr_xml.get_attr('CurrentValue', nullable=True)
+        pending_value = nic_attr_xml.get_attr('PendingValue', nullable=True)
+        read_only = nic_attr_xml.get_attr('IsReadOnly')
+
+        fqdd = nic_attr_xml.get_attr('FQDD')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'), fqdd)
@@ -81,6 +71,8 @@ class NICAttribute(object):
 class NICEnumerationAttribute(NICAttribute):
     """Enumeration NIC attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_NICEnumeration
 
     def __init__(self,
@@ -116,12 +108,10 @@ class NICEnumerationAttribute(NICAttribute):
     def parse(cls, nic_attr_xml):
         """Parse XML and create a NICEnumerationAttribute object."""
 
+        nic_attr_xml = utils.ItemView.of(nic_attr_xml, cls.namespace)
         nic_attr = NICAttribute.parse(cls.namespace, nic_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(nic_attr_xml,
-                                             'PossibleValues',
-                                             cls.namespace,
-                                             find_all=True)]
+                           in nic_attr_xml.find_all('PossibleValues')]
 
         return cls(nic_attr.name,
                    nic_attr.instance_id,
@@ -148,6 +138,8 @@ class NICEnumerationAttribute(NICAttribute):
 class NICStringAttribute(NICAttribute):
     """String NIC attribute class."""
 
+    __slots__ = ('min_length', 'max_length', 'pcre_regex')
+
     namespace = uris.DCIM_NICString
 
     def __init__(self,
@@ -189,17 +181,11 @@ class NICStringAttribute(NICAttribute):
     def parse(cls, nic_attr_xml):
         """Parse XML and create a NICStringAttribute object."""
 
+        nic_attr_xml = utils.ItemView.of(nic_attr_xml, cls.namespace)
         nic_attr = NICAttribute.parse(cls.namespace, nic_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(nic_attr_xml,
-                                                       cls.namespace,
-                                                       'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(nic_attr_xml,
-                                                       cls.namespace,
-                                                       'MaxLength'))
-        pcre_regex = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                   cls.namespace,
-                                                   'ValueExpression',
-                                                   nullable=True)
+        min_length = int(nic_attr_xml.get_attr('MinLength'))
+        max_length = int(nic_attr_xml.get_attr('MaxLength'))
+        pcre_regex = nic_attr_xml.get_attr('ValueExpression', nullable=True)
 
         return cls(nic_attr.name,
                    nic_attr.instance_id,
@@ -231,6 +217,8 @@ class NICStringAttribute(NICAttribute):
 class NICIntegerAttribute(NICAttribute):
     """Integer NIC attribute class."""
 
+    __slots__ = ('lower_bound', 'upper_bound')
+
     namespace = uris.DCIM_NICInteger
 
     def __init__(self,
@@ -268,13 +256,10 @@ class NICIntegerAttribute(NICAttribute):
     def parse(cls, nic_attr_xml):
         """Parse XML and create a NICIntegerAttribute object."""
 
+        nic_attr_xml = utils.ItemView.of(nic_attr_xml, cls.namespace)
         nic_attr = NICAttribute.parse(cls.namespace, nic_attr_xml)
-        lower_bound = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                    cls.namespace,
-                                                    'LowerBound')
-        upper_bound = utils.get_wsman_resource_attr(nic_attr_xml,
-                                                    cls.namespace,
-                                                    'UpperBound')
+        lower_bound = nic_attr_xml.get_attr('LowerBound')
+        upper_bound = nic_attr_xml.get_attr('UpperBound')
 
         if nic_attr.current_value:
             nic_attr.current_value = int(nic_attr.current_value)
@@ -321,10 +306,13 @@ class NICConfiguration(object):
         """
         self.client = client
 
-    def list_nic_settings(self, nic_id):
+    def list_nic_settings(self, nic_id, lazy=False):
         """Return the list of attribute settings of a NIC.
 
         :param nic_id: id of the network interface controller (NIC)
+        :param lazy: if True, returns a utils.LazySettings mapping building
+                     the attribute objects on access, a dictionary
+                     otherwise.
         :returns: dictionary containing the NIC settings. The keys are
                   attribute names. Each value is a
                   NICEnumerationAttribute, NICIntegerAttribute, or
@@ -337,7 +325,8 @@ class NICConfiguration(object):
 
         result = utils.list_settings(self.client,
                                      self.NAMESPACES,
-                                     fqdd_filter=nic_id)
+                                     fqdd_filter=nic_id,
+                                     lazy=lazy)
 
         return result
 
@@ -95,12 +95,102 @@ VirtualDisk = collections.namedtuple(
      'status', 'raid_status', 'span_depth', 'span_length',
      'pending_operations', 'physical_disks'])
 
+
+def _bytes_to_mb(size_b):
+    return int(size_b) // 2 ** 20
+
+
+def _controller_of(values):
+    return values['id'].split(':')[-1]
+
+
+def _physical_disk_parser(resource_uri):
+    return utils.ViewParser(PhysicalDisk, resource_uri, {
+        'id': utils.ViewField('FQDD', nullable=True),
+        'description': utils.ViewField('DeviceDescription', nullable=True),
+        'controller': utils.ComputedField(_controller_of),
+        'manufacturer': utils.ViewField('Manufacturer', nullable=True),
+        'model': utils.ViewField('Model', nullable=True),
+        'media_type': utils.ViewField('MediaType', nullable=True,
+                                      lookup=PHYSICAL_DISK_MEDIA_TYPE),
+        'interface_type': utils.ViewField(
+            'BusProtocol', nullable=True, lookup=PHYSICAL_DISK_BUS_PROTOCOL),
+        'size_mb': utils.ViewField('SizeInBytes', nullable=True,
+                                   converter=_bytes_to_mb),
+        'free_size_mb': utils.ViewField('FreeSizeInBytes', nullable=True,
+                                        converter=_bytes_to_mb),
+        'serial_number': utils.ViewField('SerialNumber', nullable=True),
+        'firmware_version': utils.ViewField('Revision', nullable=True),
+        'status': utils.ViewField('PrimaryStatus', nullable=True,
+                                  lookup=constants.PRIMARY_STATUS),
+        'raid_status': utils.ViewField('RaidStatus', nullable=True,
+                                       lookup=DISK_RAID_STATUS),
+        'sas_address': utils.ViewField('SASAddress', nullable=True,
+                                       allow_missing=True),
+        'device_protocol': utils.ViewField('DeviceProtocol', nullable=True,
+                                           allow_missing=True),
+        'bus': utils.ViewField('Bus', nullable=True, allow_missing=True,
+                               converter=str.upper),
+    })
+
+
+PHYSICAL_DISK_PARSERS = {
+    uris.DCIM_PhysicalDiskView: _physical_disk_parser(
+        uris.DCIM_PhysicalDiskView),
+    uris.DCIM_PCIeSSDView: _physical_disk_parser(uris.DCIM_PCIeSSDView),
+}
+
+RAID_CONTROLLER_PARSER = utils.ViewParser(
+    RAIDController, uris.DCIM_ControllerView, {
+        'id': utils.ViewField('FQDD', nullable=True),
+        'description': utils.ViewField('DeviceDescription', nullable=True),
+        'manufacturer': utils.ViewField('DeviceCardManufacturer',
+                                        nullable=True),
+        'model': utils.ViewField('ProductName', nullable=True),
+        'primary_status': utils.ViewField('PrimaryStatus', nullable=True,
+                                          lookup=constants.PRIMARY_STATUS),
+        'firmware_version': utils.ViewField('ControllerFirmwareVersion',
+                                            nullable=True),
+        'bus': utils.ViewField('Bus', nullable=True, converter=str.upper),
+        'supports_realtime': utils.ViewField(
+            'RealtimeCapability', nullable=True,
+            lookup=RAID_CONTROLLER_IS_REALTIME),
+    })
+
+VIRTUAL_DISK_PARSER = utils.ViewParser(
+    VirtualDisk, uris.DCIM_VirtualDiskView, {
+        'id': utils.ViewField('FQDD'),
+        'name': utils.ViewField('Name', nullable=True),
+        'description': utils.ViewField('DeviceDescription', nullable=True),
+        'controller': utils.ComputedField(_controller_of),
+        'raid_level': utils.ViewField('RAIDTypes',
+                                      lookup=REVERSE_RAID_LEVELS),
+        'size_mb': utils.ViewField('SizeInBytes', converter=_bytes_to_mb),
+        'status': utils.ViewField('PrimaryStatus',
+                                  lookup=constants.PRIMARY_STATUS),
+        'raid_status': utils.ViewField(('RAIDStatus', 'RaidStatus'),
+                                       lookup=DISK_RAID_STATUS),
+        'span_depth': utils.ViewField('SpanDepth', converter=int),
+        'span_length': utils.ViewField('SpanLength', converter=int),
+        'pending_operations': utils.ViewField(
+            'PendingOperations', lookup=VIRTUAL_DISK_PENDING_OPERATIONS),
+        'physical_disks': utils.ViewField('PhysicalDiskIDs', find_all=True),
+    })
+
 NO_FOREIGN_DRIVES = ["STOR058", "STOR018"]
 
+RAID_SERVICE_SELECTORS = {'SystemCreationClassName': 'DCIM_ComputerSystem',
+                          'CreationClassName': 'DCIM_RAIDService',
+                          'SystemName': 'DCIM:ComputerSystem',
+                          'Name': 'DCIM:RAIDService'}
+
 
 class RAIDAttribute(object):
     """Generic RAID attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only', 'fqdd')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only, fqdd):
         """Creates RAIDAttribute object
@@ -123,25 +213,20 @@ class RAIDAttribute(object):
         self.fqdd = fqdd
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     @classmethod
     def parse(cls, namespace, raid_attr_xml):
         """Parses XML and creates RAIDAttribute object"""
 
-        name = utils.get_wsman_resource_attr(
-            raid_attr_xml, namespace, 'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(
-            raid_attr_xml, namespace, 'InstanceID')
+        raid_attr_xml = utils.ItemView.of(raid_attr_xml, namespace)
+        name = raid_attr_xml.get_attr('AttributeName')
+        instance_id = raid_attr_xml.get_attr('InstanceID')
         current_value = [attr.text for attr in
-                         utils.find_xml(raid_attr_xml, 'CurrentValue',
-                                        namespace, find_all=True)]
-        pending_value = utils.get_wsman_resource_attr(
-            raid_attr_xml, namespace, 'PendingValue', nullable=True)
-        read_only = utils.get_wsman_resource_attr(
-            raid_attr_xml, namespace, 'IsReadOnly')
-        fqdd = utils.get_wsman_resource_attr(
-            raid_attr_xml, namespace, 'FQDD')
+                         raid_attr_xml.find_all('CurrentValue')]
+        pending_value = raid_attr_xml.get_attr('PendingValue', nullable=True)
+        read_only = raid_attr_xml.get_attr('IsReadOnly')
+        fqdd = raid_attr_xml.get_attr('FQDD')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'), fqdd)
@@ -150,6 +235,8 @@ class RAIDAttribute(object):
 class RAIDEnumerableAttribute(RAIDAttribute):
     """Enumerable RAID attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_RAIDEnumeration
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -179,11 +266,10 @@ class RAIDEnumerableAttribute(RAIDAttribute):
     def parse(cls, raid_attr_xml):
         """Parses XML and creates RAIDEnumerableAttribute object"""
 
+        raid_attr_xml = utils.ItemView.of(raid_attr_xml, cls.namespace)
         raid_attr = RAIDAttribute.parse(cls.namespace, raid_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(raid_attr_xml,
-                                             'PossibleValues',
-                                             cls.namespace, find_all=True)]
+                           in raid_attr_xml.find_all('PossibleValues')]
 
         return cls(raid_attr.name, raid_attr.instance_id,
                    raid_attr.current_value, raid_attr.pending_value,
@@ -204,6 +290,8 @@ class RAIDEnumerableAttribute(RAIDAttribute):
 class RAIDStringAttribute(RAIDAttribute):
     """String RAID attribute class"""
 
+    __slots__ = ('min_length', 'max_length')
+
     namespace = uris.DCIM_RAIDString
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -232,11 +320,10 @@ class RAIDStringAttribute(RAIDAttribute):
     def parse(cls, raid_attr_xml):
         """Parses XML and creates RAIDStringAttribute object"""
 
+        raid_attr_xml = utils.ItemView.of(raid_attr_xml, cls.namespace)
         raid_attr = RAIDAttribute.parse(cls.namespace, raid_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(
-            raid_attr_xml, cls.namespace, 'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(
-            raid_attr_xml, cls.namespace, 'MaxLength'))
+        min_length = int(raid_attr_xml.get_attr('MinLength'))
+        max_length = int(raid_attr_xml.get_attr('MaxLength'))
 
         return cls(raid_attr.name, raid_attr.instance_id,
                    raid_attr.current_value, raid_attr.pending_value,
@@ -247,6 +334,8 @@ class RAIDStringAttribute(RAIDAttribute):
 class RAIDIntegerAttribute(RAIDAttribute):
     """Integer RAID attribute class"""
 
+    __slots__ = ('lower_bound', 'upper_bound')
+
     namespace = uris.DCIM_RAIDInteger
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -278,11 +367,10 @@ class RAIDIntegerAttribute(RAIDAttribute):
     def parse(cls, raid_attr_xml):
         """Parses XML and creates RAIDIntegerAttribute object"""
 
+        raid_attr_xml = utils.ItemView.of(raid_attr_xml, cls.namespace)
         raid_attr = RAIDAttribute.parse(cls.namespace, raid_attr_xml)
-        lower_bound = utils.get_wsman_resource_attr(
-            raid_attr_xml, cls.namespace, 'LowerBound')
-        upper_bound = utils.get_wsman_resource_attr(
-            raid_attr_xml, cls.namespace, 'UpperBound')
+        lower_bound = raid_attr_xml.get_attr('LowerBound')
+        upper_bound = raid_attr_xml.get_attr('UpperBound')
 
         if raid_attr.current_value:
             raid_attr.current_value = int(raid_attr.current_value[0])
@@ -381,6 +469,9 @@ class RAIDManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_ControllerView)
 
+        return self._parse_list_raid_controllers(doc)
+
+    def _parse_list_raid_controllers(self, doc):
         drac_raid_controllers = utils.find_xml(doc, 'DCIM_ControllerView',
                                                uris.DCIM_ControllerView,
                                                find_all=True)
@@ -389,28 +480,7 @@ class RAIDManagement(object):
                 for controller in drac_raid_controllers]
 
     def _parse_drac_raid_controller(self, drac_controller):
-        return RAIDController(
-            id=self._get_raid_controller_attr(drac_controller, 'FQDD'),
-            description=self._get_raid_controller_attr(
-                drac_controller, 'DeviceDescription'),
-            manufacturer=self._get_raid_controller_attr(
-                drac_controller, 'DeviceCardManufacturer'),
-            model=self._get_raid_controller_attr(
-                drac_controller, 'ProductName'),
-            primary_status=constants.PRIMARY_STATUS[
-                self._get_raid_controller_attr(drac_controller,
-                                               'PrimaryStatus')],
-            firmware_version=self._get_raid_controller_attr(
-                drac_controller, 'ControllerFirmwareVersion'),
-            bus=self._get_raid_controller_attr(drac_controller, 'Bus').upper(),
-            supports_realtime=RAID_CONTROLLER_IS_REALTIME[
-                self._get_raid_controller_attr(
-                    drac_controller, 'RealtimeCapability')])
-
-    def _get_raid_controller_attr(self, drac_controller, attr_name):
-        return utils.get_wsman_resource_attr(
-            drac_controller, uris.DCIM_ControllerView, attr_name,
-            nullable=True)
+        return RAID_CONTROLLER_PARSER.parse(drac_controller)
 
     def list_virtual_disks(self):
         """Returns the list of virtual disks
@@ -424,6 +494,9 @@ class RAIDManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_VirtualDiskView)
 
+        return self._parse_list_virtual_disks(doc)
+
+    def _parse_list_virtual_disks(self, doc):
         drac_virtual_disks = utils.find_xml(doc, 'DCIM_VirtualDiskView',
                                             uris.DCIM_VirtualDiskView,
                                             find_all=True)
@@ -432,49 +505,7 @@ class RAIDManagement(object):
                 for disk in drac_virtual_disks]
 
     def _parse_drac_virtual_disk(self, drac_disk):
-        fqdd = self._get_virtual_disk_attr(drac_disk, 'FQDD')
-        drac_raid_level = self._get_virtual_disk_attr(drac_disk, 'RAIDTypes')
-        size_b = self._get_virtual_disk_attr(drac_disk, 'SizeInBytes')
-        drac_status = self._get_virtual_disk_attr(drac_disk, 'PrimaryStatus')
-        drac_raid_status = self._get_virtual_disk_attr(
-            drac_disk, 'RAIDStatus', allow_missing=True)
-        if drac_raid_status is None:
-            drac_raid_status = self._get_virtual_disk_attr(
-                drac_disk, 'RaidStatus')
-
-        drac_pending_operations = self._get_virtual_disk_attr(
-            drac_disk, 'PendingOperations')
-
-        return VirtualDisk(
-            id=fqdd,
-            name=self._get_virtual_disk_attr(drac_disk, 'Name',
-                                             nullable=True),
-            description=self._get_virtual_disk_attr(drac_disk,
-                                                    'DeviceDescription',
-                                                    nullable=True),
-            controller=fqdd.split(':')[-1],
-            raid_level=REVERSE_RAID_LEVELS[drac_raid_level],
-            size_mb=int(size_b) // 2 ** 20,
-            status=constants.PRIMARY_STATUS[drac_status],
-            raid_status=DISK_RAID_STATUS[drac_raid_status],
-            span_depth=int(self._get_virtual_disk_attr(drac_disk,
-                                                       'SpanDepth')),
-            span_length=int(self._get_virtual_disk_attr(drac_disk,
-                                                        'SpanLength')),
-            pending_operations=(
-                VIRTUAL_DISK_PENDING_OPERATIONS[drac_pending_operations]),
-            physical_disks=self._get_virtual_disk_attrs(drac_disk,
-                                                        'PhysicalDiskIDs'))
-
-    def _get_virtual_disk_attr(
-            self, drac_disk, attr_name, nullable=False, allow_missing=False):
-        return utils.get_wsman_resource_attr(
-            drac_disk, uris.DCIM_VirtualDiskView, attr_name,
-            nullable=nullable, allow_missing=allow_missing)
-
-    def _get_virtual_disk_attrs(self, drac_disk, attr_name):
-        return utils.get_all_wsman_resource_attrs(
-            drac_disk, uris.DCIM_VirtualDiskView, attr_name, nullable=False)
+        return VIRTUAL_DISK_PARSER.parse(drac_disk)
 
     def list_physical_disks(self):
         """Returns the list of physical disks
@@ -488,6 +519,30 @@ class RAIDManagement(object):
 
         doc = self.client.enumerate(uris.DCIM_PhysicalDiskView)
 
+        return self._parse_list_physical_disks(doc)
+
+    def iter_physical_disks(self):
+        """Yields the physical disks as they are received
+
+        Unlike list_physical_disks, the disks are returned in the order the
+        DRAC card reports them, so PCIe SSDs may come before other disks.
+
+        :returns: a generator of PhysicalDisk objects
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+
+        for item in self.client.iter_enumerate(uris.DCIM_PhysicalDiskView):
+            if item.tag == ('{%s}DCIM_PhysicalDiskView'
+                            % uris.DCIM_PhysicalDiskView):
+                yield self._parse_drac_physical_disk(item)
+            elif item.tag == '{%s}DCIM_PCIeSSDView' % uris.DCIM_PCIeSSDView:
+                yield self._parse_drac_physical_disk(item,
+                                                     uris.DCIM_PCIeSSDView)
+
+    def _parse_list_physical_disks(self, doc):
         drac_physical_disks = utils.find_xml(doc, 'DCIM_PhysicalDiskView',
                                              uris.DCIM_PhysicalDiskView,
                                              find_all=True)
@@ -505,66 +560,7 @@ class RAIDManagement(object):
     def _parse_drac_physical_disk(self,
                                   drac_disk,
                                   uri=uris.DCIM_PhysicalDiskView):
-        fqdd = self._get_physical_disk_attr(drac_disk, 'FQDD', uri)
-        size_b = self._get_physical_disk_attr(drac_disk, 'SizeInBytes', uri)
-
-        free_size_b = self._get_physical_disk_attr(drac_disk,
-                                                   'FreeSizeInBytes', uri)
-        if free_size_b is not None:
-            free_size_mb = int(free_size_b) // 2 ** 20
-        else:
-            free_size_mb = None
-
-        drac_status = self._get_physical_disk_attr(drac_disk, 'PrimaryStatus',
-                                                   uri)
-        drac_raid_status = self._get_physical_disk_attr(drac_disk,
-                                                        'RaidStatus', uri)
-        if drac_raid_status is not None:
-            raid_status = DISK_RAID_STATUS[drac_raid_status]
-        else:
-            raid_status = None
-        drac_media_type = self._get_physical_disk_attr(drac_disk, 'MediaType',
-                                                       uri)
-        drac_bus_protocol = self._get_physical_disk_attr(drac_disk,
-                                                         'BusProtocol', uri)
-        bus = self._get_physical_disk_attr(drac_disk,
-                                           'Bus', uri,  allow_missing=True)
-
-        if bus is not None:
-            bus = bus.upper()
-
-        return PhysicalDisk(
-            id=fqdd,
-            description=self._get_physical_disk_attr(drac_disk,
-                                                     'DeviceDescription',
-                                                     uri),
-            controller=fqdd.split(':')[-1],
-            manufacturer=self._get_physical_disk_attr(drac_disk,
-                                                      'Manufacturer', uri),
-            model=self._get_physical_disk_attr(drac_disk, 'Model', uri),
-            media_type=PHYSICAL_DISK_MEDIA_TYPE[drac_media_type],
-            interface_type=PHYSICAL_DISK_BUS_PROTOCOL[drac_bus_protocol],
-            size_mb=int(size_b) // 2 ** 20,
-            free_size_mb=free_size_mb,
-            serial_number=self._get_physical_disk_attr(drac_disk,
-                                                       'SerialNumber', uri),
-            firmware_version=self._get_physical_disk_attr(drac_disk,
-                                                          'Revision', uri),
-            status=constants.PRIMARY_STATUS[drac_status],
-            raid_status=raid_status,
-            sas_address=self._get_physical_disk_attr(drac_disk, 'SASAddress',
-                                                     uri, allow_missing=True),
-            device_protocol=self._get_physical_disk_attr(drac_disk,
-                                                         'DeviceProtocol',
-                                                         uri,
-                                                         allow_missing=True),
-            bus=bus)
-
-    def _get_physical_disk_attr(self, drac_disk, attr_name, uri,
-                                allow_missing=False):
-        return utils.get_wsman_resource_attr(
-            drac_disk, uri, attr_name, nullable=True,
-            allow_missing=allow_missing)
+        return PHYSICAL_DISK_PARSERS[uri].parse(drac_disk)
 
     def convert_physical_disks(self, physical_disks, raid_enable):
         """Converts a list of physical disks into or out of RAID mode.
@@ -586,15 +582,10 @@ class RAIDManagement(object):
         """
         invocation = 'ConvertToRAID' if raid_enable else 'ConvertToNonRAID'
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'CreationClassName': 'DCIM_RAIDService',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'Name': 'DCIM:RAIDService'}
-
         properties = {'PDArray': physical_disks}
 
         doc = self.client.invoke(uris.DCIM_RAIDService, invocation,
-                                 selectors, properties,
+                                 RAID_SERVICE_SELECTORS, properties,
                                  expected_return_value=utils.RET_SUCCESS)
 
         return utils.build_return_dict(doc, uris.DCIM_RAIDService,
@@ -630,6 +621,19 @@ class RAIDManagement(object):
         :raises: InvalidParameterValue on invalid input parameter
         """
 
+        properties = self._build_virtual_disk_properties(
+            raid_controller, physical_disks, raid_level, size_mb, disk_name,
+            span_length, span_depth)
+        doc = self.client.invoke(uris.DCIM_RAIDService, 'CreateVirtualDisk',
+                                 RAID_SERVICE_SELECTORS, properties,
+                                 expected_return_value=utils.RET_SUCCESS)
+
+        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
+                                       is_commit_required_value=True)
+
+    def _build_virtual_disk_properties(self, raid_controller, physical_disks,
+                                       raid_level, size_mb, disk_name,
+                                       span_length, span_depth):
         virtual_disk_prop_names = []
         virtual_disk_prop_values = []
         error_msgs = []
@@ -677,20 +681,10 @@ class RAIDManagement(object):
                    'the provided parameters: %r') % ','.join(error_msgs)
             raise exceptions.InvalidParameterValue(reason=msg)
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'CreationClassName': 'DCIM_RAIDService',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'Name': 'DCIM:RAIDService'}
-        properties = {'Target': raid_controller,
-                      'PDArray': physical_disks,
-                      'VDPropNameArray': virtual_disk_prop_names,
-                      'VDPropValueArray': virtual_disk_prop_values}
-        doc = self.client.invoke(uris.DCIM_RAIDService, 'CreateVirtualDisk',
-                                 selectors, properties,
-                                 expected_return_value=utils.RET_SUCCESS)
-
-        return utils.build_return_dict(doc, uris.DCIM_RAIDService,
-                                       is_commit_required_value=True)
+        return {'Target': raid_controller,
+                'PDArray': physical_disks,
+                'VDPropNameArray': virtual_disk_prop_names,
+                'VDPropValueArray': virtual_disk_prop_values}
 
     def delete_virtual_disk(self, virtual_disk):
         """Deletes a virtual disk
@@ -713,14 +707,10 @@ class RAIDManagement(object):
         :raises: DRACUnexpectedReturnValue on return value mismatch
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'CreationClassName': 'DCIM_RAIDService',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'Name': 'DCIM:RAIDService'}
         properties = {'Target': virtual_disk}
 
         doc = self.client.invoke(uris.DCIM_RAIDService, 'DeleteVirtualDisk',
-                                 selectors, properties,
+                                 RAID_SERVICE_SELECTORS, properties,
                                  expected_return_value=utils.RET_SUCCESS)
 
         return utils.build_return_dict(doc, uris.DCIM_RAIDService,
@@ -738,28 +728,12 @@ class RAIDManagement(object):
                  and the exception message does not contain
                  NOT_SUPPORTED_MSG constant
         """
-        is_jbod_capable = False
-
-        # Grab all the disks associated with the RAID controller
         all_physical_disks = self.list_physical_disks()
-        physical_disks = [physical_disk for physical_disk in all_physical_disks
-                          if physical_disk.controller == raid_controller_fqdd]
-
-        # If there is a disk in the Non-RAID state, then the controller is JBOD
-        # capable
-        ready_disk = None
-        for physical_disk in physical_disks:
-            if physical_disk.raid_status == 'non-RAID':
-                is_jbod_capable = True
-                break
-            elif not ready_disk and physical_disk.raid_status == 'ready':
-                ready_disk = physical_disk
+        ready_disk = self._get_jbod_check_disk(raid_controller_fqdd,
+                                               all_physical_disks)
+        is_jbod_capable = ready_disk is None
 
         if not is_jbod_capable:
-            if not ready_disk:
-                msg = "Unable to find a disk in the Ready state"
-                raise exceptions.DRACRequestFailed(msg)
-
             # Try moving a disk in the Ready state to JBOD mode
             try:
                 self.convert_physical_disks([ready_disk.id], False)
@@ -780,6 +754,35 @@ class RAIDManagement(object):
 
         return is_jbod_capable
 
+    def _get_jbod_check_disk(self, raid_controller_fqdd, all_physical_disks):
+        """Find the disk to use for checking if a controller supports JBOD
+
+        :param raid_controller_fqdd: The raid controller's fqdd
+        :param all_physical_disks: list of all PhysicalDisk objects
+        :returns: a PhysicalDisk in the Ready state, or None if the
+                  controller already has a disk in the non-RAID state
+        :raises: DRACRequestFailed if unable to find any disks in the Ready
+                 or non-RAID states
+        """
+        # Grab all the disks associated with the RAID controller
+        physical_disks = [physical_disk for physical_disk in all_physical_disks
+                          if physical_disk.controller == raid_controller_fqdd]
+
+        # If there is a disk in the Non-RAID state, then the controller is JBOD
+        # capable
+        ready_disk = None
+        for physical_disk in physical_disks:
+            if physical_disk.raid_status == 'non-RAID':
+                return None
+            elif not ready_disk and physical_disk.raid_status == 'ready':
+                ready_disk = physical_disk
+
+        if not ready_disk:
+            msg = "Unable to find a disk in the Ready state"
+            raise exceptions.DRACRequestFailed(msg)
+
+        return ready_disk
+
     def is_raid_controller(self, raid_controller_fqdd, raid_controllers=None):
         """Find out if object's fqdd is for a raid controller or not
 
@@ -934,17 +937,10 @@ class RAIDManagement(object):
         raid = constants.RaidStatus.raid
 
         if not controllers_to_physical_disk_ids:
-            controllers_to_physical_disk_ids = collections.defaultdict(list)
-
             all_controllers = self.list_raid_controllers()
-            for physical_d in physical_disks:
-                # Weed out disks that are not attached to a RAID controller
-                if self.is_raid_controller(physical_d.controller,
-                                           all_controllers):
-                    physical_disk_ids = controllers_to_physical_disk_ids[
-                        physical_d.controller]
-
-                    physical_disk_ids.append(physical_d.id)
+            controllers_to_physical_disk_ids = (
+                self._get_controllers_to_physical_disk_ids(physical_disks,
+                                                           all_controllers))
 
         '''Modify controllers_to_physical_disk_ids dict by inspecting desired
         status vs current status of each controller's disks.
@@ -970,27 +966,39 @@ class RAIDManagement(object):
                         LOG.debug("Controller {} does not support "
                                   "JBOD mode".format(controller))
                         controllers_to_results[controller] = \
-                            utils.build_return_dict(
-                                doc=None,
-                                resource_uri=None,
-                                is_commit_required_value=False,
-                                is_reboot_required_value=constants.
-                                RebootRequired.false)
+                            self._build_unconverted_return_dict()
                     else:
                         raise
                 else:
                     controllers_to_results[controller] = conversion_results
             else:
                 controllers_to_results[controller] = \
-                    utils.build_return_dict(
-                        doc=None,
-                        resource_uri=None,
-                        is_commit_required_value=False,
-                        is_reboot_required_value=constants.
-                        RebootRequired.false)
+                    self._build_unconverted_return_dict()
 
         return {'conversion_results': controllers_to_results}
 
+    def _get_controllers_to_physical_disk_ids(self, physical_disks,
+                                              raid_controllers):
+        controllers_to_physical_disk_ids = collections.defaultdict(list)
+
+        for physical_d in physical_disks:
+            # Weed out disks that are not attached to a RAID controller
+            if self.is_raid_controller(physical_d.controller,
+                                       raid_controllers):
+                physical_disk_ids = controllers_to_physical_disk_ids[
+                    physical_d.controller]
+
+                physical_disk_ids.append(physical_d.id)
+
+        return controllers_to_physical_disk_ids
+
+    def _build_unconverted_return_dict(self):
+        return utils.build_return_dict(
+            doc=None,
+            resource_uri=None,
+            is_commit_required_value=False,
+            is_reboot_required_value=constants.RebootRequired.false)
+
     def is_realtime_supported(self, raid_controller_fqdd):
         """Find if controller supports realtime or not
 
@@ -1027,14 +1035,10 @@ class RAIDManagement(object):
         :raises: DRACUnexpectedReturnValue on return value mismatch
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'CreationClassName': 'DCIM_RAIDService',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'Name': 'DCIM:RAIDService'}
         properties = {'Target': raid_controller}
 
         doc = self.client.invoke(uris.DCIM_RAIDService, 'ResetConfig',
-                                 selectors, properties,
+                                 RAID_SERVICE_SELECTORS, properties,
                                  expected_return_value=utils.RET_SUCCESS)
 
         return utils.build_return_dict(doc, uris.DCIM_RAIDService,
@@ -1061,16 +1065,15 @@ class RAIDManagement(object):
         :raises: DRACUnexpectedReturnValue on return value mismatch
         """
 
-        selectors = {'SystemCreationClassName': 'DCIM_ComputerSystem',
-                     'CreationClassName': 'DCIM_RAIDService',
-                     'SystemName': 'DCIM:ComputerSystem',
-                     'Name': 'DCIM:RAIDService'}
         properties = {'Target': raid_controller}
 
         doc = self.client.invoke(uris.DCIM_RAIDService, 'ClearForeignConfig',
-                                 selectors, properties,
+                                 RAID_SERVICE_SELECTORS, properties,
                                  check_return_value=False)
 
+        return self._parse_clear_foreign_config(doc)
+
+    def _parse_clear_foreign_config(self, doc):
         is_commit_required_value = True
         is_reboot_required_value = None
 
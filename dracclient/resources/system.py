@@ -16,52 +16,12 @@ from dracclient import utils
 from dracclient import wsman
 
 
-class SystemConfiguration(object):
-
-    def __init__(self, client):
-        """Creates SystemManagement object
-
-        :param client: an instance of WSManClient
-        """
-        self.client = client
-
-    def list_system_settings(self):
-        """List the System configuration settings
-
-        :returns: a dictionary with the System settings using its name as the
-                  key. The attributes are either SystemEnumerableAttribute,
-                  SystemStringAttribute or SystemIntegerAttribute objects.
-        :raises: WSManRequestFailure on request failures
-        :raises: WSManInvalidResponse when receiving invalid response
-        :raises: DRACOperationFailed on error reported back by the DRAC
-                 interface
-        """
-        result = {}
-        namespaces = [(uris.DCIM_SystemEnumeration, SystemEnumerableAttribute),
-                      (uris.DCIM_SystemString, SystemStringAttribute),
-                      (uris.DCIM_SystemInteger, SystemIntegerAttribute)]
-        for (namespace, attr_cls) in namespaces:
-            attribs = self._get_config(namespace, attr_cls)
-            result.update(attribs)
-        return result
-
-    def _get_config(self, resource, attr_cls):
-        result = {}
-
-        doc = self.client.enumerate(resource)
-
-        items = doc.find('.//{%s}Items' % wsman.NS_WSMAN)
-
-        if items is not None:
-            for item in items:
-                attribute = attr_cls.parse(item)
-                result[attribute.instance_id] = attribute
-        return result
-
-
 class SystemAttribute(object):
     """Generic System attribute class"""
 
+    __slots__ = ('name', 'instance_id', 'current_value', 'pending_value',
+                 'read_only', 'fqdd', 'group_id')
+
     def __init__(self, name, instance_id, current_value, pending_value,
                  read_only, fqdd, group_id):
         """Creates SystemAttribute object
@@ -85,7 +45,7 @@ class SystemAttribute(object):
         self.group_id = group_id
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return utils.slot_values(self) == utils.slot_values(other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -94,20 +54,14 @@ class SystemAttribute(object):
     def parse(cls, namespace, system_attr_xml):
         """Parses XML and creates SystemAttribute object"""
 
-        name = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'AttributeName')
-        instance_id = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'InstanceID')
-        current_value = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'CurrentValue', nullable=True)
-        pending_value = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'PendingValue', nullable=True)
-        read_only = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'IsReadOnly')
-        fqdd = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'FQDD')
-        group_id = utils.get_wsman_resource_attr(
-            system_attr_xml, namespace, 'GroupID')
+        system_attr_xml = utils.ItemView.of(system_attr_xml, namespace)
+        name = system_attr_xml.get_attr('AttributeName')
+        instance_id = system_attr_xml.get_attr('InstanceID')
+        current_value = system_attr_xml.get_attr('CurrentValue', nullable=True)
+        pending_value = system_attr_xml.get_attr('PendingValue', nullable=True)
+        read_only = system_attr_xml.get_attr('IsReadOnly')
+        fqdd = system_attr_xml.get_attr('FQDD')
+        group_id = system_attr_xml.get_attr('GroupID')
 
         return cls(name, instance_id, current_value, pending_value,
                    (read_only == 'true'), fqdd, group_id)
@@ -116,6 +70,8 @@ class SystemAttribute(object):
 class SystemEnumerableAttribute(SystemAttribute):
     """Enumerable System attribute class"""
 
+    __slots__ = ('possible_values',)
+
     namespace = uris.DCIM_SystemEnumeration
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -145,11 +101,11 @@ class SystemEnumerableAttribute(SystemAttribute):
     def parse(cls, system_attr_xml):
         """Parses XML and creates SystemEnumerableAttribute object"""
 
+        system_attr_xml = utils.ItemView.of(system_attr_xml, cls.namespace)
         system_attr = SystemAttribute.parse(
             cls.namespace, system_attr_xml)
         possible_values = [attr.text for attr
-                           in utils.find_xml(system_attr_xml, 'PossibleValues',
-                                             cls.namespace, find_all=True)]
+                           in system_attr_xml.find_all('PossibleValues')]
 
         return cls(system_attr.name, system_attr.instance_id,
                    system_attr.current_value, system_attr.pending_value,
@@ -171,6 +127,8 @@ class SystemEnumerableAttribute(SystemAttribute):
 class SystemStringAttribute(SystemAttribute):
     """String System attribute class"""
 
+    __slots__ = ('min_length', 'max_length')
+
     namespace = uris.DCIM_SystemString
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -200,12 +158,11 @@ class SystemStringAttribute(SystemAttribute):
     def parse(cls, system_attr_xml):
         """Parses XML and creates SystemStringAttribute object"""
 
+        system_attr_xml = utils.ItemView.of(system_attr_xml, cls.namespace)
         system_attr = SystemAttribute.parse(
             cls.namespace, system_attr_xml)
-        min_length = int(utils.get_wsman_resource_attr(
-            system_attr_xml, cls.namespace, 'MinLength'))
-        max_length = int(utils.get_wsman_resource_attr(
-            system_attr_xml, cls.namespace, 'MaxLength'))
+        min_length = int(system_attr_xml.get_attr('MinLength'))
+        max_length = int(system_attr_xml.get_attr('MaxLength'))
 
         return cls(system_attr.name, system_attr.instance_id,
                    system_attr.current_value, system_attr.pending_value,
@@ -216,6 +173,8 @@ class SystemStringAttribute(SystemAttribute):
 class SystemIntegerAttribute(SystemAttribute):
     """Integer System attribute class"""
 
+    __slots__ = ('lower_bound', 'upper_bound')
+
     namespace = uris.DCIM_SystemInteger
 
     def __init__(self, name, instance_id, current_value, pending_value,
@@ -245,11 +204,10 @@ class SystemIntegerAttribute(SystemAttribute):
     def parse(cls, system_attr_xml):
         """Parses XML and creates SystemIntegerAttribute object"""
 
+        system_attr_xml = utils.ItemView.of(system_attr_xml, cls.namespace)
         system_attr = SystemAttribute.parse(cls.namespace, system_attr_xml)
-        lower_bound = utils.get_wsman_resource_attr(
-            system_attr_xml, cls.namespace, 'LowerBound', nullable=True)
-        upper_bound = utils.get_wsman_resource_attr(
-            system_attr_xml, cls.namespace, 'UpperBound', nullable=True)
+        lower_bound = system_attr_xml.get_attr('LowerBound', nullable=True)
+        upper_bound = system_attr_xml.get_attr('UpperBound', nullable=True)
 
         if system_attr.current_value:
             system_attr.current_value = int(system_attr.current_value)
@@ -277,3 +235,50 @@ class SystemIntegerAttribute(SystemAttribute):
                        'lower': self.lower_bound,
                        'upper': self.upper_bound}
             return msg
+
+
+class SystemConfiguration(object):
+
+    NAMESPACES = [(uris.DCIM_SystemEnumeration, SystemEnumerableAttribute),
+                  (uris.DCIM_SystemString, SystemStringAttribute),
+                  (uris.DCIM_SystemInteger, SystemIntegerAttribute)]
+
+    def __init__(self, client):
+        """Creates SystemManagement object
+
+        :param client: an instance of WSManClient
+        """
+        self.client = client
+
+    def list_system_settings(self):
+        """List the System configuration settings
+
+        :returns: a dictionary with the System settings using its name as the
+                  key. The attributes are either SystemEnumerableAttribute,
+                  SystemStringAttribute or SystemIntegerAttribute objects.
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        :raises: DRACOperationFailed on error reported back by the DRAC
+                 interface
+        """
+        result = {}
+        for (namespace, attr_cls) in self.NAMESPACES:
+            attribs = self._get_config(namespace, attr_cls)
+            result.update(attribs)
+        return result
+
+    def _get_config(self, resource, attr_cls):
+        doc = self.client.enumerate(resource)
+
+        return self._parse_config(doc, attr_cls)
+
+    def _parse_config(self, doc, attr_cls):
+        result = {}
+
+        items = wsman._find_enumerate_items(doc)
+
+        if items is not None:
+            for item in items:
+                attribute = attr_cls.parse(item)
+                result[attribute.instance_id] = attribute
+        return result
@@ -0,0 +1,137 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Retry policies for WS-Man requests and iDRAC readiness polling.
+"""
+
+import collections
+import logging
+import random
+import threading
+import time
+
+from dracclient import constants
+
+LOG = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """Decides whether and when a failed attempt is retried
+
+    Delays grow exponentially with the number of attempts and, with jitter
+    enabled, are drawn uniformly between zero and the exponential delay, so
+    clients failing at the same time do not retry in lockstep.
+
+    Besides the number of attempts of a single call, retries can be limited
+    per DRAC interface over a sliding window. The budget is kept by the
+    policy object, so a policy shared between clients enforces it across
+    all of them.
+    """
+
+    def __init__(self,
+                 max_attempts=constants.DEFAULT_RETRY_MAX_ATTEMPTS,
+                 base_delay=constants.DEFAULT_RETRY_BASE_DELAY_SEC,
+                 max_delay=constants.DEFAULT_RETRY_MAX_DELAY_SEC,
+                 multiplier=2, jitter=True,
+                 retryable_statuses=constants.DEFAULT_RETRY_HTTP_STATUSES,
+                 host_budget=None,
+                 host_budget_period=(
+                     constants.DEFAULT_RETRY_HOST_BUDGET_PERIOD_SEC)):
+        """Creates RetryPolicy object
+
+        :param max_attempts: maximum number of attempts of a single call,
+                             including the first one
+        :param base_delay: number of seconds to wait before the first retry
+        :param max_delay: maximum number of seconds to wait between attempts
+        :param multiplier: factor applied to the delay after every attempt
+        :param jitter: indicates whether the delays are randomized between
+                       zero and their exponential value
+        :param retryable_statuses: HTTP status codes worth retrying
+        :param host_budget: maximum number of retries per DRAC interface
+                            within host_budget_period. If None, the number
+                            of retries is only limited per call.
+        :param host_budget_period: number of seconds the retries count
+                                   against the host_budget
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retryable_statuses = frozenset(retryable_statuses)
+        self.host_budget = host_budget
+        self.host_budget_period = host_budget_period
+
+        self._lock = threading.Lock()
+        self._host_retries = collections.defaultdict(collections.deque)
+
+    @classmethod
+    def fixed(cls, max_attempts, delay):
+        """Creates a policy retrying on a fixed delay, without jitter
+
+        :param max_attempts: maximum number of attempts of a single call
+        :param delay: number of seconds to wait between attempts
+        :returns: a RetryPolicy object
+        """
+        return cls(max_attempts=max_attempts, base_delay=delay,
+                   max_delay=delay, multiplier=1, jitter=False,
+                   retryable_statuses=())
+
+    def delay(self, attempt):
+        """Returns the number of seconds to wait after a failed attempt
+
+        :param attempt: number of the failed attempt, starting at 1
+        :returns: the delay in seconds
+        """
+        delay = min(self.max_delay,
+                    self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+    def is_retryable_status(self, status_code):
+        """Indicates if a request failing with an HTTP status is retried
+
+        :param status_code: the HTTP status code of the response
+        :returns: a boolean
+        """
+        return status_code in self.retryable_statuses
+
+    def acquire_retry(self, host):
+        """Takes a retry from the budget of a DRAC interface
+
+        :param host: hostname or IP of the DRAC interface
+        :returns: True if the retry is allowed, False if the budget of the
+                  host is exhausted
+        """
+        if self.host_budget is None:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            retries = self._host_retries[host]
+            while retries and retries[0] <= now - self.host_budget_period:
+                retries.popleft()
+
+            if len(retries) >= self.host_budget:
+                LOG.warning('Retry budget of %(budget)s retries per '
+                            '%(period)s seconds exhausted for %(host)s',
+                            {'budget': self.host_budget,
+                             'period': self.host_budget_period,
+                             'host': host})
+                return False
+
+            retries.append(now)
+            return True
@@ -0,0 +1,391 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Process wide scheduler multiplexing the polling loops of many waits.
+"""
+
+import collections
+from concurrent import futures
+import logging
+import math
+import threading
+import time
+
+from dracclient import constants
+from dracclient import exceptions
+
+LOG = logging.getLogger(__name__)
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+class PollWait(object):
+    """A pending wait of a PollScheduler
+
+    The wait is over once its check returns a true value, raises an
+    exception, is cancelled or would have to run past the deadline.
+    """
+
+    def __init__(self, check, interval, timeout=None, callback=None,
+                 clock=time.monotonic, key=None):
+        self.check = check
+        self.interval = interval
+        self.key = key
+        self.deadline = None if timeout is None else clock() + timeout
+        self.callback = callback
+        self.attempts = 0
+        self.expired = False
+        self.cancelled = False
+        self._value = None
+        self._error = None
+        self._event = threading.Event()
+
+    def next_delay(self):
+        if callable(self.interval):
+            return self.interval(self.attempts)
+
+        return self.interval
+
+    def done(self):
+        """Indicates if the wait is over
+
+        :returns: True if the wait is over
+        """
+        return self._event.is_set()
+
+    def cancel(self):
+        """Stops polling
+
+        :returns: True if the wait was still pending
+        """
+        if self.done():
+            return False
+
+        self.cancelled = True
+        self._finish()
+        return True
+
+    def result(self, timeout=None):
+        """Waits for the wait to be over
+
+        :param timeout: the number of seconds to wait. If None, waits until
+                        the wait is over.
+        :returns: the last value returned by the check, a false value if the
+                  wait expired or was cancelled
+        :raises: DRACWaitTimeout if the wait is not over after timeout
+                 seconds
+        :raises: the exception raised by the check
+        """
+        if not self._event.wait(timeout):
+            raise exceptions.DRACWaitTimeout(timeout=timeout)
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def _finish(self, value=None, error=None, expired=False):
+        self._value = value
+        self._error = error
+        self.expired = expired
+        self._event.set()
+        if self.callback is not None:
+            try:
+                self.callback(self)
+            except Exception:
+                LOG.exception('Callback of a poll wait failed')
+
+
+class PollScheduler(object):
+    """Runs the checks of many waits from a hashed timer wheel
+
+    A single thread advances the wheel one tick at a time and hands the
+    checks that are due to a bounded pool of workers, so pending waits hold
+    no thread of their own.
+
+    The checks of waits sharing a key, such as the host they poll, only
+    get a few of the workers at the same time. The checks due beyond that
+    are held back until one of the running checks of the key returns, so
+    that an unresponsive host cannot take all the workers from the others.
+    """
+
+    def __init__(
+            self, tick=constants.DEFAULT_POLL_SCHEDULER_TICK_SEC,
+            wheel_size=constants.DEFAULT_POLL_SCHEDULER_WHEEL_SIZE,
+            max_workers=constants.DEFAULT_POLL_SCHEDULER_MAX_WORKERS,
+            clock=time.monotonic,
+            max_workers_per_key=(
+                constants.DEFAULT_POLL_SCHEDULER_MAX_WORKERS_PER_KEY)):
+        """Creates PollScheduler object
+
+        :param tick: number of seconds between two turns of the wheel, the
+                     precision of the intervals
+        :param wheel_size: number of slots of the wheel
+        :param max_workers: maximum number of checks run at the same time
+        :param clock: function returning the current time in seconds
+        :param max_workers_per_key: maximum number of checks of the waits
+                                    sharing a key run at the same time
+        """
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.max_workers = max_workers
+        self.max_workers_per_key = max_workers_per_key
+        self.clock = clock
+        self._slots = [[] for _ in range(wheel_size)]
+        self._start = clock()
+        self._current_tick = 0
+        self._pending = 0
+        self._running = collections.Counter()
+        self._held = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._stopped = False
+        self._local = threading.local()
+
+    @property
+    def pending(self):
+        """The number of waits scheduled for a check"""
+        with self._condition:
+            return self._pending + sum(len(held)
+                                       for held in self._held.values())
+
+    def schedule(self, check, interval, timeout=None, callback=None,
+                 delay=0, key=None):
+        """Starts polling without waiting
+
+        :param check: callable returning a true value once the wait is over
+        :param interval: number of seconds between the checks, or a callable
+                         returning it from the number of checks made so far
+        :param timeout: number of seconds after which the wait expires. If
+                        None, the wait never expires.
+        :param callback: callable receiving the PollWait once it is over,
+                         called from a worker of the scheduler
+        :param delay: number of seconds to wait before the first check
+        :param key: hashable identifying the waits whose checks share the
+                    per key limit of workers, such as the polled host. If
+                    None, the checks are only bound by max_workers.
+        :returns: a PollWait object
+        """
+        wait = PollWait(check, interval, timeout, callback, self.clock, key)
+        self._add(wait, delay)
+        return wait
+
+    def wait(self, check, interval, timeout=None, delay=0, key=None):
+        """Polls until check returns a true value
+
+        Without delay, the first check is made from the calling thread,
+        which then blocks without polling on its own until the wait is over.
+        When called from a check run by the scheduler, the whole wait is run
+        from the calling worker instead, since the following checks could
+        otherwise wait for that worker to be free.
+
+        :param check: callable returning a true value once the wait is over
+        :param interval: number of seconds between the checks, or a callable
+                         returning it from the number of checks made so far
+        :param timeout: number of seconds after which the wait expires. If
+                        None, the wait never expires.
+        :param delay: number of seconds to wait before the first check
+        :param key: hashable identifying the waits whose checks share the
+                    per key limit of workers, such as the polled host
+        :returns: the last value returned by the check, a false value if the
+                  wait expired
+        :raises: DRACWaitCancelled if the wait was cancelled, such as by
+                 shutting down the scheduler
+        :raises: the exception raised by the check
+        """
+        wait = PollWait(check, interval, timeout, clock=self.clock, key=key)
+        if getattr(self._local, 'worker', False):
+            while delay is not None:
+                time.sleep(delay)
+                delay = self._step(wait)
+        elif delay:
+            self._add(wait, delay)
+        else:
+            self._run_check(wait)
+
+        value = wait.result()
+        if wait.cancelled:
+            raise exceptions.DRACWaitCancelled()
+
+        return value
+
+    def shutdown(self):
+        """Stops the scheduler, cancelling the pending waits"""
+        with self._condition:
+            self._stopped = True
+            waits = [wait for slot in self._slots for _, wait in slot]
+            for slot in self._slots:
+                del slot[:]
+            for held in self._held.values():
+                waits.extend(held)
+            self._held.clear()
+            self._pending = 0
+            self._condition.notify_all()
+            executor = self._executor
+
+        for wait in waits:
+            wait.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _add(self, wait, delay):
+        with self._condition:
+            if self._stopped:
+                wait.cancel()
+                return
+
+            now_tick = (self.clock() - self._start) / self.tick
+            if not self._pending:
+                self._current_tick = max(self._current_tick,
+                                         int(now_tick) + 1)
+
+            due_tick = max(int(math.ceil(now_tick + delay / self.tick)),
+                           self._current_tick)
+            self._slots[due_tick % self.wheel_size].append((due_tick, wait))
+            self._pending += 1
+            self._ensure_started()
+            self._condition.notify()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._executor = futures.ThreadPoolExecutor(self.max_workers)
+            self._thread = threading.Thread(target=self._run,
+                                            name='dracclient-poll-scheduler')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+
+                if self._stopped:
+                    return
+
+                due = self._advance()
+                if not due:
+                    self._condition.wait(max(
+                        self._start + self._current_tick * self.tick
+                        - self.clock(), 0))
+                    continue
+
+                due = [wait for wait in due if self._admit(wait)]
+                executor = self._executor
+
+            for wait in due:
+                executor.submit(self._run_worker_check, wait)
+
+    def _advance(self):
+        now_tick = int((self.clock() - self._start) / self.tick)
+        if now_tick < self._current_tick:
+            return []
+
+        due = []
+        last_tick = min(now_tick, self._current_tick + self.wheel_size - 1)
+        for tick in range(self._current_tick, last_tick + 1):
+            slot = self._slots[tick % self.wheel_size]
+            kept = [entry for entry in slot if entry[0] > now_tick]
+            due.extend(wait for due_tick, wait in slot if due_tick <= now_tick)
+            slot[:] = kept
+
+        self._current_tick = now_tick + 1
+        self._pending -= len(due)
+        return due
+
+    def _admit(self, wait):
+        # called with the condition held, returns whether the check of the
+        # wait can be handed to a worker or holds it back otherwise
+        if wait.key is None:
+            return True
+
+        if self._running[wait.key] < self.max_workers_per_key:
+            self._running[wait.key] += 1
+            return True
+
+        self._held.setdefault(wait.key, collections.deque()).append(wait)
+        return False
+
+    def _release(self, key):
+        # hands the worker of a check which returned to the next held back
+        # check of the same key
+        with self._condition:
+            held = self._held.get(key)
+            if not held or self._stopped:
+                self._running[key] -= 1
+                if not self._running[key]:
+                    del self._running[key]
+                return
+
+            wait = held.popleft()
+            if not held:
+                del self._held[key]
+            executor = self._executor
+
+        executor.submit(self._run_worker_check, wait)
+
+    def _run_worker_check(self, wait):
+        self._local.worker = True
+        try:
+            self._run_check(wait)
+        finally:
+            if wait.key is not None:
+                self._release(wait.key)
+
+    def _run_check(self, wait):
+        delay = self._step(wait)
+        if delay is not None:
+            self._add(wait, delay)
+
+    def _step(self, wait):
+        # runs a check, returning the delay until the next one or None once
+        # the wait is over
+        if wait.done():
+            return None
+
+        try:
+            value = wait.check()
+        except Exception as ex:
+            wait._finish(error=ex)
+            return None
+
+        wait.attempts += 1
+        if value:
+            wait._finish(value)
+            return None
+
+        delay = wait.next_delay()
+        if (wait.deadline is not None
+                and self.clock() + delay >= wait.deadline):
+            wait._finish(value, expired=True)
+            return None
+
+        return delay
+
+
+def get_shared_scheduler():
+    """Returns the PollScheduler shared by the whole process
+
+    :returns: a PollScheduler object
+    """
+    global _shared_scheduler
+
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = PollScheduler()
+
+        return _shared_scheduler
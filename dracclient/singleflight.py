@@ -0,0 +1,129 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Coalescing of identical concurrent read-only requests.
+"""
+
+import copy
+import logging
+import threading
+
+LOG = logging.getLogger(__name__)
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """Runs a single call at a time per key
+
+    Threads asking for a key while a call for it is in flight wait for that
+    call instead of starting their own, and get a copy of its result or the
+    exception it raised. Only meant for operations without side effects.
+
+    :param remaining_time: callable returning the number of seconds the
+                           current thread may wait for a call in flight, or
+                           None to wait until it is over
+    :param check_deadline: callable raising once the current thread is out
+                           of time, called when a wait times out
+    :param retried_errors: exception classes raised by a call which only
+                           concern the thread that made it, like running
+                           out of its own time. The waiting threads retry
+                           the call instead of getting them.
+    """
+
+    def __init__(self, remaining_time=None, check_deadline=None,
+                 retried_errors=()):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+        self._remaining_time = remaining_time
+        self._check_deadline = check_deadline
+        self._retried_errors = tuple(retried_errors)
+
+    def do(self, key, func, *args, **kwargs):
+        """Calls func, or waits for the call in flight for the same key
+
+        :param key: hashable identifying the operation and its arguments
+        :param func: the callable to run
+        :param args: positional arguments of func
+        :param kwargs: keyword arguments of func
+        :returns: the value returned by func. Waiting threads get a deep
+                  copy of it, so the callers never share mutable results.
+        :raises: the exception raised by func
+        :raises: the exception raised by check_deadline when running out of
+                 time waiting for the call in flight
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                else:
+                    call.waiters += 1
+                    self.coalesced += 1
+
+            if leader:
+                break
+
+            LOG.debug('Waiting for the request in flight for %s', key)
+            self._wait(call)
+            if call.error is None:
+                return copy.deepcopy(call.result)
+
+            if not isinstance(call.error, self._retried_errors):
+                raise call.error
+
+            LOG.debug('The request in flight for %(key)s failed with '
+                      '%(error)r, retrying it',
+                      {'key': key, 'error': call.error})
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as ex:
+            call.error = ex
+            raise
+        else:
+            # the caller is free to modify its result once returned, so the
+            # waiters copy from a snapshot taken beforehand
+            if self._finish(key, call):
+                call.result = copy.deepcopy(result)
+        finally:
+            self._finish(key, call)
+            call.done.set()
+
+        return result
+
+    def _wait(self, call):
+        if self._remaining_time is None or self._check_deadline is None:
+            call.done.wait()
+            return
+
+        while not call.done.wait(self._remaining_time()):
+            if self._check_deadline is not None:
+                self._check_deadline()
+
+    def _finish(self, key, call):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+            return call.waiters
@@ -0,0 +1,443 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+from unittest import mock
+
+import lxml.etree
+import requests_mock
+
+from dracclient import aioclient
+import dracclient.client
+from dracclient import constants
+from dracclient import exceptions
+from dracclient.resources import bios
+from dracclient.resources import raid
+from dracclient.resources import uris
+from dracclient.tests import base
+from dracclient.tests import utils as test_utils
+
+READY = test_utils.LifecycleControllerInvocations[uris.DCIM_LCService][
+    'GetRemoteServicesAPIStatus']['is_ready']
+NOT_READY = test_utils.LifecycleControllerInvocations[uris.DCIM_LCService][
+    'GetRemoteServicesAPIStatus']['is_not_ready']
+
+
+class AsyncBaseTest(base.BaseTest):
+
+    def setUp(self):
+        super(AsyncBaseTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+
+class AsyncWSManClientTestCase(AsyncBaseTest):
+
+    def _client(self, responses, **kwargs):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint.update(kwargs)
+        fake_endpoint['transport'] = test_utils.FakeAsyncTransport(responses)
+
+        return aioclient.AsyncWSManClient(**fake_endpoint)
+
+    def test_enumerate(self):
+        client = self._client([READY, '<result>yay!</result>'])
+
+        resp = self.run_async(client.enumerate('http://resource'))
+
+        self.assertEqual('yay!', resp.text)
+        self.assertEqual(2, len(client.transport.requests))
+
+    def test_enumerate_without_wait_for_idrac(self):
+        client = self._client(['<result>yay!</result>'])
+
+        resp = self.run_async(client.enumerate('http://resource',
+                                               wait_for_idrac=False))
+
+        self.assertEqual('yay!', resp.text)
+        self.assertEqual(1, len(client.transport.requests))
+
+    def test_invoke_with_expected_return_value(self):
+        xml = """
+<response xmlns:n1="http://resource">
+    <n1:ReturnValue>42</n1:ReturnValue>
+    <result>yay!</result>
+</response>
+"""
+        client = self._client([xml])
+
+        resp = self.run_async(client.invoke('http://resource', 'Foo',
+                                            expected_return_value='42',
+                                            wait_for_idrac=False))
+
+        self.assertEqual('yay!', resp.find('result').text)
+
+    def test_invoke_with_error_return_value(self):
+        xml = """
+<response xmlns:n1="http://resource">
+    <n1:ReturnValue>2</n1:ReturnValue>
+    <result>yay!</result>
+</response>
+"""
+        client = self._client([xml])
+
+        self.assertRaises(exceptions.DRACOperationFailed, self.run_async,
+                          client.invoke('http://resource', 'Foo',
+                                        wait_for_idrac=False))
+
+    def test_invoke_with_unexpected_return_value(self):
+        xml = """
+<response xmlns:n1="http://resource">
+    <n1:ReturnValue>42</n1:ReturnValue>
+    <result>yay!</result>
+</response>
+"""
+        client = self._client([xml])
+
+        self.assertRaises(exceptions.DRACUnexpectedReturnValue,
+                          self.run_async,
+                          client.invoke('http://resource', 'Foo',
+                                        expected_return_value='4242',
+                                        wait_for_idrac=False))
+
+    def test_is_idrac_ready_ready(self):
+        client = self._client([READY])
+
+        self.assertTrue(self.run_async(client.is_idrac_ready()))
+
+    def test_is_idrac_ready_not_ready(self):
+        client = self._client([NOT_READY])
+
+        self.assertFalse(self.run_async(client.is_idrac_ready()))
+
+    @mock.patch.object(asyncio, 'sleep', autospec=True)
+    def test_wait_until_idrac_is_ready(self, mock_sleep):
+        client = self._client([NOT_READY, READY], ready_retries=2,
+                              ready_retry_delay=1)
+
+        self.run_async(client.wait_until_idrac_is_ready())
+
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(asyncio, 'sleep', autospec=True)
+    def test_wait_until_idrac_is_ready_timeout(self, mock_sleep):
+        client = self._client(3 * [NOT_READY])
+
+        self.assertRaises(exceptions.DRACOperationFailed, self.run_async,
+                          client.wait_until_idrac_is_ready(retries=3,
+                                                           retry_delay=5))
+        self.assertEqual(2, mock_sleep.call_count)
+
+    def test_concurrent_requests(self):
+        clients = [self._client([READY, '<result>%d</result>' % i])
+                   for i in range(10)]
+
+        async def enumerate_all():
+            return await asyncio.gather(
+                *[client.enumerate('http://resource') for client in clients])
+
+        results = self.run_async(enumerate_all())
+
+        self.assertEqual([str(i) for i in range(10)],
+                         [result.text for result in results])
+
+
+async def _idrac_is_ready(self, retries=None, retry_delay=None):
+    pass
+
+
+@mock.patch.object(dracclient.client.WSManClient,
+                   'wait_until_idrac_is_ready', spec_set=True,
+                   autospec=True)
+@mock.patch.object(aioclient.AsyncWSManClient, 'wait_until_idrac_is_ready',
+                   _idrac_is_ready)
+class AsyncDRACClientTestCase(AsyncBaseTest):
+
+    def _drac_client(self, responses):
+        return aioclient.AsyncDRACClient(
+            transport=test_utils.FakeAsyncTransport(responses),
+            **test_utils.FAKE_ENDPOINT)
+
+    def _assert_same_result(self, responses, method, *args, **kwargs):
+        with requests_mock.Mocker() as mock_requests:
+            mock_requests.post('https://1.2.3.4:443/wsman',
+                               [{'text': resp} for resp in responses])
+            drac_client = dracclient.client.DRACClient(
+                **test_utils.FAKE_ENDPOINT)
+            expected = getattr(drac_client, method)(*args, **kwargs)
+
+        async_drac_client = self._drac_client(responses)
+        result = self.run_async(
+            getattr(async_drac_client, method)(*args, **kwargs))
+
+        self.assertEqual(expected, result)
+        self.assertEqual(len(responses),
+                         len(async_drac_client.client.transport.requests))
+        return result
+
+    def _request(self, drac_client, index=-1):
+        return lxml.etree.fromstring(
+            drac_client.client.transport.requests[index])
+
+    def test_timeouts(self, mock_wait_until_idrac_is_ready):
+        drac_client = aioclient.AsyncDRACClient(connect_timeout=5,
+                                                read_timeout=60,
+                                                **test_utils.FAKE_ENDPOINT)
+
+        self.assertEqual(5, drac_client.client.transport.connect_timeout)
+        self.assertEqual(60, drac_client.client.transport.read_timeout)
+
+    def test_get_power_state(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_ComputerSystem]['ok']],
+            'get_power_state')
+
+        self.assertEqual('POWER_ON', result)
+
+    def test_set_power_state(self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client(
+            [test_utils.BIOSInvocations[uris.DCIM_ComputerSystem][
+                'RequestStateChange']['ok']])
+
+        self.run_async(drac_client.set_power_state('POWER_ON'))
+
+        request = self._request(drac_client)
+        self.assertEqual(
+            '2', request.find('.//{%s}RequestedState'
+                              % uris.DCIM_ComputerSystem).text)
+
+    def test_set_power_state_invalid_target_state(
+            self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client([])
+
+        self.assertRaises(exceptions.InvalidParameterValue, self.run_async,
+                          drac_client.set_power_state('foo'))
+        self.assertEqual([], drac_client.client.transport.requests)
+
+    def test_list_boot_modes(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_BootConfigSetting]['ok']],
+            'list_boot_modes')
+
+        self.assertIsInstance(result[0], bios.BootMode)
+
+    def test_list_boot_devices(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_BootSourceSetting]['ok']],
+            'list_boot_devices')
+
+    def test_list_bios_settings(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSString]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSInteger]['ok']],
+            'list_bios_settings')
+
+    def test_list_bios_settings_with_colliding_attrs(
+            self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client(
+            [test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSString]['colliding'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSInteger]['ok']])
+
+        self.assertRaises(exceptions.DRACOperationFailed, self.run_async,
+                          drac_client.list_bios_settings())
+
+    def test_set_bios_settings(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSString]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSInteger]['ok'],
+             test_utils.BIOSInvocations[uris.DCIM_BIOSService][
+                 'SetAttributes']['ok']],
+            'set_bios_settings', {'ProcVirtualization': 'Disabled'})
+
+        self.assertEqual({'is_commit_required': True,
+                          'is_reboot_required': constants.RebootRequired.true},
+                         result)
+
+    def test_set_bios_settings_unchanged(self,
+                                         mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSString]['ok'],
+             test_utils.BIOSEnumerations[uris.DCIM_BIOSInteger]['ok']],
+            'set_bios_settings', {'ProcVirtualization': 'Enabled'})
+
+        self.assertFalse(result['is_commit_required'])
+
+    def test_list_idrac_settings(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.iDracCardEnumerations[
+                uris.DCIM_iDRACCardEnumeration]['ok'],
+             test_utils.iDracCardEnumerations[uris.DCIM_iDRACCardString]['ok'],
+             test_utils.iDracCardEnumerations[
+                 uris.DCIM_iDRACCardInteger]['ok']],
+            'list_idrac_settings', by_name=True)
+
+    def test_list_lifecycle_settings(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.LifecycleControllerEnumerations[
+                uris.DCIM_LCEnumeration]['ok'],
+             test_utils.LifecycleControllerEnumerations[
+                 uris.DCIM_LCString]['ok']],
+            'list_lifecycle_settings')
+
+    def test_list_system_settings(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.SystemEnumerations[uris.DCIM_SystemEnumeration]['ok'],
+             test_utils.SystemEnumerations[uris.DCIM_SystemString]['ok'],
+             test_utils.SystemEnumerations[uris.DCIM_SystemInteger]['ok']],
+            'list_system_settings')
+
+    def test_get_lifecycle_controller_version(
+            self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.LifecycleControllerEnumerations[
+                uris.DCIM_SystemView]['ok']],
+            'get_lifecycle_controller_version')
+
+        self.assertEqual((2, 1, 0), result)
+
+    def test_list_jobs(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok']],
+            'list_jobs', only_unfinished=True)
+
+    def test_get_job(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok']],
+            'get_job', 'JID_CLEARALL')
+
+        self.assertEqual('JID_CLEARALL', result.id)
+
+    def test_get_job_not_found(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.JobEnumerations[uris.DCIM_LifecycleJob][
+                'not_found']],
+            'get_job', 'foo')
+
+        self.assertIsNone(result)
+
+    def test_commit_pending_bios_changes(self,
+                                         mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.JobInvocations[uris.DCIM_BIOSService][
+                'CreateTargetedConfigJob']['ok']],
+            'commit_pending_bios_changes', reboot=True)
+
+        self.assertEqual('JID_442507917525', result)
+
+    def test_delete_jobs_with_errors(self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client(
+            2 * [test_utils.JobService[uris.DCIM_JobService][
+                'DeleteJobQueue']['error']])
+
+        with self.assertRaises(exceptions.DRACOperationFailed) as exc:
+            self.run_async(drac_client.delete_jobs(['JID_1', 'JID_2']))
+
+        self.assertIn('JID_1', str(exc.exception))
+        self.assertIn('JID_2', str(exc.exception))
+        self.assertEqual(2, len(drac_client.client.transport.requests))
+
+    def test_list_raid_controllers(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.RAIDEnumerations[uris.DCIM_ControllerView]['ok']],
+            'list_raid_controllers')
+
+        self.assertIsInstance(result[0], raid.RAIDController)
+
+    def test_list_virtual_disks(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.RAIDEnumerations[uris.DCIM_VirtualDiskView]['ok']],
+            'list_virtual_disks')
+
+    def test_list_physical_disks(self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.RAIDEnumerations[uris.DCIM_PhysicalDiskView]['ok']],
+            'list_physical_disks')
+
+        self.assertIsInstance(result[0], raid.PhysicalDisk)
+
+    def test_list_raid_settings(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.RAIDEnumerations[uris.DCIM_RAIDEnumeration]['ok'],
+             test_utils.RAIDEnumerations[uris.DCIM_RAIDString]['ok'],
+             test_utils.RAIDEnumerations[uris.DCIM_RAIDInteger]['ok']],
+            'list_raid_settings')
+
+    def test_create_virtual_disk(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.RAIDInvocations[uris.DCIM_RAIDService][
+                'CreateVirtualDisk']['ok']],
+            'create_virtual_disk', 'controller',
+            ['disk1', 'disk2'], '1', 42)
+
+    def test_create_virtual_disk_with_invalid_parameters(
+            self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client([])
+
+        self.assertRaises(exceptions.InvalidParameterValue, self.run_async,
+                          drac_client.create_virtual_disk(
+                              'controller', ['disk1'], '1', 'foo'))
+
+    def test_clear_foreign_config_with_no_foreign_drive(
+            self, mock_wait_until_idrac_is_ready):
+        result = self._assert_same_result(
+            [test_utils.RAIDInvocations[uris.DCIM_RAIDService][
+                'ClearForeignConfig']['no_foreign_drive']],
+            'clear_foreign_config', 'RAID.Integrated.1-1')
+
+        self.assertFalse(result['is_commit_required'])
+
+    def test_change_physical_disk_state(self,
+                                        mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.RAIDEnumerations[uris.DCIM_PhysicalDiskView]['ok'],
+             test_utils.RAIDEnumerations[uris.DCIM_ControllerView]['ok']],
+            'change_physical_disk_state', constants.RaidStatus.raid)
+
+    def test_list_cpus(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.InventoryEnumerations[uris.DCIM_CPUView]['ok']],
+            'list_cpus')
+
+    def test_list_memory(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.InventoryEnumerations[uris.DCIM_MemoryView]['ok']],
+            'list_memory')
+
+    def test_list_nics(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.InventoryEnumerations[uris.DCIM_NICView]['ok']],
+            'list_nics', sort=True)
+
+    def test_get_system(self, mock_wait_until_idrac_is_ready):
+        self._assert_same_result(
+            [test_utils.LifecycleControllerEnumerations[
+                uris.DCIM_SystemView]['ok']],
+            'get_system')
+
+    def test_context_manager(self, mock_wait_until_idrac_is_ready):
+        drac_client = self._drac_client([])
+
+        async def use_client():
+            async with drac_client:
+                pass
+
+        self.run_async(use_client())
+
+        self.assertTrue(drac_client.client.transport.closed)
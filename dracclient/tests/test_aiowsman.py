@@ -0,0 +1,402 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+from unittest import mock
+
+import lxml.etree
+
+from dracclient import aiowsman
+from dracclient import exceptions
+from dracclient.tests import base
+from dracclient.tests import utils as test_utils
+import dracclient.wsman
+
+
+class TransportTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(TransportTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.requests = []
+        self.connections = 0
+
+    def _serve(self, responses):
+        async def handle(reader, writer):
+            self.connections += 1
+            while responses:
+                request = await reader.readuntil(b'\r\n\r\n')
+                headers = dict(
+                    line.split(b': ', 1)
+                    for line in request.split(b'\r\n')[1:] if line)
+                body = await reader.readexactly(
+                    int(headers[b'Content-Length']))
+                self.requests.append((request, body))
+
+                resp = responses.pop(0)
+                writer.write(resp)
+                await writer.drain()
+                if b'Connection: close' in resp:
+                    break
+            writer.close()
+
+        server = self.loop.run_until_complete(
+            asyncio.start_server(handle, '127.0.0.1', 0))
+        self.addCleanup(self.loop.run_until_complete, server.wait_closed())
+        self.addCleanup(server.close)
+
+        return server.sockets[0].getsockname()[1]
+
+    def _post(self, transport, body=b'<request/>'):
+        return self.loop.run_until_complete(
+            transport.post('/wsman', body, {'Authorization': 'Basic Zm9v'}))
+
+    def test_post(self):
+        port = self._serve([b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\n'
+                            b'yay!'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        resp = self._post(transport)
+
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual('OK', resp.reason)
+        self.assertTrue(resp.ok)
+        self.assertEqual(b'yay!', resp.content)
+        request, body = self.requests[0]
+        self.assertTrue(request.startswith(b'POST /wsman HTTP/1.1\r\n'))
+        self.assertIn(b'Authorization: Basic Zm9v\r\n', request)
+        self.assertEqual(b'<request/>', body)
+        self.loop.run_until_complete(transport.close())
+
+    def test_post_reuses_connection(self):
+        port = self._serve(
+            [b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nyay!',
+             b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nyay!!'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        self._post(transport)
+        resp = self._post(transport)
+
+        self.assertEqual(b'yay!!', resp.content)
+        self.assertEqual(1, self.connections)
+        self.loop.run_until_complete(transport.close())
+
+    def test_post_with_connection_close(self):
+        responses = [b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n'
+                     b'Connection: close\r\n\r\nyay!',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nyay!!']
+        port = self._serve(responses)
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        self._post(transport)
+        resp = self._post(transport)
+
+        self.assertEqual(b'yay!!', resp.content)
+        self.assertEqual(2, self.connections)
+        self.loop.run_until_complete(transport.close())
+
+    def test_post_chunked(self):
+        port = self._serve([b'HTTP/1.1 200 OK\r\n'
+                            b'Transfer-Encoding: chunked\r\n\r\n'
+                            b'2\r\nya\r\n2\r\ny!\r\n0\r\n\r\n'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        resp = self._post(transport)
+
+        self.assertEqual(b'yay!', resp.content)
+        self.loop.run_until_complete(transport.close())
+
+    def test_post_error_status(self):
+        port = self._serve([b'HTTP/1.1 500 Internal Server Error\r\n'
+                            b'Content-Length: 0\r\n\r\n'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        resp = self._post(transport)
+
+        self.assertEqual(500, resp.status_code)
+        self.assertEqual('Internal Server Error', resp.reason)
+        self.assertFalse(resp.ok)
+        self.loop.run_until_complete(transport.close())
+
+    def test_idle_connections_are_discarded(self):
+        port = self._serve(
+            [b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nyay!'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http',
+                                       idle_timeout=60)
+        self._post(transport)
+        conn = transport._idle[0]
+        transport._idle[0] = conn._replace(last_used=conn.last_used - 100)
+
+        with mock.patch.object(transport, '_close_connection',
+                               autospec=True) as mock_close:
+            self.assertIsNone(transport._get_idle_connection())
+
+        mock_close.assert_called_once_with(mock.ANY)
+        conn.writer.close()
+
+    def test_post_read_timeout(self):
+        async def handle(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            # never answers
+            await reader.read()
+            writer.close()
+
+        server = self.loop.run_until_complete(
+            asyncio.start_server(handle, '127.0.0.1', 0))
+        self.addCleanup(self.loop.run_until_complete, server.wait_closed())
+        self.addCleanup(server.close)
+        port = server.sockets[0].getsockname()[1]
+        transport = aiowsman.Transport('127.0.0.1', port, 'http',
+                                       read_timeout=0.05)
+
+        with mock.patch.object(transport, '_close_connection',
+                               wraps=transport._close_connection) as m_close:
+            self.assertRaises(TimeoutError, self._post, transport)
+
+        m_close.assert_called_once_with(mock.ANY)
+        self.assertEqual(0, len(transport._idle))
+
+    @mock.patch.object(asyncio, 'open_connection', autospec=True)
+    def test_post_connect_timeout(self, mock_open_connection):
+        async def open_connection(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_open_connection.side_effect = open_connection
+        transport = aiowsman.Transport('127.0.0.1', 443, 'http',
+                                       connect_timeout=0.05)
+
+        self.assertRaises(TimeoutError, self._post, transport)
+
+    def test_post_malformed_response(self):
+        port = self._serve([b'HTTP/1.1 200 OK\r\nContent-Length: four\r\n'
+                            b'\r\nyay!'])
+        transport = aiowsman.Transport('127.0.0.1', port, 'http')
+
+        self.assertRaises(aiowsman.HTTPResponseError, self._post, transport)
+        self.assertEqual(0, len(transport._idle))
+
+    def _read_response(self, data, **kwargs):
+        transport = aiowsman.Transport('127.0.0.1', 80, 'http', **kwargs)
+
+        async def read_response():
+            reader = asyncio.StreamReader(limit=1024)
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await transport._read_response(reader)
+
+        return self.loop.run_until_complete(read_response())
+
+    def test_read_response_after_continue(self):
+        resp, keep_alive = self._read_response(
+            b'HTTP/1.1 100 Continue\r\n\r\n'
+            b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nyay!')
+
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual(b'yay!', resp.content)
+        self.assertTrue(keep_alive)
+
+    def test_read_response_until_connection_close(self):
+        resp, keep_alive = self._read_response(
+            b'HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nyay!')
+
+        self.assertEqual(b'yay!', resp.content)
+        self.assertFalse(keep_alive)
+
+    def test_read_response_without_content(self):
+        resp, keep_alive = self._read_response(
+            b'HTTP/1.1 204 No Content\r\n\r\n')
+
+        self.assertEqual(b'', resp.content)
+        self.assertTrue(keep_alive)
+
+    def test_read_response_http_1_0(self):
+        resp, keep_alive = self._read_response(
+            b'HTTP/1.0 200 OK\r\nContent-Length: 4\r\n\r\nyay!')
+
+        self.assertEqual(b'yay!', resp.content)
+        self.assertFalse(keep_alive)
+
+    def test_read_response_malformed(self):
+        for data in (b'yay!\r\n\r\n',
+                     b'HTTP/1.1\r\n\r\n',
+                     b'HTTP/1.1 OK 200\r\n\r\n',
+                     b'HTTP/1.1 2000 OK\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nyay!\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\n: yay!\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nServer: foo\r\n bar\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: -4\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\nyay!\r\n',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n-4\r\nyay!\r\n0\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n2\r\nyay!\r\n0\r\n\r\n'):
+            self.assertRaises(aiowsman.HTTPResponseError,
+                              self._read_response, data)
+
+    def test_read_response_truncated(self):
+        for data in (b'',
+                     b'HTTP/1.1 200',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nya',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n4\r\nya',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n4\r\nyay!\r\n'):
+            self.assertRaises(asyncio.IncompleteReadError,
+                              self._read_response, data)
+
+    def test_read_response_oversized_headers(self):
+        headers = b''.join(b'X-Header-%d: %s\r\n' % (i, b'x' * 50)
+                           for i in range(10))
+
+        self.assertRaises(aiowsman.HTTPResponseError, self._read_response,
+                          b'HTTP/1.1 200 OK\r\n' + headers + b'\r\n',
+                          max_header_size=512)
+        # beyond the buffer of the stream
+        self.assertRaises(aiowsman.HTTPResponseError, self._read_response,
+                          b'HTTP/1.1 200 OK\r\nServer: ' + b'x' * 2048 +
+                          b'\r\n\r\n')
+
+    def test_read_response_oversized_body(self):
+        for data in (b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nyay!!',
+                     b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n2\r\nya\r\n3\r\ny!!\r\n0\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nyay!!'):
+            self.assertRaises(aiowsman.HTTPResponseError,
+                              self._read_response, data, max_response_size=4)
+
+
+class ClientTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(ClientTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def _client(self, responses, **kwargs):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint.update(kwargs)
+        fake_endpoint['transport'] = test_utils.FakeAsyncTransport(responses)
+
+        return aiowsman.Client(**fake_endpoint)
+
+    def test_enumerate(self):
+        client = self._client(['<result>yay!</result>'])
+
+        resp = self.loop.run_until_complete(
+            client.enumerate('resource', auto_pull=False))
+
+        self.assertEqual('yay!', resp.text)
+        request = lxml.etree.fromstring(client.transport.requests[0])
+        self.assertIsNotNone(request.find(
+            './/{%s}Enumerate' % dracclient.wsman.NS_WSMAN_ENUM))
+
+    def test_enumerate_with_auto_pull(self):
+        client = self._client(test_utils.WSManEnumerations['context'])
+
+        resp_xml = self.loop.run_until_complete(
+            client.enumerate('FooResource'))
+
+        self.assertEqual(
+            4, len(resp_xml.findall('.//{%s}FooResource'
+                                    % 'http://FooResource')))
+        self.assertEqual(
+            1, len(resp_xml.findall('.//{%s}BazResource'
+                                    % 'http://BarResource')))
+        self.assertEqual(
+            0, len(resp_xml.findall(
+                './/{%s}EnumerationContext' % dracclient.wsman.NS_WSMAN_ENUM)))
+        self.assertEqual(4, len(client.transport.requests))
+
+    def test_enumerate_with_invalid_status_code(self):
+        client = self._client(
+            [aiowsman.Response(500, 'dumb request', {}, b'')])
+
+        self.assertRaises(exceptions.WSManInvalidResponse,
+                          self.loop.run_until_complete,
+                          client.enumerate('resource'))
+
+    def test_pull(self):
+        client = self._client(['<result>yay!</result>'])
+
+        resp = self.loop.run_until_complete(
+            client.pull('resource', 'context-uuid'))
+
+        self.assertEqual('yay!', resp.text)
+
+    def test_invoke(self):
+        client = self._client(['<result>yay!</result>'])
+
+        resp = self.loop.run_until_complete(
+            client.invoke('http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'}))
+
+        self.assertEqual('yay!', resp.text)
+
+    def test_invoke_with_connection_error_success(self):
+        client = self._client([ConnectionResetError(),
+                               '<result>yay!</result>'])
+
+        resp = self.loop.run_until_complete(
+            client.invoke('http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'}))
+
+        self.assertEqual('yay!', resp.text)
+
+    def test_invoke_with_connection_errors(self):
+        client = self._client(3 * [ConnectionResetError()])
+
+        self.assertRaises(exceptions.WSManRequestFailure,
+                          self.loop.run_until_complete,
+                          client.invoke('http://resource', 'method',
+                                        {'selector': 'foo'},
+                                        {'property': 'bar'}))
+
+    @mock.patch.object(asyncio, 'sleep', autospec=True)
+    def test_client_retry_delay(self, mock_sleep):
+        client = self._client([ConnectionResetError(),
+                               '<result>yay!</result>'], ssl_retry_delay=5)
+
+        self.loop.run_until_complete(
+            client.invoke('http://resource', 'method', {}, {}))
+
+        mock_sleep.assert_called_once_with(5)
+
+    def test_invoke_with_timeouts(self):
+        client = self._client(3 * [TimeoutError()])
+
+        self.assertRaises(exceptions.WSManRequestFailure,
+                          self.loop.run_until_complete,
+                          client.invoke('http://resource', 'method',
+                                        {'selector': 'foo'},
+                                        {'property': 'bar'}))
+
+    def test_client_timeouts(self):
+        client = aiowsman.Client(connect_timeout=5, read_timeout=60,
+                                 **test_utils.FAKE_ENDPOINT)
+
+        self.assertEqual(5, client.transport.connect_timeout)
+        self.assertEqual(60, client.transport.read_timeout)
+
+    def test_context_manager(self):
+        client = self._client([])
+
+        async def use_client():
+            async with client:
+                pass
+
+        self.loop.run_until_complete(use_client())
+
+        self.assertTrue(client.transport.closed)
@@ -310,6 +310,45 @@ class ClientBIOSConfigurationTestCase(base.BaseTest):
         self.assertIn('Proc1NumCores', bios_settings)
         self.assertEqual(expected_integer_attr, bios_settings['Proc1NumCores'])
 
+    def test_list_bios_settings_lazy(self, mock_requests,
+                                     mock_wait_until_idrac_is_ready):
+        mock_requests.post('https://1.2.3.4:443/wsman', [
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSEnumeration]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSString]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSInteger]['ok']}])
+
+        bios_settings = self.drac_client.list_bios_settings(lazy=True)
+
+        self.assertIsInstance(bios_settings, utils.LazySettings)
+        self.assertEqual(103, len(bios_settings))
+        self.assertEqual(0, bios_settings.parsed)
+        self.assertIn('MemTest', bios_settings)
+        self.assertEqual(['Enabled', 'Disabled'],
+                         bios_settings['MemTest'].possible_values)
+        self.assertIs(bios_settings['MemTest'], bios_settings['MemTest'])
+        self.assertEqual(1, bios_settings.parsed)
+
+    def test_list_bios_settings_eager(self, mock_requests,
+                                      mock_wait_until_idrac_is_ready):
+        responses = [
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSEnumeration]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSString]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSInteger]['ok']}]
+        mock_requests.post('https://1.2.3.4:443/wsman', responses * 2)
+
+        bios_settings = self.drac_client.list_bios_settings(by_name=False)
+
+        self.assertIsInstance(bios_settings, dict)
+        self.assertEqual(
+            self.drac_client.list_bios_settings(by_name=False, lazy=True),
+            bios_settings)
+
     def test_list_bios_settings_by_name_with_colliding_attrs(
             self, mock_requests, mock_wait_until_idrac_is_ready):
         mock_requests.post('https://1.2.3.4:443/wsman', [
@@ -0,0 +1,129 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from dracclient import breaker
+from dracclient.tests import base
+
+
+@mock.patch('time.monotonic', autospec=True)
+class CircuitBreakerTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(CircuitBreakerTestCase, self).setUp()
+        self.breaker = breaker.CircuitBreaker(failure_threshold=2,
+                                              reset_timeout=60)
+
+    def _open(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+    def test_closed(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.breaker.record_failure()
+
+        self.assertEqual(breaker.CLOSED, self.breaker.state)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_success_resets_failures(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(breaker.CLOSED, self.breaker.state)
+
+    def test_open(self, mock_monotonic):
+        self._open(mock_monotonic)
+
+        mock_monotonic.return_value = 130
+        self.assertEqual(breaker.OPEN, self.breaker.state)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(30, self.breaker.retry_after())
+
+    def test_half_open(self, mock_monotonic):
+        self._open(mock_monotonic)
+
+        mock_monotonic.return_value = 160
+        self.assertEqual(breaker.HALF_OPEN, self.breaker.state)
+        self.assertEqual(0, self.breaker.retry_after())
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_half_open_success(self, mock_monotonic):
+        self._open(mock_monotonic)
+        mock_monotonic.return_value = 160
+        self.breaker.allow_request()
+
+        self.breaker.record_success()
+
+        self.assertEqual(breaker.CLOSED, self.breaker.state)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_half_open_failure(self, mock_monotonic):
+        self._open(mock_monotonic)
+        mock_monotonic.return_value = 160
+        self.breaker.allow_request()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(breaker.OPEN, self.breaker.state)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(60, self.breaker.retry_after())
+
+    def test_half_open_release(self, mock_monotonic):
+        self._open(mock_monotonic)
+        mock_monotonic.return_value = 160
+        self.breaker.allow_request()
+
+        self.breaker.release()
+
+        self.assertEqual(breaker.HALF_OPEN, self.breaker.state)
+        self.assertTrue(self.breaker.allow_request())
+
+
+class CircuitBreakerRegistryTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(CircuitBreakerRegistryTestCase, self).setUp()
+        self.registry = breaker.CircuitBreakerRegistry(failure_threshold=1)
+
+    def test_get(self):
+        self.assertIs(self.registry.get('1.2.3.4'),
+                      self.registry.get('1.2.3.4'))
+        self.assertIsNot(self.registry.get('1.2.3.4'),
+                         self.registry.get('5.6.7.8'))
+        self.assertEqual(1, self.registry.get('1.2.3.4').failure_threshold)
+
+    def test_state(self):
+        self.registry.get('1.2.3.4').record_failure()
+        self.registry.get('5.6.7.8').record_success()
+
+        self.assertEqual(breaker.OPEN, self.registry.state('1.2.3.4'))
+        self.assertEqual(breaker.CLOSED, self.registry.state('9.10.11.12'))
+        self.assertEqual({'1.2.3.4': breaker.OPEN,
+                          '5.6.7.8': breaker.CLOSED},
+                         self.registry.states())
+
+    def test_reset(self):
+        self.registry.get('1.2.3.4').record_failure()
+
+        self.registry.reset('1.2.3.4')
+
+        self.assertEqual(breaker.CLOSED, self.registry.state('1.2.3.4'))
+
+    def test_get_shared_registry(self):
+        self.assertIs(breaker.get_shared_registry(),
+                      breaker.get_shared_registry())
@@ -11,21 +11,37 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+import time
 from unittest import mock
 
+import lxml.etree
+import requests.exceptions
 import requests_mock
 
 import dracclient.client
 from dracclient import constants
 from dracclient import exceptions
 from dracclient.resources import uris
+from dracclient import retry
+from dracclient import scheduler
 from dracclient.tests import base
 from dracclient.tests import utils as test_utils
+import dracclient.wsman
 
 
 @requests_mock.Mocker()
 class WSManClientTestCase(base.BaseTest):
 
+    def setUp(self):
+        super(WSManClientTestCase, self).setUp()
+        self.poll_scheduler = scheduler.PollScheduler(tick=0.001)
+        self.addCleanup(self.poll_scheduler.shutdown)
+
+    def _client(self, **kwargs):
+        return dracclient.client.WSManClient(
+            poll_scheduler=self.poll_scheduler, **kwargs)
+
     @mock.patch.object(dracclient.client.WSManClient,
                        'wait_until_idrac_is_ready', spec_set=True,
                        autospec=True)
@@ -51,6 +67,35 @@ class WSManClientTestCase(base.BaseTest):
         self.assertFalse(mock_wait_until_idrac_is_ready.called)
         self.assertEqual('yay!', resp.text)
 
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'wait_until_idrac_is_ready', spec_set=True,
+                       autospec=True)
+    def test_iter_enumerate(self, mock_requests,
+                            mock_wait_until_idrac_is_ready):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            text=test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+        items = list(client.iter_enumerate(uris.DCIM_LifecycleJob))
+        mock_wait_until_idrac_is_ready.assert_called_once_with(client)
+        self.assertEqual(6, len(items))
+
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'wait_until_idrac_is_ready', spec_set=True,
+                       autospec=True)
+    def test_iter_enumerate_without_wait_for_idrac(
+            self, mock_requests, mock_wait_until_idrac_is_ready):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            text=test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+        items = list(client.iter_enumerate(uris.DCIM_LifecycleJob,
+                                           wait_for_idrac=False))
+        self.assertFalse(mock_wait_until_idrac_is_ready.called)
+        self.assertEqual(6, len(items))
+
     @mock.patch.object(dracclient.client.WSManClient,
                        'wait_until_idrac_is_ready', spec_set=True,
                        autospec=True)
@@ -159,11 +204,12 @@ class WSManClientTestCase(base.BaseTest):
         client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
         self.assertFalse(client.is_idrac_ready())
 
+    @mock.patch.object(retry.RetryPolicy, 'delay', autospec=True,
+                       return_value=0)
     @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
                        autospec=True)
-    @mock.patch('time.sleep', autospec=True)
     def test_wait_until_idrac_is_ready_with_none_arguments(
-            self, mock_requests, mock_ts, mock_is_idrac_ready):
+            self, mock_requests, mock_is_idrac_ready, mock_delay):
         ready_retries = 2
         ready_retry_delay = 1
 
@@ -175,18 +221,21 @@ class WSManClientTestCase(base.BaseTest):
         fake_endpoint['ready_retries'] = ready_retries
         fake_endpoint['ready_retry_delay'] = ready_retry_delay
 
-        client = dracclient.client.WSManClient(**fake_endpoint)
+        client = self._client(**fake_endpoint)
         client.wait_until_idrac_is_ready(retries=None, retry_delay=None)
 
         self.assertEqual(mock_is_idrac_ready.call_count, ready_retries)
-        self.assertEqual(mock_ts.call_count, ready_retries - 1)
-        mock_ts.assert_called_with(ready_retry_delay)
+        self.assertEqual(mock_delay.call_count, ready_retries - 1)
+        policy = mock_delay.call_args[0][0]
+        self.assertEqual(ready_retries, policy.max_attempts)
+        self.assertEqual(ready_retry_delay, policy.base_delay)
 
+    @mock.patch.object(retry.RetryPolicy, 'delay', autospec=True,
+                       return_value=0)
     @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
                        autospec=True)
-    @mock.patch('time.sleep', autospec=True)
     def test_wait_until_idrac_is_ready_with_non_none_arguments(
-            self, mock_requests, mock_ts, mock_is_idrac_ready):
+            self, mock_requests, mock_is_idrac_ready, mock_delay):
         retries = 2
         self.assertNotEqual(retries, constants.DEFAULT_IDRAC_IS_READY_RETRIES)
 
@@ -204,12 +253,102 @@ class WSManClientTestCase(base.BaseTest):
         fake_endpoint['ready_retry_delay'] = (
             constants.DEFAULT_IDRAC_IS_READY_RETRY_DELAY_SEC)
 
-        client = dracclient.client.WSManClient(**fake_endpoint)
+        client = self._client(**fake_endpoint)
         client.wait_until_idrac_is_ready(retries, retry_delay)
 
         self.assertEqual(mock_is_idrac_ready.call_count, retries)
-        self.assertEqual(mock_ts.call_count, retries - 1)
-        mock_ts.assert_called_with(retry_delay)
+        self.assertEqual(mock_delay.call_count, retries - 1)
+        policy = mock_delay.call_args[0][0]
+        self.assertEqual(retries, policy.max_attempts)
+        self.assertEqual(retry_delay, policy.base_delay)
+
+    @mock.patch.object(retry.RetryPolicy, 'delay', autospec=True,
+                       return_value=0)
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_with_ready_retry_policy(
+            self, mock_requests, mock_is_idrac_ready, mock_delay):
+        mock_is_idrac_ready.side_effect = [False, False, True]
+        policy = retry.RetryPolicy(max_attempts=3, base_delay=5,
+                                   jitter=False)
+
+        client = self._client(ready_retry_policy=policy,
+                              **test_utils.FAKE_ENDPOINT)
+        client.wait_until_idrac_is_ready()
+
+        self.assertEqual(3, mock_is_idrac_ready.call_count)
+        self.assertEqual([mock.call(policy, 1), mock.call(policy, 2)],
+                         mock_delay.call_args_list)
+
+    @mock.patch.object(retry.RetryPolicy, 'delay', autospec=True,
+                       return_value=0)
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_with_exhausted_host_budget(
+            self, mock_requests, mock_is_idrac_ready, mock_delay):
+        mock_is_idrac_ready.return_value = False
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['ready_retry_policy'] = retry.RetryPolicy(
+            max_attempts=10, host_budget=2)
+
+        client = self._client(**fake_endpoint)
+
+        self.assertRaises(exceptions.DRACOperationFailed,
+                          client.wait_until_idrac_is_ready)
+        self.assertEqual(3, mock_is_idrac_ready.call_count)
+
+    def test_wait_until_idrac_is_ready_with_deadline(self, mock_requests):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            text=test_utils.LifecycleControllerInvocations[
+                uris.DCIM_LCService]['GetRemoteServicesAPIStatus'][
+                'is_not_ready'])
+        client = self._client(**test_utils.FAKE_ENDPOINT)
+
+        with client.deadline(5):
+            self.assertRaises(exceptions.DRACDeadlineExceeded,
+                              client.wait_until_idrac_is_ready)
+
+        self.assertEqual(1, mock_requests.call_count)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_checks_within_deadline(
+            self, mock_requests, mock_is_idrac_ready):
+        remaining = []
+
+        def is_idrac_ready(client):
+            remaining.append(client.remaining_time())
+            return len(remaining) == 2
+
+        mock_is_idrac_ready.side_effect = is_idrac_ready
+        client = self._client(
+            ready_retry_policy=retry.RetryPolicy.fixed(3, 0.01),
+            **test_utils.FAKE_ENDPOINT)
+
+        with client.deadline(60):
+            client.wait_until_idrac_is_ready()
+
+        self.assertEqual(2, len(remaining))
+        for seconds in remaining:
+            self.assertGreater(seconds, 50)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_cancelled(self, mock_requests,
+                                                 mock_is_idrac_ready):
+        def is_idrac_ready(client):
+            # stops the scheduler while the iDRAC is not ready
+            self.poll_scheduler.shutdown()
+            return False
+
+        mock_is_idrac_ready.side_effect = is_idrac_ready
+        client = self._client(
+            ready_retry_policy=retry.RetryPolicy.fixed(3, 0.01),
+            **test_utils.FAKE_ENDPOINT)
+
+        self.assertRaises(exceptions.DRACWaitCancelled,
+                          client.wait_until_idrac_is_ready)
 
     def test_wait_until_idrac_is_ready_ready(self, mock_requests):
         expected_text = test_utils.LifecycleControllerInvocations[
@@ -225,15 +364,191 @@ class WSManClientTestCase(base.BaseTest):
             self.fail('wait_until_idrac_is_ready() timed out when it should '
                       'not have!')
 
-    @mock.patch('time.sleep', autospec=True)
+    @mock.patch.object(retry.RetryPolicy, 'delay', autospec=True,
+                       return_value=0)
     def test_wait_until_idrac_is_ready_timeout(self,
                                                mock_requests,
-                                               mock_ts):
+                                               mock_delay):
         expected_text = test_utils.LifecycleControllerInvocations[
             uris.DCIM_LCService]['GetRemoteServicesAPIStatus']['is_not_ready']
         mock_requests.post('https://1.2.3.4:443/wsman',
                            text=expected_text)
 
-        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+        client = self._client(**test_utils.FAKE_ENDPOINT)
         self.assertRaises(exceptions.DRACOperationFailed,
                           client.wait_until_idrac_is_ready)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_with_ready_ttl(self, mock_requests,
+                                                      mock_is_idrac_ready):
+        mock_is_idrac_ready.return_value = True
+        client = dracclient.client.WSManClient(ready_ttl=60,
+                                               **test_utils.FAKE_ENDPOINT)
+
+        client.wait_until_idrac_is_ready()
+        client.wait_until_idrac_is_ready()
+
+        mock_is_idrac_ready.assert_called_once_with(client)
+        self.assertEqual(1, client.ready_probes_skipped)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_wait_until_idrac_is_ready_without_ready_ttl(self, mock_requests,
+                                                         mock_is_idrac_ready):
+        mock_is_idrac_ready.return_value = True
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+
+        client.wait_until_idrac_is_ready()
+        client.wait_until_idrac_is_ready()
+
+        self.assertEqual(2, mock_is_idrac_ready.call_count)
+        self.assertEqual(0, client.ready_probes_skipped)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    @mock.patch('time.monotonic', autospec=True)
+    def test_wait_until_idrac_is_ready_with_expired_ready_ttl(
+            self, mock_requests, mock_monotonic, mock_is_idrac_ready):
+        mock_is_idrac_ready.return_value = True
+        mock_monotonic.side_effect = [0, 61, 61]
+        client = dracclient.client.WSManClient(ready_ttl=60,
+                                               **test_utils.FAKE_ENDPOINT)
+
+        client.wait_until_idrac_is_ready()
+        client.wait_until_idrac_is_ready()
+
+        self.assertEqual(2, mock_is_idrac_ready.call_count)
+        self.assertEqual(0, client.ready_probes_skipped)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       autospec=True)
+    def test_ready_cache_invalidated_on_request_failure(self, mock_requests,
+                                                        mock_is_idrac_ready):
+        mock_is_idrac_ready.return_value = True
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           exc=requests.exceptions.ConnectionError)
+        client = dracclient.client.WSManClient(ready_ttl=60,
+                                               **test_utils.FAKE_ENDPOINT)
+
+        self.assertRaises(exceptions.WSManRequestFailure, client.enumerate,
+                          'http://resource')
+        client.wait_until_idrac_is_ready()
+
+        self.assertEqual(2, mock_is_idrac_ready.call_count)
+
+    @mock.patch.object(dracclient.wsman.Client, 'enumerate', spec_set=True,
+                       autospec=True)
+    def test_enumerate_coalesces_concurrent_requests(self, mock_requests,
+                                                     mock_enumerate):
+        started = threading.Event()
+        release = threading.Event()
+
+        def enumerate(*args):
+            started.set()
+            release.wait(5)
+            return lxml.etree.fromstring('<result>yay!</result>')
+
+        mock_enumerate.side_effect = enumerate
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(client.enumerate(
+                'http://resource', wait_for_idrac=False)))
+            for i in range(2)]
+
+        threads[0].start()
+        started.wait(5)
+        threads[1].start()
+        while not client.requests_coalesced:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        mock_enumerate.assert_called_once_with(
+            client, 'http://resource', True, 100, True, None, 'cql')
+        self.assertEqual(['yay!', 'yay!'], [r.text for r in results])
+
+    @mock.patch.object(dracclient.wsman.Client, 'enumerate', spec_set=True,
+                       autospec=True)
+    def test_enumerate_does_not_coalesce_different_filters(
+            self, mock_requests, mock_enumerate):
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+
+        client.enumerate('http://resource', filter_query='foo',
+                         wait_for_idrac=False)
+        client.enumerate('http://resource', filter_query='bar',
+                         wait_for_idrac=False)
+
+        self.assertEqual(2, mock_enumerate.call_count)
+        self.assertEqual(0, client.requests_coalesced)
+
+    @mock.patch.object(dracclient.wsman.Client, 'enumerate', spec_set=True,
+                       autospec=True)
+    def test_enumerate_does_not_coalesce_without_auto_pull(
+            self, mock_requests, mock_enumerate):
+        calls = threading.Semaphore(0)
+        release = threading.Event()
+
+        def enumerate(*args):
+            calls.release()
+            release.wait(5)
+            return lxml.etree.fromstring('<result>context</result>')
+
+        mock_enumerate.side_effect = enumerate
+        client = dracclient.client.WSManClient(**test_utils.FAKE_ENDPOINT)
+        threads = [threading.Thread(
+            target=client.enumerate, args=('http://resource',),
+            kwargs={'auto_pull': False, 'wait_for_idrac': False})
+            for i in range(2)]
+
+        for thread in threads:
+            thread.start()
+        # both requests are in flight at once
+        self.assertTrue(calls.acquire(timeout=5))
+        self.assertTrue(calls.acquire(timeout=5))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(2, mock_enumerate.call_count)
+        self.assertEqual(0, client.requests_coalesced)
+
+
+class DRACClientTestCase(base.BaseTest):
+
+    @mock.patch.object(dracclient.client.WSManClient, 'close', spec_set=True,
+                       autospec=True)
+    def test_close(self, mock_close):
+        client = dracclient.client.DRACClient(**test_utils.FAKE_ENDPOINT)
+
+        client.close()
+
+        mock_close.assert_called_once_with(client.client)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'close', spec_set=True,
+                       autospec=True)
+    def test_context_manager(self, mock_close):
+        with dracclient.client.DRACClient(
+                **test_utils.FAKE_ENDPOINT) as client:
+            self.assertIsInstance(client, dracclient.client.DRACClient)
+
+        mock_close.assert_called_once_with(client.client)
+
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'wait_until_idrac_is_ready', spec_set=True,
+                       autospec=True)
+    def test_deadline(self, mock_wait_until_idrac_is_ready):
+        client = dracclient.client.DRACClient(**test_utils.FAKE_ENDPOINT)
+
+        with client.deadline(0):
+            self.assertRaises(exceptions.DRACDeadlineExceeded,
+                              client.list_jobs)
+
+    def test_connection_settings(self):
+        client = dracclient.client.DRACClient(pool_size=4, idle_timeout=5,
+                                              **test_utils.FAKE_ENDPOINT)
+
+        self.assertEqual(4, client.client.pool_size)
+        self.assertEqual(5, client.client.idle_timeout)
@@ -0,0 +1,159 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+import dracclient.client
+from dracclient import exceptions
+from dracclient import fleet
+from dracclient.tests import base
+
+
+def _node(host):
+    return {'host': host, 'username': 'admin', 'password': 's3cr3t'}
+
+
+class FleetExecutorTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(FleetExecutorTestCase, self).setUp()
+        self.executor = fleet.FleetExecutor(max_workers=2, max_per_host=1)
+        self.addCleanup(self.executor.shutdown)
+        self.lock = threading.Lock()
+        self.running = {}
+        self.max_running = 0
+        self.max_running_per_host = 0
+
+    def _track(self, drac_client, release=None):
+        host = drac_client.client.host
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.max_running = max(self.max_running,
+                                   sum(self.running.values()))
+            self.max_running_per_host = max(self.max_running_per_host,
+                                            self.running[host])
+        try:
+            if release is not None:
+                release.wait(5)
+            return host
+        finally:
+            with self.lock:
+                self.running[host] -= 1
+
+    @mock.patch.object(dracclient.client.DRACClient, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_run_with_method_name(self, mock_list_jobs):
+        mock_list_jobs.return_value = ['job']
+
+        results = list(self.executor.run([_node('1.2.3.4'), _node('5.6.7.8')],
+                                         'list_jobs', only_unfinished=True))
+
+        self.assertEqual({'1.2.3.4', '5.6.7.8'},
+                         {result.host for result in results})
+        for result in results:
+            self.assertEqual(['job'], result.result)
+            self.assertIsNone(result.error)
+        mock_list_jobs.assert_called_with(mock.ANY, only_unfinished=True)
+        self.assertEqual(2, mock_list_jobs.call_count)
+
+    def test_run_with_callable(self):
+        results = list(self.executor.run([_node('1.2.3.4')],
+                                         lambda drac_client, suffix:
+                                         drac_client.client.host + suffix,
+                                         '!'))
+
+        self.assertEqual('1.2.3.4!', results[0].result)
+        self.assertEqual(_node('1.2.3.4'), results[0].node)
+
+    def test_run_reports_errors(self):
+        def operation(drac_client):
+            if drac_client.client.host == '1.2.3.4':
+                raise exceptions.DRACOperationFailed(drac_messages='boom')
+            return 'ok'
+
+        results = self.executor.run_all([_node('1.2.3.4'), _node('5.6.7.8')],
+                                        operation)
+
+        self.assertIsInstance(results['1.2.3.4'].error,
+                              exceptions.DRACOperationFailed)
+        self.assertIsNone(results['1.2.3.4'].result)
+        self.assertEqual('ok', results['5.6.7.8'].result)
+        self.assertIsNone(results['5.6.7.8'].error)
+
+    def test_run_yields_results_in_completion_order(self):
+        release = threading.Event()
+
+        def operation(drac_client):
+            if drac_client.client.host == 'slow':
+                release.wait(5)
+            return drac_client.client.host
+
+        results = self.executor.run([_node('slow'), _node('fast')], operation)
+
+        self.assertEqual('fast', next(results).host)
+        release.set()
+        self.assertEqual('slow', next(results).host)
+
+    def test_run_caps_concurrency(self):
+        nodes = [_node('host%d' % i) for i in range(6)]
+        release = threading.Event()
+        release.set()
+
+        results = self.executor.run_all(nodes, self._track, release)
+
+        self.assertEqual(6, len(results))
+        self.assertLessEqual(self.max_running, 2)
+
+    def test_run_caps_concurrency_per_host(self):
+        nodes = [_node('1.2.3.4')] * 3 + [_node('5.6.7.8')]
+
+        results = list(self.executor.run(nodes, self._track))
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(1, self.max_running_per_host)
+
+    def test_run_with_timeout(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        results = self.executor.run_all(
+            [_node('1.2.3.4'), _node('5.6.7.8'), _node('9.10.11.12')],
+            self._track, release, run_timeout=0.1)
+
+        self.assertEqual(3, len(results))
+        for result in results.values():
+            self.assertIsInstance(result.error,
+                                  exceptions.FleetOperationTimeout)
+
+    def test_run_passes_timeout_to_operation(self):
+        def operation(drac_client, timeout):
+            return timeout
+
+        results = self.executor.run_all([_node('1.2.3.4')], operation,
+                                        timeout=600, run_timeout=10)
+
+        self.assertEqual(600, results['1.2.3.4'].result)
+        self.assertIsNone(results['1.2.3.4'].error)
+
+    def test_clients_share_session_pool(self):
+        session_pool = mock.Mock()
+        executor = fleet.FleetExecutor(session_pool=session_pool)
+        self.addCleanup(executor.shutdown)
+
+        with mock.patch.object(dracclient.client, 'DRACClient',
+                               autospec=True) as mock_client:
+            executor.run_all([_node('1.2.3.4')], 'list_jobs')
+
+        mock_client.assert_called_once_with(session_pool=session_pool,
+                                            **_node('1.2.3.4'))
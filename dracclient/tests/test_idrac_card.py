@@ -20,6 +20,7 @@ import requests_mock
 import dracclient.client
 from dracclient import constants
 from dracclient import exceptions
+from dracclient import probe
 from dracclient.resources import idrac_card
 from dracclient.resources import job
 from dracclient.resources import uris
@@ -184,6 +185,24 @@ class ClientiDRACCardConfigurationTestCase(base.BaseTest):
         self.assertEqual(expected_enum_attr, idrac_settings[
                          'Info.1#Type'])
 
+    def test_list_idrac_settings_by_name_eager(
+            self, mock_requests, mock_wait_until_idrac_is_ready):
+        responses = [
+            {'text': test_utils.iDracCardEnumerations[
+                uris.DCIM_iDRACCardEnumeration]['ok']},
+            {'text': test_utils.iDracCardEnumerations[
+                uris.DCIM_iDRACCardString]['ok']},
+            {'text': test_utils.iDracCardEnumerations[
+                uris.DCIM_iDRACCardInteger]['ok']}]
+        mock_requests.post('https://1.2.3.4:443/wsman', responses * 2)
+
+        idrac_settings = self.drac_client.list_idrac_settings(by_name=True)
+
+        self.assertIsInstance(idrac_settings, dict)
+        self.assertEqual(
+            self.drac_client.list_idrac_settings(by_name=True, lazy=True),
+            idrac_settings)
+
     @mock.patch.object(dracclient.client.WSManClient, 'invoke',
                        spec_set=True, autospec=True)
     def test_set_idrac_settings(
@@ -358,122 +377,55 @@ class ClientiDRACCardResetTestCase(base.BaseTest):
         self.drac_client = dracclient.client.DRACClient(
             **test_utils.FAKE_ENDPOINT)
 
-    @mock.patch('dracclient.client.subprocess.call')
-    def test_ping_host(self, mock_os_system):
-        mock_os_system.return_value = 0
-        response = self.drac_client._ping_host('127.0.0.1')
-        self.assertEqual(mock_os_system.call_count, 1)
-        self.assertEqual(True, response)
-
-    @mock.patch('dracclient.client.subprocess.call')
-    def test_ping_host_not_pingable(self, mock_os_system):
-        mock_os_system.return_value = 1
-        response = self.drac_client._ping_host('127.0.0.1')
-        self.assertEqual(mock_os_system.call_count, 1)
-        self.assertEqual(False, response)
-
-    @mock.patch('dracclient.client.subprocess.call')
-    def test_ping_host_name_not_known(self, mock_os_system):
-        mock_os_system.return_value = 2
-        response = self.drac_client._ping_host('127.0.0.1')
-        self.assertEqual(mock_os_system.call_count, 1)
-        self.assertEqual(False, response)
+    @mock.patch.object(probe.LivenessProbe, 'wait_for_state', spec_set=True,
+                       autospec=True)
+    def test_wait_for_host_alive(self, mock_wait_for_state):
+        mock_wait_for_state.return_value = {'hostname': True}
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_alive(self, mock_ping_host, mock_sleep):
-        total_calls = 5
-        ping_count = 3
-        mock_ping_host.return_value = True
-        mock_sleep.return_value = None
         response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=True,
-            ping_count=ping_count,
-            retries=total_calls)
+            'hostname', alive=True, timeout=60)
+
         self.assertEqual(True, response)
-        self.assertEqual(mock_sleep.call_count, ping_count)
-        self.assertEqual(mock_ping_host.call_count, ping_count)
+        mock_wait_for_state.assert_called_once_with(
+            mock.ANY, ['hostname'], True, 60)
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_alive_fail(self, mock_ping_host, mock_sleep):
-        total_calls = 5
-        ping_count = 3
-        mock_ping_host.return_value = False
-        mock_sleep.return_value = None
-        response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=True,
-            ping_count=ping_count,
-            retries=total_calls)
-        self.assertEqual(False, response)
-        self.assertEqual(mock_sleep.call_count, total_calls)
-        self.assertEqual(mock_ping_host.call_count, total_calls)
+    @mock.patch.object(probe.LivenessProbe, 'wait_for_state', spec_set=True,
+                       autospec=True)
+    def test_wait_for_host_dead_fail(self, mock_wait_for_state):
+        mock_wait_for_state.return_value = {'hostname': False}
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_dead(self, mock_ping_host, mock_sleep):
-        total_calls = 5
-        ping_count = 3
-        mock_ping_host.return_value = False
-        mock_sleep.return_value = None
         response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=False,
-            ping_count=ping_count,
-            retries=total_calls)
-        self.assertEqual(True, response)
-        self.assertEqual(mock_sleep.call_count, ping_count)
-        self.assertEqual(mock_ping_host.call_count, ping_count)
+            'hostname', alive=False, timeout=60)
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_dead_fail(self, mock_ping_host, mock_sleep):
-        total_calls = 5
-        ping_count = 3
-        mock_ping_host.return_value = True
-        mock_sleep.return_value = None
-        response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=False,
-            ping_count=ping_count,
-            retries=total_calls)
         self.assertEqual(False, response)
-        self.assertEqual(mock_sleep.call_count, total_calls)
-        self.assertEqual(mock_ping_host.call_count, total_calls)
+        mock_wait_for_state.assert_called_once_with(
+            mock.ANY, ['hostname'], False, 60)
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_alive_with_intermittent(
-            self, mock_ping_host, mock_sleep):
-        total_calls = 6
-        ping_count = 3
-        mock_ping_host.side_effect = [True, True, False, True, True, True]
-        mock_sleep.return_value = None
-        response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=True,
-            ping_count=ping_count,
-            retries=total_calls)
-        self.assertEqual(True, response)
-        self.assertEqual(mock_sleep.call_count, total_calls)
+    @mock.patch.object(probe.LivenessProbe, 'wait_for_state', spec_set=True,
+                       autospec=True)
+    def test_wait_for_host_capped_to_deadline(self, mock_wait_for_state):
+        mock_wait_for_state.return_value = {'hostname': False}
 
-    @mock.patch('time.sleep')
-    @mock.patch('dracclient.client.DRACClient._ping_host')
-    def test_wait_for_host_dead_with_intermittent(
-            self, mock_ping_host, mock_sleep):
-        total_calls = 6
-        ping_count = 3
-        mock_ping_host.side_effect = [False, False, True, False, False, False]
-        mock_sleep.return_value = None
-        response = self.drac_client._wait_for_host_state(
-            'hostname',
-            alive=False,
-            ping_count=ping_count,
-            retries=total_calls)
-        self.assertEqual(True, response)
-        self.assertEqual(mock_sleep.call_count, total_calls)
+        with mock.patch('time.monotonic',
+                        side_effect=[1000.0, 1000.0, 1011.0]):
+            with self.drac_client.deadline(10):
+                self.assertRaises(exceptions.DRACDeadlineExceeded,
+                                  self.drac_client._wait_for_host_state,
+                                  'hostname', alive=True, timeout=60)
+
+        mock_wait_for_state.assert_called_once_with(
+            mock.ANY, ['hostname'], True, 10)
+
+    def test_liveness_probe_uses_port(self):
+        self.assertEqual(test_utils.FAKE_ENDPOINT['port'],
+                         self.drac_client._liveness_probe.port)
+
+    def test_liveness_probe_custom(self):
+        liveness_probe = probe.LivenessProbe(port=4443, interval=1)
+        drac_client = dracclient.client.DRACClient(
+            liveness_probe=liveness_probe, **test_utils.FAKE_ENDPOINT)
+
+        self.assertIs(liveness_probe, drac_client._liveness_probe)
 
     @mock.patch.object(dracclient.client.WSManClient, 'invoke', spec_set=True,
                        autospec=True)
@@ -496,6 +448,22 @@ class ClientiDRACCardResetTestCase(base.BaseTest):
             check_return_value=False)
         self.assertTrue(result)
 
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke', spec_set=True,
+                       autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'invalidate_ready_cache', spec_set=True, autospec=True)
+    def test_reset_idrac_invalidates_ready_cache(self,
+                                                 mock_invalidate_ready_cache,
+                                                 mock_invoke):
+        mock_invoke.return_value = lxml.etree.fromstring(
+            test_utils.iDracCardInvocations[uris.DCIM_iDRACCardService][
+                'iDRACReset']['ok'])
+
+        self.drac_client.reset_idrac()
+
+        mock_invalidate_ready_cache.assert_called_once_with(
+            self.drac_client.client)
+
     @mock.patch.object(dracclient.client.WSManClient, 'invoke', spec_set=True,
                        autospec=True)
     def test_reset_idrac_force(self, mock_invoke):
@@ -13,6 +13,7 @@
 
 import datetime
 import lxml.etree
+import threading
 from unittest import mock
 
 import requests_mock
@@ -20,7 +21,9 @@ import requests_mock
 import dracclient.client
 from dracclient import exceptions
 import dracclient.resources.job
+import dracclient.wsman
 from dracclient.resources import uris
+from dracclient import scheduler
 from dracclient.tests import base
 from dracclient.tests import utils as test_utils
 from dracclient import utils
@@ -65,6 +68,31 @@ class ClientJobManagementTestCase(base.BaseTest):
             mock.ANY, uris.DCIM_LifecycleJob,
             filter_query=expected_filter_query)
 
+    @requests_mock.Mocker()
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'wait_until_idrac_is_ready', spec_set=True,
+                       autospec=True)
+    def test_iter_jobs(self, mock_requests, mock_wait_until_idrac_is_ready):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            text=test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        jobs = self.drac_client.iter_jobs()
+
+        self.assertEqual(self.drac_client.list_jobs(), list(jobs))
+
+    @mock.patch.object(dracclient.client.WSManClient, 'iter_enumerate',
+                       spec_set=True, autospec=True)
+    def test_iter_jobs_only_unfinished(self, mock_iter_enumerate):
+        mock_iter_enumerate.return_value = iter([])
+
+        list(self.drac_client.iter_jobs(only_unfinished=True))
+
+        mock_iter_enumerate.assert_called_once_with(
+            mock.ANY, uris.DCIM_LifecycleJob,
+            filter_query=dracclient.resources.job.UNFINISHED_JOBS_FILTER_QUERY,
+            wait_for_idrac=True)
+
     @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
                        spec_set=True, autospec=True)
     def test_get_job(self, mock_enumerate):
@@ -104,6 +132,317 @@ class ClientJobManagementTestCase(base.BaseTest):
             filter_query=expected_filter_query)
         self.assertIsNone(job)
 
+    @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
+                       spec_set=True, autospec=True)
+    def test_get_jobs(self, mock_enumerate):
+        mock_enumerate.return_value = lxml.etree.fromstring(
+            test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        jobs = self.drac_client.get_jobs(['JID_001436912645', 'JID_42',
+                                          'JID_001436981582',
+                                          'JID_001436912645'])
+
+        self.assertEqual(['JID_001436912645', 'JID_42', 'JID_001436981582'],
+                         list(jobs))
+        self.assertEqual('Completed', jobs['JID_001436912645'].status)
+        self.assertIsNone(jobs['JID_42'])
+        self.assertEqual('Running', jobs['JID_001436981582'].status)
+        mock_enumerate.assert_called_once_with(
+            mock.ANY, uris.DCIM_LifecycleJob,
+            filter_query=('select * from DCIM_LifecycleJob where '
+                          'InstanceID="JID_001436912645" or '
+                          'InstanceID="JID_42" or '
+                          'InstanceID="JID_001436981582"'),
+            wait_for_idrac=True)
+
+    @mock.patch.object(dracclient.resources.job,
+                       'JOBS_FILTER_QUERY_MAX_LENGTH', 80)
+    @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
+                       spec_set=True, autospec=True)
+    def test_get_jobs_chunked(self, mock_enumerate):
+        mock_enumerate.return_value = lxml.etree.fromstring(
+            test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['not_found'])
+
+        jobs = self.drac_client.get_jobs(['JID_1', 'JID_2', 'JID_3'])
+
+        self.assertEqual({'JID_1': None, 'JID_2': None, 'JID_3': None}, jobs)
+        mock_enumerate.assert_has_calls([
+            mock.call(mock.ANY, uris.DCIM_LifecycleJob,
+                      filter_query=('select * from DCIM_LifecycleJob where '
+                                    'InstanceID="JID_1" or '
+                                    'InstanceID="JID_2"'),
+                      wait_for_idrac=True),
+            mock.call(mock.ANY, uris.DCIM_LifecycleJob,
+                      filter_query=('select * from DCIM_LifecycleJob where '
+                                    'InstanceID="JID_3"'),
+                      wait_for_idrac=False)])
+        self.assertEqual(2, mock_enumerate.call_count)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
+                       spec_set=True, autospec=True)
+    def test_get_jobs_empty_list(self, mock_enumerate):
+        self.assertEqual({}, self.drac_client.get_jobs([]))
+        mock_enumerate.assert_not_called()
+
+    def _job(self, job_id, status='Running', percent_complete='0'):
+        return dracclient.resources.job.Job(
+            id=job_id, name='ConfigBIOS:BIOS.Setup.1-1',
+            start_time='TIME_NOW', until_time='TIME_NA', message='NA',
+            status=status, percent_complete=percent_complete)
+
+    def _wait_for_jobs(self, job_ids, **kwargs):
+        poll_scheduler = scheduler.PollScheduler(tick=0.001)
+        self.addCleanup(poll_scheduler.shutdown)
+        self.drac_client.client.poll_scheduler = poll_scheduler
+        kwargs.setdefault('interval', 0)
+
+        return self.drac_client.wait_for_jobs(job_ids, **kwargs)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs(self, mock_fetch_jobs):
+        mock_fetch_jobs.side_effect = [
+            {'JID_1': self._job('JID_1'), 'JID_2': self._job('JID_2')},
+            {'JID_1': self._job('JID_1', 'Completed', '100'),
+             'JID_2': self._job('JID_2')},
+            {'JID_2': self._job('JID_2', 'Failed', '100')}]
+
+        jobs = self._wait_for_jobs(['JID_2', 'JID_1'])
+
+        self.assertEqual(['JID_2', 'JID_1'], list(jobs))
+        self.assertEqual('Completed', jobs['JID_1'].status)
+        self.assertEqual('Failed', jobs['JID_2'].status)
+        self.assertEqual(
+            [mock.call(mock.ANY, ['JID_1', 'JID_2'], wait_for_idrac=True),
+             mock.call(mock.ANY, ['JID_1', 'JID_2'], wait_for_idrac=False),
+             mock.call(mock.ANY, ['JID_2'], wait_for_idrac=False)],
+            mock_fetch_jobs.call_args_list)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_missing(self, mock_fetch_jobs):
+        mock_fetch_jobs.return_value = {}
+
+        jobs = self._wait_for_jobs(['JID_1'])
+
+        self.assertEqual({'JID_1': None}, jobs)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_none(self, mock_fetch_jobs):
+        self.assertEqual({}, self._wait_for_jobs([]))
+        mock_fetch_jobs.assert_not_called()
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_timeout(self, mock_fetch_jobs):
+        mock_fetch_jobs.return_value = {'JID_1': self._job('JID_1')}
+
+        self.assertRaises(exceptions.DRACWaitTimeout, self._wait_for_jobs,
+                          ['JID_1'], timeout=0.03, interval=0.01)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_cancelled(self, mock_fetch_jobs):
+        def fetch_jobs(job_mgmt, job_ids, wait_for_idrac):
+            if not wait_for_idrac:
+                job_mgmt.client.poll_scheduler.shutdown()
+            return {'JID_1': self._job('JID_1')}
+
+        mock_fetch_jobs.side_effect = fetch_jobs
+
+        self.assertRaises(exceptions.DRACWaitCancelled, self._wait_for_jobs,
+                          ['JID_1'])
+        self.assertEqual(2, mock_fetch_jobs.call_count)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_request_failure(self, mock_is_idrac_ready,
+                                           mock_fetch_jobs):
+        mock_fetch_jobs.side_effect = [
+            {'JID_1': self._job('JID_1')},
+            exceptions.WSManRequestFailure(),
+            {'JID_1': self._job('JID_1', 'Completed', '100')}]
+        mock_is_idrac_ready.side_effect = [
+            exceptions.WSManRequestFailure(), False, True]
+
+        jobs = self._wait_for_jobs(['JID_1'])
+
+        self.assertEqual('Completed', jobs['JID_1'].status)
+        self.assertEqual(
+            [mock.call(mock.ANY, ['JID_1'], wait_for_idrac=True),
+             mock.call(mock.ANY, ['JID_1'], wait_for_idrac=False),
+             mock.call(mock.ANY, ['JID_1'], wait_for_idrac=False)],
+            mock_fetch_jobs.call_args_list)
+        self.assertEqual(3, mock_is_idrac_ready.call_count)
+
+    @mock.patch.object(dracclient.wsman.Client, 'enumerate', spec_set=True,
+                       autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_single_worker(self, mock_is_idrac_ready,
+                                         mock_enumerate):
+        # the checks made after a request failure must not wait for the
+        # iDRAC from the only worker of the scheduler
+        jobs = test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok']
+        running = lxml.etree.fromstring(jobs.replace('Completed', 'Running'))
+        completed = lxml.etree.fromstring(jobs)
+        mock_enumerate.side_effect = [
+            running, exceptions.WSManRequestFailure(), completed]
+        ready = iter([True, False])
+        mock_is_idrac_ready.side_effect = lambda client: next(ready, True)
+        poll_scheduler = scheduler.PollScheduler(tick=0.001, max_workers=1)
+        self.addCleanup(poll_scheduler.shutdown)
+        self.drac_client.client.poll_scheduler = poll_scheduler
+        self.drac_client.client._ready_ttl = 0
+        result = {}
+
+        def wait():
+            result.update(self.drac_client.wait_for_jobs(
+                ['JID_001436960861'], interval=0))
+
+        thread = threading.Thread(target=wait)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual('Completed', result['JID_001436960861'].status)
+        self.assertEqual(3, mock_enumerate.call_count)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
+                       spec_set=True, autospec=True)
+    def test_wait_for_jobs_single_enumeration(self, mock_enumerate):
+        expected_filter_query = ('select * from DCIM_LifecycleJob where '
+                                 'InstanceID="JID_001436912645" or '
+                                 'InstanceID="JID_001436960861"')
+        mock_enumerate.return_value = lxml.etree.fromstring(
+            test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        jobs = self._wait_for_jobs(['JID_001436960861', 'JID_001436912645'])
+
+        mock_enumerate.assert_called_once_with(
+            mock.ANY, uris.DCIM_LifecycleJob,
+            filter_query=expected_filter_query, wait_for_idrac=True)
+        self.assertEqual('Completed', jobs['JID_001436960861'].status)
+        self.assertEqual('Completed', jobs['JID_001436912645'].status)
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_wait_for_jobs_adaptive_interval(self, mock_monotonic):
+        mock_fetch_jobs = mock.Mock()
+        job_mgmt = mock.Mock(_fetch_jobs=mock_fetch_jobs)
+        jobs_wait = dracclient.resources.job._JobsWait(
+            job_mgmt, ['JID_1', 'JID_2'], 5, 60)
+        mock_fetch_jobs.side_effect = [
+            {'JID_1': self._job('JID_1', percent_complete='10'),
+             'JID_2': self._job('JID_2', percent_complete='NA')},
+            {'JID_1': self._job('JID_1', percent_complete='30'),
+             'JID_2': self._job('JID_2', percent_complete='NA')},
+            {'JID_1': self._job('JID_1', percent_complete='98'),
+             'JID_2': self._job('JID_2', percent_complete='NA')}]
+
+        mock_monotonic.return_value = 100
+        jobs_wait.check()
+        self.assertEqual(5, jobs_wait.next_interval(1))
+
+        # 1% per second, the job should finish in 70 seconds
+        mock_monotonic.return_value = 120
+        jobs_wait.check()
+        self.assertEqual(35, jobs_wait.next_interval(2))
+
+        mock_monotonic.return_value = 188
+        jobs_wait.check()
+        self.assertEqual(5, jobs_wait.next_interval(3))
+
+    def _watch_jobs(self, job_ids=None, **kwargs):
+        poll_scheduler = scheduler.PollScheduler(tick=0.001)
+        self.addCleanup(poll_scheduler.shutdown)
+        self.drac_client.client.poll_scheduler = poll_scheduler
+        kwargs.setdefault('interval', 0.01)
+
+        return self.drac_client.watch_jobs(job_ids, **kwargs)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       spec_set=True, autospec=True, return_value=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_watch_jobs(self, mock_iter_jobs, mock_fetch_jobs,
+                        mock_is_idrac_ready):
+        job_1 = self._job('JID_1', percent_complete='10')
+        job_1_progress = self._job('JID_1', percent_complete='50')
+        job_1_done = self._job('JID_1', 'Completed', '100')
+        job_2 = self._job('JID_2', 'Scheduled')
+        mock_iter_jobs.side_effect = [iter([job_1, job_2]),
+                                      iter([job_1, job_2]),
+                                      iter([job_1_progress, job_2]),
+                                      iter([job_2])]
+        mock_fetch_jobs.return_value = {'JID_1': job_1_done}
+
+        events = self._watch_jobs()
+        watched = [next(events) for _ in range(4)]
+
+        JobEvent = dracclient.resources.job.JobEvent
+        self.assertEqual([JobEvent('JID_1', None, job_1),
+                          JobEvent('JID_2', None, job_2),
+                          JobEvent('JID_1', job_1, job_1_progress),
+                          JobEvent('JID_1', job_1_progress, job_1_done)],
+                         watched)
+        self.assertEqual(
+            [mock.call(mock.ANY, only_unfinished=True, wait_for_idrac=True)] +
+            [mock.call(mock.ANY, only_unfinished=True,
+                       wait_for_idrac=False)] * 3,
+            mock_iter_jobs.call_args_list)
+        mock_fetch_jobs.assert_called_once_with(mock.ANY, ['JID_1'],
+                                                wait_for_idrac=False)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_watch_jobs_idrac_not_ready(self, mock_iter_jobs,
+                                        mock_is_idrac_ready):
+        job_1 = self._job('JID_1', percent_complete='10')
+        job_1_progress = self._job('JID_1', percent_complete='50')
+        mock_iter_jobs.side_effect = [iter([job_1]), iter([job_1_progress])]
+        mock_is_idrac_ready.side_effect = [False, True]
+        self.drac_client.client._ready_ttl = 0
+
+        events = self._watch_jobs()
+        watched = [next(events) for _ in range(2)]
+
+        self.assertEqual(job_1_progress, watched[1].current)
+        self.assertEqual(2, mock_iter_jobs.call_count)
+        self.assertEqual(2, mock_is_idrac_ready.call_count)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'is_idrac_ready',
+                       spec_set=True, autospec=True, return_value=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_watch_jobs_with_job_ids(self, mock_iter_jobs, mock_fetch_jobs,
+                                     mock_is_idrac_ready):
+        job_1 = self._job('JID_1')
+        job_1_done = self._job('JID_1', 'Failed', '100')
+        job_2_done = self._job('JID_2', 'Completed', '100')
+        job_3 = self._job('JID_3')
+        mock_iter_jobs.side_effect = [iter([job_1, job_3]), iter([job_3])]
+        mock_fetch_jobs.side_effect = [{'JID_2': job_2_done},
+                                       {'JID_1': job_1_done}]
+
+        events = list(self._watch_jobs(['JID_1', 'JID_2']))
+
+        JobEvent = dracclient.resources.job.JobEvent
+        self.assertEqual([JobEvent('JID_2', None, job_2_done),
+                          JobEvent('JID_1', None, job_1),
+                          JobEvent('JID_1', job_1, job_1_done)],
+                         events)
+        self.assertEqual(2, mock_iter_jobs.call_count)
+
     @mock.patch.object(dracclient.client.WSManClient, 'invoke',
                        spec_set=True, autospec=True)
     def test_delete_jobs_all(self, mock_invoke):
@@ -190,6 +529,389 @@ class ClientJobManagementTestCase(base.BaseTest):
         self.drac_client.delete_jobs([])
         self.assertFalse(mock_invoke.called)
 
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_job_view_refresh(self, mock_iter_jobs, mock_fetch_jobs):
+        clear_all = self._job('JID_CLEARALL', 'Pending')._replace(
+            name='CLEARALL')
+        mock_iter_jobs.side_effect = [
+            iter([clear_all, self._job('JID_1', 'Completed'),
+                  self._job('JID_2'), self._job('JID_3'),
+                  self._job('JID_4', 'Scheduled')]),
+            iter([self._job('JID_4', 'Running'), self._job('JID_5')])]
+        mock_fetch_jobs.return_value = {'JID_2': self._job('JID_2', 'Failed')}
+        view = self.drac_client.job_view()
+
+        self.assertEqual(
+            ['JID_CLEARALL', 'JID_1', 'JID_2', 'JID_3', 'JID_4'],
+            [job.id for job in view.refresh()])
+        jobs = view.refresh()
+
+        self.assertEqual([clear_all, self._job('JID_1', 'Completed'),
+                          self._job('JID_2', 'Failed'),
+                          self._job('JID_4', 'Running'), self._job('JID_5')],
+                         jobs)
+        self.assertEqual(jobs, view.jobs)
+        self.assertIsNone(view.get('JID_3'))
+        self.assertEqual(self._job('JID_5'), view.get('JID_5'))
+        mock_iter_jobs.assert_has_calls([mock.call(mock.ANY),
+                                         mock.call(mock.ANY,
+                                                   only_unfinished=True)])
+        mock_fetch_jobs.assert_called_once_with(
+            mock.ANY, ['JID_2', 'JID_3'], wait_for_idrac=False)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, '_fetch_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_job_view_refresh_unchanged(self, mock_iter_jobs,
+                                        mock_fetch_jobs):
+        mock_iter_jobs.side_effect = [
+            iter([self._job('JID_1', 'Completed'), self._job('JID_2')]),
+            iter([self._job('JID_2', percent_complete='50')])]
+        view = self.drac_client.job_view()
+        view.refresh()
+
+        self.assertEqual([self._job('JID_1', 'Completed'),
+                          self._job('JID_2', percent_complete='50')],
+                         view.refresh())
+        mock_fetch_jobs.assert_not_called()
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_job_view_full_refresh(self, mock_iter_jobs):
+        mock_iter_jobs.side_effect = [
+            iter([self._job('JID_1', 'Completed'), self._job('JID_2')]),
+            iter([self._job('JID_2', 'Completed')])]
+        view = self.drac_client.job_view()
+        view.refresh()
+
+        self.assertEqual([self._job('JID_2', 'Completed')],
+                         view.refresh(full=True))
+        mock_iter_jobs.assert_has_calls([mock.call(mock.ANY),
+                                         mock.call(mock.ANY)])
+
+    @mock.patch('time.monotonic', autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'iter_jobs',
+                       spec_set=True, autospec=True)
+    def test_job_view_periodic_full_refresh(self, mock_iter_jobs,
+                                            mock_monotonic):
+        # JID_2 was created and finished between the last two refreshes
+        mock_iter_jobs.side_effect = [
+            iter([self._job('JID_1')]),
+            iter([self._job('JID_1')]),
+            iter([self._job('JID_1'), self._job('JID_2', 'Completed')])]
+        view = self.drac_client.job_view(full_refresh_interval=60)
+        mock_monotonic.return_value = 100
+        view.refresh()
+        mock_monotonic.return_value = 130
+        view.refresh()
+        mock_monotonic.return_value = 160
+
+        self.assertEqual([self._job('JID_1'), self._job('JID_2', 'Completed')],
+                         view.refresh())
+        self.assertEqual([mock.call(mock.ANY),
+                          mock.call(mock.ANY, only_unfinished=True),
+                          mock.call(mock.ANY)],
+                         mock_iter_jobs.call_args_list)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs(self, mock_list_jobs, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_CLEARALL'),
+                                       self._job('JID_1', 'Completed'),
+                                       self._job('JID_2', 'Failed'),
+                                       self._job('JID_3')]
+        error = exceptions.DRACOperationFailed(drac_messages='Invalid Job ID')
+
+        def invoke(client, resource_uri, method, selectors, properties,
+                   **kwargs):
+            if properties['JobID'] == 'JID_2':
+                raise error
+
+        mock_invoke.side_effect = invoke
+
+        result = self.drac_client.bulk_delete_jobs(['JID_1', 'JID_2',
+                                                    'JID_1'])
+
+        self.assertEqual([('JID_1', None), ('JID_2', error)],
+                         list(result.items()))
+        mock_list_jobs.assert_called_once_with(mock.ANY)
+        self.assertEqual(2, mock_invoke.call_count)
+        mock_invoke.assert_any_call(
+            mock.ANY, uris.DCIM_JobService, 'DeleteJobQueue',
+            dracclient.resources.job.JOB_SERVICE_SELECTORS,
+            {'JobID': 'JID_1'}, expected_return_value=utils.RET_SUCCESS,
+            wait_for_idrac=False)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient, 'enumerate',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_clear_all(self, mock_list_jobs, mock_enumerate,
+                                        mock_invoke):
+        job_ids = ['JID_001436981582', 'JID_001436980372',
+                   'JID_001436966148', 'JID_001436960861',
+                   'JID_001436912645']
+        mock_list_jobs.return_value = [self._job('JID_CLEARALL')] + [
+            self._job(job_id, 'Completed') for job_id in job_ids]
+        mock_enumerate.return_value = lxml.etree.fromstring(
+            test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok'])
+
+        result = self.drac_client.bulk_delete_jobs(job_ids)
+
+        self.assertEqual([(job_id, None) for job_id in job_ids],
+                         list(result.items()))
+        # the job queue is listed again right before
+        mock_enumerate.assert_called_once_with(
+            mock.ANY, uris.DCIM_LifecycleJob, wait_for_idrac=False)
+        mock_invoke.assert_called_once_with(
+            mock.ANY, uris.DCIM_JobService, 'DeleteJobQueue',
+            dracclient.resources.job.JOB_SERVICE_SELECTORS,
+            {'JobID': 'JID_CLEARALL'},
+            expected_return_value=utils.RET_SUCCESS, wait_for_idrac=False)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement,
+                       '_list_queued_job_ids', spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_clear_all_queue_changed(
+            self, mock_list_jobs, mock_list_queued_job_ids, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_1', 'Completed'),
+                                       self._job('JID_2', 'Failed')]
+        mock_list_queued_job_ids.return_value = set(['JID_1', 'JID_2',
+                                                     'JID_3'])
+
+        result = self.drac_client.bulk_delete_jobs(['JID_2', 'JID_1'])
+
+        self.assertEqual([('JID_2', None), ('JID_1', None)],
+                         list(result.items()))
+        # JID_CLEARALL would have deleted JID_3 as well
+        self.assertEqual(
+            [{'JobID': 'JID_1'}, {'JobID': 'JID_2'}],
+            sorted((c[0][4] for c in mock_invoke.call_args_list),
+                   key=lambda properties: properties['JobID']))
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement,
+                       '_list_queued_job_ids', spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_clear_all_failed(self, mock_list_jobs,
+                                               mock_list_queued_job_ids,
+                                               mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_1', 'Completed')]
+        mock_list_queued_job_ids.return_value = set(['JID_1'])
+        error = exceptions.DRACOperationFailed(drac_messages='Failed')
+        mock_invoke.side_effect = error
+
+        result = self.drac_client.bulk_delete_jobs(['JID_1'])
+
+        self.assertEqual({'JID_1': error}, result)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_not_queued(self, mock_list_jobs, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_CLEARALL'),
+                                       self._job('JID_1', 'Completed'),
+                                       self._job('JID_2', 'Failed')]
+
+        result = self.drac_client.bulk_delete_jobs(['JID_3', 'JID_1',
+                                                    'JID_2'])
+
+        self.assertEqual(['JID_3', 'JID_1', 'JID_2'], list(result))
+        self.assertIsInstance(result['JID_3'],
+                              exceptions.DRACOperationFailed)
+        self.assertIsNone(result['JID_1'])
+        self.assertIsNone(result['JID_2'])
+        # the jobs are not the whole job queue, JID_CLEARALL would not
+        # delete them only
+        self.assertEqual(
+            [{'JobID': 'JID_1'}, {'JobID': 'JID_2'}],
+            sorted((c[0][4] for c in mock_invoke.call_args_list),
+                   key=lambda properties: properties['JobID']))
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_empty_queue(self, mock_list_jobs, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_CLEARALL')]
+
+        result = self.drac_client.bulk_delete_jobs(['JID_1'])
+
+        self.assertEqual(['JID_1'], list(result))
+        self.assertIsInstance(result['JID_1'],
+                              exceptions.DRACOperationFailed)
+        mock_invoke.assert_not_called()
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_bulk_delete_jobs_empty_list(self, mock_list_jobs, mock_invoke):
+        self.assertEqual({}, self.drac_client.bulk_delete_jobs([]))
+        mock_list_jobs.assert_not_called()
+        mock_invoke.assert_not_called()
+
+    def test_job_retention_policy_keep_last(self):
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=2)
+        jobs = [self._job('JID_CLEARALL', 'Pending'),
+                self._job('JID_001436900005', 'Completed'),
+                self._job('JID_001436900002', 'Failed'),
+                self._job('JID_001436900003', 'Scheduled'),
+                self._job('JID_001436900004', 'Completed with Errors'),
+                self._job('JID_001436900001', 'Completed')]
+
+        self.assertEqual(['JID_001436900001', 'JID_001436900002'],
+                         policy.select(jobs))
+
+    def test_job_retention_policy_max_age(self):
+        policy = dracclient.resources.job.JobRetentionPolicy(max_age=3600)
+        jobs = [self._job('JID_001436900000', 'Completed'),
+                self._job('JID_001436905400', 'Completed'),
+                self._job('JID_UNKNOWN', 'Completed'),
+                self._job('JID_001436890000')]
+        now = 1436907600
+
+        self.assertEqual(['JID_001436900000'], policy.select(jobs, now))
+
+    def test_job_retention_policy_keep_last_and_max_age(self):
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=1,
+                                                             max_age=3600)
+        jobs = [self._job('JID_001436900000', 'Completed'),
+                self._job('JID_001436905400', 'Completed'),
+                self._job('JID_001436890000', 'Completed')]
+        now = 1436907600
+
+        self.assertEqual(['JID_001436890000', 'JID_001436900000'],
+                         policy.select(jobs, now))
+
+    def test_job_retention_policy_with_job_queue(self):
+        jobs = self.drac_client._job_mgmt._parse_list_jobs(
+            lxml.etree.fromstring(
+                test_utils.JobEnumerations[uris.DCIM_LifecycleJob]['ok']))
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=2,
+                                                             max_age=1)
+
+        # four jobs are finished, all created long before now
+        self.assertEqual(['JID_001436912645', 'JID_001436960861'],
+                         policy.select(jobs))
+        self.assertEqual(
+            ['JID_001436912645', 'JID_001436960861'],
+            dracclient.resources.job.JobRetentionPolicy(
+                max_age=3600 * 6).select(jobs, now=1436985000))
+
+    def test_job_creation_time(self):
+        self.assertEqual(
+            1436912645,
+            dracclient.resources.job.job_creation_time('JID_001436912645'))
+        self.assertIsNone(
+            dracclient.resources.job.job_creation_time('JID_CLEARALL'))
+
+    def test_job_retention_policy_missing_limits(self):
+        self.assertRaises(exceptions.InvalidParameterValue,
+                          dracclient.resources.job.JobRetentionPolicy)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_prune_jobs(self, mock_list_jobs, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_CLEARALL', 'Pending'),
+                                       self._job('JID_1', 'Completed'),
+                                       self._job('JID_2', 'Failed'),
+                                       self._job('JID_3', 'Completed'),
+                                       self._job('JID_4'),
+                                       self._job('JID_5', 'Completed')]
+        error = exceptions.DRACOperationFailed(drac_messages='Invalid Job ID')
+
+        def invoke(client, resource_uri, method, selectors, properties,
+                   **kwargs):
+            if properties['JobID'] == 'JID_2':
+                raise error
+
+        mock_invoke.side_effect = invoke
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=1)
+
+        result = self.drac_client.prune_jobs(policy)
+
+        self.assertEqual(5, result.size_before)
+        self.assertEqual(3, result.size_after)
+        self.assertEqual(['JID_1', 'JID_3'], result.deleted)
+        self.assertEqual({'JID_2': error}, result.errors)
+        mock_list_jobs.assert_called_once_with(mock.ANY)
+        self.assertEqual(3, mock_invoke.call_count)
+
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'list_jobs',
+                       spec_set=True, autospec=True)
+    def test_prune_jobs_nothing_to_prune(self, mock_list_jobs, mock_invoke):
+        mock_list_jobs.return_value = [self._job('JID_1', 'Completed'),
+                                       self._job('JID_2')]
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=1)
+
+        result = self.drac_client.prune_jobs(policy)
+
+        self.assertEqual(
+            dracclient.resources.job.PruneResult(
+                size_before=2, size_after=2, deleted=[], errors={}),
+            result)
+        mock_invoke.assert_not_called()
+
+    def test_prune_jobs_without_policy(self):
+        self.assertRaises(exceptions.InvalidParameterValue,
+                          self.drac_client.prune_jobs)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'prune_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    def test_create_config_job_prunes_jobs(self, mock_invoke,
+                                           mock_prune_jobs):
+        policy = dracclient.resources.job.JobRetentionPolicy(keep_last=10)
+        drac_client = dracclient.client.DRACClient(
+            job_retention_policy=policy, **test_utils.FAKE_ENDPOINT)
+        mock_invoke.return_value = lxml.etree.fromstring(
+            test_utils.JobInvocations[uris.DCIM_BIOSService][
+                'CreateTargetedConfigJob']['ok'])
+        mock_prune_jobs.side_effect = exceptions.WSManRequestFailure()
+
+        job_id = drac_client.create_config_job(
+            uris.DCIM_BIOSService, 'DCIM_BIOSService', 'DCIM:BIOSService',
+            'BIOS.Setup.1-1')
+
+        self.assertEqual('JID_442507917525', job_id)
+        mock_prune_jobs.assert_called_once_with(mock.ANY)
+
+    @mock.patch.object(dracclient.resources.job.JobManagement, 'prune_jobs',
+                       spec_set=True, autospec=True)
+    @mock.patch.object(dracclient.client.WSManClient, 'invoke',
+                       spec_set=True, autospec=True)
+    def test_create_config_job_without_policy(self, mock_invoke,
+                                              mock_prune_jobs):
+        mock_invoke.return_value = lxml.etree.fromstring(
+            test_utils.JobInvocations[uris.DCIM_BIOSService][
+                'CreateTargetedConfigJob']['ok'])
+
+        self.drac_client.create_config_job(
+            uris.DCIM_BIOSService, 'DCIM_BIOSService', 'DCIM:BIOSService',
+            'BIOS.Setup.1-1')
+
+        mock_prune_jobs.assert_not_called()
+
     @requests_mock.Mocker()
     @mock.patch.object(dracclient.client.WSManClient,
                        'wait_until_idrac_is_ready', spec_set=True,
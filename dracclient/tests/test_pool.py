@@ -0,0 +1,197 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+import requests_mock
+
+import dracclient.client
+from dracclient import pool
+from dracclient.tests import base
+from dracclient.tests import utils as test_utils
+import dracclient.wsman
+
+
+class SessionPoolTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(SessionPoolTestCase, self).setUp()
+        self.pool = pool.SessionPool(max_hosts=2, max_connections=4,
+                                     max_connections_per_host=3,
+                                     idle_timeout=None)
+
+    def test_session_reused_for_same_key(self):
+        with self.pool.session(('host1', 443)) as session1:
+            pass
+        with self.pool.session(('host1', 443)) as session2:
+            pass
+
+        self.assertIs(session1, session2)
+        self.assertEqual(pool.PoolStats(hits=1, misses=1, evictions=0,
+                                        hosts=1, connections_in_use=0),
+                         self.pool.stats())
+
+    def test_session_per_key(self):
+        with self.pool.session(('host1', 443)) as session1:
+            pass
+        with self.pool.session(('host2', 443)) as session2:
+            pass
+
+        self.assertIsNot(session1, session2)
+        self.assertEqual(2, self.pool.stats().misses)
+
+    def test_per_host_connection_cap(self):
+        with self.pool.session(('host1', 443)) as session:
+            adapter = session.get_adapter('https://host1')
+
+        self.assertEqual(3, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    def test_connections_in_use(self):
+        with self.pool.session(('host1', 443)):
+            with self.pool.session(('host1', 443)):
+                self.assertEqual(2, self.pool.stats().connections_in_use)
+
+        self.assertEqual(0, self.pool.stats().connections_in_use)
+
+    def test_global_connection_cap(self):
+        self.pool._connections = mock.Mock()
+
+        with self.pool.session(('host1', 443)):
+            self.pool._connections.acquire.assert_called_once_with()
+            self.assertFalse(self.pool._connections.release.called)
+
+        self.pool._connections.release.assert_called_once_with()
+
+    def test_lru_eviction(self):
+        with self.pool.session(('host1', 443)) as session1:
+            pass
+        with self.pool.session(('host2', 443)):
+            pass
+        with self.pool.session(('host1', 443)):
+            pass
+
+        with mock.patch.object(session1, 'close',
+                               autospec=True) as mock_close:
+            with self.pool.session(('host3', 443)):
+                pass
+
+        self.assertFalse(mock_close.called)
+        self.assertEqual(['host1', 'host3'],
+                         [key[0] for key in self.pool._entries])
+        self.assertEqual(1, self.pool.stats().evictions)
+
+    def test_lru_eviction_skips_sessions_in_use(self):
+        with self.pool.session(('host1', 443)):
+            with self.pool.session(('host2', 443)):
+                with self.pool.session(('host3', 443)):
+                    self.assertEqual(3, self.pool.stats().hosts)
+
+        with self.pool.session(('host4', 443)):
+            pass
+
+        self.assertEqual(2, self.pool.stats().hosts)
+        self.assertEqual(2, self.pool.stats().evictions)
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_idle_eviction(self, mock_monotonic):
+        mock_monotonic.side_effect = [0, 0, 0, 100, 100, 100]
+        self.pool.idle_timeout = 60
+
+        with self.pool.session(('host1', 443)) as session1:
+            pass
+        with self.pool.session(('host1', 443)) as session2:
+            pass
+
+        self.assertIsNot(session1, session2)
+        self.assertEqual(pool.PoolStats(hits=0, misses=2, evictions=1,
+                                        hosts=1, connections_in_use=0),
+                         self.pool.stats())
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_idle_eviction_stops_at_recent_session(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        self.pool.max_hosts = 4
+        self.pool.idle_timeout = 60
+        with self.pool.session(('host1', 443)):
+            pass
+        mock_monotonic.return_value = 50
+        with self.pool.session(('host2', 443)):
+            pass
+        with self.pool.session(('host3', 443)):
+            pass
+        # only an entry out of order could still expire after a recent one
+        self.pool._entries[('host3', 443)].last_used = 0
+        mock_monotonic.return_value = 100
+
+        self.pool._evict_idle()
+
+        # host1 has expired, the scan stopped at host2
+        self.assertEqual(['host2', 'host3'],
+                         [key[0] for key in self.pool._entries])
+        self.assertEqual(1, self.pool.stats().evictions)
+
+    def test_clear(self):
+        with self.pool.session(('host1', 443)):
+            pass
+
+        self.pool.clear()
+
+        self.assertEqual(0, self.pool.stats().hosts)
+
+    def test_get_shared_pool(self):
+        self.assertIsInstance(pool.get_shared_pool(), pool.SessionPool)
+        self.assertIs(pool.get_shared_pool(), pool.get_shared_pool())
+
+
+@requests_mock.Mocker()
+class ClientSessionPoolTestCase(base.BaseTest):
+
+    def test_clients_share_session(self, mock_requests):
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           text='<result>yay!</result>')
+        session_pool = pool.SessionPool()
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['session_pool'] = session_pool
+
+        for _ in range(3):
+            with dracclient.wsman.Client(**fake_endpoint) as client:
+                resp = client.enumerate('resource', auto_pull=False)
+                self.assertEqual('yay!', resp.text)
+                self.assertIsNone(client._session)
+
+        self.assertEqual(pool.PoolStats(hits=2, misses=1, evictions=0,
+                                        hosts=1, connections_in_use=0),
+                         session_pool.stats())
+
+    def test_credentials_are_part_of_key(self, mock_requests):
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           text='<result>yay!</result>')
+        session_pool = pool.SessionPool()
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['session_pool'] = session_pool
+        client1 = dracclient.wsman.Client(**fake_endpoint)
+        fake_endpoint['password'] = 'other'
+        client2 = dracclient.wsman.Client(**fake_endpoint)
+
+        client1.enumerate('resource', auto_pull=False)
+        client2.enumerate('resource', auto_pull=False)
+
+        self.assertEqual(2, session_pool.stats().misses)
+
+    def test_drac_client_with_session_pool(self, mock_requests):
+        session_pool = pool.SessionPool()
+        client = dracclient.client.DRACClient(session_pool=session_pool,
+                                              **test_utils.FAKE_ENDPOINT)
+
+        self.assertIs(session_pool, client.client._session_pool)
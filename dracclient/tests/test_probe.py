@@ -0,0 +1,133 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import socket
+from unittest import mock
+
+from dracclient import probe
+from dracclient import scheduler
+from dracclient.tests import base
+
+
+class LivenessProbeTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(LivenessProbeTestCase, self).setUp()
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(listener.close)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(8)
+        self.port = listener.getsockname()[1]
+        self.poll_scheduler = scheduler.PollScheduler(tick=0.001)
+        self.addCleanup(self.poll_scheduler.shutdown)
+        self.probe = probe.LivenessProbe(port=self.port, timeout=1,
+                                         interval=0,
+                                         poll_scheduler=self.poll_scheduler)
+
+    def test_probe_listening(self):
+        self.assertEqual({'127.0.0.1': True},
+                         self.probe.probe(['127.0.0.1']))
+
+    def test_probe_refused(self):
+        closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        closed.bind(('127.0.0.1', 0))
+        port = closed.getsockname()[1]
+        closed.close()
+
+        liveness_probe = probe.LivenessProbe(port=port, timeout=1)
+
+        self.assertEqual({'127.0.0.1': True},
+                         liveness_probe.probe(['127.0.0.1']))
+
+    @mock.patch.object(socket, 'getaddrinfo', spec_set=True, autospec=True)
+    def test_probe_name_not_known(self, mock_getaddrinfo):
+        mock_getaddrinfo.side_effect = socket.gaierror('Name not known')
+
+        self.assertEqual({'unknown': False}, self.probe.probe(['unknown']))
+
+    @mock.patch.object(probe.selectors.DefaultSelector, 'select',
+                       autospec=True)
+    def test_probe_timeout(self, mock_select):
+        self.probe.timeout = 0.01
+        mock_select.return_value = []
+
+        self.assertEqual({'127.0.0.1': False},
+                         self.probe.probe(['127.0.0.1']))
+
+    def test_probe_many_hosts(self):
+        hosts = ['127.0.0.1', '127.0.0.2', 'localhost']
+
+        self.assertEqual(dict.fromkeys(hosts, True), self.probe.probe(hosts))
+
+    @mock.patch.object(probe.LivenessProbe, 'probe', spec_set=True,
+                       autospec=True)
+    def test_wait_for_state_alive(self, mock_probe):
+        mock_probe.side_effect = [{'host1': True, 'host2': False},
+                                  {'host1': False, 'host2': True},
+                                  {'host1': True, 'host2': True},
+                                  {'host1': True, 'host2': True},
+                                  {'host1': True}]
+        self.probe.up_confirmations = 3
+
+        result = self.probe.wait_for_state(['host1', 'host2'], True, 60)
+
+        self.assertEqual({'host1': True, 'host2': True}, result)
+        self.assertEqual(5, mock_probe.call_count)
+        mock_probe.assert_called_with(mock.ANY, {'host1'})
+
+    @mock.patch.object(probe.LivenessProbe, 'probe', spec_set=True,
+                       autospec=True)
+    def test_wait_for_state_down(self, mock_probe):
+        mock_probe.side_effect = [{'host': False}, {'host': False}]
+        self.probe.down_confirmations = 2
+
+        result = self.probe.wait_for_state(['host'], False, 60)
+
+        self.assertEqual({'host': True}, result)
+        self.assertEqual(2, mock_probe.call_count)
+
+    @mock.patch.object(probe.LivenessProbe, 'probe', spec_set=True,
+                       autospec=True)
+    def test_wait_for_state_timeout(self, mock_probe):
+        mock_probe.return_value = {'host': True}
+        self.probe.interval = 0.01
+
+        result = self.probe.wait_for_state(['host'], False, 0.05)
+
+        self.assertEqual({'host': False}, result)
+        self.assertLessEqual(mock_probe.call_count, 5)
+
+    def test_probe_async(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        result = loop.run_until_complete(
+            self.probe.probe_async(['127.0.0.1']))
+
+        self.assertEqual({'127.0.0.1': True}, result)
+
+    @mock.patch.object(probe.LivenessProbe, 'probe_async', spec_set=True,
+                       autospec=True)
+    def test_wait_for_state_async(self, mock_probe_async):
+        mock_probe_async.side_effect = [{'host': True}, {'host': True}]
+        self.probe.interval = 0
+        self.probe.up_confirmations = 2
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        result = loop.run_until_complete(
+            self.probe.wait_for_state_async(['host'], True, 60))
+
+        self.assertEqual({'host': True}, result)
+        self.assertEqual(2, mock_probe_async.call_count)
@@ -407,6 +407,22 @@ class ClientRAIDManagementTestCase(base.BaseTest):
         self.assertIn(expected_physical_disk,
                       self.drac_client.list_physical_disks())
 
+    @mock.patch.object(dracclient.client.WSManClient,
+                       'wait_until_idrac_is_ready', spec_set=True,
+                       autospec=True)
+    def test_iter_physical_disks(self, mock_requests,
+                                 mock_wait_until_idrac_is_ready):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            text=test_utils.RAIDEnumerations[uris.DCIM_PhysicalDiskView]['ok'])
+
+        physical_disks = list(self.drac_client.iter_physical_disks())
+
+        self.assertEqual(
+            sorted(self.drac_client.list_physical_disks(),
+                   key=lambda disk: disk.id),
+            sorted(physical_disks, key=lambda disk: disk.id))
+
     @mock.patch.object(dracclient.client.WSManClient,
                        'wait_until_idrac_is_ready', spec_set=True,
                        autospec=True)
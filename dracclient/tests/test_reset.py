@@ -0,0 +1,211 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+import dracclient.client
+from dracclient import exceptions
+from dracclient import probe
+from dracclient import reset
+from dracclient import retry
+from dracclient import scheduler
+from dracclient.tests import base
+from dracclient.tests import utils as test_utils
+
+
+@mock.patch('time.sleep')
+class ResetHandleTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(ResetHandleTestCase, self).setUp()
+        self.liveness_probe = probe.LivenessProbe(interval=0,
+                                                  up_confirmations=2,
+                                                  down_confirmations=1)
+        self.mock_probe = mock.patch.object(
+            self.liveness_probe, 'probe', autospec=True).start()
+        self.addCleanup(mock.patch.stopall)
+        self.poll_scheduler = scheduler.PollScheduler(tick=0.001)
+        self.addCleanup(self.poll_scheduler.shutdown)
+
+    def _client(self, host='1.2.3.4', ready=(True,)):
+        client = mock.Mock(spec=dracclient.client.WSManClient)
+        client.host = host
+        client.poll_scheduler = self.poll_scheduler
+        client.bind_deadline.side_effect = lambda func: func
+        client.ready_retry_policy = retry.RetryPolicy.fixed(3, 0)
+        client.is_idrac_ready.side_effect = list(ready)
+        return client
+
+    def _handle(self, client, ready_wait_time=0, state_timeout=60):
+        return reset.ResetHandle(client, self.liveness_probe,
+                                 ready_wait_time, state_timeout)
+
+    def test_phases(self, mock_sleep):
+        self.mock_probe.side_effect = [{'1.2.3.4': True},
+                                       {'1.2.3.4': False},
+                                       {'1.2.3.4': True},
+                                       {'1.2.3.4': True}]
+        client = self._client()
+        handle = self._handle(client)
+
+        self.assertEqual(reset.RESET_ISSUED, handle.phase)
+        self.assertFalse(handle.poll())
+        self.assertEqual(reset.RESET_ISSUED, handle.phase)
+        self.assertFalse(handle.poll())
+        self.assertEqual(reset.UNREACHABLE, handle.phase)
+        self.assertFalse(handle.poll())
+        self.assertFalse(handle.poll())
+        self.assertEqual(reset.REACHABLE, handle.phase)
+        self.assertTrue(handle.poll())
+        self.assertEqual(reset.READY, handle.phase)
+        self.assertTrue(handle.done())
+        self.assertTrue(handle.result())
+
+        self.assertEqual(
+            [reset.RESET_ISSUED, reset.UNREACHABLE, reset.REACHABLE,
+             reset.READY],
+            sorted(handle.timestamps, key=handle.timestamps.get))
+        client.cache_ready.assert_called_once_with()
+        mock_sleep.assert_not_called()
+
+    def test_result(self, mock_sleep):
+        self.mock_probe.side_effect = [{'1.2.3.4': False},
+                                       {'1.2.3.4': True},
+                                       {'1.2.3.4': True}]
+        handle = self._handle(self._client(ready=[False, True]))
+
+        self.assertTrue(handle.result())
+        self.assertEqual(reset.READY, handle.phase)
+        mock_sleep.assert_called_with(0)
+
+    def test_result_timeout(self, mock_sleep):
+        self.mock_probe.return_value = {'1.2.3.4': True}
+        handle = self._handle(self._client())
+
+        self.assertRaises(exceptions.DRACResetInProgress, handle.result, 0)
+        self.assertFalse(handle.done())
+
+    def test_not_pingable_timeout(self, mock_sleep):
+        self.mock_probe.return_value = {'1.2.3.4': True}
+        self.liveness_probe.interval = 1
+        handle = self._handle(self._client(), state_timeout=0)
+
+        self.assertTrue(handle.poll())
+        self.assertIsInstance(handle.error, exceptions.DRACOperationFailed)
+        self.assertRaisesRegex(exceptions.DRACOperationFailed,
+                               'not pingable', handle.result)
+
+    def test_ready_timeout(self, mock_sleep):
+        self.mock_probe.side_effect = [{'1.2.3.4': False},
+                                       {'1.2.3.4': True},
+                                       {'1.2.3.4': True}]
+        client = self._client(ready=[False, False, False])
+
+        handle = self._handle(client)
+
+        self.assertRaisesRegex(exceptions.DRACOperationFailed,
+                               'become ready', handle.result)
+        self.assertEqual(3, client.is_idrac_ready.call_count)
+
+    def test_ready_retry_delay(self, mock_sleep):
+        self.mock_probe.side_effect = [{'1.2.3.4': False},
+                                       {'1.2.3.4': True},
+                                       {'1.2.3.4': True}]
+        client = self._client(ready=[False])
+        client.ready_retry_policy = retry.RetryPolicy.fixed(3, 10)
+        handle = self._handle(client)
+
+        for _ in range(4):
+            handle.poll()
+
+        self.assertEqual(reset.REACHABLE, handle.phase)
+        self.assertGreater(handle.wait_time(), 9)
+        self.assertFalse(handle.poll())
+        self.assertEqual(1, client.is_idrac_ready.call_count)
+
+    def test_ready_request_failure(self, mock_sleep):
+        self.mock_probe.side_effect = [{'1.2.3.4': False},
+                                       {'1.2.3.4': True},
+                                       {'1.2.3.4': True}]
+        client = self._client(
+            ready=[exceptions.WSManRequestFailure(), True])
+
+        handle = self._handle(client)
+
+        self.assertTrue(handle.result())
+
+    def test_wait_all(self, mock_sleep):
+        self.mock_probe.side_effect = [
+            {'1.2.3.4': False, '1.2.3.5': True},
+            {'1.2.3.4': True, '1.2.3.5': False},
+            {'1.2.3.4': True, '1.2.3.5': True},
+            {'1.2.3.5': True}]
+        handles = [self._handle(self._client('1.2.3.4')),
+                   self._handle(self._client('1.2.3.5'))]
+
+        self.assertEqual(handles, reset.wait_all(handles))
+
+        for handle in handles:
+            self.assertEqual(reset.READY, handle.phase)
+        self.assertEqual(4, self.mock_probe.call_count)
+
+    def test_poll_all_checks_ready_at_once(self, mock_sleep):
+        self.mock_probe.side_effect = [
+            {'1.2.3.4': False, '1.2.3.5': False},
+            {'1.2.3.4': True, '1.2.3.5': True},
+            {'1.2.3.4': True, '1.2.3.5': True}]
+        clients = [self._client('1.2.3.4'), self._client('1.2.3.5')]
+        handles = [self._handle(client) for client in clients]
+        for _ in range(3):
+            self.assertEqual([], reset.poll_all(handles))
+        # both checks have to be in flight for either to return
+        barrier = threading.Barrier(2, timeout=5)
+        for client in clients:
+            client.is_idrac_ready.side_effect = (
+                lambda: barrier.wait() is not None)
+
+        self.assertEqual(handles, reset.poll_all(handles))
+
+        for client in clients:
+            client.is_idrac_ready.assert_called_once_with()
+            client.bind_deadline.assert_called_once_with(mock.ANY)
+
+
+class ClientStartResetTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(ClientStartResetTestCase, self).setUp()
+        self.drac_client = dracclient.client.DRACClient(
+            **test_utils.FAKE_ENDPOINT)
+
+    @mock.patch(
+        'dracclient.client.idrac_card.iDRACCardConfiguration.reset_idrac')
+    def test_start_reset_idrac(self, mock_reset_idrac):
+        mock_reset_idrac.return_value = True
+
+        handle = self.drac_client.start_reset_idrac(force=True)
+
+        mock_reset_idrac.assert_called_once_with(True)
+        self.assertEqual(reset.RESET_ISSUED, handle.phase)
+        self.assertEqual(test_utils.FAKE_ENDPOINT['host'], handle.host)
+        self.assertIs(self.drac_client._liveness_probe,
+                      handle.liveness_probe)
+
+    @mock.patch(
+        'dracclient.client.idrac_card.iDRACCardConfiguration.reset_idrac')
+    def test_start_reset_idrac_failed(self, mock_reset_idrac):
+        mock_reset_idrac.return_value = False
+
+        self.assertRaises(exceptions.DRACOperationFailed,
+                          self.drac_client.start_reset_idrac)
@@ -0,0 +1,67 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from dracclient import retry
+from dracclient.tests import base
+
+
+class RetryPolicyTestCase(base.BaseTest):
+
+    def test_delay(self):
+        policy = retry.RetryPolicy(base_delay=1, max_delay=10, jitter=False)
+
+        self.assertEqual([1, 2, 4, 8, 10, 10],
+                         [policy.delay(attempt) for attempt in range(1, 7)])
+
+    @mock.patch('random.uniform', autospec=True)
+    def test_delay_with_jitter(self, mock_uniform):
+        mock_uniform.return_value = 1.5
+        policy = retry.RetryPolicy(base_delay=1, max_delay=10)
+
+        self.assertEqual(1.5, policy.delay(3))
+        mock_uniform.assert_called_once_with(0, 4)
+
+    def test_fixed(self):
+        policy = retry.RetryPolicy.fixed(5, 10)
+
+        self.assertEqual(5, policy.max_attempts)
+        self.assertEqual([10, 10, 10],
+                         [policy.delay(attempt) for attempt in range(1, 4)])
+        self.assertFalse(policy.is_retryable_status(503))
+
+    def test_is_retryable_status(self):
+        policy = retry.RetryPolicy()
+
+        self.assertTrue(policy.is_retryable_status(503))
+        self.assertFalse(policy.is_retryable_status(401))
+
+    def test_acquire_retry_without_host_budget(self):
+        policy = retry.RetryPolicy()
+
+        self.assertTrue(all(policy.acquire_retry('1.2.3.4')
+                            for i in range(100)))
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_acquire_retry_with_host_budget(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        policy = retry.RetryPolicy(host_budget=2, host_budget_period=60)
+
+        self.assertTrue(policy.acquire_retry('1.2.3.4'))
+        self.assertTrue(policy.acquire_retry('1.2.3.4'))
+        self.assertFalse(policy.acquire_retry('1.2.3.4'))
+        self.assertTrue(policy.acquire_retry('5.6.7.8'))
+
+        mock_monotonic.return_value = 160
+        self.assertTrue(policy.acquire_retry('1.2.3.4'))
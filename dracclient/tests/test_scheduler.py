@@ -0,0 +1,226 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+from unittest import mock
+
+from dracclient import exceptions
+from dracclient import scheduler
+from dracclient.tests import base
+
+
+class PollSchedulerTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(PollSchedulerTestCase, self).setUp()
+        self.scheduler = scheduler.PollScheduler(tick=0.001, wheel_size=8,
+                                                 max_workers=2)
+        self.addCleanup(self.scheduler.shutdown)
+
+    def test_schedule(self):
+        check = mock.Mock(side_effect=[False, False, 'done'])
+
+        wait = self.scheduler.schedule(check, 0)
+
+        self.assertEqual('done', wait.result(5))
+        self.assertTrue(wait.done())
+        self.assertFalse(wait.expired)
+        self.assertEqual(3, wait.attempts)
+        self.assertEqual(0, self.scheduler.pending)
+
+    def test_schedule_with_interval_callable(self):
+        check = mock.Mock(side_effect=[False, False, True])
+        interval = mock.Mock(return_value=0.002)
+
+        self.assertTrue(self.scheduler.schedule(check, interval).result(5))
+        self.assertEqual([mock.call(1), mock.call(2)],
+                         interval.call_args_list)
+
+    def test_schedule_with_delay_beyond_wheel(self):
+        check = mock.Mock(return_value=True)
+        started = time.monotonic()
+
+        wait = self.scheduler.schedule(check, 0, delay=0.05)
+
+        self.assertTrue(wait.result(5))
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        check.assert_called_once_with()
+
+    def test_schedule_expired(self):
+        check = mock.Mock(return_value=False)
+
+        wait = self.scheduler.schedule(check, 0.01, timeout=0.03)
+
+        self.assertFalse(wait.result(5))
+        self.assertTrue(wait.expired)
+        self.assertLessEqual(check.call_count, 3)
+
+    def test_schedule_check_error(self):
+        check = mock.Mock(side_effect=[False, exceptions.WSManRequestFailure])
+
+        wait = self.scheduler.schedule(check, 0)
+
+        self.assertRaises(exceptions.WSManRequestFailure, wait.result, 5)
+
+    def test_schedule_callback(self):
+        finished = threading.Event()
+        callback = mock.Mock(side_effect=lambda wait: finished.set())
+
+        wait = self.scheduler.schedule(mock.Mock(return_value=True), 0,
+                                       callback=callback)
+
+        self.assertTrue(finished.wait(5))
+        callback.assert_called_once_with(wait)
+
+    def test_result_timeout(self):
+        wait = self.scheduler.schedule(mock.Mock(return_value=True), 0,
+                                       delay=60)
+
+        self.assertRaises(exceptions.DRACWaitTimeout, wait.result, 0.01)
+        self.assertTrue(wait.cancel())
+        self.assertIsNone(wait.result())
+        self.assertTrue(wait.cancelled)
+
+    def test_many_waits(self):
+        threads = threading.active_count()
+        checks = [mock.Mock(side_effect=[False, True]) for _ in range(500)]
+
+        waits = [self.scheduler.schedule(check, 0.005) for check in checks]
+
+        for wait in waits:
+            self.assertTrue(wait.result(5))
+        # the thread of the wheel and the workers
+        self.assertLessEqual(threading.active_count(), threads + 3)
+
+    def test_schedule_with_hung_key(self):
+        # the checks of a hung host only hold one of the two workers, the
+        # waits of the other hosts still complete
+        poll_scheduler = scheduler.PollScheduler(tick=0.001, max_workers=2,
+                                                 max_workers_per_key=1)
+        self.addCleanup(poll_scheduler.shutdown)
+        hung = threading.Event()
+        self.addCleanup(hung.set)
+        hung_check = mock.Mock(side_effect=lambda: hung.wait(5))
+
+        hung_waits = [poll_scheduler.schedule(hung_check, 0, key='hung-host')
+                      for _ in range(2)]
+        wait = poll_scheduler.schedule(mock.Mock(side_effect=[False, True]),
+                                       0, key='host')
+
+        self.assertTrue(wait.result(5))
+        self.assertEqual(1, hung_check.call_count)
+        self.assertEqual(1, poll_scheduler.pending)
+
+        hung.set()
+        for hung_wait in hung_waits:
+            self.assertTrue(hung_wait.result(5))
+        self.assertEqual(2, hung_check.call_count)
+
+    def test_shutdown_with_held_back_check(self):
+        poll_scheduler = scheduler.PollScheduler(tick=0.001,
+                                                 max_workers_per_key=1)
+        hung = threading.Event()
+        self.addCleanup(hung.set)
+        poll_scheduler.schedule(lambda: hung.wait(5), 0, key='host')
+        held_wait = poll_scheduler.schedule(mock.Mock(return_value=True), 0,
+                                            key='host')
+        while poll_scheduler.pending != 1 or not poll_scheduler._held:
+            time.sleep(0.001)
+
+        poll_scheduler.shutdown()
+
+        self.assertTrue(held_wait.cancelled)
+        self.assertEqual(0, poll_scheduler.pending)
+
+    def test_wait(self):
+        threads = []
+
+        def check():
+            threads.append(threading.current_thread())
+            return len(threads) == 2
+
+        self.assertTrue(self.scheduler.wait(check, 0))
+        self.assertIs(threading.current_thread(), threads[0])
+        self.assertIsNot(threading.current_thread(), threads[1])
+
+    def test_wait_from_worker(self):
+        # a wait made from a check of a scheduler with a single worker is
+        # run from that worker
+        poll_scheduler = scheduler.PollScheduler(tick=0.001, max_workers=1)
+        self.addCleanup(poll_scheduler.shutdown)
+        nested_threads = []
+
+        def nested_check():
+            nested_threads.append(threading.current_thread())
+            return len(nested_threads) == 3
+
+        checks = []
+
+        def check():
+            checks.append(threading.current_thread())
+            if len(checks) == 1:
+                return False
+
+            return poll_scheduler.wait(nested_check, 0, timeout=5)
+
+        wait = poll_scheduler.schedule(check, 0)
+
+        self.assertTrue(wait.result(5))
+        self.assertEqual([checks[1]] * 3, nested_threads)
+
+    def test_wait_with_delay(self):
+        threads = []
+
+        def check():
+            threads.append(threading.current_thread())
+            return True
+
+        self.assertTrue(self.scheduler.wait(check, 10, delay=0.01))
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+    def test_wait_cancelled(self):
+        def check():
+            self.scheduler.shutdown()
+            return False
+
+        self.assertRaises(exceptions.DRACWaitCancelled, self.scheduler.wait,
+                          check, 0)
+
+    def test_wait_expired(self):
+        self.assertFalse(self.scheduler.wait(mock.Mock(return_value=False),
+                                             0.05, timeout=0.01))
+
+    def test_wait_ready(self):
+        check = mock.Mock(return_value=True)
+
+        self.assertTrue(self.scheduler.wait(check, 10))
+        check.assert_called_once_with()
+        self.assertEqual(0, self.scheduler.pending)
+
+    def test_shutdown(self):
+        wait = self.scheduler.schedule(mock.Mock(return_value=True), 0,
+                                       delay=60)
+
+        self.scheduler.shutdown()
+
+        self.assertTrue(wait.done())
+        self.assertTrue(wait.cancelled)
+        self.assertEqual(0, self.scheduler.pending)
+
+
+class SharedSchedulerTestCase(base.BaseTest):
+
+    def test_get_shared_scheduler(self):
+        self.assertIs(scheduler.get_shared_scheduler(),
+                      scheduler.get_shared_scheduler())
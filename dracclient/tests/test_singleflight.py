@@ -0,0 +1,159 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from dracclient import exceptions
+from dracclient import singleflight
+from dracclient.tests import base
+
+
+class SingleFlightTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(SingleFlightTestCase, self).setUp()
+        self.single_flight = singleflight.SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _slow_call(self, result):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _run_concurrently(self, key, result, waiters=2):
+        results = []
+        errors = []
+
+        def run():
+            try:
+                results.append(self.single_flight.do(key, self._slow_call,
+                                                     result))
+            except Exception as ex:
+                errors.append(ex)
+
+        leader = threading.Thread(target=run)
+        leader.start()
+        self.started.wait(5)
+        threads = [threading.Thread(target=run) for i in range(waiters)]
+        for thread in threads:
+            thread.start()
+        while self.single_flight.coalesced < waiters:
+            time.sleep(0.01)
+        self.release.set()
+        for thread in [leader] + threads:
+            thread.join(5)
+
+        return results, errors
+
+    def test_do(self):
+        self.release.set()
+
+        self.assertEqual('yay!', self.single_flight.do('key', self._slow_call,
+                                                       'yay!'))
+        self.assertEqual('yay!', self.single_flight.do('key', self._slow_call,
+                                                       'yay!'))
+        self.assertEqual(2, self.calls)
+        self.assertEqual(0, self.single_flight.coalesced)
+
+    def test_do_coalesces_concurrent_calls(self):
+        result = {'foo': ['bar']}
+
+        results, errors = self._run_concurrently('key', result)
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual(2, self.single_flight.coalesced)
+        self.assertEqual([result] * 3, results)
+        self.assertEqual([], errors)
+        # every caller gets its own object
+        self.assertEqual(3, len(set(id(r) for r in results)))
+
+    def test_do_raises_to_all_waiters(self):
+        error = exceptions.WSManRequestFailure('boom')
+
+        results, errors = self._run_concurrently('key', error)
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual([], results)
+        self.assertEqual([error] * 3, errors)
+
+    def test_do_with_different_keys(self):
+        self.release.set()
+
+        self.single_flight.do('key1', self._slow_call, 'foo')
+        self.single_flight.do('key2', self._slow_call, 'bar')
+
+        self.assertEqual(2, self.calls)
+
+    def test_do_retries_errors_of_the_caller(self):
+        self.single_flight = singleflight.SingleFlight(
+            retried_errors=[exceptions.DRACDeadlineExceeded])
+        error = exceptions.DRACDeadlineExceeded(host='1.2.3.4')
+        outcomes = [error, 'yay!', 'yay!']
+
+        def call():
+            result = outcomes.pop(0)
+            if result is error:
+                self.started.set()
+                self.release.wait(5)
+                raise result
+            return result
+
+        errors = []
+
+        def run_leader():
+            try:
+                self.single_flight.do('key', call)
+            except Exception as ex:
+                errors.append(ex)
+
+        leader = threading.Thread(target=run_leader)
+        leader.start()
+        self.started.wait(5)
+        results = []
+        follower = threading.Thread(
+            target=lambda: results.append(self.single_flight.do('key', call)))
+        follower.start()
+        while self.single_flight.coalesced < 1:
+            time.sleep(0.01)
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual([error], errors)
+        self.assertEqual(['yay!'], results)
+
+    def test_do_waits_until_the_deadline(self):
+        error = exceptions.DRACDeadlineExceeded(host='1.2.3.4')
+
+        def check_deadline():
+            raise error
+
+        self.single_flight = singleflight.SingleFlight(
+            remaining_time=lambda: 0.01, check_deadline=check_deadline)
+        leader = threading.Thread(target=self.single_flight.do,
+                                  args=('key', self._slow_call, 'yay!'))
+        leader.start()
+        self.started.wait(5)
+        self.addCleanup(leader.join, 5)
+        self.addCleanup(self.release.set)
+
+        self.assertRaises(exceptions.DRACDeadlineExceeded,
+                          self.single_flight.do, 'key', self._slow_call,
+                          'yay!')
+        self.assertEqual(1, self.calls)
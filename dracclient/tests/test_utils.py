@@ -11,11 +11,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import re
+from unittest import mock
 
 from lxml import etree
+import requests_mock
 
+import dracclient.client
 from dracclient import exceptions
+from dracclient.resources import bios
+from dracclient.resources import idrac_card
+from dracclient.resources import lifecycle_controller
+from dracclient.resources import nic
+from dracclient.resources import raid
+from dracclient.resources import system
 from dracclient.resources import uris
 from dracclient.tests import base
 from dracclient.tests import utils as test_utils
@@ -49,6 +59,34 @@ class UtilsTestCase(base.BaseTest):
 
         self.assertFalse(utils._is_attr_non_nil(version))
 
+    def test_find_xml(self):
+        doc = etree.fromstring(
+            test_utils.RAIDEnumerations[uris.DCIM_PhysicalDiskView]['ok'])
+        query = './/{%s}DCIM_PhysicalDiskView' % uris.DCIM_PhysicalDiskView
+
+        disks = utils.find_xml(doc, 'DCIM_PhysicalDiskView',
+                               uris.DCIM_PhysicalDiskView, find_all=True)
+        disk = utils.find_xml(doc, 'DCIM_PhysicalDiskView',
+                              uris.DCIM_PhysicalDiskView)
+
+        self.assertEqual(doc.findall(query), disks)
+        self.assertEqual(doc.find(query), disk)
+        self.assertIsNone(utils.find_xml(doc, 'Missing',
+                                         uris.DCIM_PhysicalDiskView))
+        self.assertEqual([], utils.find_xml(doc, 'Missing',
+                                            uris.DCIM_PhysicalDiskView,
+                                            find_all=True))
+
+    def test_find_xml_reuses_descendant_finder(self):
+        doc = etree.fromstring(
+            test_utils.InventoryEnumerations[uris.DCIM_CPUView]['ok'])
+        utils.find_xml(doc, 'FQDD', uris.DCIM_CPUView)
+        hits = utils._descendant_finder.cache_info().hits
+
+        utils.find_xml(doc, 'FQDD', uris.DCIM_CPUView)
+
+        self.assertEqual(hits + 1, utils._descendant_finder.cache_info().hits)
+
     def test_get_wsman_resource_attr(self):
         doc = etree.fromstring(
             test_utils.InventoryEnumerations[uris.DCIM_CPUView]['ok'])
@@ -167,9 +205,259 @@ class UtilsTestCase(base.BaseTest):
             nullable=True)
         self.assertEqual(result, [])
 
+    def _item_view(self, enumerations, resource_uri, variant='ok'):
+        doc = etree.fromstring(enumerations[resource_uri][variant])
+        items = utils.find_xml(doc, resource_uri.split('/')[-1],
+                               resource_uri, find_all=True)
+
+        return utils.ItemView(items[0], resource_uri)
+
+    def test_item_view_get_attr(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView)
+
+        self.assertEqual('1', view.get_attr('HyperThreadingEnabled'))
+        self.assertEqual(
+            utils.get_wsman_resource_attr(view.item, uris.DCIM_CPUView,
+                                          'FQDD'),
+            view.get_attr('FQDD'))
+
+    def test_item_view_get_attr_missing_attr(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView, 'missing_flags')
+
+        self.assertRaises(exceptions.DRACMissingResponseField,
+                          view.get_attr, 'HyperThreadingEnabled')
+        self.assertIsNone(view.get_attr('HyperThreadingEnabled',
+                                        allow_missing=True))
+        self.assertIsNone(view.find('HyperThreadingEnabled'))
+
+    def test_item_view_get_attr_missing_text(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView, 'empty_flag')
+
+        self.assertRaises(exceptions.DRACEmptyResponseField,
+                          view.get_attr, 'HyperThreadingEnabled')
+
+    def test_item_view_get_attr_nil(self):
+        view = self._item_view(test_utils.RAIDEnumerations,
+                               uris.DCIM_ControllerView)
+
+        self.assertIsNone(view.get_attr('DriverVersion', nullable=True))
+        self.assertEqual([], view.get_all_attrs('DriverVersion',
+                                                nullable=True))
+
+    def test_item_view_get_all_attrs(self):
+        view = self._item_view(test_utils.RAIDEnumerations,
+                               uris.DCIM_VirtualDiskView)
+
+        self.assertEqual(
+            ['Disk.Bay.0:Enclosure.Internal.0-1:RAID.Integrated.1-1',
+             'Disk.Bay.1:Enclosure.Internal.0-1:RAID.Integrated.1-1'],
+            view.get_all_attrs('PhysicalDiskIDs'))
+        self.assertEqual(2, len(view.find_all('PhysicalDiskIDs')))
+        self.assertEqual([], view.get_all_attrs('Missing'))
+
+    def test_item_view_ignores_other_namespaces(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView)
+
+        other_view = utils.ItemView(view.item, uris.DCIM_MemoryView)
+
+        self.assertIsNone(other_view.find('FQDD'))
+
+    def test_item_view_of(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView)
+
+        self.assertIs(view, utils.ItemView.of(view, uris.DCIM_CPUView))
+        other_view = utils.ItemView.of(view, uris.DCIM_MemoryView)
+        self.assertIs(view.item, other_view.item)
+        self.assertEqual(uris.DCIM_MemoryView, other_view.resource_uri)
+
+    def test_view_parser_parse(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView)
+        cpu = collections.namedtuple(
+            'CPU', ['id', 'cores', 'status', 'ht_enabled', 'threads',
+                    'model'])
+        parser = utils.ViewParser(cpu, uris.DCIM_CPUView, {
+            'id': utils.ViewField('FQDD'),
+            'cores': utils.ViewField('NumberOfProcessorCores',
+                                     converter=int),
+            'status': utils.ViewField('PrimaryStatus',
+                                      lookup={'1': 'ok'}),
+            'ht_enabled': utils.ViewField('Missing', allow_missing=True,
+                                          converter=bool, default=False),
+            'threads': utils.ComputedField(
+                lambda values: values['cores'] * 2),
+            'model': utils.ViewField(('Missing', 'Model')),
+        })
+
+        self.assertEqual(
+            cpu(id='CPU.Socket.1', cores=6, status='ok', ht_enabled=False,
+                threads=12, model=view.get_attr('Model')),
+            parser.parse(view.item))
+
+    def test_view_parser_parse_all_attrs(self):
+        view = self._item_view(test_utils.RAIDEnumerations,
+                               uris.DCIM_VirtualDiskView)
+        disk = collections.namedtuple('VirtualDisk', ['physical_disks'])
+        parser = utils.ViewParser(disk, uris.DCIM_VirtualDiskView, {
+            'physical_disks': utils.ViewField('PhysicalDiskIDs',
+                                              find_all=True)})
+
+        self.assertEqual(view.get_all_attrs('PhysicalDiskIDs'),
+                         parser.parse(view).physical_disks)
+
+    def test_view_parser_parse_missing_attr(self):
+        view = self._item_view(test_utils.InventoryEnumerations,
+                               uris.DCIM_CPUView, 'missing_flags')
+        cpu = collections.namedtuple('CPU', ['ht_enabled'])
+        parser = utils.ViewParser(cpu, uris.DCIM_CPUView, {
+            'ht_enabled': utils.ViewField('HyperThreadingEnabled')})
+
+        self.assertRaises(exceptions.DRACMissingResponseField,
+                          parser.parse, view.item)
+
+    def test_view_parser_fields_mismatch(self):
+        cpu = collections.namedtuple('CPU', ['id', 'cores'])
+
+        self.assertRaisesRegex(
+            ValueError, 'cores, model', utils.ViewParser, cpu,
+            uris.DCIM_CPUView, {'id': utils.ViewField('FQDD'),
+                                'model': utils.ViewField('Model')})
+
+    def test_lazy_settings(self):
+        doc = etree.fromstring(
+            test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'])
+
+        settings = utils._parse_config(doc, bios.BIOSEnumerableAttribute,
+                                       by_name=True, fqdd_filter=None,
+                                       name_formatter=None, lazy=True)
+
+        self.assertEqual(
+            utils._parse_config(doc, bios.BIOSEnumerableAttribute,
+                                by_name=True, fqdd_filter=None,
+                                name_formatter=None),
+            dict(settings))
+        self.assertRaises(KeyError, settings.__getitem__, 'Missing')
+
+    def test_lazy_settings_name_formatter(self):
+        doc = etree.fromstring(test_utils.iDracCardEnumerations[
+            uris.DCIM_iDRACCardEnumeration]['ok'])
+
+        settings = utils._parse_config(
+            doc, idrac_card.iDRACCardEnumerableAttribute, by_name=True,
+            fqdd_filter='iDRAC.Embedded.2',
+            name_formatter=idrac_card._name_formatter, lazy=True)
+
+        self.assertEqual(['Info.1#Type'], list(settings))
+        self.assertEqual(0, settings.parsed)
+
+    def test_lazy_settings_missing_key_attr(self):
+        doc = etree.fromstring(test_utils.LifecycleControllerEnumerations[
+            uris.DCIM_LCEnumeration]['ok'])
+
+        self.assertRaises(exceptions.DRACMissingResponseField,
+                          utils._parse_config, doc,
+                          lifecycle_controller.LCEnumerableAttribute,
+                          by_name=True, fqdd_filter='LC.Embedded.1',
+                          name_formatter=None, lazy=True)
+
+    def test_merge_lazy_settings_with_colliding_attrs(self):
+        doc = etree.fromstring(
+            test_utils.BIOSEnumerations[uris.DCIM_BIOSEnumeration]['ok'])
+        settings = utils._parse_config(doc, bios.BIOSEnumerableAttribute,
+                                       by_name=True, fqdd_filter=None,
+                                       name_formatter=None, lazy=True)
+
+        self.assertRaises(exceptions.DRACOperationFailed,
+                          utils._merge_settings, settings, settings)
+
+    def test_slot_values(self):
+        attr = bios.BIOSEnumerableAttribute(
+            name='MemTest', instance_id='BIOS.Setup.1-1:MemTest',
+            current_value='Disabled', pending_value=None, read_only=False,
+            possible_values=['Enabled', 'Disabled'])
+
+        self.assertEqual({'name': 'MemTest',
+                          'instance_id': 'BIOS.Setup.1-1:MemTest',
+                          'current_value': 'Disabled',
+                          'pending_value': None,
+                          'read_only': False,
+                          'possible_values': ['Enabled', 'Disabled']},
+                         utils.slot_values(attr))
+        self.assertEqual({}, utils.slot_values(object()))
+
+    def test_slotted_attribute_equality(self):
+        args = ('MemTest', 'BIOS.Setup.1-1:MemTest', 'Disabled', None, False)
+        attr = bios.BIOSEnumerableAttribute(*args, possible_values=['a'])
+
+        self.assertEqual(
+            bios.BIOSEnumerableAttribute(*args, possible_values=['a']), attr)
+        self.assertNotEqual(
+            bios.BIOSEnumerableAttribute(*args, possible_values=['b']), attr)
+        self.assertNotEqual(bios.BIOSAttribute(*args), attr)
+
+    def test_attribute_classes_are_slotted(self):
+        for resource in (bios.BIOSConfiguration,
+                         idrac_card.iDRACCardConfiguration,
+                         lifecycle_controller.LCConfiguration,
+                         nic.NICConfiguration, raid.RAIDManagement,
+                         system.SystemConfiguration):
+            for _, attr_cls in resource.NAMESPACES:
+                self.assertFalse(
+                    hasattr(attr_cls.__new__(attr_cls), '__dict__'),
+                    attr_cls.__name__)
+
     def test_build_return_dict_fail(self):
         self.assertRaises(exceptions.InvalidParameterValue,
                           utils.build_return_dict,
                           doc=None,
                           resource_uri=None,
                           is_reboot_required_value='foo')
+
+
+@requests_mock.Mocker()
+@mock.patch.object(dracclient.client.WSManClient,
+                   'wait_until_idrac_is_ready', spec_set=True,
+                   autospec=True)
+class IterSettingsTestCase(base.BaseTest):
+
+    def setUp(self):
+        super(IterSettingsTestCase, self).setUp()
+        self.client = dracclient.client.WSManClient(
+            **test_utils.FAKE_ENDPOINT)
+        self.namespaces = [
+            (uris.DCIM_BIOSEnumeration, bios.BIOSEnumerableAttribute),
+            (uris.DCIM_BIOSString, bios.BIOSStringAttribute)]
+
+    def test_iter_settings(self, mock_requests,
+                           mock_wait_until_idrac_is_ready):
+        responses = [
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSEnumeration]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSString]['ok']}]
+        mock_requests.post('https://1.2.3.4:443/wsman', responses * 2)
+
+        settings = utils.iter_settings(self.client, self.namespaces)
+
+        first = next(settings)
+        self.assertEqual(1, mock_requests.call_count)
+        settings = dict([first] + list(settings))
+        self.assertEqual(utils.list_settings(self.client, self.namespaces),
+                         settings)
+
+    def test_iter_settings_with_colliding_attrs(
+            self, mock_requests, mock_wait_until_idrac_is_ready):
+        mock_requests.post('https://1.2.3.4:443/wsman', [
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSEnumeration]['ok']},
+            {'text': test_utils.BIOSEnumerations[
+                uris.DCIM_BIOSString]['colliding']}])
+
+        settings = utils.iter_settings(self.client, self.namespaces)
+
+        self.assertRaises(exceptions.DRACOperationFailed, list, settings)
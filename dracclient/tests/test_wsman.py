@@ -21,7 +21,9 @@ import requests.exceptions
 import requests_mock
 import six
 
+from dracclient import breaker
 from dracclient import exceptions
+from dracclient import retry
 from dracclient.tests import base
 from dracclient.tests import utils as test_utils
 import dracclient.wsman
@@ -99,6 +101,41 @@ class ClientTestCase(base.BaseTest):
         mock_pull.assert_called_once_with(self.client, 'FooResource',
                                           'enum-context-uuid', 42)
 
+    @requests_mock.Mocker()
+    def test_iter_enumerate(self, mock_requests):
+        mock_requests.post(
+            'https://1.2.3.4:443/wsman',
+            [{'text': test_utils.WSManEnumerations['context'][0]},
+             {'text': test_utils.WSManEnumerations['context'][1]},
+             {'text': test_utils.WSManEnumerations['context'][2]},
+             {'text': test_utils.WSManEnumerations['context'][3]}])
+
+        items = self.client.iter_enumerate('FooResource')
+
+        self.assertEqual('{http://FooResource}FooResource', next(items).tag)
+        self.assertEqual(1, mock_requests.call_count)
+        self.assertEqual(['{http://FooResource}FooResource'] * 3
+                         + ['{http://BarResource}BazResource'],
+                         [item.tag for item in items])
+        self.assertEqual(4, mock_requests.call_count)
+
+    @requests_mock.Mocker()
+    @mock.patch.object(dracclient.wsman.Client, 'pull', autospec=True)
+    def test_iter_enumerate_without_optimization(self, mock_requests,
+                                                 mock_pull):
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           text=test_utils.WSManEnumerations['context'][0])
+        mock_pull.return_value = lxml.etree.fromstring(
+            test_utils.WSManEnumerations['context'][3])
+
+        items = list(self.client.iter_enumerate('FooResource',
+                                                optimization=False,
+                                                max_elems=42))
+
+        self.assertEqual(2, len(items))
+        mock_pull.assert_called_once_with(self.client, 'FooResource',
+                                          'enum-context-uuid', 42)
+
     @requests_mock.Mocker()
     def test_pull(self, mock_requests):
         expected_resp = '<result>yay!</result>'
@@ -186,6 +223,301 @@ class ClientTestCase(base.BaseTest):
         self.assertEqual('yay!', resp.text)
         mock_ts.assert_called_once_with(ssl_retry_delay)
 
+    @requests_mock.Mocker()
+    @mock.patch('time.sleep', autospec=True)
+    def test_client_retry_policy(self, mock_requests, mock_ts):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['retry_policy'] = retry.RetryPolicy(
+            max_attempts=4, base_delay=2, jitter=False)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           [{'exc': requests.exceptions.ConnectionError},
+                            {'status_code': 503, 'reason': 'busy'},
+                            {'exc': requests.exceptions.SSLError},
+                            {'text': '<result>yay!</result>'}])
+
+        resp = client.invoke('http://resource', 'method',
+                             {'selector': 'foo'}, {'property': 'bar'})
+
+        self.assertEqual('yay!', resp.text)
+        self.assertEqual([mock.call(2), mock.call(4), mock.call(8)],
+                         mock_ts.call_args_list)
+
+    @requests_mock.Mocker()
+    @mock.patch('time.sleep', autospec=True)
+    def test_client_retry_policy_with_unretryable_status(self, mock_requests,
+                                                         mock_ts):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['retry_policy'] = retry.RetryPolicy()
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman', status_code=500,
+                           reason='dumb request')
+
+        self.assertRaises(exceptions.WSManInvalidResponse,
+                          client.invoke, 'http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'})
+        self.assertEqual(1, mock_requests.call_count)
+        self.assertFalse(mock_ts.called)
+
+    @requests_mock.Mocker()
+    @mock.patch('time.sleep', autospec=True)
+    def test_client_retry_policy_with_exhausted_host_budget(self,
+                                                            mock_requests,
+                                                            mock_ts):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['retry_policy'] = retry.RetryPolicy(max_attempts=5,
+                                                          host_budget=1)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman', status_code=503,
+                           reason='busy')
+
+        self.assertRaises(exceptions.WSManInvalidResponse,
+                          client.invoke, 'http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'})
+        self.assertEqual(2, mock_requests.call_count)
+
+    @requests_mock.Mocker()
+    def test_client_with_open_circuit(self, mock_requests):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['circuit_breakers'] = breaker.CircuitBreakerRegistry(
+            failure_threshold=2)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           exc=requests.exceptions.ConnectionError)
+
+        for i in range(2):
+            self.assertRaises(exceptions.WSManRequestFailure,
+                              client.invoke, 'http://resource', 'method',
+                              {'selector': 'foo'}, {'property': 'bar'})
+        self.assertRaises(exceptions.WSManCircuitOpen,
+                          client.invoke, 'http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'})
+
+        self.assertEqual(2 * client.ssl_retries, mock_requests.call_count)
+        self.assertEqual(breaker.OPEN,
+                         client.circuit_breakers.state('1.2.3.4'))
+
+    @requests_mock.Mocker()
+    def test_client_with_circuit_breakers_records_success(self,
+                                                          mock_requests):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['circuit_breakers'] = breaker.CircuitBreakerRegistry(
+            failure_threshold=2)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           [{'exc': requests.exceptions.ConnectionError},
+                            {'exc': requests.exceptions.ConnectionError},
+                            {'exc': requests.exceptions.ConnectionError},
+                            {'status_code': 500, 'reason': 'dumb request'}])
+
+        self.assertRaises(exceptions.WSManRequestFailure,
+                          client.invoke, 'http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'})
+        self.assertRaises(exceptions.WSManInvalidResponse,
+                          client.invoke, 'http://resource', 'method',
+                          {'selector': 'foo'}, {'property': 'bar'})
+
+        self.assertEqual(0, client.circuit_breakers.get('1.2.3.4')._failures)
+
+    def _client_with_session(self, **kwargs):
+        session = mock.Mock()
+        session.post.return_value.ok = True
+        session.post.return_value.content = b'<result>yay!</result>'
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint.update(kwargs)
+        fake_endpoint['session'] = session
+
+        return dracclient.wsman.Client(**fake_endpoint)
+
+    def test_client_timeouts(self):
+        client = self._client_with_session(connect_timeout=5,
+                                           read_timeout=None)
+
+        client.enumerate('resource', auto_pull=False)
+
+        client._session.post.assert_called_once_with(
+            'https://1.2.3.4:443/wsman', auth=mock.ANY, data=mock.ANY,
+            timeout=(5, None), verify=False)
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_deadline_caps_timeouts(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        client = self._client_with_session(connect_timeout=5,
+                                           read_timeout=None)
+
+        with client.deadline(30):
+            mock_monotonic.return_value = 110
+            client.enumerate('resource', auto_pull=False)
+
+        client._session.post.assert_called_once_with(
+            'https://1.2.3.4:443/wsman', auth=mock.ANY, data=mock.ANY,
+            timeout=(5, 20), verify=False)
+
+    def test_deadline_exceeded(self):
+        client = self._client_with_session()
+
+        with client.deadline(0):
+            self.assertRaises(exceptions.DRACDeadlineExceeded,
+                              client.enumerate, 'resource')
+
+        self.assertFalse(client._session.post.called)
+        self.assertIsNone(client.remaining_time())
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_nested_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        client = self._client_with_session()
+
+        with client.deadline(30):
+            with client.deadline(60):
+                self.assertEqual(30, client.remaining_time())
+            with client.deadline(10):
+                self.assertEqual(10, client.remaining_time())
+            self.assertEqual(30, client.remaining_time())
+
+    @requests_mock.Mocker()
+    @mock.patch('time.sleep', autospec=True)
+    def test_deadline_exceeded_during_retries(self, mock_requests, mock_ts):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['retry_policy'] = retry.RetryPolicy(
+            max_attempts=5, base_delay=10, jitter=False)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           exc=requests.exceptions.ConnectionError)
+
+        with mock.patch('time.monotonic', autospec=True) as mock_monotonic:
+            mock_monotonic.return_value = 100
+            with client.deadline(15):
+                mock_ts.side_effect = lambda delay: setattr(
+                    mock_monotonic, 'return_value',
+                    mock_monotonic.return_value + delay)
+
+                self.assertRaises(exceptions.DRACDeadlineExceeded,
+                                  client.invoke, 'http://resource', 'method',
+                                  {'selector': 'foo'}, {'property': 'bar'})
+
+        self.assertEqual([mock.call(10), mock.call(5)],
+                         mock_ts.call_args_list)
+        self.assertEqual(2, mock_requests.call_count)
+
+    def test_deadline_exceeded_with_circuit_breakers(self):
+        registry = breaker.CircuitBreakerRegistry(failure_threshold=1)
+        client = self._client_with_session(circuit_breakers=registry)
+
+        with client.deadline(0):
+            self.assertRaises(exceptions.DRACDeadlineExceeded,
+                              client.enumerate, 'resource')
+
+        self.assertFalse(client._session.post.called)
+        self.assertEqual(breaker.CLOSED, registry.state('1.2.3.4'))
+        self.assertEqual(0, registry.get('1.2.3.4')._failures)
+
+    @requests_mock.Mocker()
+    @mock.patch('time.sleep', autospec=True)
+    def test_deadline_exceeded_during_retries_with_circuit_breakers(
+            self, mock_requests, mock_ts):
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['retry_policy'] = retry.RetryPolicy(
+            max_attempts=5, base_delay=10, jitter=False)
+        fake_endpoint['circuit_breakers'] = breaker.CircuitBreakerRegistry(
+            failure_threshold=1)
+        client = dracclient.wsman.Client(**fake_endpoint)
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           exc=requests.exceptions.ConnectionError)
+
+        with mock.patch('time.monotonic', autospec=True) as mock_monotonic:
+            mock_monotonic.return_value = 100
+            with client.deadline(15):
+                mock_ts.side_effect = lambda delay: setattr(
+                    mock_monotonic, 'return_value',
+                    mock_monotonic.return_value + delay)
+
+                self.assertRaises(exceptions.DRACDeadlineExceeded,
+                                  client.invoke, 'http://resource', 'method',
+                                  {'selector': 'foo'}, {'property': 'bar'})
+
+            self.assertEqual(breaker.CLOSED,
+                             client.circuit_breakers.state('1.2.3.4'))
+
+    @requests_mock.Mocker()
+    def test_session_is_reused(self, mock_requests):
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           text='<result>yay!</result>')
+
+        self.client.invoke('http://resource', 'method', {}, {})
+        session = self.client._session
+        self.client.enumerate('resource', auto_pull=False)
+
+        self.assertIsNotNone(session)
+        self.assertIs(session, self.client._session)
+        self.assertEqual(2, mock_requests.call_count)
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test_idle_connections_are_discarded(self, mock_monotonic):
+        mock_monotonic.side_effect = [0, 10, 100]
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['idle_timeout'] = 60
+        client = dracclient.wsman.Client(**fake_endpoint)
+
+        with mock.patch.object(client, '_create_session',
+                               autospec=True) as mock_create_session:
+            session = mock_create_session.return_value
+            session.post.return_value.content = b'<result>yay!</result>'
+            client.enumerate('resource', auto_pull=False)
+            client.enumerate('resource', auto_pull=False)
+            self.assertFalse(session.close.called)
+
+            client.enumerate('resource', auto_pull=False)
+
+        mock_create_session.assert_called_once_with()
+        session.close.assert_called_once_with()
+        self.assertEqual(3, session.post.call_count)
+
+    @requests_mock.Mocker()
+    def test_close(self, mock_requests):
+        mock_requests.post('https://1.2.3.4:443/wsman',
+                           text='<result>yay!</result>')
+        self.client.enumerate('resource', auto_pull=False)
+        session = self.client._session
+
+        with mock.patch.object(session, 'close',
+                               autospec=True) as mock_close:
+            self.client.close()
+
+        mock_close.assert_called_once_with()
+        self.assertIsNone(self.client._session)
+
+        resp = self.client.enumerate('resource', auto_pull=False)
+        self.assertEqual('yay!', resp.text)
+        self.assertIsNot(session, self.client._session)
+
+    def test_context_manager(self):
+        with mock.patch.object(dracclient.wsman.Client, 'close',
+                               autospec=True) as mock_close:
+            with dracclient.wsman.Client(
+                    **test_utils.FAKE_ENDPOINT) as client:
+                self.assertIsInstance(client, dracclient.wsman.Client)
+
+        mock_close.assert_called_once_with(client)
+
+    def test_close_with_external_session(self):
+        session = mock.Mock()
+        session.post.return_value.ok = True
+        session.post.return_value.content = b'<result>yay!</result>'
+        fake_endpoint = test_utils.FAKE_ENDPOINT.copy()
+        fake_endpoint['session'] = session
+        client = dracclient.wsman.Client(**fake_endpoint)
+
+        resp = client.enumerate('resource', auto_pull=False)
+        client.close()
+
+        self.assertEqual('yay!', resp.text)
+        session.post.assert_called_once_with(
+            'https://1.2.3.4:443/wsman', auth=mock.ANY, data=mock.ANY,
+            timeout=(10, 300), verify=False)
+        self.assertFalse(session.close.called)
+        self.assertIs(session, client._session)
+
 
 class PayloadTestCase(base.BaseTest):
 
@@ -13,6 +13,7 @@
 
 import os
 
+from dracclient import aiowsman
 from dracclient.resources import uris
 
 FAKE_ENDPOINT = {
@@ -35,6 +36,34 @@ def load_wsman_xml(name):
     return xml_body
 
 
+class FakeAsyncTransport(object):
+    """aiowsman.Transport replacement replaying canned responses."""
+
+    def __init__(self, responses):
+        """Creates FakeAsyncTransport object
+
+        :param responses: list of response bodies, exceptions to raise or
+                          aiowsman.Response objects, in the order they are
+                          returned
+        """
+        self.responses = list(responses)
+        self.requests = []
+        self.closed = False
+
+    async def post(self, path, body, headers):
+        self.requests.append(body)
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        if not isinstance(resp, aiowsman.Response):
+            resp = aiowsman.Response(200, 'OK', {}, resp.encode('utf-8'))
+
+        return resp
+
+    async def close(self):
+        self.closed = True
+
+
 WSManEnumerations = {
     'context': [
         load_wsman_xml('wsman-enum_context-1'),
@@ -15,7 +15,10 @@
 Common functionalities shared between different DRAC modules.
 """
 
+import collections.abc
+
 from dracclient import constants
+import functools
 import logging
 
 from dracclient import exceptions
@@ -25,6 +28,9 @@ LOG = logging.getLogger(__name__)
 
 NS_XMLSchema_Instance = 'http://www.w3.org/2001/XMLSchema-instance'
 
+# maximum number of find_xml descendant finders kept
+QUERY_CACHE_SIZE = 1024
+
 # ReturnValue constants
 RET_SUCCESS = '0'
 RET_ERROR = '2'
@@ -51,11 +57,20 @@ def find_xml(doc, item, namespace, find_all=False):
               elements were found.
 
     """
-    query = ('.//{%(namespace)s}%(item)s' % {'namespace': namespace,
-                                             'item': item})
+    return _descendant_finder(namespace, item, find_all)(doc)
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _descendant_finder(namespace, item, find_all):
+    # returns a function finding .//{namespace}item, without formatting and
+    # parsing the path on every call. Iterating over the descendants
+    # filtered by tag is faster than evaluating the path with lxml
+    # ElementPath or an ETXPath object.
+    tag = '{%s}%s' % (namespace, item)
     if find_all:
-        return doc.findall(query)
-    return doc.find(query)
+        return lambda doc: list(doc.iterdescendants(tag))
+
+    return lambda doc: next(doc.iterdescendants(tag), None)
 
 
 def _is_attr_non_nil(elem):
@@ -88,6 +103,10 @@ def get_wsman_resource_attr(doc, resource_uri, attr_name, nullable=False,
     """
     item = find_xml(doc, attr_name, resource_uri)
 
+    return _get_attr_value(item, attr_name, nullable, allow_missing)
+
+
+def _get_attr_value(item, attr_name, nullable, allow_missing):
     if item is None:
         if allow_missing:
             return
@@ -120,6 +139,10 @@ def get_all_wsman_resource_attrs(doc, resource_uri, attr_name, nullable=False):
     """
     items = find_xml(doc, attr_name, resource_uri, find_all=True)
 
+    return _get_attr_values(items, attr_name, nullable)
+
+
+def _get_attr_values(items, attr_name, nullable):
     if not nullable:
         for item in items:
             if item.text is None:
@@ -130,6 +153,351 @@ def get_all_wsman_resource_attrs(doc, resource_uri, attr_name, nullable=False):
         return [item.text.strip() for item in items if _is_attr_non_nil(item)]
 
 
+class ItemView(object):
+    """Attributes of a resource item, indexed in a single pass
+
+    get_wsman_resource_attr searches the whole item for every attribute it
+    reads. The view walks the item once, mapping the local names of the
+    elements in the resource namespace to the elements, so that reading an
+    attribute is a dictionary lookup.
+    """
+
+    def __init__(self, item, resource_uri):
+        """Creates ItemView object
+
+        :param item: the element tree object of the item.
+        :param resource_uri: the resource URI of the namespace.
+        """
+        self.item = item
+        self.resource_uri = resource_uri
+        start = len(resource_uri) + 2
+        elems = {}
+        for elem in item.iterdescendants('{%s}*' % resource_uri):
+            name = elem.tag[start:]
+            if name in elems:
+                elems[name].append(elem)
+            else:
+                elems[name] = [elem]
+        self._elems = elems
+
+    @classmethod
+    def of(cls, item, resource_uri):
+        """Returns a view of an item
+
+        :param item: the element tree object of the item, or a view of it.
+        :param resource_uri: the resource URI of the namespace.
+        :returns: item if it is already a view for resource_uri, a new
+                  ItemView object otherwise.
+        """
+        if isinstance(item, cls):
+            if item.resource_uri == resource_uri:
+                return item
+            item = item.item
+
+        return cls(item, resource_uri)
+
+    def find(self, attr_name):
+        """Find the first element of an attribute.
+
+        :param attr_name: the name of the attribute.
+        :returns: the element object, None if not found.
+        """
+        elems = self._elems.get(attr_name)
+        if elems:
+            return elems[0]
+
+    def find_all(self, attr_name):
+        """Find all the elements of an attribute.
+
+        :param attr_name: the name of the attribute.
+        :returns: a list of element objects, empty if none was found.
+        """
+        return list(self._elems.get(attr_name, ()))
+
+    def get_attr(self, attr_name, nullable=False, allow_missing=False):
+        """Returns the value of an attribute.
+
+        Behaves as get_wsman_resource_attr.
+
+        :param attr_name: the name of the attribute.
+        :param nullable: if True, returns None when the element is nil.
+        :param allow_missing: if True, returns None when the attribute is
+                              missing instead of raising
+                              DRACMissingResponseField.
+        :raises: DRACMissingResponseField if the attribute is missing and
+                 allow_missing is False.
+        :raises: DRACEmptyResponseField if the attribute has no text and
+                 nullable is False.
+        :returns: value of the attribute
+        """
+        return _get_attr_value(self.find(attr_name), attr_name, nullable,
+                               allow_missing)
+
+    def get_all_attrs(self, attr_name, nullable=False):
+        """Returns the values of all instances of an attribute.
+
+        Behaves as get_all_wsman_resource_attrs.
+
+        :param attr_name: the name of the attribute.
+        :param nullable: if True, the nil elements are left out.
+        :raises: DRACEmptyResponseField if any of the instances has no text
+                 and nullable is False.
+        :returns: a list containing the value of each of the instances of the
+                  attribute.
+        """
+        return _get_attr_values(self._elems.get(attr_name, ()), attr_name,
+                                nullable)
+
+
+class ViewField(object):
+    """Declares how a field of a view is read from its item"""
+
+    def __init__(self, attr_name, nullable=False, allow_missing=False,
+                 lookup=None, converter=None, default=None, find_all=False):
+        """Creates ViewField object
+
+        :param attr_name: the name of the attribute, or a tuple of names
+                          tried in turn until one is present.
+        :param nullable: if True, the value is None when the element is nil.
+        :param allow_missing: if True, the value is None when the attribute
+                              is missing instead of raising
+                              DRACMissingResponseField.
+        :param lookup: dictionary mapping the value read to the value of the
+                       field, such as constants.PRIMARY_STATUS.
+        :param converter: callable applied to the value, after the lookup.
+        :param default: the value of the field when the value read is None.
+                        The lookup and converter are only applied to values
+                        other than None.
+        :param find_all: if True, the value is the list of the values of all
+                         instances of the attribute, as returned by
+                         ItemView.get_all_attrs.
+        """
+        if isinstance(attr_name, tuple):
+            self.attr_names = attr_name
+        else:
+            self.attr_names = (attr_name,)
+        self.nullable = nullable
+        self.allow_missing = allow_missing
+        self.lookup = lookup
+        self.converter = converter
+        self.default = default
+        self.find_all = find_all
+
+    def compile(self):
+        """Returns a function reading the field from an ItemView"""
+        read = self._compile_read()
+        lookup = self.lookup
+        converter = self.converter
+        default = self.default
+        if lookup is None and converter is None:
+            if default is None:
+                return read
+
+            def get(view):
+                value = read(view)
+                return default if value is None else value
+        elif lookup is None:
+            def get(view):
+                value = read(view)
+                if value is None:
+                    return default
+
+                return converter(value)
+        elif converter is None:
+            def get(view):
+                value = read(view)
+                if value is None:
+                    return default
+
+                return lookup[value]
+        else:
+            def get(view):
+                value = read(view)
+                if value is None:
+                    return default
+
+                return converter(lookup[value])
+
+        return get
+
+    def _compile_read(self):
+        fallbacks = self.attr_names[:-1]
+        attr_name = self.attr_names[-1]
+        nullable = self.nullable
+        allow_missing = self.allow_missing
+
+        if self.find_all:
+            def read(view):
+                return view.get_all_attrs(attr_name, nullable)
+        elif fallbacks:
+            def read(view):
+                for name in fallbacks:
+                    value = view.get_attr(name, nullable, True)
+                    if value is not None:
+                        return value
+
+                return view.get_attr(attr_name, nullable, allow_missing)
+        else:
+            def read(view):
+                return view.get_attr(attr_name, nullable, allow_missing)
+
+        return read
+
+
+class ComputedField(object):
+    """Declares a field of a view computed from the fields read"""
+
+    def __init__(self, func):
+        """Creates ComputedField object
+
+        :param func: callable receiving the dictionary of the values of the
+                     ViewField fields, keyed by field name, and returning the
+                     value of the field.
+        """
+        self.func = func
+
+
+class ViewParser(object):
+    """Parses the items of a DCIM view from a declarative spec
+
+    The spec declares how every field of the view namedtuple is read. It is
+    compiled once into one reading function per field, so that parsing an
+    item is a single pass over it, to build its ItemView, followed by one
+    dictionary lookup and the conversions per field.
+    """
+
+    def __init__(self, view_cls, resource_uri, fields):
+        """Creates ViewParser object
+
+        :param view_cls: the namedtuple class of the view.
+        :param resource_uri: the resource URI of the namespace.
+        :param fields: a dictionary of ViewField and ComputedField objects
+                       keyed by the names of the fields of view_cls.
+        :raises: ValueError if fields does not match the fields of view_cls.
+        """
+        if set(fields) != set(view_cls._fields):
+            raise ValueError(
+                'The spec of %(view)s does not match its fields: '
+                '%(fields)s' % {
+                    'view': view_cls.__name__,
+                    'fields': ', '.join(sorted(
+                        set(fields) ^ set(view_cls._fields)))})
+
+        self.view_cls = view_cls
+        self.resource_uri = resource_uri
+        self._readers = [(name, field.compile())
+                         for name, field in fields.items()
+                         if isinstance(field, ViewField)]
+        self._computed = [(name, field.func)
+                          for name, field in fields.items()
+                          if isinstance(field, ComputedField)]
+
+    def parse(self, item):
+        """Parses an item
+
+        :param item: the element tree object of the item, or an ItemView of
+                     it.
+        :returns: a view_cls object
+        :raises: DRACMissingResponseField if a required attribute is missing.
+        :raises: DRACEmptyResponseField if a non nullable attribute has no
+                 text.
+        """
+        view = ItemView.of(item, self.resource_uri)
+        values = {}
+        for name, read in self._readers:
+            values[name] = read(view)
+        for name, func in self._computed:
+            values[name] = func(values)
+
+        return self.view_cls(**values)
+
+
+class LazySettings(collections.abc.Mapping):
+    """Configuration settings parsed on access
+
+    The items of the enumeration responses are indexed by key up front,
+    reading only the elements making up the key, and each attribute object is
+    built the first time it is read, so that callers reading a few settings
+    out of thousands do not pay for parsing all of them.
+
+    Unlike the dictionaries returned by default, the mapping is read-only,
+    keeps the parsed responses alive and raises the parsing errors of an
+    attribute when it is read.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._settings = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._settings[key]
+        except KeyError:
+            attr_cls, item = self._items[key]
+
+        attribute = attr_cls.parse(item)
+        self._settings[key] = attribute
+        return attribute
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return '<%s with %d settings>' % (type(self).__name__, len(self))
+
+    @property
+    def parsed(self):
+        """The number of attribute objects built so far"""
+        return len(self._settings)
+
+    def _add(self, key, attr_cls, item):
+        self._items[key] = (attr_cls, item)
+        self._settings.pop(key, None)
+
+    def _update(self, other):
+        self._items.update(other._items)
+        self._settings.update(other._settings)
+
+
+class _SettingKeys(object):
+    """The attributes of a setting item which its key is made of
+
+    Stands for the attribute object when computing the key of a lazily
+    parsed setting, reading the attributes straight from the item.
+    """
+
+    def __init__(self, item, namespace):
+        self._item = item
+        self._namespace = namespace
+
+    def _get_attr(self, attr_name):
+        return _get_attr_value(
+            self._item.find('{%s}%s' % (self._namespace, attr_name)),
+            attr_name, nullable=False, allow_missing=False)
+
+    @property
+    def name(self):
+        return self._get_attr('AttributeName')
+
+    @property
+    def instance_id(self):
+        return self._get_attr('InstanceID')
+
+    @property
+    def fqdd(self):
+        return self._get_attr('FQDD')
+
+    @property
+    def group_id(self):
+        return self._get_attr('GroupID')
+
+
 def build_return_dict(doc, resource_uri,
                       is_commit_required_value=None,
                       is_reboot_required_value=None):
@@ -219,6 +587,28 @@ def reboot_required(doc, resource_uri):
     return REBOOT_REQUIRED[reboot_required_value.text.lower()]
 
 
+def slot_values(obj):
+    """Returns the attributes of an object stored in slots
+
+    Stands for obj.__dict__ for the classes declaring __slots__, such as the
+    attribute classes of the resources.
+
+    :param obj: the object.
+    :returns: a dictionary of the values of the slots declared by the
+              classes of obj, keyed by slot name. The slots which were never
+              set are left out.
+    """
+    values = {}
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            try:
+                values[name] = getattr(obj, name)
+            except AttributeError:
+                pass
+
+    return values
+
+
 def validate_integer_value(value, attr_name, error_msgs):
     """Validate integer value"""
 
@@ -233,7 +623,7 @@ def validate_integer_value(value, attr_name, error_msgs):
 
 
 def list_settings(client, namespaces, by_name=True, fqdd_filter=None,
-                  name_formatter=None, wait_for_idrac=True):
+                  name_formatter=None, wait_for_idrac=True, lazy=False):
     """List the configuration settings
 
     :param client: an instance of WSManClient.
@@ -248,6 +638,10 @@ def list_settings(client, namespaces, by_name=True, fqdd_filter=None,
     :param wait_for_idrac: indicates whether or not to wait for the
                            iDRAC to be ready to accept commands before
                            issuing the command.
+    :param lazy: if True, returns a LazySettings mapping building the
+                 attribute objects on access. The name_formatter is then
+                 given an object with the name, instance_id, fqdd and
+                 group_id attributes of the setting only.
     :returns: a dictionary with the settings using name or instance_id as
               the key.
     :raises: WSManRequestFailure on request failures
@@ -256,40 +650,107 @@ def list_settings(client, namespaces, by_name=True, fqdd_filter=None,
              interface
     """
 
-    result = {}
+    result = LazySettings() if lazy else {}
     for (namespace, attr_cls) in namespaces:
         attribs = _get_config(client, namespace, attr_cls, by_name,
-                              fqdd_filter, name_formatter, wait_for_idrac)
-        if not set(result).isdisjoint(set(attribs)):
-            raise exceptions.DRACOperationFailed(
-                drac_messages=('Colliding attributes %r' % (
-                    set(result) & set(attribs))))
-        result.update(attribs)
+                              fqdd_filter, name_formatter, wait_for_idrac,
+                              lazy)
+        _merge_settings(result, attribs)
     return result
 
 
-def _get_config(client, resource, attr_cls, by_name, fqdd_filter,
-                name_formatter, wait_for_idrac):
-    result = {}
+def iter_settings(client, namespaces, by_name=True, fqdd_filter=None,
+                  name_formatter=None, wait_for_idrac=True):
+    """Yields the configuration settings as they are received
 
+    :param client: an instance of WSManClient.
+    :param namespaces: a list of URI/class pairs to retrieve.
+    :param by_name: controls whether the returned keys are the attribute
+                    names or the instance_ids.
+    :param fqdd_filter: An FQDD used to filter the instances.  Note that
+                        this is only used when by_name is True.
+    :param name_formatter: a method used to format the returned keys.  By
+                           default, attribute.name will be used.
+    :param wait_for_idrac: indicates whether or not to wait for the
+                           iDRAC to be ready to accept commands before
+                           issuing the command.
+    :returns: a generator of (key, setting) tuples, using name or
+              instance_id as the key.
+    :raises: WSManRequestFailure on request failures
+    :raises: WSManInvalidResponse when receiving invalid response
+    :raises: DRACOperationFailed on error reported back by the DRAC
+             interface
+    """
+
+    seen = set()
+    for (namespace, attr_cls) in namespaces:
+        items = client.iter_enumerate(namespace,
+                                      wait_for_idrac=wait_for_idrac)
+        keys = set()
+        for (key, attribute) in _parse_settings(items, attr_cls, by_name,
+                                                fqdd_filter, name_formatter):
+            if key in seen:
+                raise exceptions.DRACOperationFailed(
+                    drac_messages=('Colliding attributes %r' % {key}))
+            keys.add(key)
+            yield (key, attribute)
+        seen.update(keys)
+
+
+def _merge_settings(result, attribs):
+    if not set(result).isdisjoint(set(attribs)):
+        raise exceptions.DRACOperationFailed(
+            drac_messages=('Colliding attributes %r' % (
+                set(result) & set(attribs))))
+    if isinstance(result, LazySettings):
+        result._update(attribs)
+    else:
+        result.update(attribs)
+
+
+def _get_config(client, resource, attr_cls, by_name, fqdd_filter,
+                name_formatter, wait_for_idrac, lazy=False):
     doc = client.enumerate(resource, wait_for_idrac=wait_for_idrac)
-    items = doc.find('.//{%s}Items' % wsman.NS_WSMAN)
 
+    return _parse_config(doc, attr_cls, by_name, fqdd_filter, name_formatter,
+                         lazy)
+
+
+def _parse_config(doc, attr_cls, by_name, fqdd_filter, name_formatter,
+                  lazy=False):
+    items = wsman._find_enumerate_items(doc)
+
+    if not lazy:
+        return dict(_parse_settings(items, attr_cls, by_name, fqdd_filter,
+                                    name_formatter))
+
+    settings = LazySettings()
+    for item in items:
+        key = _setting_key(_SettingKeys(item, attr_cls.namespace), by_name,
+                           fqdd_filter, name_formatter)
+        if key is not None:
+            settings._add(key, attr_cls, item)
+    return settings
+
+
+def _parse_settings(items, attr_cls, by_name, fqdd_filter, name_formatter):
     for item in items:
         attribute = attr_cls.parse(item)
-        if by_name:
-            # Filter out all instances without a matching FQDD
-            if fqdd_filter is None or fqdd_filter == attribute.fqdd:
-                if name_formatter is None:
-                    name = attribute.name
-                else:
-                    name = name_formatter(attribute)
-
-                result[name] = attribute
-        else:
-            result[attribute.instance_id] = attribute
+        key = _setting_key(attribute, by_name, fqdd_filter, name_formatter)
+        if key is not None:
+            yield (key, attribute)
 
-    return result
+
+def _setting_key(attribute, by_name, fqdd_filter, name_formatter):
+    if not by_name:
+        return attribute.instance_id
+
+    # Filter out all instances without a matching FQDD
+    if fqdd_filter is None or fqdd_filter == attribute.fqdd:
+        if name_formatter is None:
+            return attribute.name
+        else:
+            return name_formatter(attribute)
 
 
 def set_settings(settings_type,
@@ -345,8 +806,44 @@ def set_settings(settings_type,
     """
     current_settings = list_settings(client, namespaces, by_name=by_name,
                                      name_formatter=name_formatter,
-                                     wait_for_idrac=wait_for_idrac)
+                                     wait_for_idrac=wait_for_idrac,
+                                     lazy=True)
+
+    properties = _build_set_attributes_properties(
+        settings_type, current_settings, new_settings, target)
+    if properties is None:
+        return build_return_dict(
+            None,
+            resource_uri,
+            is_commit_required_value=False,
+            is_reboot_required_value=constants.RebootRequired.false)
+
+    selectors = _build_set_attributes_selectors(cim_creation_class_name,
+                                                cim_name)
+    doc = client.invoke(resource_uri, 'SetAttributes',
+                        selectors, properties,
+                        wait_for_idrac=wait_for_idrac)
+
+    return build_return_dict(doc, resource_uri)
+
+
+def _build_set_attributes_selectors(cim_creation_class_name, cim_name):
+    return {'CreationClassName': cim_creation_class_name,
+            'Name': cim_name,
+            'SystemCreationClassName': 'DCIM_ComputerSystem',
+            'SystemName': 'DCIM:ComputerSystem'}
 
+
+def _build_set_attributes_properties(settings_type, current_settings,
+                                     new_settings, target):
+    """Validates new settings against the current ones
+
+    :returns: the properties of the SetAttributes invocation, or None if
+              none of the new settings differs from the current value
+    :raises: DRACOperationFailed on new settings with invalid values or
+             attempting to set read-only settings
+    :raises: InvalidParameterValue on invalid new setting
+    """
     unknown_keys = set(new_settings) - set(current_settings)
     if unknown_keys:
         msg = ('Unknown %(settings_type)s attributes found: %(unknown_keys)r' %
@@ -405,16 +902,7 @@ def set_settings(settings_type,
             drac_messages=drac_messages)
 
     if not attrib_names:
-        return build_return_dict(
-            None,
-            resource_uri,
-            is_commit_required_value=False,
-            is_reboot_required_value=constants.RebootRequired.false)
-
-    selectors = {'CreationClassName': cim_creation_class_name,
-                 'Name': cim_name,
-                 'SystemCreationClassName': 'DCIM_ComputerSystem',
-                 'SystemName': 'DCIM:ComputerSystem'}
+        return None
 
     properties = {'Target': target,
                   'AttributeValue': [new_settings[attr] for attr
@@ -431,8 +919,5 @@ def set_settings(settings_type,
                                        attr in attrib_names]
     else:
         properties['AttributeName'] = attrib_names
-    doc = client.invoke(resource_uri, 'SetAttributes',
-                        selectors, properties,
-                        wait_for_idrac=wait_for_idrac)
 
-    return build_return_dict(doc, resource_uri)
+    return properties
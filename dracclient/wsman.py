@@ -11,17 +11,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import contextlib
 import logging
 import re
 import six
+import threading
 import time
 import uuid
 
 from lxml import etree as ElementTree
+import requests.adapters
 import requests.exceptions
 
 from dracclient import constants
 from dracclient import exceptions
+from dracclient import retry
 
 LOG = logging.getLogger(__name__)
 
@@ -36,6 +40,20 @@ NS_MAP = {'s': NS_SOAP_ENV,
           'wsa': NS_WS_ADDR,
           'wsman': NS_WSMAN}
 
+# Queries of the parts of the enumeration responses, compiled once. The
+# items and the enumeration context sit right under the response element of
+# the SOAP body, so the queries are anchored instead of searching the items.
+_ENUM_XPATH_NS_MAP = {'s': NS_SOAP_ENV,
+                      'wsen': NS_WSMAN_ENUM,
+                      'wsman': NS_WSMAN}
+_ENUM_CONTEXT_XPATH = ElementTree.XPath(
+    '/s:Envelope/s:Body/*/wsen:EnumerationContext',
+    namespaces=_ENUM_XPATH_NS_MAP)
+_ENUMERATE_ITEMS_XPATH = ElementTree.XPath(
+    '/s:Envelope/s:Body/*/wsman:Items', namespaces=_ENUM_XPATH_NS_MAP)
+_PULLED_ITEMS_XPATH = ElementTree.XPath(
+    '/s:Envelope/s:Body/*/wsen:Items', namespaces=_ENUM_XPATH_NS_MAP)
+
 FILTER_DIALECT_MAP = {'cql': 'http://schemas.dmtf.org/wbem/cql/1/dsp0202.pdf',
                       'wql': 'http://schemas.microsoft.com/wbem/wsman/1/WQL'}
 
@@ -47,7 +65,13 @@ class Client(object):
                  protocol='https',
                  ssl_retries=constants.DEFAULT_WSMAN_SSL_ERROR_RETRIES,
                  ssl_retry_delay=(
-                     constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC)):
+                     constants.DEFAULT_WSMAN_SSL_ERROR_RETRY_DELAY_SEC),
+                 pool_size=constants.DEFAULT_WSMAN_POOL_SIZE,
+                 idle_timeout=constants.DEFAULT_WSMAN_IDLE_TIMEOUT_SEC,
+                 session=None, session_pool=None, retry_policy=None,
+                 circuit_breakers=None,
+                 connect_timeout=constants.DEFAULT_WSMAN_CONNECT_TIMEOUT_SEC,
+                 read_timeout=constants.DEFAULT_WSMAN_READ_TIMEOUT_SEC):
         """Creates client object
 
         :param host: hostname or IP of the DRAC interface
@@ -59,6 +83,32 @@ class Client(object):
         :param ssl_retries: number of resends to attempt on SSL failures
         :param ssl_retry_delay: number of seconds to wait between
                                 retries on SSL failures
+        :param pool_size: maximum number of keep-alive connections kept open
+                          to the DRAC interface
+        :param idle_timeout: number of seconds a pooled connection may stay
+                             unused before it is discarded. If None, idle
+                             connections are never discarded.
+        :param session: a requests.Session compatible object used to send
+                        the requests. If None, a session owned by this client
+                        is created on first use. A session passed in is not
+                        closed by close().
+        :param session_pool: a pool.SessionPool to borrow the session from,
+                             such as pool.get_shared_pool(). Takes precedence
+                             over session, pool_size and idle_timeout.
+        :param retry_policy: a retry.RetryPolicy deciding how failed
+                             requests are retried. Takes precedence over
+                             ssl_retries and ssl_retry_delay.
+        :param circuit_breakers: a breaker.CircuitBreakerRegistry tracking
+                                 the failures of the DRAC interface, such as
+                                 breaker.get_shared_registry(). Requests
+                                 fail fast with WSManCircuitOpen while its
+                                 circuit is open. If None, requests are
+                                 always sent.
+        :param connect_timeout: number of seconds to wait for a connection
+                                to the DRAC interface. If None, waits
+                                forever.
+        :param read_timeout: number of seconds to wait for the DRAC interface
+                             to send a response. If None, waits forever.
         """
 
         self.host = host
@@ -74,23 +124,214 @@ class Client(object):
             'host': self.host,
             'port': self.port,
             'path': self.path})
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+        self._last_used = None
+
+        self._session_pool = session_pool
+        self._pool_key = (host, port, username, password)
+
+        if retry_policy is None:
+            retry_policy = retry.RetryPolicy.fixed(ssl_retries,
+                                                   ssl_retry_delay)
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the connections kept open to the DRAC interface.
+
+        The client remains usable; a new session is created on the next
+        request.
+        """
+        with self._session_lock:
+            if self._session is not None and self._owns_session:
+                self._session.close()
+                self._session = None
+            self._last_used = None
+
+    @contextlib.contextmanager
+    def deadline(self, timeout):
+        """Bounds the time spent by the calls of the current thread
+
+        Every request sent, retry and readiness wait of the calls made within
+        the context counts against the same budget. Once it is spent, they
+        raise DRACDeadlineExceeded. Nested deadlines can only shorten the
+        budget.
+
+        :param timeout: number of seconds the calls may take
+        """
+        previous = getattr(self._local, 'deadline', None)
+        deadline = time.monotonic() + timeout
+        if previous is not None:
+            deadline = min(deadline, previous)
+
+        self._local.deadline = deadline
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+
+    def remaining_time(self):
+        """Returns the number of seconds left before the deadline
+
+        :returns: the number of seconds, or None if the current thread has
+                  no deadline
+        """
+        deadline = getattr(self._local, 'deadline', None)
+        if deadline is None:
+            return None
+
+        return max(deadline - time.monotonic(), 0)
+
+    def check_deadline(self):
+        """Checks that the deadline of the current thread has not passed
+
+        :raises: DRACDeadlineExceeded when the deadline has passed
+        """
+        if self.remaining_time() == 0:
+            raise exceptions.DRACDeadlineExceeded(host=self.host)
+
+    def bind_deadline(self, func):
+        """Binds a function to the deadline of the current thread
+
+        The calls of the returned function count against the deadline of
+        the thread that bound it, whichever thread makes them, such as a
+        worker of a poll scheduler.
+
+        :param func: the function to bind
+        :returns: the bound function
+        """
+        deadline = getattr(self._local, 'deadline', None)
+
+        def bound(*args, **kwargs):
+            previous = getattr(self._local, 'deadline', None)
+            self._local.deadline = deadline
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.deadline = previous
+
+        return bound
+
+    def cap_to_deadline(self, seconds):
+        """Caps a number of seconds to the time left before the deadline
+
+        :param seconds: the number of seconds, None meaning no limit
+        :returns: the smallest of seconds and the remaining time of the
+                  current thread
+        """
+        remaining = self.remaining_time()
+        if remaining is None:
+            return seconds
+        if seconds is None:
+            return remaining
+
+        return min(seconds, remaining)
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def _get_session(self):
+        with self._session_lock:
+            now = time.monotonic()
+            if self._session is None:
+                self._session = self._create_session()
+            elif (self._owns_session
+                    and self.idle_timeout is not None
+                    and self._last_used is not None
+                    and now - self._last_used > self.idle_timeout):
+                LOG.debug('Discarding connections to %(endpoint)s idle for '
+                          'more than %(idle_timeout)s seconds',
+                          {'endpoint': self.endpoint,
+                           'idle_timeout': self.idle_timeout})
+                # closing the session only empties its connection pools,
+                # the session itself can still be used
+                self._session.close()
+            self._last_used = now
+
+            return self._session
+
+    def _post(self, payload):
+        self.check_deadline()
+
+        timeout = (self.cap_to_deadline(self.connect_timeout),
+                   self.cap_to_deadline(self.read_timeout))
+        kwargs = {'auth': requests.auth.HTTPBasicAuth(self.username,
+                                                      self.password),
+                  'data': payload,
+                  'timeout': timeout,
+                  # TODO(ifarkas): enable cert verification
+                  'verify': False}
+
+        if self._session_pool is not None:
+            with self._session_pool.session(self._pool_key) as session:
+                return session.post(self.endpoint, **kwargs)
+
+        return self._get_session().post(self.endpoint, **kwargs)
 
     def _do_request(self, payload):
         payload = payload.build()
         LOG.debug('Sending request to %(endpoint)s: %(payload)s',
                   {'endpoint': self.endpoint, 'payload': payload})
 
+        # running out of time says nothing about the health of the host
+        self.check_deadline()
+
+        breaker = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(self.host)
+            if not breaker.allow_request():
+                raise exceptions.WSManCircuitOpen(host=self.host,
+                                                  state=breaker.state)
+
+        try:
+            resp = self._post_with_retries(payload)
+        except exceptions.DRACDeadlineExceeded:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+
+        LOG.debug('Received response from %(endpoint)s: %(payload)s',
+                  {'endpoint': self.endpoint, 'payload': resp.content})
+        if not resp.ok:
+            raise exceptions.WSManInvalidResponse(
+                status_code=resp.status_code,
+                reason=resp.reason)
+        else:
+            return resp
+
+    def _post_with_retries(self, payload):
+        policy = self.retry_policy
         num_tries = 1
-        while num_tries <= self.ssl_retries:
+        while True:
             try:
-                resp = requests.post(
-                    self.endpoint,
-                    auth=requests.auth.HTTPBasicAuth(self.username,
-                                                     self.password),
-                    data=payload,
-                    # TODO(ifarkas): enable cert verification
-                    verify=False)
-                break
+                resp = self._post(payload)
             except (requests.exceptions.ConnectionError,
                     requests.exceptions.SSLError) as ex:
 
@@ -100,10 +341,12 @@ class Client(object):
                         error_type=type(ex).__name__,
                         host=self.host,
                         num_tries=num_tries,
-                        retries=self.ssl_retries)
+                        retries=policy.max_attempts)
 
-                if num_tries == self.ssl_retries:
+                if (num_tries >= policy.max_attempts
+                        or not policy.acquire_retry(self.host)):
                     LOG.error(error_msg)
+                    self.check_deadline()
                     raise exceptions.WSManRequestFailure(
                         "A {error_type} error occurred while communicating "
                         "with {host}: {error}".format(
@@ -113,10 +356,6 @@ class Client(object):
                 else:
                     LOG.warning(error_msg)
 
-                num_tries += 1
-                if self.ssl_retry_delay > 0 and num_tries <= self.ssl_retries:
-                    time.sleep(self.ssl_retry_delay)
-
             except requests.exceptions.RequestException as ex:
                 error_msg = "A {error_type} error occurred while " \
                     "communicating with {host}: {error}".format(
@@ -124,16 +363,30 @@ class Client(object):
                         host=self.host,
                         error=ex)
                 LOG.error(error_msg)
+                self.check_deadline()
                 raise exceptions.WSManRequestFailure(error_msg)
 
-        LOG.debug('Received response from %(endpoint)s: %(payload)s',
-                  {'endpoint': self.endpoint, 'payload': resp.content})
-        if not resp.ok:
-            raise exceptions.WSManInvalidResponse(
-                status_code=resp.status_code,
-                reason=resp.reason)
-        else:
-            return resp
+            else:
+                if (resp.ok
+                        or not policy.is_retryable_status(resp.status_code)
+                        or num_tries >= policy.max_attempts
+                        or not policy.acquire_retry(self.host)):
+                    break
+
+                LOG.warning('Received %(status_code)s %(reason)s from '
+                            '%(host)s, attempt %(num_tries)s of %(retries)s',
+                            {'status_code': resp.status_code,
+                             'reason': resp.reason,
+                             'host': self.host,
+                             'num_tries': num_tries,
+                             'retries': policy.max_attempts})
+
+            delay = self.cap_to_deadline(policy.delay(num_tries))
+            num_tries += 1
+            if delay > 0:
+                time.sleep(delay)
+
+        return resp
 
     def enumerate(self, resource_uri, optimization=True, max_elems=100,
                   auto_pull=True, filter_query=None, filter_dialect='cql'):
@@ -159,46 +412,64 @@ class Client(object):
                                     filter_query, filter_dialect)
 
         resp = self._do_request(payload)
-        try:
-            resp_xml = ElementTree.fromstring(resp.content)
-        except ElementTree.XMLSyntaxError:
-            LOG.warning('Received invalid content from iDRAC.  Filtering out '
-                        'unprintable characters: ' + repr(resp.content))
-
-            # Filter out everything except for printable ASCII characters and
-            # tab
-            resp_xml = ElementTree.fromstring(re.sub(six.b('[^\x20-\x7e\t]'),
-                                                     six.b(''),
-                                                     resp.content))
+        resp_xml = _parse_enumerate_response(resp.content)
 
         if auto_pull:
-            # The first response returns "<wsman:Items>"
-            find_items_wsman_query = './/{%s}Items' % NS_WSMAN
+            items_xml = _find_enumerate_items(resp_xml)
 
-            # Successive pulls return "<wsen:Items>"
-            find_items_enum_query = './/{%s}Items' % NS_WSMAN_ENUM
+            context = self._enum_context(resp_xml)
+            while context is not None:
+                pull_resp_xml = self.pull(resource_uri, context, max_elems)
+                context = self._enum_context(pull_resp_xml)
 
-            full_resp_xml = resp_xml
-            items_xml = full_resp_xml.find(find_items_wsman_query)
+                _merge_pulled_items(items_xml, pull_resp_xml)
 
-            context = self._enum_context(full_resp_xml)
-            while context is not None:
-                resp_xml = self.pull(resource_uri, context, max_elems)
-                context = self._enum_context(resp_xml)
+            _remove_enum_context(resp_xml)
 
-                # Merge in next batch of enumeration items
-                for item in resp_xml.find(find_items_enum_query):
-                    items_xml.append(item)
+        return resp_xml
 
-            # remove enumeration context because items are already merged
-            enum_context_elem = full_resp_xml.find('.//{%s}EnumerationContext'
-                                                   % NS_WSMAN_ENUM)
-            if enum_context_elem is not None:
-                enum_context_elem.getparent().remove(enum_context_elem)
+    def iter_enumerate(self, resource_uri, optimization=True, max_elems=100,
+                       filter_query=None, filter_dialect='cql'):
+        """Executes enumerate operation over WSMan, yielding the items.
 
-            return full_resp_xml
-        else:
-            return resp_xml
+        Unlike enumerate with auto_pull, the pulled items are not merged into
+        a single document. Each batch is handed out as soon as it is
+        received and released once its items have been consumed.
+
+        :param resource_uri: URI of resource to enumerate.
+        :param optimization: flag to enable enumeration optimization. If
+                             disabled, the items are only returned by the
+                             pull operations.
+        :param max_elems: maximum number of elements returned by each
+                          operation.
+        :param filter_query: filter query string.
+        :param filter_dialect: filter dialect. Valid options are: 'cql' and
+                               'wql'.
+        :returns: a generator of lxml.etree.Element objects, one per item.
+        :raises: WSManRequestFailure on request failures
+        :raises: WSManInvalidResponse when receiving invalid response
+        """
+
+        payload = _EnumeratePayload(self.endpoint, resource_uri,
+                                    optimization, max_elems,
+                                    filter_query, filter_dialect)
+
+        resp = self._do_request(payload)
+        resp_xml = _parse_enumerate_response(resp.content)
+        items_xml = _find_enumerate_items(resp_xml)
+        context = self._enum_context(resp_xml)
+
+        while True:
+            if items_xml is not None:
+                for item in items_xml:
+                    yield item
+
+            if context is None:
+                return
+
+            resp_xml = self.pull(resource_uri, context, max_elems)
+            items_xml = _find_pulled_items(resp_xml)
+            context = self._enum_context(resp_xml)
 
     def pull(self, resource_uri, context, max_elems=100):
         """Executes pull operation over WSMan.
@@ -238,9 +509,54 @@ class Client(object):
         return resp_xml
 
     def _enum_context(self, resp):
-        context_elem = resp.find('.//{%s}EnumerationContext' % NS_WSMAN_ENUM)
-        if context_elem is not None:
-            return context_elem.text
+        return _enum_context(resp)
+
+
+def _parse_enumerate_response(content):
+    try:
+        return ElementTree.fromstring(content)
+    except ElementTree.XMLSyntaxError:
+        LOG.warning('Received invalid content from iDRAC.  Filtering out '
+                    'unprintable characters: ' + repr(content))
+
+        # Filter out everything except for printable ASCII characters and
+        # tab
+        return ElementTree.fromstring(re.sub(six.b('[^\x20-\x7e\t]'),
+                                             six.b(''),
+                                             content))
+
+
+def _first(elems):
+    if elems:
+        return elems[0]
+
+
+def _enum_context(resp):
+    context_elem = _first(_ENUM_CONTEXT_XPATH(resp))
+    if context_elem is not None:
+        return context_elem.text
+
+
+def _find_enumerate_items(resp):
+    # The first response returns "<wsman:Items>"
+    return _first(_ENUMERATE_ITEMS_XPATH(resp))
+
+
+def _find_pulled_items(resp):
+    # Successive pulls return "<wsen:Items>"
+    return _first(_PULLED_ITEMS_XPATH(resp))
+
+
+def _merge_pulled_items(items_xml, pull_resp):
+    for item in _find_pulled_items(pull_resp):
+        items_xml.append(item)
+
+
+def _remove_enum_context(resp):
+    # remove enumeration context because items are already merged
+    enum_context_elem = _first(_ENUM_CONTEXT_XPATH(resp))
+    if enum_context_elem is not None:
+        enum_context_elem.getparent().remove(enum_context_elem)
 
 
 class _Payload(object):
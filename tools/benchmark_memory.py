@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark of the memory used by the settings attribute objects.
+
+Reports, for each attribute class, the bytes per attribute parsed from the
+test fixtures of dracclient/tests/wsman_mocks, values included, and the bytes
+per attribute of the object holding the values, with the values stored in
+a __dict__, as the attribute classes did before declaring __slots__, and in
+the slots::
+
+    python tools/benchmark_memory.py --copies 1000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from lxml import etree
+
+from dracclient.resources import bios
+from dracclient.resources import idrac_card
+from dracclient.resources import lifecycle_controller
+from dracclient.resources import nic
+from dracclient.resources import raid
+from dracclient.resources import system
+from dracclient.tests import utils as test_utils
+from dracclient import wsman
+
+FIXTURES = [
+    (test_utils.BIOSEnumerations, bios.BIOSConfiguration.NAMESPACES),
+    (test_utils.iDracCardEnumerations,
+     idrac_card.iDRACCardConfiguration.NAMESPACES),
+    (test_utils.LifecycleControllerEnumerations,
+     lifecycle_controller.LCConfiguration.NAMESPACES),
+    (test_utils.NICEnumerations, nic.NICConfiguration.NAMESPACES),
+    (test_utils.RAIDEnumerations, raid.RAIDManagement.NAMESPACES),
+    (test_utils.SystemEnumerations, system.SystemConfiguration.NAMESPACES),
+]
+
+
+def _slot_names(attr_cls):
+    # in the order the constructors set them, base class first
+    return [name for cls in reversed(attr_cls.__mro__)
+            for name in getattr(cls, '__slots__', ())]
+
+
+def _dict_backed_class(attr_cls):
+    return type(attr_cls.__name__, (object,), {})
+
+
+def _copy(attr, copy_cls, names):
+    copy = copy_cls.__new__(copy_cls)
+    for name in names:
+        setattr(copy, name, getattr(attr, name))
+
+    return copy
+
+
+def _measure(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--copies', type=int, default=1000,
+                        help='number of copies of each attribute measured')
+    args = parser.parse_args()
+
+    print('%-30s %6s %10s %10s %10s %8s' % (
+        'class', 'attrs', 'parsed B', 'dict B', 'slots B', 'saved'))
+    for enumerations, namespaces in FIXTURES:
+        for resource_uri, attr_cls in namespaces:
+            doc = etree.fromstring(enumerations[resource_uri]['ok'])
+            items = list(wsman._find_enumerate_items(doc))
+            attrs, parsed = _measure(
+                lambda: [attr_cls.parse(item) for item in items])
+
+            names = _slot_names(attr_cls)
+            dict_cls = _dict_backed_class(attr_cls)
+            sizes = []
+            for copy_cls in (dict_cls, attr_cls):
+                _, size = _measure(
+                    lambda: [_copy(attr, copy_cls, names)
+                             for attr in attrs
+                             for _ in range(args.copies)])
+                sizes.append(size / float(len(attrs) * args.copies))
+
+            print('%-30s %6d %10.0f %10.0f %10.0f %7.0f%%' % (
+                attr_cls.__name__, len(attrs), parsed / float(len(attrs)),
+                sizes[0], sizes[1], 100 * (1 - sizes[1] / sizes[0])))
+
+
+if __name__ == '__main__':
+    main()
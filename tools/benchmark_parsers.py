@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark of the parsing of the WS-Man responses of the test fixtures.
+
+Reports, for each DCIM view of dracclient/tests/wsman_mocks, the time per
+item spent reading every attribute of the items with a descendant search
+per attribute, as utils.get_wsman_resource_attr does, and with a single pass
+over the item with utils.ItemView. Also reports the time spent finding the
+enumeration context and the items in each response with ElementPath queries
+formatted on every call and with the compiled queries, and the time per item
+spent by the ViewParser of each view namedtuple::
+
+    python tools/benchmark_parsers.py --number 2000
+"""
+
+import argparse
+import timeit
+
+from lxml import etree
+
+from dracclient.resources import bios
+from dracclient.resources import inventory
+from dracclient.resources import job
+from dracclient.resources import raid
+from dracclient.resources import uris
+from dracclient.tests import utils as test_utils
+from dracclient import utils
+from dracclient import wsman
+
+FIXTURES = [
+    ('BIOSEnumeration', test_utils.BIOSEnumerations,
+     uris.DCIM_BIOSEnumeration),
+    ('BIOSInteger', test_utils.BIOSEnumerations, uris.DCIM_BIOSInteger),
+    ('BIOSString', test_utils.BIOSEnumerations, uris.DCIM_BIOSString),
+    ('BootSourceSetting', test_utils.BIOSEnumerations,
+     uris.DCIM_BootSourceSetting),
+    ('CPUView', test_utils.InventoryEnumerations, uris.DCIM_CPUView),
+    ('MemoryView', test_utils.InventoryEnumerations, uris.DCIM_MemoryView),
+    ('NICView', test_utils.InventoryEnumerations, uris.DCIM_NICView),
+    ('LifecycleJob', test_utils.JobEnumerations, uris.DCIM_LifecycleJob),
+    ('iDRACCardEnumeration', test_utils.iDracCardEnumerations,
+     uris.DCIM_iDRACCardEnumeration),
+    ('NICEnumeration', test_utils.NICEnumerations,
+     uris.DCIM_NICEnumeration),
+    ('ControllerView', test_utils.RAIDEnumerations,
+     uris.DCIM_ControllerView),
+    ('PhysicalDiskView', test_utils.RAIDEnumerations,
+     uris.DCIM_PhysicalDiskView),
+    ('VirtualDiskView', test_utils.RAIDEnumerations,
+     uris.DCIM_VirtualDiskView),
+]
+
+VIEW_PARSERS = [
+    ('BootMode', test_utils.BIOSEnumerations, bios.BOOT_MODE_PARSER),
+    ('BootDevice', test_utils.BIOSEnumerations, bios.BOOT_DEVICE_PARSER),
+    ('CPU', test_utils.InventoryEnumerations, inventory.CPU_PARSER),
+    ('Memory', test_utils.InventoryEnumerations, inventory.MEMORY_PARSER),
+    ('NIC', test_utils.InventoryEnumerations, inventory.NIC_PARSER),
+    ('System', test_utils.LifecycleControllerEnumerations,
+     inventory.SYSTEM_PARSER),
+    ('Job', test_utils.JobEnumerations, job.JOB_PARSER),
+    ('RAIDController', test_utils.RAIDEnumerations,
+     raid.RAID_CONTROLLER_PARSER),
+    ('PhysicalDisk', test_utils.RAIDEnumerations,
+     raid.PHYSICAL_DISK_PARSERS[uris.DCIM_PhysicalDiskView]),
+    ('VirtualDisk', test_utils.RAIDEnumerations, raid.VIRTUAL_DISK_PARSER),
+]
+
+
+def _load_items(enumerations, resource_uri):
+    doc = etree.fromstring(enumerations[resource_uri]['ok'])
+    items = utils.find_xml(doc, resource_uri.split('/')[-1], resource_uri,
+                           find_all=True)
+    names = sorted(set(etree.QName(elem).localname
+                       for item in items
+                       for elem in item.iterchildren('{%s}*' % resource_uri)))
+
+    return items, names
+
+
+def _read_with_searches(items, resource_uri, names):
+    for item in items:
+        for name in names:
+            elem = utils.find_xml(item, name, resource_uri)
+            if elem is not None:
+                elem.text
+
+
+def _read_with_view(items, resource_uri, names):
+    for item in items:
+        view = utils.ItemView(item, resource_uri)
+        for name in names:
+            elem = view.find(name)
+            if elem is not None:
+                elem.text
+
+
+def _lookup_with_paths(doc, resource_uri):
+    # the ElementPath lookups of an enumeration response, formatted on every
+    # call
+    doc.find('.//{%s}EnumerationContext' % wsman.NS_WSMAN_ENUM)
+    doc.find('.//{%s}Items' % wsman.NS_WSMAN)
+    doc.findall('.//{%(namespace)s}%(item)s' % {
+        'namespace': resource_uri, 'item': resource_uri.split('/')[-1]})
+
+
+def _lookup_with_compiled_queries(doc, resource_uri):
+    wsman._enum_context(doc)
+    wsman._find_enumerate_items(doc)
+    utils.find_xml(doc, resource_uri.split('/')[-1], resource_uri,
+                   find_all=True)
+
+
+def _parse_with_parser(items, parser, names):
+    for item in items:
+        parser.parse(item)
+
+
+def _time_per_item(func, items, arg, names, number):
+    elapsed = min(timeit.repeat(
+        lambda: func(items, arg, names), number=number, repeat=3))
+
+    return elapsed / number / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--number', type=int, default=1000,
+                        help='number of passes over each fixture')
+    args = parser.parse_args()
+
+    print('%-22s %6s %6s %12s %12s %8s' % ('view', 'items', 'fields',
+                                           'search us', 'view us',
+                                           'speedup'))
+    for name, enumerations, resource_uri in FIXTURES:
+        items, names = _load_items(enumerations, resource_uri)
+        searches = _time_per_item(_read_with_searches, items, resource_uri,
+                                  names, args.number)
+        view = _time_per_item(_read_with_view, items, resource_uri, names,
+                              args.number)
+        print('%-22s %6d %6d %12.2f %12.2f %7.1fx' % (
+            name, len(items), len(names), searches, view, searches / view))
+
+    print()
+    print('%-22s %12s %12s %8s' % ('response', 'path us', 'compiled us',
+                                   'speedup'))
+    for name, enumerations, resource_uri in FIXTURES:
+        doc = etree.fromstring(enumerations[resource_uri]['ok'])
+        paths = min(timeit.repeat(
+            lambda: _lookup_with_paths(doc, resource_uri),
+            number=args.number, repeat=3)) / args.number * 1e6
+        compiled = min(timeit.repeat(
+            lambda: _lookup_with_compiled_queries(doc, resource_uri),
+            number=args.number, repeat=3)) / args.number * 1e6
+        print('%-22s %12.2f %12.2f %7.1fx' % (name, paths, compiled,
+                                              paths / compiled))
+
+    print()
+    print('%-22s %6s %6s %12s' % ('parser', 'items', 'fields', 'parse us'))
+    for name, enumerations, parser in VIEW_PARSERS:
+        items, _ = _load_items(enumerations, parser.resource_uri)
+        parsed = _time_per_item(_parse_with_parser, items, parser, None,
+                                args.number)
+        print('%-22s %6d %6d %12.2f' % (name, len(items),
+                                        len(parser.view_cls._fields),
+                                        parsed))
+
+
+if __name__ == '__main__':
+    main()